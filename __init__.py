@@ -10,51 +10,59 @@ __author__ = "Jeremy Buisan"
 import logging
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-# Imports sécurisés avec gestion d'erreurs
-__all__ = []
+# Imports sécurisés et différés : chaque module n'est importé qu'au premier
+# accès à l'un de ses noms (PEP 562)
+import importlib
+from typing import Any, List
 
-# Import de la configuration
 try:
-    from config.settings import settings
-    __all__.append('settings')
+    from utils.lazy_import import LazyImporter
 except ImportError:
-    pass
+    LazyImporter = None
 
-# Imports des modules core
-try:
-    from core.database import Database
-    __all__.append('Database')
-except ImportError:
-    pass
+__all__ = []
 
-try:
-    from core.session_manager import SessionManager, get_session_manager
-    __all__.extend(['SessionManager', 'get_session_manager'])
-except ImportError:
-    pass
 
-try:
-    from core.cache import CacheManager
-    __all__.append('CacheManager')
-except ImportError:
-    pass
+def _safe_import(module_name: str, names: List[str]) -> bool:
+    """Import sécurisé d'un module (noms ignorés s'il est indisponible)"""
+    try:
+        module = importlib.import_module(module_name)
+        values = [getattr(module, name) for name in names]
+    except (ImportError, AttributeError):
+        return False
+    
+    globals().update(zip(names, values))
+    __all__.extend(name for name in names if name not in __all__)
+    return True
 
-# Imports des modèles
-try:
-    from models.entities import Artist, Track, Album, Credit, Session
-    __all__.extend(['Artist', 'Track', 'Album', 'Credit', 'Session'])
-except ImportError:
-    pass
 
-try:
-    from models.enums import SessionStatus, ExtractionStatus
-    __all__.extend(['SessionStatus', 'ExtractionStatus'])
-except ImportError:
-    pass
+_PUBLIC_MODULES = (
+    # Configuration
+    ('config.settings', ['settings']),
+    # Modules core
+    ('core.database', ['Database']),
+    ('core.session_manager', ['SessionManager', 'get_session_manager']),
+    ('core.cache', ['CacheManager']),
+    # Modèles
+    ('models.entities', ['Artist', 'Track', 'Album', 'Credit', 'Session']),
+    ('models.enums', ['SessionStatus', 'ExtractionStatus']),
+    # Découvreurs
+    ('discovery.genius_discovery', ['GeniusDiscovery']),
+)
 
-# Imports des découvreurs
-try:
-    from discovery.genius_discovery import GeniusDiscovery
-    __all__.append('GeniusDiscovery')
-except ImportError:
-    pass
\ No newline at end of file
+if LazyImporter is not None:
+    _lazy = LazyImporter(__name__, _safe_import)
+    for _module_name, _names in _PUBLIC_MODULES:
+        _lazy.register(_module_name, _names)
+    __all__ = _lazy.names()
+    
+    def __getattr__(name: str) -> Any:
+        """Import différé à la première utilisation d'un nom public"""
+        return _lazy.resolve(name, globals())
+    
+    def __dir__() -> List[str]:
+        return _lazy.dir(globals())
+else:
+    # Sans utils : imports immédiats, comme avant le chargement différé
+    for _module_name, _names in _PUBLIC_MODULES:
+        _safe_import(_module_name, _names)
@@ -5,6 +5,7 @@ Music Data Extractor - Point d'entrée principal
 Usage:
     python -m music_data_extractor --help
     python -m music_data_extractor extract "Nom Artiste"
+    python -m music_data_extractor resume <session_id>
     python -m music_data_extractor gui
     python -m music_data_extractor stats
 """
@@ -13,7 +14,7 @@ import sys
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Ajouter le répertoire parent au path pour les imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -21,8 +22,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config.settings import settings
 from core.session_manager import get_session_manager
 from core.database import Database
-from utils.export_utils import ExportManager, export_all_formats
 from utils.logging_config import setup_logging
+from utils.profiling import disable_profiling, enable_profiling, export_profile, get_profile_report
 from models.enums import ExportFormat
 
 class MusicDataExtractorCLI:
@@ -34,7 +35,7 @@ class MusicDataExtractorCLI:
         self.database = Database()
         
     def extract_artist(self, artist_name: str, max_tracks: Optional[int] = None, 
-                      export_format: Optional[str] = None) -> str:
+                      export_format: Optional[str] = None, profile: bool = False) -> str:
         """
         Pipeline complet d'extraction pour un artiste.
         
@@ -42,13 +43,13 @@ class MusicDataExtractorCLI:
             artist_name: Nom de l'artiste à extraire
             max_tracks: Nombre maximum de tracks à traiter
             export_format: Format d'export ('json', 'csv', 'html', 'all')
+            profile: Profiler les chemins chauds (rapport et piles folded exportés)
             
         Returns:
             ID de la session créée
         """
         # Import dynamique pour éviter les imports circulaires
-        from steps.step1_discover import DiscoveryStep
-        from steps.step2_extract import ExtractionStep
+        from steps.pipeline import ExtractionPipeline
         
         self.logger.info(f"🎯 Début extraction pour: {artist_name}")
         
@@ -58,28 +59,32 @@ class MusicDataExtractorCLI:
             metadata={'cli_extraction': True, 'max_tracks': max_tracks}
         )
         
+        if profile:
+            enable_profiling()
+        
         try:
-            # Étape 1: Découverte
-            discovery_step = DiscoveryStep(self.session_manager, self.database)
-            tracks, discovery_stats = discovery_step.discover_artist_tracks(
+            # Étapes 1 et 2 en pipeline: l'extraction démarre dès les premiers morceaux découverts
+            pipeline = ExtractionPipeline(self.session_manager, self.database)
+            extraction_results, pipeline_stats = pipeline.run(
                 artist_name, session_id, max_tracks
             )
             
-            self.logger.info(f"📊 Découverte terminée: {discovery_stats.final_count} morceaux trouvés")
+            self.logger.info(f"📊 Découverte terminée: {pipeline_stats.tracks_discovered} morceaux trouvés")
             
-            if not tracks:
+            if not pipeline_stats.tracks_discovered:
                 self.logger.warning("❌ Aucun morceau trouvé")
                 self.session_manager.fail_session(session_id, "Aucun morceau trouvé")
                 return session_id
             
-            # Étape 2: Extraction
-            extraction_step = ExtractionStep(self.session_manager, self.database)
-            extraction_results = extraction_step.extract_tracks_data(tracks, session_id)
-            
-            self.logger.info(f"🔍 Extraction terminée: {len(extraction_results)} morceaux traités")
+            self.logger.info(
+                f"🔍 Extraction terminée: {len(extraction_results['tracks'])} morceaux traités"
+            )
             
             # Étape 3: Export
             if export_format:
+                # Import différé : pandas n'est chargé que pour un export
+                from utils.export_utils import ExportManager, export_all_formats
+                
                 export_manager = ExportManager(self.database)
                 artist = self.database.get_artist_by_name(artist_name)
                 
@@ -95,11 +100,15 @@ class MusicDataExtractorCLI:
                         self.logger.info(f"   📁 {file_path}")
             
             # Marquer comme terminé
-            self.session_manager.complete_session(session_id, {
-                'tracks_discovered': len(tracks),
-                'tracks_extracted': len(extraction_results),
+            final_stats = {
+                'tracks_discovered': pipeline_stats.tracks_discovered,
+                'tracks_extracted': len(extraction_results['tracks']),
+                'pipeline': pipeline_stats.to_dict(),
                 'export_format': export_format
-            })
+            }
+            if profile:
+                final_stats['profile'] = get_profile_report()['categories']
+            self.session_manager.complete_session(session_id, final_stats)
             
             self.logger.info(f"✅ Extraction terminée avec succès pour {artist_name}")
             
@@ -107,9 +116,55 @@ class MusicDataExtractorCLI:
             self.logger.error(f"❌ Erreur lors de l'extraction: {e}")
             self.session_manager.fail_session(session_id, str(e))
             raise
+        finally:
+            if profile:
+                self._export_profile(session_id)
         
         return session_id
     
+    def _export_profile(self, session_id: str):
+        """Arrête le profilage et exporte le rapport de la session"""
+        disable_profiling()
+        paths = export_profile(session_id)
+        self.logger.info(f"⏱️ Profil: {paths['report']}")
+        self.logger.info(f"🔥 Piles (flame graph): {paths['folded']}")
+    
+    def resume_session(self, session_id: str, profile: bool = False) -> Dict[str, int]:
+        """
+        Reprend l'extraction d'une session depuis sa file de tâches persistante.
+        
+        Plusieurs processus peuvent reprendre la même session en parallèle.
+        
+        Returns:
+            Nombre de tâches par état après traitement
+        """
+        from steps.step2_extract import ExtractionStep
+        
+        queue_stats = self.database.get_task_queue_stats(session_id)
+        if not queue_stats['pending'] and not queue_stats['leased']:
+            self.logger.info(f"Aucune tâche à reprendre pour la session {session_id}")
+            return queue_stats
+        
+        self.logger.info(f"🔁 Reprise de la session {session_id}: "
+                         f"{queue_stats['pending']} tâches en attente, {queue_stats['leased']} réservées")
+        
+        extraction_step = ExtractionStep(self.session_manager, self.database)
+        if profile:
+            enable_profiling()
+        try:
+            _, stats = extraction_step.process_task_queue(session_id)
+        finally:
+            if profile:
+                self._export_profile(session_id)
+        
+        queue_stats = self.database.get_task_queue_stats(session_id)
+        if not queue_stats['pending'] and not queue_stats['leased']:
+            self.session_manager.complete_session(session_id, {
+                'tracks_extracted': stats.tracks_successful,
+                'tasks': queue_stats
+            })
+        return queue_stats
+    
     def show_stats(self, artist_name: Optional[str] = None):
         """Affiche les statistiques"""
         print("\n📈 === STATISTIQUES ===")
@@ -183,6 +238,16 @@ def main():
                                help='Format d\'export des données')
     extract_parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                                default='INFO', help='Niveau de logging')
+    extract_parser.add_argument('--profile', action='store_true',
+                               help='Profiler l\'extraction (rapport JSON et piles pour flame graph)')
+    
+    # Commande resume
+    resume_parser = subparsers.add_parser('resume', help='Reprendre l\'extraction d\'une session')
+    resume_parser.add_argument('session_id', help='ID de la session')
+    resume_parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
+                               default='INFO', help='Niveau de logging')
+    resume_parser.add_argument('--profile', action='store_true',
+                               help='Profiler la reprise (rapport JSON et piles pour flame graph)')
     
     # Commande GUI
     gui_parser = subparsers.add_parser('gui', help='Lancer l\'interface graphique')
@@ -213,13 +278,23 @@ def main():
             session_id = cli.extract_artist(
                 artist_name=args.artist_name,
                 max_tracks=args.max_tracks,
-                export_format=args.export
+                export_format=args.export,
+                profile=args.profile
             )
             print(f"\n✅ Extraction terminée. Session ID: {session_id}")
         except Exception as e:
             print(f"\n❌ Erreur: {e}")
             sys.exit(1)
     
+    elif args.command == 'resume':
+        try:
+            queue_stats = cli.resume_session(args.session_id, profile=args.profile)
+            print(f"\n✅ Reprise terminée: {queue_stats['done']} tâches terminées, "
+                  f"{queue_stats['failed']} en échec, {queue_stats['pending']} en attente")
+        except Exception as e:
+            print(f"\n❌ Erreur: {e}")
+            sys.exit(1)
+    
     elif args.command == 'gui':
         try:
             import streamlit.web.cli as stcli
@@ -0,0 +1,20 @@
+# benchmarks/__init__.py
+"""
+Benchmarks hors ligne de Music Data Extractor.
+
+Les réponses des APIs (Genius, Spotify, Last.fm, Discogs) et des pages
+scrapées (Rapedia, TuneBat) sont rejouées par un serveur HTTP local à
+partir des gabarits de benchmarks/fixtures : aucun accès réseau, résultats
+reproductibles d'une machine à l'autre.
+
+Les sous-systèmes (Database, DuplicateDetector, QualityChecker, exports)
+sont mesurés à part sur des catalogues synthétiques de plusieurs millions
+de lignes (benchmarks.catalog_generator).
+
+Usage:
+    python -m benchmarks.suite --sizes 100 1000 10000
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+    python -m benchmarks.scaling --sizes 10000 100000 1000000
+    python -m benchmarks.logging_bench --tracks 10000
+    python -m benchmarks.entities_bench --count 100000
+"""
@@ -0,0 +1,557 @@
+# benchmarks/catalog_generator.py
+"""
+Générateur de catalogues synthétiques pour les tests de montée en charge.
+
+Remplit le schéma SQLite (artistes, albums, morceaux, crédits) avec des
+distributions réalistes, sans aucun appel API :
+
+- nombre de morceaux par artiste log-normal (médiane ~60, quelques
+  artistes très prolifiques), noms français accentués et pseudonymes ;
+- albums, EP, singles et mixtapes, ~10 % de morceaux hors album ;
+- featurings (« (feat. X) », « ft. X & Y »…) pris parmi les autres
+  artistes, avec le crédit correspondant ;
+- variantes remix/live/acoustique et quasi-doublons de titres (accents
+  perdus, casse, ponctuation, coquilles) pour le DuplicateDetector ;
+- mélange de rôles de crédits (production, mix, mastering, écriture,
+  instruments…), personnes réutilisées selon une loi de Zipf, ~2 % de
+  crédits dupliqués ou orthographiés autrement.
+
+La génération est déterministe pour une graine donnée et se fait en flux
+(un artiste à la fois) par insertions groupées dans une seule
+transaction, index secondaires reconstruits à la fin.
+
+Usage:
+    python -m benchmarks.catalog_generator --tracks 1000000 --db /tmp/catalog.db
+"""
+
+import argparse
+import math
+import random
+import sqlite3
+import sys
+import time
+import unicodedata
+from bisect import bisect
+from dataclasses import asdict, dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# ===== VOCABULAIRE =====
+
+_FIRST_NAMES = [
+    "Théo", "Léa", "Clément", "Hélène", "Jérôme", "Anaïs", "Maël", "Chloé", "Noé", "Zoé",
+    "Raphaël", "Inès", "Gaëtan", "Mélanie", "Loïc", "Océane", "Benoît", "Cécile", "Joël", "Aurélie",
+    "Mathéo", "Éloïse", "Frédéric", "Solène", "Stéphane", "Maëlys", "Anaël", "Médéric", "Agnès", "Yanis"
+]
+_LAST_NAMES = [
+    "Lefèvre", "Ségara", "Dupré", "Bélanger", "Moreau", "Giraud", "Fournier", "Béranger", "Lemaître",
+    "Côté", "Mercier", "Ménard", "Brûlé", "Rivière", "Lévêque", "Chênevert", "Caron", "Dufresne",
+    "Gagné", "Hébert", "Pâquet", "Thériault", "Noël", "Benoît", "Lacroix", "Félix", "Boucher", "Émery"
+]
+_PSEUDO_PREFIXES = ["", "", "", "Lil ", "MC ", "Big ", "Le ", "La ", "Don ", "Young ", "DJ "]
+_PSEUDO_SYLLABLES = [
+    "ka", "zo", "né", "ri", "lo", "mé", "ya", "sk", "dé", "jo", "ba", "ti", "ké", "na", "vo", "zé",
+    "sa", "ro", "fi", "mü", "ly", "gu", "ça", "pa"
+]
+_TITLE_WORDS = [
+    "Égérie", "Été", "Nuit", "Mélancolie", "Rêve", "Cœur", "Fenêtre", "Déjà-vu", "Périphérique",
+    "Lumière", "Brûlure", "Tempête", "Silence", "Éclipse", "Mémoire", "Océan", "Béton", "Fièvre",
+    "Âme", "Naïf", "Horizon", "Ivresse", "Quartier", "Bénédiction", "Frère", "Misère", "Château",
+    "Dérive", "Héritage", "Poussière", "Étoile", "Ténèbres", "Vérité", "Liberté", "Rancœur",
+    "Symphonie", "Paradoxe", "Boussole", "Promesse", "Fantôme", "Métropole", "Équilibre", "Vertige",
+    "Cicatrice", "Crépuscule", "Orage", "Sérénade", "Odyssée", "Pénombre", "Voyou", "Étincelle"
+]
+_TITLE_ARTICLES = ["", "", "", "", "La ", "Le ", "Les ", "L'", "Mon ", "Ma ", "Nos "]
+
+_FEATURING_FORMATS = ["{title} (feat. {names})", "{title} (Ft. {names})", "{title} ft. {names}",
+                      "{title} [feat. {names}]", "{title} (avec {names})"]
+_VARIANT_SUFFIXES = [" (Remix)", " - Remix {person}", " ({person} Remix)", " [Version acoustique]",
+                     " (Live)", " (Extended Mix)", " (Radio Edit)", " - Version longue", " (Instrumental)"]
+
+_ALBUM_TYPES = [("album", 0.45, (10, 18)), ("ep", 0.25, (4, 7)),
+                ("single", 0.20, (1, 2)), ("mixtape", 0.10, (12, 22))]
+_KEYS = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+_GENRES = ["rap", "hip_hop", "trap", "drill", "boom_bap", "cloud_rap", "rnb", "pop"]
+_LABELS = ["Seine Zoo", "Def Jam France", "Rec. 118", "Because Music", "7th Magnitude",
+           "Capitol Music France", "Indépendant", "Panenka Music", "Al Sur", "Géante Rouge"]
+_DATA_SOURCES = [("genius", 0.6), ("discogs", 0.2), ("spotify", 0.1), ("rapedia", 0.1)]
+
+# Rôles des crédits : (type, catégorie, probabilité par morceau, instrument)
+_CREDIT_ROLES = [
+    ("producer", "production", 0.90, None),
+    ("co_producer", "production", 0.20, None),
+    ("additional_producer", "production", 0.08, None),
+    ("executive_producer", "production", 0.05, None),
+    ("mixing_engineer", "engineering", 0.60, None),
+    ("mastering_engineer", "engineering", 0.50, None),
+    ("recording_engineer", "engineering", 0.35, None),
+    ("songwriter", "songwriting", 0.40, None),
+    ("composer", "songwriting", 0.25, None),
+    ("lyricist", "songwriting", 0.15, None),
+    ("guitar", "musician", 0.06, "Guitare"),
+    ("piano", "musician", 0.05, "Piano"),
+    ("bass", "musician", 0.04, "Basse"),
+    ("synthesizer", "musician", 0.04, "Synthétiseur"),
+    ("drums", "musician", 0.03, "Batterie"),
+    ("backing_vocals", "vocals", 0.10, None),
+    ("scratches", "other", 0.03, None),
+    ("sample", "other", 0.04, None)
+]
+
+_TRACK_COLUMNS = ("id", "title", "artist_id", "artist_name", "album_id", "album_title",
+                  "track_number", "disc_number", "genius_id", "spotify_id", "genius_url",
+                  "duration_seconds", "bpm", "key", "has_lyrics", "lyrics", "created_at", "updated_at")
+_ALBUM_COLUMNS = ("id", "title", "artist_id", "release_date", "release_year", "album_type", "genre",
+                  "label", "spotify_id", "track_count", "total_duration", "created_at", "updated_at")
+_CREDIT_COLUMNS = ("id", "track_id", "credit_category", "credit_type", "person_name", "role_detail",
+                   "instrument", "is_primary", "is_featuring", "is_uncredited", "data_source",
+                   "extraction_date", "created_at")
+_ARTIST_COLUMNS = ("id", "name", "genius_id", "spotify_id", "genre", "country", "created_at", "updated_at")
+
+_SPOTIFY_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Date de référence fixe : deux générations de même graine sont identiques
+_EPOCH = time.mktime((2021, 1, 1, 0, 0, 0, 0, 0, -1))
+
+
+@dataclass
+class CatalogStats:
+    """Statistiques d'une génération"""
+    seed: int = 42
+    artists: int = 0
+    albums: int = 0
+    tracks: int = 0
+    credits: int = 0
+    featuring_tracks: int = 0
+    variant_tracks: int = 0
+    near_duplicate_tracks: int = 0
+    duplicate_credits: int = 0
+    largest_artist_id: Optional[int] = None
+    largest_artist_tracks: int = 0
+    generation_seconds: float = 0.0
+    index_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        rows = self.artists + self.albums + self.tracks + self.credits
+        return rows / self.generation_seconds if self.generation_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit en dictionnaire pour export"""
+        return {**asdict(self), 'rows_per_second': round(self.rows_per_second, 1)}
+
+
+class _WeightedChoice:
+    """Tirage pondéré en O(log n) (random.choices recalcule les cumuls à chaque appel)"""
+
+    __slots__ = ('values', 'cumulative', 'total')
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        self.values = list(values)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def __call__(self, rng: random.Random) -> Any:
+        return self.values[bisect(self.cumulative, rng.random() * self.total)]
+
+
+def _strip_accents(text: str) -> str:
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+
+class CatalogGenerator:
+    """
+    Génère un catalogue de N morceaux dans une base existante.
+
+    Les identifiants sont attribués à la suite des lignes déjà présentes :
+    plusieurs générations (graines différentes) peuvent se cumuler.
+    """
+
+    def __init__(self, seed: int = 42,
+                 featuring_rate: float = 0.22,
+                 variant_rate: float = 0.05,
+                 near_duplicate_rate: float = 0.03,
+                 duplicate_credit_rate: float = 0.02,
+                 median_tracks_per_artist: int = 60,
+                 max_tracks_per_artist: int = 3000,
+                 chunk_size: int = 50000):
+        self.seed = seed
+        self.config = {
+            'featuring_rate': featuring_rate,
+            'variant_rate': variant_rate,
+            'near_duplicate_rate': near_duplicate_rate,
+            'duplicate_credit_rate': duplicate_credit_rate,
+            'median_tracks_per_artist': median_tracks_per_artist,
+            'max_tracks_per_artist': max_tracks_per_artist,
+            'chunk_size': chunk_size
+        }
+        self.rng = random.Random(seed)
+        self._album_type = _WeightedChoice(_ALBUM_TYPES, [weight for _, weight, _ in _ALBUM_TYPES])
+        self._data_source = _WeightedChoice([s for s, _ in _DATA_SOURCES], [w for _, w in _DATA_SOURCES])
+
+    # ===== API =====
+
+    def generate(self, db_path: str, n_tracks: int, rebuild_indexes: bool = True) -> CatalogStats:
+        """
+        Insère n_tracks morceaux (et leurs artistes, albums, crédits).
+
+        Args:
+            db_path: Base SQLite dont le schéma existe (Database(db_path) au préalable)
+            n_tracks: Nombre de morceaux à générer
+            rebuild_indexes: Supprime les index secondaires pendant l'insertion
+                puis les reconstruit (bien plus rapide au-delà de ~100k lignes)
+
+        Returns:
+            Statistiques de la génération
+        """
+        stats = CatalogStats(seed=self.seed)
+        start = time.perf_counter()
+
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            # Base jetable : la durabilité n'a pas d'intérêt pendant le remplissage
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -200000")
+
+            indexes = self._drop_secondary_indexes(conn) if rebuild_indexes else []
+            conn.execute("BEGIN")
+            self._generate_rows(conn, n_tracks, stats)
+            conn.execute("COMMIT")
+
+            index_start = time.perf_counter()
+            for sql in indexes:
+                conn.execute(sql)
+            conn.execute("ANALYZE")
+            stats.index_seconds = round(time.perf_counter() - index_start, 3)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        stats.generation_seconds = round(time.perf_counter() - start, 3)
+        return stats
+
+    # ===== GÉNÉRATION =====
+
+    def _generate_rows(self, conn: sqlite3.Connection, n_tracks: int, stats: CatalogStats):
+        rng = self.rng
+        next_ids = {table: self._max_id(conn, table) + 1 for table in ('artists', 'albums', 'tracks', 'credits')}
+        genius_base = self._max_value(conn, 'tracks', 'genius_id') + 1
+
+        sizes = self._artist_sizes(n_tracks)
+        artist_names = self._artist_names(len(sizes), conn)
+        # Les artistes les plus cités en featuring sont les premiers (Zipf)
+        pick_artist = _WeightedChoice(artist_names, [1.0 / (rank + 1) for rank in range(len(artist_names))])
+        people = self._people(max(50, int(math.sqrt(n_tracks) * 4)))
+        pick_person = _WeightedChoice(people, [1.0 / (rank + 1) ** 0.9 for rank in range(len(people))])
+
+        buffers: Dict[str, List[tuple]] = {'artists': [], 'albums': [], 'tracks': [], 'credits': []}
+        chunk_size = self.config['chunk_size']
+
+        for size, artist_name in zip(sizes, artist_names):
+            artist_id = next_ids['artists']
+            next_ids['artists'] += 1
+            created = self._timestamp(rng.random() * 4 * 365 * 86400)
+            buffers['artists'].append((
+                artist_id, artist_name, 7000000 + artist_id if rng.random() < 0.85 else None,
+                self._spotify_id(rng) if rng.random() < 0.7 else None,
+                rng.choice(_GENRES), "FR" if rng.random() < 0.8 else rng.choice(["BE", "CH", "CA", "SN", "CI"]),
+                created, created
+            ))
+            stats.artists += 1
+            if size > stats.largest_artist_tracks:
+                stats.largest_artist_id, stats.largest_artist_tracks = artist_id, size
+
+            self._generate_artist_catalog(artist_id, artist_name, size, created, next_ids,
+                                          genius_base, pick_artist, pick_person, buffers, stats)
+
+            if len(buffers['tracks']) + len(buffers['credits']) >= chunk_size:
+                self._flush(conn, buffers)
+        self._flush(conn, buffers)
+
+    def _generate_artist_catalog(self, artist_id: int, artist_name: str, size: int, created: str,
+                                 next_ids: Dict[str, int], genius_base: int,
+                                 pick_artist: _WeightedChoice, pick_person: _WeightedChoice,
+                                 buffers: Dict[str, List[tuple]], stats: CatalogStats):
+        """Albums, morceaux et crédits d'un artiste"""
+        rng = self.rng
+        titles: List[str] = []
+        # Équipe habituelle de l'artiste : mêmes producteurs et ingénieurs d'un morceau à l'autre
+        team = [pick_person(rng) for _ in range(rng.randint(3, 8))]
+        first_year = rng.randint(1995, 2020)
+        albums_released = 0
+        remaining = size
+
+        while remaining > 0:
+            if rng.random() < 0.1:
+                album_id, album_title, album_tracks, year = None, None, 1, rng.randint(first_year, 2024)
+            else:
+                album_type, _, (low, high) = self._album_type(rng)
+                album_tracks = min(remaining, rng.randint(low, high))
+                album_id = next_ids['albums']
+                next_ids['albums'] += 1
+                album_title = self._title(rng)
+                year = min(2024, first_year + albums_released + rng.randint(0, 1))
+                albums_released += 1
+                buffers['albums'].append((
+                    album_id, album_title, artist_id, f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    year, album_type, rng.choice(_GENRES), rng.choice(_LABELS),
+                    self._spotify_id(rng) if rng.random() < 0.6 else None,
+                    album_tracks, None, created, created
+                ))
+                stats.albums += 1
+
+            for position in range(1, album_tracks + 1):
+                track_id = next_ids['tracks']
+                next_ids['tracks'] += 1
+                title, featured, kind = self._track_title(rng, titles, pick_artist, pick_person, artist_name)
+                titles.append(title)
+                if kind == 'variant':
+                    stats.variant_tracks += 1
+                elif kind == 'near_duplicate':
+                    stats.near_duplicate_tracks += 1
+                if featured:
+                    stats.featuring_tracks += 1
+
+                duration = int(rng.lognormvariate(5.3, 0.25)) if rng.random() < 0.95 else None
+                bpm = min(180, max(60, int(rng.gauss(92, 22)))) if rng.random() < 0.65 else None
+                key = f"{rng.choice(_KEYS)}{'m' if rng.random() < 0.6 else ''}" if rng.random() < 0.5 else None
+                genius_id = genius_base + track_id if rng.random() < 0.8 else None
+                buffers['tracks'].append((
+                    track_id, title, artist_id, artist_name, album_id, album_title,
+                    position if album_id else None, 1, genius_id,
+                    self._spotify_id(rng) if rng.random() < 0.6 else None,
+                    f"https://genius.com/songs/{genius_id}" if genius_id else None,
+                    duration, bpm, key, 1 if rng.random() < 0.7 else 0, None, created, created
+                ))
+                stats.tracks += 1
+
+                self._track_credits(rng, track_id, artist_name, featured, team, pick_person,
+                                    next_ids, buffers['credits'], stats, created)
+            remaining -= album_tracks
+
+    def _track_title(self, rng: random.Random, previous: List[str], pick_artist: _WeightedChoice,
+                     pick_person: _WeightedChoice, artist_name: str) -> Tuple[str, List[str], str]:
+        """Titre d'un morceau : nouveau, variante d'un précédent ou quasi-doublon"""
+        config = self.config
+        draw = rng.random()
+        if previous and draw < config['near_duplicate_rate']:
+            return self._near_duplicate(rng, rng.choice(previous)), [], 'near_duplicate'
+        if previous and draw < config['near_duplicate_rate'] + config['variant_rate']:
+            base = rng.choice(previous)
+            return base + rng.choice(_VARIANT_SUFFIXES).format(person=pick_person(rng)), [], 'variant'
+
+        title = self._title(rng)
+        featured: List[str] = []
+        if rng.random() < config['featuring_rate']:
+            for _ in range(1 if rng.random() < 0.75 else rng.randint(2, 3)):
+                name = pick_artist(rng)
+                if name != artist_name and name not in featured:
+                    featured.append(name)
+            if featured:
+                names = " & ".join(featured) if len(featured) < 3 else f"{', '.join(featured[:-1])} & {featured[-1]}"
+                title = rng.choice(_FEATURING_FORMATS).format(title=title, names=names)
+        return title, featured, 'original'
+
+    def _track_credits(self, rng: random.Random, track_id: int, artist_name: str, featured: List[str],
+                       team: List[str], pick_person: _WeightedChoice, next_ids: Dict[str, int],
+                       credits: List[tuple], stats: CatalogStats, created: str):
+        """Crédits d'un morceau selon le mélange de rôles"""
+        source = self._data_source(rng)
+        rows = []
+        for name in featured:
+            rows.append(("artist", "featuring", name, None, None, 0, 1))
+        for credit_type, category, probability, instrument in _CREDIT_ROLES:
+            if rng.random() >= probability:
+                continue
+            if credit_type in ("songwriter", "lyricist") and rng.random() < 0.6:
+                person = artist_name
+            else:
+                person = rng.choice(team) if rng.random() < 0.7 else pick_person(rng)
+            rows.append((category, credit_type, person, None, instrument, 1 if credit_type == "producer" else 0, 0))
+
+        if rows and rng.random() < self.config['duplicate_credit_rate']:
+            category, credit_type, person, detail, instrument, primary, featuring = rng.choice(rows)
+            variant = rng.choice([person, person.upper(), _strip_accents(person), person.replace(" ", "  ")])
+            rows.append((category, credit_type, variant, detail, instrument, primary, featuring))
+            stats.duplicate_credits += 1
+
+        for category, credit_type, person, detail, instrument, primary, featuring in rows:
+            credits.append((
+                next_ids['credits'], track_id, category, credit_type, person, detail, instrument,
+                primary, featuring, 1 if rng.random() < 0.01 else 0, source, created, created
+            ))
+            next_ids['credits'] += 1
+        stats.credits += len(rows)
+
+    # ===== VOCABULAIRE =====
+
+    def _artist_sizes(self, n_tracks: int) -> List[int]:
+        """Nombre de morceaux par artiste (log-normal, tronqué), somme exacte n_tracks"""
+        rng = self.rng
+        mu = math.log(self.config['median_tracks_per_artist'])
+        sizes: List[int] = []
+        total = 0
+        while total < n_tracks:
+            size = min(self.config['max_tracks_per_artist'], max(1, int(rng.lognormvariate(mu, 1.0))))
+            size = min(size, n_tracks - total)
+            sizes.append(size)
+            total += size
+        return sizes
+
+    def _artist_names(self, count: int, conn: sqlite3.Connection) -> List[str]:
+        """Noms uniques (contrainte UNIQUE de artists.name), absents de la base"""
+        rng = self.rng
+        taken = {row[0] for row in conn.execute("SELECT name FROM artists")}
+        names: List[str] = []
+        while len(names) < count:
+            if rng.random() < 0.4:
+                name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+            else:
+                syllables = "".join(rng.choice(_PSEUDO_SYLLABLES) for _ in range(rng.randint(2, 3)))
+                name = rng.choice(_PSEUDO_PREFIXES) + syllables.capitalize()
+            if name in taken:
+                name = f"{name} {len(names) + 2}"
+                if name in taken:
+                    continue
+            taken.add(name)
+            names.append(name)
+        return names
+
+    def _people(self, count: int) -> List[str]:
+        """Producteurs, ingénieurs et musiciens (noms ou pseudonymes)"""
+        rng = self.rng
+        people = []
+        seen = set()
+        while len(people) < count:
+            if rng.random() < 0.5:
+                name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+            else:
+                name = "".join(rng.choice(_PSEUDO_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+                if rng.random() < 0.3:
+                    name += rng.choice([" Beats", " Prod", "on the Track", " Music"])
+            if name not in seen:
+                seen.add(name)
+                people.append(name)
+        return people
+
+    @staticmethod
+    def _title(rng: random.Random) -> str:
+        words = [rng.choice(_TITLE_WORDS) for _ in range(rng.choice((1, 1, 2, 2, 3)))]
+        title = " ".join([words[0]] + [word.lower() for word in words[1:]])
+        article = rng.choice(_TITLE_ARTICLES)
+        if article:
+            # Élision devant une voyelle (accentuée ou non) ou un h muet
+            if _strip_accents(title[0]).lower() in 'aeiouh':
+                article = "L'" if article in ("La ", "Le ", "L'") else article
+            elif article == "L'":
+                article = "Le "
+            title = article + (title[0].lower() + title[1:])
+        return title
+
+    @staticmethod
+    def _near_duplicate(rng: random.Random, title: str) -> str:
+        """Titre presque identique : accents, casse, ponctuation ou coquille"""
+        mutation = rng.randrange(6)
+        if mutation == 0:
+            return _strip_accents(title)
+        if mutation == 1:
+            return title.upper() if rng.random() < 0.5 else title.lower()
+        if mutation == 2:
+            return title.replace("'", "’") if "'" in title else title + "!"
+        if mutation == 3:
+            return f" {title}  "
+        if mutation == 4 and len(title) > 3:
+            i = rng.randrange(len(title) - 1)
+            return title[:i] + title[i + 1] + title[i] + title[i + 2:]
+        return f"{title} Pt. 2"
+
+    @staticmethod
+    def _spotify_id(rng: random.Random) -> str:
+        # 22 caractères alphanumériques comme les IDs Spotify (base 36 d'un entier de 114 bits)
+        value = rng.getrandbits(114)
+        digits = []
+        for _ in range(22):
+            value, digit = divmod(value, 36)
+            digits.append(_SPOTIFY_ALPHABET[digit])
+        return "".join(digits)
+
+    @staticmethod
+    def _timestamp(offset_seconds: float) -> str:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(_EPOCH + offset_seconds))
+
+    # ===== SQLITE =====
+
+    @staticmethod
+    def _flush(conn: sqlite3.Connection, buffers: Dict[str, List[tuple]]):
+        """Insère les lignes en attente ; artistes et albums avant leurs morceaux"""
+        for table, columns in (('artists', _ARTIST_COLUMNS), ('albums', _ALBUM_COLUMNS),
+                               ('tracks', _TRACK_COLUMNS), ('credits', _CREDIT_COLUMNS)):
+            rows = buffers[table]
+            if rows:
+                conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    rows
+                )
+                rows.clear()
+
+    @staticmethod
+    def _drop_secondary_indexes(conn: sqlite3.Connection) -> List[str]:
+        """Supprime les index non uniques des tables remplies ; renvoie leur SQL de création"""
+        rows = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            "AND tbl_name IN ('artists', 'albums', 'tracks', 'credits')"
+        ).fetchall()
+        statements = []
+        for name, sql in rows:
+            if sql.upper().startswith("CREATE UNIQUE"):
+                continue
+            conn.execute(f'DROP INDEX "{name}"')
+            statements.append(sql)
+        return statements
+
+    @staticmethod
+    def _max_id(conn: sqlite3.Connection, table: str) -> int:
+        return conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+
+    @staticmethod
+    def _max_value(conn: sqlite3.Connection, table: str, column: str) -> int:
+        return conn.execute(f"SELECT COALESCE(MAX({column}), 0) FROM {table}").fetchone()[0]
+
+
+def generate_catalog(db_path: str, n_tracks: int, seed: int = 42, **options) -> CatalogStats:
+    """
+    Crée (ou complète) une base au schéma du projet et y génère n_tracks morceaux.
+
+    Args:
+        db_path: Chemin de la base SQLite
+        n_tracks: Nombre de morceaux
+        seed: Graine (même graine, même catalogue)
+        **options: Paramètres de CatalogGenerator (taux de featurings, etc.)
+    """
+    from core.database import Database
+
+    Database(str(db_path))  # Schéma et migrations
+    return CatalogGenerator(seed=seed, **options).generate(str(db_path), n_tracks)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Génère un catalogue synthétique dans une base SQLite")
+    parser.add_argument('--tracks', type=int, default=100000, help='Nombre de morceaux')
+    parser.add_argument('--db', type=Path, required=True, help='Base SQLite à remplir')
+    parser.add_argument('--seed', type=int, default=42, help='Graine du générateur')
+    args = parser.parse_args(argv)
+
+    stats = generate_catalog(str(args.db), args.tracks, seed=args.seed)
+    print(f"✅ {stats.tracks} morceaux, {stats.credits} crédits, {stats.albums} albums, "
+          f"{stats.artists} artistes en {stats.generation_seconds:.1f}s "
+          f"({stats.rows_per_second:,.0f} lignes/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
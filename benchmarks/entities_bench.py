@@ -0,0 +1,120 @@
+# benchmarks/entities_bench.py
+"""
+Mémoire et temps de construction des entités (models.entities) : Credit
+à slots contre l'équivalent à __dict__, constructeur contre construction
+en lot depuis des lignes SQLite (build_entities).
+
+Usage:
+    python -m benchmarks.entities_bench
+    python -m benchmarks.entities_bench --count 1000000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from models.entities import Credit, build_entities, normalize_search_name
+from models.enums import CreditType, DataSource
+
+
+def benchmark_entities(count: int = 100_000) -> Dict[str, Any]:
+    """
+    Mesure mémoire et temps de construction de crédits : entité à __dict__
+    (normalisation et timestamps calculés à la construction), constructeur
+    de l'entité à slots et construction en lot depuis des lignes.
+    
+    Args:
+        count: Nombre de crédits construits
+    
+    Returns:
+        Temps (s) et mémoire allouée (Mo) par méthode
+    """
+    def _legacy_post_init(credit):
+        current_time = datetime.now()
+        credit.created_at = credit.created_at or current_time
+        credit.updated_at = current_time
+        credit.normalized_name = credit.normalized_name or normalize_search_name(credit.person_name)
+
+    # Équivalent de Credit avant le passage aux slots, pour référence
+    LegacyCredit = make_dataclass(
+        'LegacyCredit',
+        [
+            (credit_field.name, credit_field.type,
+             field(default=credit_field.default) if credit_field.default is not MISSING
+             else field(default_factory=credit_field.default_factory))
+            for credit_field in fields(Credit)
+        ],
+        namespace={'__post_init__': _legacy_post_init}
+    )
+
+    rows = [
+        {
+            'id': index,
+            'track_id': index // 10,
+            'person_name': f"Producer {index % 500}",
+            'credit_type': CreditType.PRODUCER.value,
+            'is_primary': 0,
+            'data_source': DataSource.GENIUS.value
+        }
+        for index in range(count)
+    ]
+    columns = {
+        'id': 'id', 'track_id': 'track_id', 'person_name': 'person_name',
+        'credit_type': 'credit_type', 'is_primary': 'is_primary', 'source': 'data_source'
+    }
+    converters = {'credit_type': CreditType, 'is_primary': bool, 'source': DataSource}
+
+    def construct(entity_class):
+        return [
+            entity_class(
+                id=row['id'], track_id=row['track_id'], person_name=row['person_name'],
+                credit_type=CreditType(row['credit_type']), is_primary=bool(row['is_primary']),
+                source=DataSource(row['data_source'])
+            )
+            for row in rows
+        ]
+
+    def bulk():
+        return build_entities(Credit, rows, columns, converters)
+
+    results: Dict[str, Any] = {'count': count}
+    methods = (
+        ('dict_constructor', lambda: construct(LegacyCredit)),
+        ('constructor', lambda: construct(Credit)),
+        ('bulk', bulk)
+    )
+    for label, method in methods:
+        tracemalloc.start()
+        start = time.perf_counter()
+        entities = method()
+        elapsed = time.perf_counter() - start
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[label] = {
+            'seconds': round(elapsed, 4),
+            'memory_mb': round(allocated / (1024 * 1024), 2)
+        }
+        del entities
+
+    results['speedup'] = round(results['constructor']['seconds'] / max(results['bulk']['seconds'], 1e-9), 2)
+    results['memory_saved_mb'] = round(results['dict_constructor']['memory_mb'] - results['constructor']['memory_mb'], 2)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Mesure la construction des entités Credit")
+    parser.add_argument('--count', type=int, default=100_000, help='Nombre de crédits construits')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(benchmark_entities(args.count), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# benchmarks/logging_bench.py
+"""
+Coût du logging pendant une extraction : handlers synchrones contre file
+asynchrone (utils.logging_config.MusicDataLogger), et coût d'un appel
+DEBUG désactivé selon qu'il construit une f-string ou diffère ses arguments.
+
+Usage:
+    python -m benchmarks.logging_bench
+    python -m benchmarks.logging_bench --tracks 50000 --level DEBUG
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logging_config import MusicDataLogger
+
+
+def benchmark_logging(num_tracks: int = 10000, batch_size: int = 50,
+                      level: int = logging.INFO) -> Dict[str, Any]:
+    """
+    Rejoue les logs d'une extraction de num_tracks morceaux (une ligne INFO
+    et trois DEBUG par morceau, une ligne de progression par lot) avec des
+    handlers synchrones puis avec la file asynchrone, dans un répertoire
+    temporaire.
+    
+    Returns:
+        Temps passé dans le thread appelant, temps jusqu'à l'écriture
+        complète et pertes, par mode
+    """
+    def replay(logger: logging.Logger):
+        for index in range(num_tracks):
+            logger.info("🎵 Extraction %d/%d: %s", index + 1, num_tracks, f"Track {index}")
+            for source in ('genius', 'spotify', 'discogs'):
+                logger.debug("🔍 %s: données récupérées pour %s", source, index)
+            if (index + 1) % batch_size == 0:
+                logger.info("📈 extraction: %d/%d (%.1f%%)",
+                            index + 1, num_tracks, (index + 1) / num_tracks * 100)
+    
+    report: Dict[str, Any] = {'num_tracks': num_tracks, 'level': logging.getLevelName(level)}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mode, async_enabled in (('sync', False), ('async', True)):
+            manager = MusicDataLogger(logs_dir=Path(tmp_dir) / mode, async_enabled=async_enabled,
+                                      configure_main_logger=False)
+            manager.log_level = level
+            logger = manager.get_logger(f"benchmark_{mode}")
+            logger.setLevel(level)
+            
+            start = time.perf_counter()
+            replay(logger)
+            caller_seconds = time.perf_counter() - start
+            manager.flush_all_logs(timeout=60.0)
+            total_seconds = time.perf_counter() - start
+            
+            stats = manager.get_log_stats()
+            manager.shutdown()
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            
+            report[mode] = {
+                'caller_seconds': round(caller_seconds, 4),
+                'total_seconds': round(total_seconds, 4),
+                'caller_us_per_track': round(caller_seconds / num_tracks * 1e6, 2),
+                'dropped_records': stats.get('dropped_records', {}),
+                'batches_written': stats.get('batches_written', 0)
+            }
+    
+    # Coût d'un appel désactivé : f-string construite vs arguments différés
+    disabled = logging.getLogger('benchmark_disabled')
+    disabled.setLevel(logging.WARNING)
+    start = time.perf_counter()
+    for index in range(num_tracks):
+        disabled.debug(f"🔍 genius: données récupérées pour {index} ({index / num_tracks:.2%})")
+    eager = time.perf_counter() - start
+    start = time.perf_counter()
+    for index in range(num_tracks):
+        disabled.debug("🔍 genius: données récupérées pour %s (%.2f%%)", index, index / num_tracks)
+    lazy = time.perf_counter() - start
+    report['disabled_debug'] = {'fstring_seconds': round(eager, 4), 'lazy_seconds': round(lazy, 4)}
+    
+    if report['async']['caller_seconds']:
+        report['caller_speedup'] = round(
+            report['sync']['caller_seconds'] / report['async']['caller_seconds'], 2
+        )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare le logging synchrone et asynchrone")
+    parser.add_argument('--tracks', type=int, default=10000, help='Nombre de morceaux simulés')
+    parser.add_argument('--batch-size', type=int, default=50, help='Morceaux par ligne de progression')
+    parser.add_argument('--level', default='INFO', help='Niveau des loggers mesurés')
+    args = parser.parse_args(argv)
+
+    report = benchmark_logging(args.tracks, args.batch_size, getattr(logging, args.level.upper()))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,264 @@
+# benchmarks/scaling.py
+"""
+Montée en charge des sous-systèmes sur catalogues synthétiques.
+
+Pour chaque taille N (10k, 100k, 1M morceaux par défaut), un processus
+dédié génère le catalogue (benchmarks.catalog_generator) dans un
+répertoire de données vierge puis chronomètre :
+
+- Database : statistiques, morceaux et tables colonnaires, recherche ;
+- DuplicateDetector : doublons de morceaux et de crédits ;
+- QualityChecker : métriques globales et par artiste ;
+- exports JSON et CSV (ExportManager).
+
+Les opérations par artiste portent sur l'artiste le plus prolifique du
+catalogue. Entre deux tailles, l'exposant d'échelle de chaque opération
+(log(t2/t1) / log(N2/N1) : 1 = linéaire, 2 = quadratique) est calculé.
+
+Usage:
+    python -m benchmarks.scaling
+    python -m benchmarks.scaling --sizes 10000 100000 --output scaling.json
+    python -m benchmarks.scaling --baseline benchmarks/scaling_baseline.json
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.suite import (
+    DEFAULT_TOLERANCE, PROJECT_ROOT, compare_to_baseline, db_size_mb, peak_rss_mb
+)
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+
+# Sous ce seuil, l'exposant d'échelle n'est pas significatif
+_MIN_EXPONENT_SECONDS = 0.01
+
+
+# ===== WORKER =====
+
+def _timed(phases: Dict[str, float], errors: Dict[str, str], name: str, operation: Callable[[], Any]) -> Any:
+    """Chronomètre une opération ; une erreur est notée sans interrompre les suivantes"""
+    start = time.perf_counter()
+    try:
+        result = operation()
+    except Exception as e:
+        errors[name] = f"{type(e).__name__}: {e}"
+        return None
+    phases[name] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_worker(size: int, seed: int) -> Dict[str, Any]:
+    """
+    Génère un catalogue de size morceaux et mesure chaque sous-système.
+
+    Appelé dans un processus dédié (MDE_DATA_DIR vierge) : le catalogue est
+    écrit dans la base par défaut, celle qu'ouvrent aussi les composants
+    instanciant leur propre Database.
+    """
+    from benchmarks.catalog_generator import generate_catalog
+    from config.settings import settings
+    from core.database import Database
+
+    db_path = settings.data_dir / "music_data.db"
+    catalog = generate_catalog(str(db_path), size, seed=seed)
+    database = Database(str(db_path))
+    artist_id = catalog.largest_artist_id
+
+    phases: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+
+    # Database
+    _timed(phases, errors, 'db.stats', lambda: database.get_stats())
+    _timed(phases, errors, 'db.stats_artist', lambda: database.get_stats(artist_id))
+    tracks = _timed(phases, errors, 'db.tracks_artist', lambda: database.get_tracks_by_artist(artist_id))
+    _timed(phases, errors, 'db.track_table', lambda: database.get_track_table())
+    _timed(phases, errors, 'db.credit_table_artist', lambda: database.get_credit_table(artist_id))
+    _timed(phases, errors, 'db.search', lambda: database.search_tracks('vertige'))
+
+    # DuplicateDetector
+    def detector():
+        from processors.duplicate_detector import DuplicateDetector
+        return DuplicateDetector(database)
+
+    _timed(phases, errors, 'duplicates.tracks_artist',
+           lambda: detector().detect_track_duplicates(artist_id))
+    _timed(phases, errors, 'duplicates.credits_artist',
+           lambda: detector().detect_credit_duplicates([track.id for track in tracks or []]))
+
+    # QualityChecker
+    def checker():
+        from processors.quality_checker import QualityChecker
+        quality_checker = QualityChecker()
+        quality_checker.database = database
+        return quality_checker
+
+    _timed(phases, errors, 'quality.metrics', lambda: checker().calculate_quality_metrics())
+    _timed(phases, errors, 'quality.metrics_artist', lambda: checker().calculate_quality_metrics(artist_id))
+
+    # Exports
+    def export(export_format: str):
+        from utils.export_utils import ExportManager
+        artist = database.get_artist_by_id(artist_id)
+        albums = database.get_albums_by_artist(artist_id)
+        return ExportManager().export_artist_data(artist, tracks or [], albums, export_format)
+
+    _timed(phases, errors, 'export.json', lambda: export('json'))
+    _timed(phases, errors, 'export.csv', lambda: export('csv'))
+
+    return {
+        'size': size,
+        'seed': seed,
+        'catalog': catalog.to_dict(),
+        'wall_seconds': round(sum(phases.values()), 3),
+        'peak_rss_mb': peak_rss_mb(),
+        'db_size_mb': db_size_mb(db_path),
+        'phases': phases,
+        'errors': errors
+    }
+
+
+# ===== ORCHESTRATION =====
+
+def _run_size(size: int, seed: int) -> Dict[str, Any]:
+    """Lance le worker d'une taille dans un processus et un répertoire vierges"""
+    with tempfile.TemporaryDirectory(prefix=f'mde_scaling_{size}_') as workdir:
+        output = Path(workdir) / 'result.json'
+        env = {**os.environ, 'MDE_DATA_DIR': workdir}
+        command = [sys.executable, '-m', 'benchmarks.scaling', '--worker',
+                   '--size', str(size), '--seed', str(seed), '--output', str(output)]
+        completed = subprocess.run(command, cwd=str(PROJECT_ROOT), env=env,
+                                   capture_output=True, text=True)
+        if completed.returncode != 0 or not output.exists():
+            return {'size': size, 'error': completed.stderr.strip().splitlines()[-20:]}
+        with open(output, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def scaling_exponents(results: Sequence[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Exposant d'échelle de chaque opération entre tailles successives.
+
+    Returns:
+        Par opération : liste de {'from', 'to', 'exponent'}
+    """
+    valid = sorted((entry for entry in results if 'error' not in entry), key=lambda entry: entry['size'])
+    exponents: Dict[str, List[Dict[str, Any]]] = {}
+    for previous, current in zip(valid, valid[1:]):
+        size_ratio = math.log(current['size'] / previous['size'])
+        for phase, seconds in current['phases'].items():
+            before = previous['phases'].get(phase)
+            if not before or max(before, seconds) < _MIN_EXPONENT_SECONDS:
+                continue
+            exponents.setdefault(phase, []).append({
+                'from': previous['size'], 'to': current['size'],
+                'exponent': round(math.log(seconds / before) / size_ratio, 2)
+            })
+    return exponents
+
+
+def run_scaling(sizes: Sequence[int] = DEFAULT_SIZES, seed: int = 42,
+                baseline: Optional[Dict[str, Any]] = None,
+                tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """
+    Mesure chaque sous-système pour chaque taille de catalogue.
+
+    Returns:
+        Rapport (résultats par taille, exposants d'échelle, régressions éventuelles)
+    """
+    results = [_run_size(size, seed) for size in sizes]
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'results': results,
+        'exponents': scaling_exponents(results)
+    }
+    if baseline:
+        report['regressions'] = compare_to_baseline(report, baseline, tolerance)
+    return report
+
+
+def _print_report(report: Dict[str, Any]):
+    results = [entry for entry in report['results'] if 'error' not in entry]
+    for entry in report['results']:
+        if 'error' in entry:
+            print(f"❌ Taille {entry['size']}: échec du worker")
+            for line in entry['error']:
+                print(f"   {line}")
+
+    if results:
+        print(f"\n{'opération':<28}" + "".join(f"{entry['size']:>12}" for entry in results) + "   exposant")
+        generation = [entry['catalog']['generation_seconds'] for entry in results]
+        print(f"{'génération':<28}" + "".join(f"{seconds:>11.2f}s" for seconds in generation))
+        phases = list(dict.fromkeys(phase for entry in results
+                                    for phase in list(entry['phases']) + list(entry['errors'])))
+        for phase in phases:
+            cells = []
+            for entry in results:
+                seconds = entry['phases'].get(phase)
+                cells.append(f"{seconds:>11.3f}s" if seconds is not None else f"{'erreur':>12}")
+            exponents = report['exponents'].get(phase, [])
+            print(f"{phase:<28}" + "".join(cells) + "   " + " ".join(f"{e['exponent']:.2f}" for e in exponents))
+
+        errors = {phase: message for entry in results for phase, message in entry['errors'].items()}
+        for phase, message in errors.items():
+            print(f"⚠️ {phase}: {message}")
+
+    for regression in report.get('regressions', []):
+        if regression['change'] is None:
+            print(f"⚠️ Régression taille {regression['size']}: le worker a échoué")
+        else:
+            print(f"⚠️ Régression taille {regression['size']} - {regression['metric']}: "
+                  f"{regression['baseline']} -> {regression['current']} ({regression['change']:+.0%})")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Montée en charge sur catalogues synthétiques")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Nombres de morceaux des catalogues')
+    parser.add_argument('--seed', type=int, default=42, help='Graine du générateur')
+    parser.add_argument('--baseline', type=Path, help='Rapport de référence à comparer')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Dégradation relative tolérée (0.15 = 15 %%)')
+    parser.add_argument('--output', type=Path, help='Fichier du rapport JSON')
+    parser.add_argument('--update-baseline', type=Path, help='Écrit le rapport comme nouvelle référence')
+    # Mode interne : exécution d'une taille dans le processus isolé
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        result = run_worker(args.size, args.seed)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        return 0
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = run_scaling(args.sizes, args.seed, baseline, args.tolerance)
+    _print_report(report)
+
+    for path in (args.output, args.update_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    failed = any('error' in entry for entry in report['results'])
+    return 1 if report.get('regressions') or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
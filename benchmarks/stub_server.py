@@ -0,0 +1,568 @@
+# benchmarks/stub_server.py
+"""
+Serveur HTTP local rejouant les réponses enregistrées des APIs et sites.
+
+Les gabarits de benchmarks/fixtures (réponses réelles anonymisées) sont
+déclinés pour un artiste synthétique dont le nombre de morceaux fixe la
+taille du benchmark : « Artiste Benchmark 1000 » expose 1000 morceaux sur
+Genius, avec les albums, crédits et métadonnées correspondants sur les
+autres sources. Tout est déterministe (graine fixe) : deux exécutions
+envoient exactement les mêmes réponses.
+
+Les extracteurs sont redirigés vers ce serveur par les clés
+apis.<source>.base_url des settings.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import unicodedata
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+ARTIST_PREFIX = "Artiste Benchmark"
+
+# Identifiants Genius synthétiques : hors de la plage des vrais artistes
+_GENIUS_ARTIST_BASE = 900000
+_SONG_ID_FACTOR = 100000
+
+# Titres : mots inventés, syllabes tirées au hasard. Des mots du dictionnaire
+# partagés par deux titres suffisent à les rendre quasi-doublons pour la
+# déduplication floue de la découverte (similarité de caractères)
+_TITLE_SYLLABLES = [
+    "ba", "ko", "ri", "zu", "ma", "lé", "no", "sa", "ti", "vé", "da", "mi", "ro", "ka",
+    "nu", "pé", "lo", "ga", "si", "fa", "bé", "to", "ra", "dé", "mo", "ly", "zo", "ké",
+    "ni", "va", "xo", "ju", "wa", "qué", "chi", "gno", "tra", "pla", "cro", "fré"
+]
+_TITLE_WORD_COUNT = 3
+_WORD_SYLLABLE_COUNT = 3
+_FEATURED_ARTISTS = [
+    "Alpha Wann", "Georgio", "Lomepal", "Népal", "Clément Bazin", "Hélène Ségara",
+    "Josman", "Laylow", "Zélie", "Chilla", "Médine", "Sofiane Pamart"
+]
+_PRODUCERS = ["Diabi", "Hugz Hefner", "Stwo", "Ikaz Boi", "Pyroman", "Myth Syzer", "Kezah", "Éloi"]
+_KEYS = ["C Major", "C♯ Minor", "D Major", "E♭ Minor", "F Major", "F♯ Minor", "G Major", "A Minor", "B♭ Major"]
+
+
+def slugify(text: str) -> str:
+    """Slug ASCII utilisé dans les URLs des pages HTML"""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', ascii_text.lower()).strip('-')
+
+
+def _stable_int(*parts: Any) -> int:
+    """Entier stable entre exécutions (hash() est randomisé par processus)"""
+    digest = hashlib.blake2b('|'.join(str(p) for p in parts).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+class FixtureLibrary:
+    """
+    Déclinaison déterministe des réponses enregistrées.
+
+    Les morceaux d'un artiste sont générés une fois (titres accentués,
+    ~20 % de featurings, ~5 % de remixes) puis servis par toutes les
+    routes : un même morceau a le même titre, album et crédits partout.
+    """
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR, seed: int = 42):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.seed = seed
+        self._json: Dict[str, Dict[str, Any]] = {}
+        self._templates: Dict[str, Template] = {}
+        self._catalogs: Dict[int, List[Dict[str, Any]]] = {}
+        self._title_index: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+        for path in sorted(self.fixtures_dir.glob('*.json')):
+            with open(path, encoding='utf-8') as f:
+                self._json[path.stem] = json.load(f)
+        for path in sorted(self.fixtures_dir.glob('*.html')):
+            self._templates[path.stem] = Template(path.read_text(encoding='utf-8'))
+
+    # ===== CATALOGUE =====
+
+    @staticmethod
+    def artist_name(size: int) -> str:
+        return f"{ARTIST_PREFIX} {size}"
+
+    @staticmethod
+    def size_from_name(name: str) -> Optional[int]:
+        match = re.search(rf'{ARTIST_PREFIX}\s+(\d+)', name or '', re.IGNORECASE)
+        return int(match.group(1)) if match else None
+
+    def catalog(self, size: int) -> List[Dict[str, Any]]:
+        """Morceaux de l'artiste de taille donnée (générés une seule fois)"""
+        with self._lock:
+            tracks = self._catalogs.get(size)
+            if tracks is None:
+                tracks = self._catalogs[size] = self._build_catalog(size)
+                self._title_index[size] = {slugify(t['title']): t for t in tracks}
+            return tracks
+
+    def _build_catalog(self, size: int) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:{size}")
+        artist_id = _GENIUS_ARTIST_BASE + size
+        album_count = max(1, size // 14)
+        tracks = []
+        used_titles: Set[str] = set()
+
+        for index in range(size):
+            title = self._distinct_title(rng, used_titles)
+            featured = rng.sample(_FEATURED_ARTISTS, rng.randint(1, 2)) if rng.random() < 0.2 else []
+            if rng.random() < 0.05:
+                title += f" (Remix {rng.choice(_PRODUCERS)})"
+            album_index = index % album_count
+            tracks.append({
+                'index': index,
+                'genius_id': artist_id * _SONG_ID_FACTOR + index,
+                'title': title,
+                'featured': featured,
+                'producers': rng.sample(_PRODUCERS, rng.randint(1, 3)),
+                'album': f"Album {album_index + 1}",
+                'album_index': album_index,
+                'track_number': index // album_count + 1,
+                'year': 2010 + album_index % 14,
+                'duration_ms': rng.randint(120000, 300000),
+                'bpm': round(rng.uniform(70, 160)),
+                'key': rng.choice(_KEYS),
+                'features': {
+                    'energy': round(rng.random(), 3),
+                    'danceability': round(rng.random(), 3),
+                    'valence': round(rng.random(), 3)
+                }
+            })
+        return tracks
+
+    @staticmethod
+    def _distinct_title(rng: random.Random, used_titles: Set[str]) -> str:
+        """Titre de mots inventés, jamais deux fois le même dans un catalogue"""
+        while True:
+            words = ["".join(rng.choice(_TITLE_SYLLABLES) for _ in range(_WORD_SYLLABLE_COUNT))
+                     for _ in range(_TITLE_WORD_COUNT)]
+            title = " ".join([words[0].capitalize()] + words[1:])
+            if title not in used_titles:
+                used_titles.add(title)
+                return title
+
+    def find_track(self, title: str, artist: str = '') -> Optional[Dict[str, Any]]:
+        """Retrouve un morceau synthétique par titre (et artiste si connu)"""
+        size = self.size_from_name(artist)
+        sizes = [size] if size is not None else list(self._catalogs)
+        wanted = slugify(title)
+        for candidate_size in sizes:
+            self.catalog(candidate_size)
+            track = self._title_index[candidate_size].get(wanted)
+            if track:
+                return {**track, 'size': candidate_size}
+        return None
+
+    def track_by_song_id(self, song_id: int) -> Optional[Dict[str, Any]]:
+        artist_id, index = divmod(song_id, _SONG_ID_FACTOR)
+        size = artist_id - _GENIUS_ARTIST_BASE
+        if size <= 0:
+            return None
+        tracks = self.catalog(size)
+        return {**tracks[index], 'size': size} if index < len(tracks) else None
+
+    # ===== DÉCLINAISONS =====
+
+    def genius_song(self, track: Dict[str, Any]) -> Dict[str, Any]:
+        size = track['size']
+        song = json.loads(json.dumps(self._json['genius_song']))
+        path = f"/{slugify(self.artist_name(size))}-{slugify(track['title'])}-lyrics"
+        song.update({
+            'id': track['genius_id'],
+            'api_path': f"/songs/{track['genius_id']}",
+            'title': track['title'],
+            'full_title': f"{track['title']} by {self.artist_name(size)}",
+            'title_with_featured': track['title'] + (
+                f" (Ft. {' & '.join(track['featured'])})" if track['featured'] else ''),
+            'path': path,
+            'url': f"https://genius.com{path}",
+            'release_date_components': {'year': track['year'], 'month': 6, 'day': 8},
+            'featured_artists': [
+                {'id': _stable_int('feat', name) % 100000, 'name': name,
+                 'api_path': f"/artists/{_stable_int('feat', name) % 100000}"}
+                for name in track['featured']
+            ],
+            'primary_artist': {
+                **song['primary_artist'],
+                'id': _GENIUS_ARTIST_BASE + size,
+                'api_path': f"/artists/{_GENIUS_ARTIST_BASE + size}",
+                'name': self.artist_name(size),
+                'url': f"https://genius.com/artists/{quote(self.artist_name(size))}"
+            }
+        })
+        song['stats']['pageviews'] = 1000 + _stable_int('views', track['genius_id']) % 500000
+        return song
+
+    def spotify_track(self, track: Dict[str, Any]) -> Dict[str, Any]:
+        data = json.loads(json.dumps(self._json['spotify_track']))
+        track_id = f"bench{track['genius_id']}"
+        artists = [{'id': f"benchartist{track['size']}", 'name': self.artist_name(track['size']),
+                    'type': 'artist'}]
+        artists += [{'id': f"feat{_stable_int('feat', name) % 100000}", 'name': name, 'type': 'artist'}
+                    for name in track['featured']]
+        data.update({
+            'id': track_id, 'uri': f"spotify:track:{track_id}", 'name': track['title'],
+            'artists': artists, 'duration_ms': track['duration_ms'],
+            'track_number': track['track_number'],
+            'external_ids': {'isrc': f"FRBEN{track['genius_id'] % 10 ** 7:07d}"}
+        })
+        data['album'].update({
+            'id': f"benchalbum{track['size']}x{track['album_index']}",
+            'name': track['album'], 'artists': artists[:1],
+            'release_date': f"{track['year']}-06-08"
+        })
+        return data
+
+    def spotify_features(self, track: Dict[str, Any]) -> Dict[str, Any]:
+        data = dict(self._json['spotify_audio_features'])
+        data.update(track['features'])
+        data.update({'id': f"bench{track['genius_id']}", 'tempo': float(track['bpm']),
+                     'duration_ms': track['duration_ms']})
+        return data
+
+    def lastfm_track(self, track: Dict[str, Any]) -> Dict[str, Any]:
+        data = json.loads(json.dumps(self._json['lastfm_track_info']))
+        info = data['track']
+        info.update({'name': track['title'], 'duration': str(track['duration_ms']),
+                     'listeners': str(_stable_int('listeners', track['genius_id']) % 100000),
+                     'playcount': str(_stable_int('plays', track['genius_id']) % 1000000)})
+        info['artist']['name'] = self.artist_name(track['size'])
+        info['album'].update({'artist': self.artist_name(track['size']), 'title': track['album']})
+        return data
+
+    def discogs_release(self, size: int, album_index: int) -> Dict[str, Any]:
+        data = json.loads(json.dumps(self._json['discogs_release']))
+        tracks = [t for t in self.catalog(size) if t['album_index'] == album_index]
+        data.update({
+            'id': self.discogs_release_id(size, album_index),
+            'title': f"Album {album_index + 1}",
+            'year': tracks[0]['year'] if tracks else 2015,
+            'artists': [{**data['artists'][0], 'name': self.artist_name(size)}],
+            'tracklist': [
+                {'position': str(t['track_number']), 'type_': 'track', 'title': t['title'],
+                 'duration': f"{t['duration_ms'] // 60000}:{t['duration_ms'] // 1000 % 60:02d}",
+                 'extraartists': [{'id': _stable_int('prod', p) % 100000, 'name': p, 'role': 'Producer'}
+                                  for p in t['producers']]
+                                 + [{'id': _stable_int('feat', f) % 100000, 'name': f, 'role': 'Featuring'}
+                                    for f in t['featured']]}
+                for t in tracks
+            ]
+        })
+        return data
+
+    @staticmethod
+    def discogs_release_id(size: int, album_index: int) -> int:
+        return size * 1000 + album_index
+
+    def render(self, template: str, **values: Any) -> str:
+        return self._templates[template].safe_substitute(**values)
+
+    # ===== ROUTAGE =====
+
+    def respond(self, service: str, path: str, query: Dict[str, str],
+                method: str = 'GET') -> Tuple[int, str, str]:
+        """
+        Réponse d'une requête rejouée.
+
+        Returns:
+            Tuple (code HTTP, content-type, corps)
+        """
+        handler = getattr(self, f"_route_{service}", None)
+        result = handler(path.strip('/'), query, method) if handler else None
+        if result is None:
+            return 404, 'application/json', json.dumps({'error': 'not found', 'path': path})
+        if isinstance(result, str):
+            return 200, 'text/html; charset=utf-8', result
+        return 200, 'application/json', json.dumps(result, ensure_ascii=False)
+
+    def _route_genius(self, path: str, query: Dict[str, str], method: str) -> Any:
+        if path == 'search':
+            size = self.size_from_name(query.get('q', ''))
+            if size is None:
+                return {'meta': {'status': 200}, 'response': {'hits': []}}
+            matches = self.catalog(size)
+            track = self.find_track(query['q'], self.artist_name(size)) if ' - ' in query['q'] else None
+            hits = [track] if track else [{**t, 'size': size} for t in matches[:10]]
+            return {'meta': {'status': 200}, 'response': {
+                'hits': [{'type': 'song', 'result': self.genius_song(t)} for t in hits]}}
+
+        match = re.fullmatch(r'artists/(\d+)/songs', path)
+        if match:
+            size = int(match.group(1)) - _GENIUS_ARTIST_BASE
+            per_page = min(int(query.get('per_page', 20)), 50)
+            page = max(int(query.get('page', 1)), 1)
+            tracks = self.catalog(size) if size > 0 else []
+            chunk = tracks[(page - 1) * per_page:page * per_page]
+            next_page = page + 1 if page * per_page < len(tracks) else None
+            return {'meta': {'status': 200}, 'response': {
+                'songs': [self.genius_song({**t, 'size': size}) for t in chunk],
+                'next_page': next_page}}
+
+        match = re.fullmatch(r'songs/(\d+)', path)
+        if match:
+            track = self.track_by_song_id(int(match.group(1)))
+            if track:
+                return {'meta': {'status': 200}, 'response': {'song': self.genius_song(track)}}
+        return None
+
+    def _route_spotify(self, path: str, query: Dict[str, str], method: str) -> Any:
+        if path.endswith('api/token'):
+            return {'access_token': 'benchmark-token', 'token_type': 'Bearer', 'expires_in': 3600}
+        path = path[len('v1/'):] if path.startswith('v1/') else path
+
+        if path == 'search':
+            text = query.get('q', '')
+            artist_match = re.search(r'artist:"?([^"]+)"?', text)
+            track_match = re.search(r'track:"?([^"]+?)"?(?:\s+artist:|$)', text)
+            artist = artist_match.group(1) if artist_match else text
+            size = self.size_from_name(artist)
+            if query.get('type', 'track').startswith('artist'):
+                items = [{'id': f"benchartist{size}", 'name': self.artist_name(size), 'type': 'artist',
+                          'genres': ['french hip hop'], 'popularity': 50,
+                          'followers': {'total': 1000 * (size or 1)}}] if size else []
+                return {'artists': {'items': items, 'total': len(items)}}
+            track = self.find_track(track_match.group(1) if track_match else text, artist)
+            items = [self.spotify_track(track)] if track else []
+            return {'tracks': {'items': items, 'total': len(items)}}
+
+        match = re.fullmatch(r'artists/benchartist(\d+)/(albums|top-tracks)', path)
+        if match:
+            size = int(match.group(1))
+            tracks = [{**t, 'size': size} for t in self.catalog(size)]
+            if match.group(2) == 'top-tracks':
+                return {'tracks': [self.spotify_track(t) for t in tracks[:10]]}
+            albums = {t['album_index']: self.spotify_track(t)['album'] for t in tracks}
+            limit, offset = int(query.get('limit', 50)), int(query.get('offset', 0))
+            items = list(albums.values())[offset:offset + limit]
+            return {'items': items, 'total': len(albums),
+                    'next': None if offset + limit >= len(albums) else 'more'}
+
+        match = re.fullmatch(r'albums/benchalbum(\d+)x(\d+)(/tracks)?', path)
+        if match:
+            size, album_index = int(match.group(1)), int(match.group(2))
+            tracks = [self.spotify_track({**t, 'size': size}) for t in self.catalog(size)
+                      if t['album_index'] == album_index]
+            if match.group(3):
+                return {'items': tracks, 'total': len(tracks), 'next': None}
+            return {**tracks[0]['album'], 'tracks': {'items': tracks}} if tracks else None
+
+        if path.startswith('audio-features'):
+            ids = query.get('ids', path.rpartition('/')[2]).split(',')
+            features = []
+            for track_id in ids:
+                track = self.track_by_song_id(int(track_id[5:])) if track_id.startswith('bench') else None
+                features.append(self.spotify_features(track) if track else None)
+            return {'audio_features': features} if 'ids' in query else features[0]
+
+        match = re.fullmatch(r'tracks/bench(\d+)', path)
+        if match:
+            track = self.track_by_song_id(int(match.group(1)))
+            return self.spotify_track(track) if track else None
+        return None
+
+    def _route_lastfm(self, path: str, query: Dict[str, str], method: str) -> Any:
+        api_method = query.get('method', '')
+        artist = query.get('artist', '')
+        if api_method == 'track.getInfo':
+            track = self.find_track(query.get('track', ''), artist)
+            return self.lastfm_track(track) if track else {'error': 6, 'message': 'Track not found'}
+        if api_method == 'album.getInfo':
+            return {'album': {'name': query.get('album', ''), 'artist': artist,
+                              'listeners': '1200', 'playcount': '34000', 'tracks': {'track': []}}}
+        if api_method == 'artist.getInfo':
+            return {'artist': {'name': artist, 'stats': {'listeners': '50000', 'playcount': '900000'},
+                               'tags': {'tag': [{'name': 'french rap'}]}}}
+        if api_method == 'chart.getTopTracks':
+            return {'tracks': {'track': []}}
+        return None
+
+    def _route_discogs(self, path: str, query: Dict[str, str], method: str) -> Any:
+        if path == 'database/search':
+            track = self.find_track(query.get('track', '') or query.get('q', ''), query.get('artist', ''))
+            size = track['size'] if track else self.size_from_name(query.get('artist', '') or query.get('q', ''))
+            if size is None:
+                return {'results': [], 'pagination': {'items': 0, 'pages': 0}}
+            album_indexes = [track['album_index']] if track else range(min(5, max(1, size // 14)))
+            results = [{'id': self.discogs_release_id(size, i), 'type': 'release',
+                        'title': f"{self.artist_name(size)} - Album {i + 1}", 'year': str(2010 + i % 14),
+                        'resource_url': f"/releases/{self.discogs_release_id(size, i)}"}
+                       for i in album_indexes]
+            return {'results': results, 'pagination': {'items': len(results), 'pages': 1}}
+
+        match = re.fullmatch(r'(releases|masters)/(\d+)', path)
+        if match:
+            size, album_index = divmod(int(match.group(2)), 1000)
+            return self.discogs_release(size, album_index) if size else None
+
+        match = re.fullmatch(r'artists/(\d+)', path)
+        if match:
+            return {'id': int(match.group(1)), 'name': query.get('name', 'Artiste'), 'profile': ''}
+        return None
+
+    def _route_rapedia(self, path: str, query: Dict[str, str], method: str) -> Any:
+        if path in ('', 'rechercher'):
+            text = query.get('q', '') or query.get('s', '')
+            size = self.size_from_name(text)
+            track = self.find_track(text) if text and size is None else None
+            results = ''
+            if size is not None:
+                artist = self.artist_name(size)
+                results = (f'    <div class="search-result"><a href="/rapedia/artiste/{slugify(artist)}">'
+                           f'{artist}</a></div>')
+            elif track:
+                results = (f'    <div class="search-result"><a href="/rapedia/morceau/{slugify(track["title"])}'
+                           f'-{track["genius_id"]}">{track["title"]} - {self.artist_name(track["size"])}</a></div>')
+            return self.render('rapedia_search', query=text, results=results)
+
+        match = re.fullmatch(r'artiste/([a-z0-9-]+)', path)
+        if match:
+            size = self.size_from_name(match.group(1).replace('-', ' '))
+            if size is None:
+                return None
+            items = [f'      <li class="track-item"><a href="/rapedia/morceau/{slugify(t["title"])}'
+                     f'-{t["genius_id"]}">{t["title"]}</a></li>' for t in self.catalog(size)]
+            return self.render('rapedia_artist', artist=self.artist_name(size), tracks='\n'.join(items))
+
+        match = re.fullmatch(r'morceau/.*-(\d+)', path)
+        if match:
+            track = self.track_by_song_id(int(match.group(1)))
+            if not track:
+                return None
+            credits = [f'      <li><span class="role">Producteur</span> : <a>{p}</a></li>' for p in track['producers']]
+            credits += [f'      <li><span class="role">Featuring</span> : <a>{f}</a></li>' for f in track['featured']]
+            artist = self.artist_name(track['size'])
+            return self.render('rapedia_track', title=track['title'], artist=artist,
+                               artist_slug=slugify(artist), album=track['album'],
+                               album_slug=slugify(track['album']),
+                               release_date=f"08/06/{track['year']}", credits='\n'.join(credits))
+        return None
+
+    def _route_tunebat(self, path: str, query: Dict[str, str], method: str) -> Any:
+        if path.lower() == 'search':
+            text = query.get('q', '')
+            # Requête « Artiste Titre » : le titre suit le nom de l'artiste
+            title = re.sub(rf'^{ARTIST_PREFIX}\s+\d+\s*', '', text, flags=re.IGNORECASE)
+            track = self.find_track(title, text)
+            results = ''
+            if track:
+                # Libellé « Artiste - Titre » : c'est ce que TuneBatScraper découpe
+                results = (f'  <div class="search-result"><a href="/tunebat/Info/{slugify(track["title"])}'
+                           f'/{track["genius_id"]}">{self.artist_name(track["size"])} - {track["title"]}</a></div>')
+            return self.render('tunebat_search', query=text, results=results)
+
+        match = re.fullmatch(r'Info/[^/]+/(\d+)', path)
+        if match:
+            track = self.track_by_song_id(int(match.group(1)))
+            if not track:
+                return None
+            seconds = track['duration_ms'] // 1000
+            return self.render('tunebat_track', title=track['title'], artist=self.artist_name(track['size']),
+                               key=track['key'], bpm=track['bpm'], duration=f"{seconds // 60}:{seconds % 60:02d}",
+                               **{name: round(value * 100) for name, value in track['features'].items()})
+        return None
+
+
+def service_base_urls(stub_url: str) -> Dict[str, str]:
+    """Valeurs des clés de settings redirigeant chaque source vers le serveur"""
+    urls = {f'apis.{service}.base_url': f"{stub_url}/{service}" for service in StubAPIServer.SERVICES}
+    urls['apis.spotify.base_url'] = f"{stub_url}/spotify/v1"
+    urls['apis.spotify.auth_url'] = f"{stub_url}/spotify/api/token"
+    urls['apis.lastfm.base_url'] = f"{stub_url}/lastfm/2.0/"
+    return urls
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Route /<source>/<chemin> vers la FixtureLibrary du serveur"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._reply('GET')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self._reply('POST')
+
+    def _reply(self, method: str):
+        parts = urlsplit(self.path)
+        service, _, path = unquote(parts.path).lstrip('/').partition('/')
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        server: 'StubAPIServer' = self.server.stub
+        server.count(service)
+
+        status, content_type, body = server.library.respond(service, path, query, method)
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Pas de sortie par requête : elle fausserait les mesures
+        pass
+
+
+class StubAPIServer:
+    """
+    Serveur de rejeu dans un thread, sur un port libre de 127.0.0.1.
+
+    Usage:
+        with StubAPIServer() as stub:
+            for key, url in service_base_urls(stub.url).items():
+                settings.set(key, url)
+    """
+
+    SERVICES = ('genius', 'spotify', 'lastfm', 'discogs', 'rapedia', 'tunebat')
+
+    def __init__(self, library: Optional[FixtureLibrary] = None, host: str = '127.0.0.1', port: int = 0):
+        self.library = library or FixtureLibrary()
+        self._httpd = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+        self._counts_lock = threading.Lock()
+        self.request_counts: Dict[str, int] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, service: str) -> str:
+        return f"{self.url}/{service}"
+
+    def count(self, service: str):
+        with self._counts_lock:
+            self.request_counts[service] = self.request_counts.get(service, 0) + 1
+
+    def start(self) -> 'StubAPIServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='benchmark-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+
+    def __enter__(self) -> 'StubAPIServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
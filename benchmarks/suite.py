@@ -0,0 +1,341 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks reproductible, entièrement hors ligne.
+
+Pour chaque taille d'artiste (100, 1000, 10000 morceaux par défaut), le
+pipeline complet découverte -> extraction -> traitement -> export tourne
+contre le serveur de rejeu (benchmarks.stub_server), dans un processus
+dédié et un répertoire de données vierge (MDE_DATA_DIR) : ni cache, ni
+base, ni quota d'une exécution précédente ne faussent la mesure.
+
+Mesures par taille : temps total et par phase, débit (morceaux/s), pic
+de mémoire résidente, taille de la base SQLite (WAL compris), totaux du
+profileur par catégorie et requêtes reçues par source.
+
+Usage:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --sizes 100 1000 --output report.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --update-baseline benchmarks/baseline.json
+
+Avec --baseline, toute mesure qui se dégrade au-delà de la tolérance
+(15 % par défaut) est signalée et le code de sortie vaut 1.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_TOLERANCE = 0.15
+
+# Sous ce seuil, un écart relatif sur une durée n'est que du bruit
+MIN_COMPARED_SECONDS = 0.05
+
+# Sens de dégradation de chaque mesure comparée à la référence
+_HIGHER_IS_WORSE = ('wall_seconds', 'peak_rss_mb', 'db_size_mb')
+_LOWER_IS_WORSE = ('throughput_tracks_per_second',)
+
+# Identifiants factices : les extracteurs exigent une clé pour s'initialiser
+_DUMMY_CREDENTIALS = {
+    'GENIUS_API_KEY': 'benchmark',
+    'SPOTIFY_CLIENT_ID': 'benchmark',
+    'SPOTIFY_CLIENT_SECRET': 'benchmark',
+    'LAST_FM_API_KEY': 'benchmark',
+    'DISCOGS_TOKEN': 'benchmark'
+}
+
+_RATE_LIMITED_APIS = ('genius', 'spotify', 'discogs', 'lastfm', 'web_scraping', 'tunebat')
+
+
+# ===== MESURES =====
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus courant"""
+    if RESOURCE_AVAILABLE:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kio sous Linux, octets sous macOS
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    if PSUTIL_AVAILABLE:
+        memory = psutil.Process().memory_info()
+        return round(getattr(memory, 'peak_wset', memory.rss) / (1024 * 1024), 1)
+    return None
+
+
+def db_size_mb(db_path: Path) -> float:
+    """Taille de la base, journaux WAL et SHM compris"""
+    total = 0
+    for suffix in ('', '-wal', '-shm'):
+        path = Path(f"{db_path}{suffix}")
+        if path.exists():
+            total += path.stat().st_size
+    return round(total / (1024 * 1024), 3)
+
+
+# ===== WORKER =====
+
+def _configure_worker(stub_url: str):
+    """Redirige les sources vers le serveur de rejeu et lève les quotas"""
+    from benchmarks.stub_server import service_base_urls
+    from config.settings import settings
+
+    for key, url in service_base_urls(stub_url).items():
+        settings.set(key, url)
+    # Les plus grands artistes synthétiques dépassent les 20 pages Genius par défaut
+    settings.set('apis.genius.max_pages', 10 ** 4)
+
+    # Le rejeu n'a pas de quota : seul le coût du code est mesuré
+    unlimited = {'requests_per_minute': 10 ** 9, 'requests_per_hour': 10 ** 9}
+    settings.set('rate_limits', {api: dict(unlimited) for api in _RATE_LIMITED_APIS})
+    settings.set('rate_limits.backend', 'memory')
+    settings.set('tunebat.delay_between_requests', 0)
+
+    # Audio features Spotify fermées aux nouvelles applications : BPM et
+    # tonalité viennent de TuneBat, comme pour ces comptes en production
+    settings.set('spotify.include_audio_features', False)
+
+    # Paroles : scraping Selenium de genius.com, hors du périmètre du rejeu HTTP
+    settings.set('extraction.include_lyrics', False)
+
+
+def run_worker(size: int, stub_url: str, workdir: Path) -> Dict[str, Any]:
+    """
+    Exécute le pipeline complet pour l'artiste synthétique de taille donnée.
+
+    Appelé dans un processus dédié (MDE_DATA_DIR pointant vers workdir) ;
+    les imports du projet sont faits ici, après la redirection des données.
+    """
+    import asyncio
+
+    _configure_worker(stub_url)
+
+    from benchmarks.stub_server import FixtureLibrary
+    from core.database import Database
+    from core.session_manager import SessionManager
+    from steps.pipeline import ExtractionPipeline
+    from steps.step3_process import ProcessingStep
+    from steps.step4_export import ExportStep
+    from utils.profiling import disable_profiling, enable_profiling, get_profile_report
+
+    artist_name = FixtureLibrary.artist_name(size)
+    db_path = Path(workdir) / 'benchmark.db'
+    database = Database(str(db_path))
+    session_manager = SessionManager(database)
+    session_id = session_manager.create_session(artist_name=artist_name, metadata={'benchmark': True})
+
+    phases: Dict[str, float] = {}
+    enable_profiling()
+    start = time.perf_counter()
+
+    phase_start = time.perf_counter()
+    pipeline = ExtractionPipeline(session_manager, database)
+    _, pipeline_stats = pipeline.run(artist_name, session_id, max_tracks=size)
+    phases['discovery_extraction'] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    asyncio.run(ProcessingStep(session_manager, database).process_artist_data(artist_name, session_id))
+    phases['processing'] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    asyncio.run(ExportStep(session_manager, database).export_artist_data(artist_name, ['json', 'csv']))
+    phases['export'] = time.perf_counter() - phase_start
+
+    session_manager.flush()
+    wall_seconds = time.perf_counter() - start
+    disable_profiling()
+    session_manager.complete_session(session_id, {'benchmark_size': size})
+
+    tracks = pipeline_stats.tracks_discovered
+    return {
+        'size': size,
+        'tracks_discovered': tracks,
+        'tracks_extracted': pipeline_stats.extraction.tracks_successful,
+        'wall_seconds': round(wall_seconds, 3),
+        'throughput_tracks_per_second': round(tracks / wall_seconds, 2) if wall_seconds else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+        'db_size_mb': db_size_mb(db_path),
+        'phases': {name: round(seconds, 3) for name, seconds in phases.items()},
+        'profile': get_profile_report()['categories']
+    }
+
+
+# ===== ORCHESTRATION =====
+
+def _run_size(size: int, stub_url: str) -> Dict[str, Any]:
+    """Lance le worker d'une taille dans un processus et un répertoire vierges"""
+    with tempfile.TemporaryDirectory(prefix=f'mde_bench_{size}_') as workdir:
+        output = Path(workdir) / 'result.json'
+        env = {**os.environ, **_DUMMY_CREDENTIALS, 'MDE_DATA_DIR': workdir}
+        command = [
+            sys.executable, '-m', 'benchmarks.suite', '--worker',
+            '--size', str(size), '--stub-url', stub_url,
+            '--workdir', workdir, '--output', str(output)
+        ]
+        completed = subprocess.run(command, cwd=str(PROJECT_ROOT), env=env,
+                                   capture_output=True, text=True)
+        if completed.returncode != 0 or not output.exists():
+            return {'size': size, 'error': completed.stderr.strip().splitlines()[-20:]}
+        with open(output, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES,
+              baseline: Optional[Dict[str, Any]] = None,
+              tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """
+    Exécute la suite pour chaque taille contre un serveur de rejeu commun.
+
+    Args:
+        sizes: Nombres de morceaux des artistes synthétiques
+        baseline: Rapport de référence (optionnel)
+        tolerance: Dégradation relative tolérée avant signalement
+
+    Returns:
+        Rapport complet (résultats par taille, régressions éventuelles)
+    """
+    from benchmarks.stub_server import StubAPIServer
+
+    results = []
+    with StubAPIServer() as stub:
+        for size in sizes:
+            before = dict(stub.request_counts)
+            result = _run_size(size, stub.url)
+            result['stub_requests'] = {
+                service: count - before.get(service, 0)
+                for service, count in stub.request_counts.items()
+                if count - before.get(service, 0)
+            }
+            results.append(result)
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'results': results
+    }
+    if baseline:
+        report['regressions'] = compare_to_baseline(report, baseline, tolerance)
+    return report
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Compare un rapport à la référence, taille par taille.
+
+    Returns:
+        Mesures dégradées au-delà de la tolérance (taille, mesure, valeurs, écart)
+    """
+    reference = {entry['size']: entry for entry in baseline.get('results', []) if 'error' not in entry}
+    regressions = []
+
+    def check(size: int, metric: str, current: Any, previous: Any, higher_is_worse: bool):
+        if not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) or not previous:
+            return
+        if metric.endswith('seconds') and max(current, previous) < MIN_COMPARED_SECONDS:
+            return
+        change = (current - previous) / previous
+        if (change if higher_is_worse else -change) > tolerance:
+            regressions.append({'size': size, 'metric': metric, 'baseline': previous,
+                                'current': current, 'change': round(change, 3)})
+
+    for entry in report.get('results', []):
+        previous = reference.get(entry['size'])
+        if previous is None:
+            continue
+        if 'error' in entry:
+            regressions.append({'size': entry['size'], 'metric': 'error', 'baseline': None,
+                                'current': entry['error'], 'change': None})
+            continue
+        for metric in _HIGHER_IS_WORSE:
+            check(entry['size'], metric, entry.get(metric), previous.get(metric), True)
+        for metric in _LOWER_IS_WORSE:
+            check(entry['size'], metric, entry.get(metric), previous.get(metric), False)
+        for phase, seconds in entry.get('phases', {}).items():
+            check(entry['size'], f'phases.{phase}_seconds', seconds,
+                  previous.get('phases', {}).get(phase), True)
+
+    return regressions
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"\n{'taille':>8} {'morceaux':>9} {'total (s)':>10} {'morceaux/s':>11} {'RSS (Mo)':>9} {'base (Mo)':>10}")
+    for entry in report['results']:
+        if 'error' in entry:
+            print(f"{entry['size']:>8}  ❌ échec du worker")
+            for line in entry['error']:
+                print(f"           {line}")
+            continue
+        print(f"{entry['size']:>8} {entry['tracks_discovered']:>9} {entry['wall_seconds']:>10.2f} "
+              f"{entry['throughput_tracks_per_second']:>11.1f} {entry['peak_rss_mb'] or 0:>9.1f} "
+              f"{entry['db_size_mb']:>10.2f}")
+
+    for regression in report.get('regressions', []):
+        print(f"⚠️ Régression taille {regression['size']} - {regression['metric']}: "
+              f"{regression['baseline']} -> {regression['current']} ({regression['change']:+.0%})"
+              if regression['change'] is not None else
+              f"⚠️ Régression taille {regression['size']}: le worker a échoué")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks hors ligne du pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Nombres de morceaux des artistes synthétiques')
+    parser.add_argument('--baseline', type=Path, help='Rapport de référence à comparer')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Dégradation relative tolérée (0.15 = 15 %%)')
+    parser.add_argument('--output', type=Path, help='Fichier du rapport JSON')
+    parser.add_argument('--update-baseline', type=Path, help='Écrit le rapport comme nouvelle référence')
+    # Mode interne : exécution d'une taille dans le processus isolé
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--stub-url', help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        result = run_worker(args.size, args.stub_url, args.workdir)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        return 0
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = run_suite(args.sizes, baseline, args.tolerance)
+    _print_report(report)
+
+    for path in (args.output, args.update_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    failed = any('error' in entry for entry in report['results'])
+    return 1 if report.get('regressions') or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -113,7 +113,8 @@ class Settings:
     
     def _calculate_paths(self) -> Dict[str, Path]:
         """Calcule tous les chemins en une seule fois"""
-        data_dir = self.project_root / "data"
+        # MDE_DATA_DIR : données isolées (benchmarks, plusieurs instances)
+        data_dir = Path(os.getenv("MDE_DATA_DIR") or self.project_root / "data")
         logs_dir = self.project_root / "logs"
         
         return {
@@ -46,6 +46,7 @@ _safe_import("exceptions", [
     "DatabaseError", "DatabaseConnectionError", "DatabaseSchemaError", "DatabaseIntegrityError",
     "DataError", "DataValidationError", "DataInconsistencyError",
     "ExtractionError", "ArtistNotFoundError", "TrackExtractionError", "CreditExtractionError",
+    "ProcessingError",
     "CacheError", "CacheExpiredError", "CacheCorruptedError",
     "SessionError", "SessionNotFoundError", "SessionCorruptedError", "SessionStatusError",
     "ExportError", "ExportFormatError", "ExportDataError"
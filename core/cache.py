@@ -1,6 +1,8 @@
 # core/cache.py
+import asyncio
 import hashlib
 import json
+import logging
 import pickle
 import zlib
 from datetime import datetime, timedelta
@@ -13,13 +15,18 @@ from contextlib import contextmanager
 from config.settings import settings
 from core.database import Database
 from core.exceptions import CacheError, CacheExpiredError, CacheCorruptedError
+from utils.profiling import profiled
+
+logger = logging.getLogger(__name__)
 
 
 class CacheManager:
     """Gestionnaire de cache intelligent avec expiration automatique et optimisations"""
     
-    def __init__(self, db: Optional[Database] = None):
+    def __init__(self, db: Optional[Database] = None, namespace: Optional[str] = None):
         self.db = db or Database()
+        # Préfixe des clés : les extracteurs partagent la même table de cache
+        self.namespace = namespace
         self.default_expire_days = settings.get('cache.ttl_hours', 168) // 24  # Convertir heures en jours
         self.max_size_mb = settings.get('cache.max_size_mb', 500)
         self.compress_data = settings.get('cache.compress_data', True)
@@ -44,9 +51,8 @@ class CacheManager:
         if self.auto_cleanup_enabled:
             self._auto_cleanup()
     
-    @lru_cache(maxsize=1024)
     def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
-        """Génère une clé de cache unique basée sur les paramètres - avec cache LRU"""
+        """Génère une clé de cache unique basée sur les paramètres (listes et dicts acceptés)"""
         # Créer une chaîne unique à partir des arguments
         key_data = {
             'args': args,
@@ -59,6 +65,10 @@ class CacheManager:
         
         return f"{prefix}:{key_hash}"
     
+    def _namespaced(self, key: str) -> str:
+        """Clé stockée, préfixée par l'espace de noms du gestionnaire"""
+        return f"{self.namespace}:{key}" if self.namespace else key
+    
     def _serialize_value(self, value: Any) -> bytes:
         """Sérialise et compresse optionnellement une valeur"""
         try:
@@ -134,8 +144,11 @@ class CacheManager:
                 key = sorted_items[i][0]
                 del self._memory_cache[key]
     
+    @profiled('cache', 'get')
     def get(self, key: str) -> Optional[Any]:
         """Récupère une valeur du cache avec cache multi-niveau"""
+        key = self._namespaced(key)
+        
         # Vérifier cache mémoire d'abord
         memory_result = self._check_memory_cache(key)
         if memory_result is not None:
@@ -159,12 +172,24 @@ class CacheManager:
         except Exception as e:
             raise CacheError(f"Erreur lecture cache: {e}")
     
-    def set(self, key: str, value: Any, expire_days: Optional[int] = None) -> None:
-        """Met une valeur en cache avec optimisations"""
-        if expire_days is None:
-            expire_days = self.default_expire_days
+    @profiled('cache', 'set')
+    def set(self, key: str, value: Any, expire_days: Optional[int] = None,
+            expire_hours: Optional[float] = None, ttl: Optional[int] = None) -> None:
+        """
+        Met une valeur en cache avec optimisations.
         
-        expires_at = datetime.now() + timedelta(days=expire_days)
+        La durée de vie se donne en jours, en heures ou en secondes (ttl) ;
+        sans durée, celle de la configuration s'applique.
+        """
+        if ttl is not None:
+            lifetime = timedelta(seconds=ttl)
+        elif expire_hours is not None:
+            lifetime = timedelta(hours=expire_hours)
+        else:
+            lifetime = timedelta(days=self.default_expire_days if expire_days is None else expire_days)
+        
+        key = self._namespaced(key)
+        expires_at = datetime.now() + lifetime
         
         try:
             # Sauvegarder en base
@@ -184,6 +209,7 @@ class CacheManager:
     
     def delete(self, key: str) -> None:
         """Supprime une entrée du cache"""
+        key = self._namespaced(key)
         try:
             # Supprimer de la base
             with self.db.get_connection() as conn:
@@ -424,8 +450,25 @@ class SmartCache:
         }
     
     def cache_result(self, prefix: str, expire_days: Optional[int] = None):
-        """Décorateur pour mettre en cache le résultat d'une fonction"""
+        """Décorateur pour mettre en cache le résultat d'une fonction (ou coroutine)"""
         def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    cache_key = self.cache._generate_cache_key(prefix, *args, **kwargs)
+                    
+                    cached_result = self.cache.get(cache_key)
+                    if cached_result is not None:
+                        return cached_result
+                    
+                    # Le résultat mis en cache est celui de la coroutine, pas la coroutine
+                    result = await func(*args, **kwargs)
+                    if result is not None:
+                        self._store_result(cache_key, result, expire_days)
+                    
+                    return result
+                return async_wrapper
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
                 # Générer la clé de cache
@@ -439,12 +482,19 @@ class SmartCache:
                 # Exécuter la fonction et mettre en cache
                 result = func(*args, **kwargs)
                 if result is not None:  # Ne pas cacher les résultats None
-                    self.cache.set(cache_key, result, expire_days)
+                    self._store_result(cache_key, result, expire_days)
                 
                 return result
             return wrapper
         return decorator
     
+    def _store_result(self, cache_key: str, result: Any, expire_days: Optional[int]):
+        """Mise en cache au mieux : un résultat non sérialisable n'interrompt pas l'appel"""
+        try:
+            self.cache.set(cache_key, result, expire_days)
+        except CacheError as e:
+            logger.debug(f"Résultat non mis en cache ({cache_key}): {e}")
+    
     def invalidate_on_event(self, event: str, entity_id: Optional[str] = None):
         """Invalide le cache basé sur un événement"""
         if event in self.invalidation_rules:
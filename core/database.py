@@ -1,14 +1,147 @@
 # core/database.py - Version corrigée et complétée
 import sqlite3
+import copy
 import json
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+from datetime import datetime, timezone
 from contextlib import contextmanager
 
 from config.settings import settings
-from models.entities import Artist, Album, Track, Credit, Session
-from models.enums import AlbumType, CreditCategory, SessionStatus, DataSource
+from models.entities import Artist, Album, Track, Credit, Session, build_entities
+from models.enums import AlbumType, CreditCategory, CreditType, SessionStatus, DataSource
+from utils.profiling import profiled
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Convertit un timestamp SQLite (ISO 8601) en datetime"""
+    if not value or isinstance(value, datetime):
+        return value or None
+    return datetime.fromisoformat(value)
+
+
+# Champ de l'entité -> colonne de la table (construction en lot)
+_TRACK_ROW_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'artist_id': 'artist_id',
+    'artist_name': 'artist_name',
+    'album_id': 'album_id',
+    'album_name': 'album_title',
+    'track_number': 'track_number',
+    'disc_number': 'disc_number',
+    'genius_id': 'genius_id',
+    'spotify_id': 'spotify_id',
+    'genius_url': 'genius_url',
+    'duration_seconds': 'duration_seconds',
+    'bpm': 'bpm',
+    'key_signature': 'key',
+    'has_lyrics': 'has_lyrics',
+    'lyrics': 'lyrics',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at'
+}
+
+_TRACK_ROW_CONVERTERS = {
+    'has_lyrics': bool,
+    'created_at': _parse_timestamp,
+    'updated_at': _parse_timestamp
+}
+
+_CREDIT_ROW_FIELDS = {
+    'id': 'id',
+    'track_id': 'track_id',
+    'credit_category': 'credit_category',
+    'credit_type': 'credit_type',
+    'person_name': 'person_name',
+    'role_detail': 'role_detail',
+    'instrument': 'instrument',
+    'is_primary': 'is_primary',
+    'is_featuring': 'is_featuring',
+    'is_uncredited': 'is_uncredited',
+    'source': 'data_source',
+    'extraction_date': 'extraction_date',
+    'created_at': 'created_at'
+}
+
+_CREDIT_ROW_CONVERTERS = {
+    'credit_category': lambda value: CreditCategory(value) if value else CreditCategory.UNKNOWN,
+    'credit_type': CreditType,
+    'is_primary': bool,
+    'is_featuring': bool,
+    'is_uncredited': bool,
+    'source': DataSource,
+    'extraction_date': _parse_timestamp,
+    'created_at': _parse_timestamp
+}
+
+
+# ===== DELTAS DE CHECKPOINTS =====
+# Delta entre deux états JSON: {'s': {clé: valeur}, 'd': [clés supprimées],
+# 'p': {clé: sous-delta}, 'a': {clé: éléments ajoutés en fin de liste}}
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """Égalité stricte de valeurs JSON : 1, 1.0 et True sont distincts"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_json_equal, a, b))
+    return a == b
+
+
+def _json_delta(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """Delta de deux dictionnaires JSON (None si identiques)"""
+    delta: Dict[str, Any] = {}
+    removed = [key for key in old if key not in new]
+    if removed:
+        delta['d'] = removed
+    
+    for key, value in new.items():
+        if key in old:
+            previous = old[key]
+            # == d'abord (rapide), puis type par type : 1 -> True ou 1 -> 1.0 est un changement
+            if previous == value and _json_equal(previous, value):
+                continue
+            if isinstance(previous, dict) and isinstance(value, dict):
+                delta.setdefault('p', {})[key] = _json_delta(previous, value)
+                continue
+            if (isinstance(previous, list) and isinstance(value, list)
+                    and len(value) > len(previous) and _json_equal(value[:len(previous)], previous)):
+                delta.setdefault('a', {})[key] = value[len(previous):]
+                continue
+        delta.setdefault('s', {})[key] = value
+    
+    return delta or None
+
+
+def _apply_json_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Applique un delta sur place et retourne l'état"""
+    for key in delta.get('d', ()):
+        state.pop(key, None)
+    for key, value in delta.get('s', {}).items():
+        state[key] = value
+    for key, sub_delta in delta.get('p', {}).items():
+        _apply_json_delta(state[key], sub_delta)
+    for key, items in delta.get('a', {}).items():
+        state[key].extend(items)
+    return state
+
+
+def _pack_checkpoint(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _unpack_checkpoint(payload: bytes) -> Any:
+    return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+
+# Sessions dont les états de checkpoint ne sont plus gardés en mémoire
+_FINISHED_SESSION_STATUSES = (SessionStatus.COMPLETED, SessionStatus.FAILED, SessionStatus.CANCELLED)
 
 
 class Database:
@@ -17,6 +150,19 @@ class Database:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or str(settings.data_dir / "music_data.db")
         self.migrations_dir = Path(__file__).parent / "migrations"
+        
+        # Checkpoints: dernier état connu par (session, étape) et métriques
+        self.checkpoint_compact_every = settings.get('sessions.checkpoint_compact_every', 20)
+        self.checkpoint_state_cache_size = settings.get('sessions.checkpoint_state_cache_size', 32)
+        # (session, étape) -> (dernier id, état), du moins au plus récemment utilisé
+        self._checkpoint_states: Dict[tuple, tuple] = {}
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_metrics = {
+            'saves': 0, 'bases': 0, 'deltas': 0, 'unchanged': 0, 'compactions': 0,
+            'raw_bytes': 0, 'stored_bytes': 0, 'save_seconds': 0.0,
+            'loads': 0, 'load_seconds': 0.0
+        }
+        
         self._init_database()
     
     def _init_database(self):
@@ -61,7 +207,8 @@ class Database:
     
     def _get_migration_files(self) -> List[str]:
         """Récupère la liste des fichiers de migration"""
-        return ["001_initial_schema.sql"]
+        return ["001_initial_schema.sql", "002_person_aliases.sql", "003_extraction_tasks.sql",
+                "004_checkpoint_deltas.sql", "005_session_dashboard.sql"]
     
     def _get_executed_migrations(self, conn: sqlite3.Connection) -> List[str]:
         """Récupère la liste des migrations déjà exécutées"""
@@ -72,6 +219,14 @@ class Database:
         """Exécute une migration spécifique"""
         if migration_file == "001_initial_schema.sql":
             self._create_initial_schema(conn)
+        elif migration_file == "002_person_aliases.sql":
+            self._create_person_aliases_schema(conn)
+        elif migration_file == "003_extraction_tasks.sql":
+            self._create_extraction_tasks_schema(conn)
+        elif migration_file == "004_checkpoint_deltas.sql":
+            self._create_checkpoint_deltas_schema(conn)
+        elif migration_file == "005_session_dashboard.sql":
+            self._create_session_dashboard_schema(conn)
         
         # Marquer la migration comme exécutée
         conn.execute(
@@ -210,6 +365,124 @@ class Database:
         # Index pour les performances
         self._create_indexes(conn)
     
+    def _create_person_aliases_schema(self, conn: sqlite3.Connection):
+        """Crée les tables de l'index global des personnes (canonique + alias)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS persons (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                canonical_name TEXT NOT NULL,
+                normalized_key TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS person_aliases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                person_id INTEGER NOT NULL,
+                alias TEXT UNIQUE NOT NULL,
+                normalized_key TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (person_id) REFERENCES persons (id)
+            )
+        """)
+        
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_persons_key ON persons(normalized_key)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_person_aliases_person ON person_aliases(person_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_person_aliases_key ON person_aliases(normalized_key)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_credits_person ON credits(person_name)")
+    
+    def _create_extraction_tasks_schema(self, conn: sqlite3.Connection):
+        """Crée la file de tâches d'extraction persistante (une ligne par morceau et extracteur)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                track_id INTEGER NOT NULL,
+                extractor TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                priority INTEGER DEFAULT 0,
+                attempts INTEGER DEFAULT 0,
+                available_at REAL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (session_id, track_id, extractor),
+                FOREIGN KEY (track_id) REFERENCES tracks (id)
+            )
+        """)
+        
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_tasks_claim "
+            "ON extraction_tasks(session_id, state, available_at)"
+        )
+    
+    def _create_checkpoint_deltas_schema(self, conn: sqlite3.Connection):
+        """Checkpoints compressés en base + deltas, avec pointeur vers le dernier état"""
+        # Colonnes des checkpoints compressés (les lignes existantes restent en JSON 'full')
+        for column_sql in (
+            "ALTER TABLE checkpoints ADD COLUMN kind TEXT DEFAULT 'full'",
+            "ALTER TABLE checkpoints ADD COLUMN base_id INTEGER",
+            "ALTER TABLE checkpoints ADD COLUMN payload BLOB",
+            "ALTER TABLE checkpoints ADD COLUMN raw_size INTEGER",
+            "ALTER TABLE checkpoints ADD COLUMN stored_size INTEGER"
+        ):
+            conn.execute(column_sql)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_heads (
+                session_id TEXT NOT NULL,
+                step_name TEXT NOT NULL,
+                base_id INTEGER NOT NULL,
+                latest_id INTEGER NOT NULL,
+                chain_length INTEGER DEFAULT 0,
+                base_size INTEGER DEFAULT 0,
+                chain_size INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (session_id, step_name)
+            )
+        """)
+        
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_checkpoints_session_step "
+            "ON checkpoints(session_id, step_name, id)"
+        )
+    
+    def _create_session_dashboard_schema(self, conn: sqlite3.Connection):
+        """Index des requêtes du dashboard et compteur de version des sessions"""
+        indexes = [
+            # Pagination par curseur (updated_at, id), avec ou sans filtre de statut
+            "CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at, id)",
+            "CREATE INDEX IF NOT EXISTS idx_sessions_status_updated ON sessions(status, updated_at, id)",
+            "CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at)",
+            # Index couvrant du classement des artistes
+            "CREATE INDEX IF NOT EXISTS idx_sessions_artist_tracks ON sessions(artist_name, total_tracks_found)"
+        ]
+        for index_sql in indexes:
+            conn.execute(index_sql)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS data_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES ('sessions', 0)")
+        
+        # Les triggers couvrent aussi les écritures hors Database (suppressions SQL directes,
+        # autres processus) : le compteur suffit à invalider les caches du dashboard
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_sessions_version_{event.lower()}
+                AFTER {event} ON sessions
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = 'sessions';
+                END
+            """)
+    
     def _create_indexes(self, conn: sqlite3.Connection):
         """Crée les index pour optimiser les performances"""
         indexes = [
@@ -254,25 +527,45 @@ class Database:
             row = cursor.fetchone()
             
             if row:
-                return Session(
-                    id=row['id'],
-                    artist_name=row['artist_name'],
-                    status=SessionStatus(row['status']),
-                    current_step=row['current_step'],
-                    total_tracks_found=row['total_tracks_found'],
-                    tracks_processed=row['tracks_processed'],
-                    tracks_with_credits=row['tracks_with_credits'],
-                    tracks_with_albums=row['tracks_with_albums'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None,
-                    metadata=json.loads(row['metadata']) if row['metadata'] else {}
-                )
+                return self._row_to_session(row)
         return None
     
     def update_session(self, session: Session):
         """Met à jour une session"""
+        self.update_sessions([session])
+    
+    @profiled('db')
+    def update_sessions(self, sessions: List[Session]) -> int:
+        """
+        Met à jour plusieurs sessions en une seule transaction.
+        
+        Les métadonnées sont sérialisées session par session : une valeur non
+        JSON est convertie en texte, et une session encore impossible à
+        sérialiser est écartée sans faire échouer le lot.
+        
+        Returns:
+            Nombre de sessions écrites
+        """
+        rows = []
+        for session in sessions:
+            metadata = self._dump_session_metadata(session)
+            if metadata is None:
+                continue
+            rows.append((
+                session.artist_name,
+                session.status.value,
+                session.current_step,
+                session.total_tracks_found,
+                session.tracks_processed,
+                session.tracks_with_credits,
+                session.tracks_with_albums,
+                metadata,
+                session.id
+            ))
+        if not rows:
+            return 0
         with self.get_connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 UPDATE sessions SET
                     artist_name = ?,
                     status = ?,
@@ -284,17 +577,21 @@ class Database:
                     metadata = ?,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            """, (
-                session.artist_name,
-                session.status.value,
-                session.current_step,
-                session.total_tracks_found,
-                session.tracks_processed,
-                session.tracks_with_credits,
-                session.tracks_with_albums,
-                json.dumps(session.metadata),
-                session.id
-            ))
+            """, rows)
+        
+        finished = {session.id for session in sessions if session.status in _FINISHED_SESSION_STATUSES}
+        if finished:
+            self._forget_checkpoint_states(finished)
+        return len(rows)
+    
+    @staticmethod
+    def _dump_session_metadata(session: Session) -> Optional[str]:
+        """Sérialise les métadonnées d'une session (None si impossible, ex. référence circulaire)"""
+        try:
+            return json.dumps(session.metadata, default=str)
+        except (TypeError, ValueError) as e:
+            print(f"⚠️ Session {session.id} ignorée, métadonnées non sérialisables: {e}")
+            return None
     
     def list_sessions(self, status: Optional[SessionStatus] = None, 
                      limit: Optional[int] = None) -> List[Session]:
@@ -322,23 +619,180 @@ class Database:
                         "SELECT * FROM sessions ORDER BY created_at DESC"
                     )
             
-            sessions = []
-            for row in cursor.fetchall():
-                sessions.append(Session(
-                    id=row['id'],
-                    artist_name=row['artist_name'],
-                    status=SessionStatus(row['status']),
-                    current_step=row['current_step'],
-                    total_tracks_found=row['total_tracks_found'],
-                    tracks_processed=row['tracks_processed'],
-                    tracks_with_credits=row['tracks_with_credits'],
-                    tracks_with_albums=row['tracks_with_albums'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None,
-                    metadata=json.loads(row['metadata']) if row['metadata'] else {}
-                ))
+            return [self._row_to_session(row) for row in cursor.fetchall()]
+    
+    def get_sessions_by_artist(self, artist_name: str) -> List[Session]:
+        """Sessions d'un artiste, les plus récentes d'abord"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM sessions WHERE artist_name = ? COLLATE NOCASE ORDER BY created_at DESC",
+                (artist_name,)
+            )
+            return [self._row_to_session(row) for row in cursor.fetchall()]
+    
+    def _row_to_session(self, row: sqlite3.Row) -> Session:
+        """Construit une Session depuis une ligne de la table sessions"""
+        session = Session(
+            id=row['id'],
+            artist_name=row['artist_name'],
+            status=SessionStatus(int(row['status'])),
+            current_step=row['current_step'],
+            total_tracks_found=row['total_tracks_found'],
+            tracks_processed=row['tracks_processed'],
+            tracks_with_credits=row['tracks_with_credits'],
+            tracks_with_albums=row['tracks_with_albums'],
+            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+            metadata=json.loads(row['metadata']) if row['metadata'] else {}
+        )
+        # __post_init__ horodate updated_at à la construction : on rétablit la valeur en base
+        if row['updated_at']:
+            session.updated_at = datetime.fromisoformat(row['updated_at'])
+        return session
+    
+    # ==================== DASHBOARD DES SESSIONS ====================
+    
+    def get_sessions_version(self) -> int:
+        """
+        Compteur incrémenté à chaque écriture dans la table sessions.
+        
+        Tenu par trigger : deux lectures qui renvoient la même valeur voient
+        les mêmes sessions, ce qui en fait une clé de cache fiable.
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT version FROM data_versions WHERE name = 'sessions'"
+            ).fetchone()
+        return row['version'] if row else 0
+    
+    @staticmethod
+    def _to_db_timestamp(dt: datetime) -> str:
+        """Format de CURRENT_TIMESTAMP (UTC) ; une datetime naïve est supposée UTC"""
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt.strftime('%Y-%m-%d %H:%M:%S')
+    
+    def _session_filters(self, statuses: Optional[Sequence[SessionStatus]] = None,
+                         since: Optional[datetime] = None, until: Optional[datetime] = None,
+                         artist: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+        """Clauses WHERE communes aux requêtes du dashboard"""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(status.value for status in statuses)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(self._to_db_timestamp(since))
+        if until:
+            clauses.append("created_at < ?")
+            params.append(self._to_db_timestamp(until))
+        if artist:
+            escaped = artist.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            clauses.append("artist_name LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        return clauses, params
+    
+    @profiled('db')
+    def query_sessions(self, statuses: Optional[Sequence[SessionStatus]] = None,
+                       since: Optional[datetime] = None, until: Optional[datetime] = None,
+                       artist: Optional[str] = None, limit: int = 50,
+                       after: Optional[Tuple[str, str]] = None) -> Tuple[List[Session], Optional[Tuple[str, str]]]:
+        """
+        Page de sessions, de la plus récemment mise à jour à la plus ancienne.
+        
+        Pagination par curseur (keyset) sur (updated_at, id) : le coût d'une
+        page ne dépend pas de sa position, contrairement à OFFSET.
+        
+        Args:
+            statuses: Statuts retenus (tous si None)
+            since: Créées à partir de cette date
+            until: Créées avant cette date
+            artist: Fragment du nom d'artiste (insensible à la casse)
+            limit: Taille de la page
+            after: Curseur renvoyé par la page précédente
             
-            return sessions
+        Returns:
+            (sessions de la page, curseur de la page suivante ou None)
+        """
+        clauses, params = self._session_filters(statuses, since, until, artist)
+        if after:
+            clauses.append("(updated_at < ? OR (updated_at = ? AND id < ?))")
+            params.extend((after[0], after[0], after[1]))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM sessions {where} ORDER BY updated_at DESC, id DESC LIMIT ?",
+                (*params, limit + 1)
+            ).fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['updated_at'], rows[-1]['id'])
+        return [self._row_to_session(row) for row in rows], next_cursor
+    
+    def count_sessions(self, statuses: Optional[Sequence[SessionStatus]] = None,
+                       since: Optional[datetime] = None, until: Optional[datetime] = None,
+                       artist: Optional[str] = None) -> int:
+        """Nombre de sessions correspondant aux filtres de query_sessions"""
+        clauses, params = self._session_filters(statuses, since, until, artist)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.get_connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+    
+    @profiled('db')
+    def get_session_dashboard_stats(self, since: Optional[datetime] = None,
+                                    top_artists: int = 5, recent: int = 5) -> Dict[str, Any]:
+        """
+        Agrégats des graphiques du dashboard, calculés en SQL sur les index.
+        
+        Args:
+            since: Début de la période de 'sessions_since' (sinon 0)
+            top_artists: Nombre d'artistes du classement
+            recent: Nombre de sessions récentes
+            
+        Returns:
+            Dict avec total_sessions, status_counts ({SessionStatus: n}),
+            sessions_since, top_artists ([(artiste, morceaux)]) et
+            recent_sessions (par date de création décroissante)
+        """
+        with self.get_connection() as conn:
+            status_counts = {}
+            for row in conn.execute("SELECT status, COUNT(*) AS count FROM sessions GROUP BY status"):
+                try:
+                    status_counts[SessionStatus(int(row['status']))] = row['count']
+                except (TypeError, ValueError):
+                    continue
+            
+            sessions_since = 0
+            if since:
+                sessions_since = conn.execute(
+                    "SELECT COUNT(*) FROM sessions WHERE created_at >= ?",
+                    (self._to_db_timestamp(since),)
+                ).fetchone()[0]
+            
+            top_rows = conn.execute("""
+                SELECT artist_name, MAX(total_tracks_found) AS tracks
+                FROM sessions
+                WHERE total_tracks_found > 0
+                GROUP BY artist_name
+                ORDER BY tracks DESC, artist_name
+                LIMIT ?
+            """, (top_artists,)).fetchall()
+            
+            recent_rows = conn.execute(
+                "SELECT * FROM sessions ORDER BY created_at DESC, id DESC LIMIT ?",
+                (recent,)
+            ).fetchall()
+        
+        return {
+            'total_sessions': sum(status_counts.values()),
+            'status_counts': status_counts,
+            'sessions_since': sessions_since,
+            'top_artists': [(row['artist_name'], row['tracks']) for row in top_rows],
+            'recent_sessions': [self._row_to_session(row) for row in recent_rows]
+        }
     
     # ==================== ARTISTS ====================
     
@@ -359,6 +813,7 @@ class Database:
             ))
             return cursor.lastrowid
     
+    @profiled('db')
     def save_artist(self, artist: Artist) -> Artist:
         """
         Sauvegarde un artiste (création ou mise à jour).
@@ -531,6 +986,7 @@ class Database:
             ))
             return cursor.lastrowid
     
+    @profiled('db')
     def save_track(self, track: Track) -> Track:
         """Sauvegarde un track (création ou mise à jour)"""
         if track.id:
@@ -554,6 +1010,32 @@ class Database:
                 return self._row_to_track(row)
         return None
     
+    def get_track_by_title_and_artist(self, title: str, artist_id: int) -> Optional[Track]:
+        """Récupère un track par son titre (insensible à la casse) et son artiste"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM tracks WHERE artist_id = ? AND title = ? COLLATE NOCASE LIMIT 1",
+                (artist_id, title)
+            )
+            row = cursor.fetchone()
+            
+            if row:
+                return self._row_to_track(row)
+        return None
+    
+    def get_tracks_by_ids(self, track_ids: List[int]) -> List[Track]:
+        """Récupère plusieurs tracks en une requête"""
+        track_ids = list(track_ids)
+        if not track_ids:
+            return []
+        placeholders = ','.join('?' * len(track_ids))
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM tracks WHERE id IN ({placeholders})",
+                track_ids
+            )
+            return self._rows_to_tracks(cursor.fetchall())
+    
     def get_tracks_by_artist(self, artist_id: int, limit: Optional[int] = None) -> List[Track]:
         """Récupère tous les tracks d'un artiste"""
         with self.get_connection() as conn:
@@ -568,12 +1050,13 @@ class Database:
                     (artist_id,)
                 )
             
-            tracks = []
-            for row in cursor.fetchall():
-                tracks.append(self._row_to_track(row))
-            
-            return tracks
+            return self._rows_to_tracks(cursor.fetchall())
+    
+    def get_tracks_by_artist_id(self, artist_id: int) -> List[Track]:
+        """Alias de get_tracks_by_artist (nom utilisé par les processors)"""
+        return self.get_tracks_by_artist(artist_id)
     
+    @profiled('db')
     def update_track(self, track: Track):
         """Met à jour un track"""
         with self.get_connection() as conn:
@@ -617,24 +1100,11 @@ class Database:
     
     def _row_to_track(self, row) -> Track:
         """Convertit une ligne de base en objet Track"""
-        return Track(
-            id=row['id'],
-            title=row['title'],
-            artist_id=row['artist_id'],
-            artist_name=row['artist_name'],
-            album_id=row['album_id'],
-            album_name=row['album_title'],
-            track_number=row['track_number'],
-            disc_number=row['disc_number'],
-            genius_id=row['genius_id'],
-            spotify_id=row['spotify_id'],
-            genius_url=row['genius_url'],
-            duration=row['duration_seconds'],
-            bpm=row['bpm'],
-            key=row['key'],
-            has_lyrics=bool(row['has_lyrics']),
-            lyrics=row['lyrics']
-        )
+        return self._rows_to_tracks((row,))[0]
+    
+    def _rows_to_tracks(self, rows) -> List[Track]:
+        """Convertit des lignes de base en objets Track (construction en lot)"""
+        return build_entities(Track, rows, _TRACK_ROW_FIELDS, _TRACK_ROW_CONVERTERS)
     
     # ==================== ALBUMS ====================
     
@@ -658,12 +1128,13 @@ class Database:
                 album.spotify_id,
                 album.discogs_id,
                 album.genius_id,
-                album.total_tracks,
+                album.track_count,
                 0,  # total_duration
                 None  # cover_url
             ))
             return cursor.lastrowid
     
+    @profiled('db')
     def save_album(self, album: Album) -> Album:
         """Sauvegarde un album (création ou mise à jour)"""
         if album.id:
@@ -730,7 +1201,7 @@ class Database:
                 album.spotify_id,
                 album.discogs_id,
                 album.genius_id,
-                album.total_tracks,
+                album.track_count,
                 album.id
             ))
     
@@ -747,7 +1218,7 @@ class Database:
             spotify_id=row['spotify_id'],
             discogs_id=row['discogs_id'],
             genius_id=row['genius_id'],
-            total_tracks=row['track_count'] or 0
+            track_count=row['track_count'] or 0
         )
     
     # ==================== CREDITS ====================
@@ -776,6 +1247,7 @@ class Database:
             ))
             return cursor.lastrowid
     
+    @profiled('db')
     def save_credit(self, credit: Credit) -> Credit:
         """Sauvegarde un crédit (création ou mise à jour)"""
         if credit.id:
@@ -794,11 +1266,34 @@ class Database:
                 (track_id,)
             )
             
-            credits = []
-            for row in cursor.fetchall():
-                credits.append(self._row_to_credit(row))
+            return self._rows_to_credits(cursor.fetchall())
+    
+    def get_credits_by_artist(self, artist_id: int) -> List[Credit]:
+        """Récupère tous les crédits des tracks d'un artiste"""
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT c.* FROM credits c
+                JOIN tracks t ON t.id = c.track_id
+                WHERE t.artist_id = ?
+                ORDER BY c.track_id, c.credit_category, c.person_name
+            """, (artist_id,))
             
-            return credits
+            return self._rows_to_credits(cursor.fetchall())
+    
+    def get_credits_by_track_id(self, track_id: int) -> List[Credit]:
+        """Alias de get_credits_by_track (nom utilisé par les processors)"""
+        return self.get_credits_by_track(track_id)
+    
+    def get_features_by_track_id(self, track_id: int) -> List[str]:
+        """Noms des artistes en featuring d'un track (crédits de type featuring)"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT DISTINCT person_name FROM credits "
+                "WHERE track_id = ? AND (is_featuring = 1 OR credit_type = 'featuring') "
+                "ORDER BY person_name",
+                (track_id,)
+            )
+            return [row[0] for row in cursor.fetchall()]
     
     def update_credit(self, credit: Credit):
         """Met à jour un crédit"""
@@ -834,23 +1329,180 @@ class Database:
     
     def _row_to_credit(self, row) -> Credit:
         """Convertit une ligne de base en objet Credit"""
-        from models.enums import CreditType
+        return self._rows_to_credits((row,))[0]
+    
+    def _rows_to_credits(self, rows) -> List[Credit]:
+        """Convertit des lignes de base en objets Credit (construction en lot)"""
+        return build_entities(Credit, rows, _CREDIT_ROW_FIELDS, _CREDIT_ROW_CONVERTERS)
+    
+    def get_credit_person_names(self, artist_id: Optional[int] = None) -> List[str]:
+        """Récupère les noms distincts des personnes créditées (optionnellement pour un artiste)"""
+        with self.get_connection() as conn:
+            if artist_id:
+                cursor = conn.execute("""
+                    SELECT DISTINCT c.person_name FROM credits c
+                    JOIN tracks t ON c.track_id = t.id
+                    WHERE t.artist_id = ? AND c.person_name IS NOT NULL
+                """, (artist_id,))
+            else:
+                cursor = conn.execute(
+                    "SELECT DISTINCT person_name FROM credits WHERE person_name IS NOT NULL"
+                )
+            
+            return [row[0] for row in cursor.fetchall()]
+    
+    def rename_credit_persons(self, corrections: Dict[str, str], 
+                              artist_id: Optional[int] = None) -> int:
+        """
+        Renomme les personnes créditées en un seul UPDATE.
         
-        return Credit(
-            id=row['id'],
-            track_id=row['track_id'],
-            credit_category=CreditCategory(row['credit_category']) if row['credit_category'] else None,
-            credit_type=CreditType(row['credit_type']),
-            person_name=row['person_name'],
-            role_detail=row['role_detail'],
-            instrument=row['instrument'],
-            is_primary=bool(row['is_primary']),
-            is_featuring=bool(row['is_featuring']),
-            is_uncredited=bool(row['is_uncredited']),
-            data_source=DataSource(row['data_source']),
-            extraction_date=datetime.fromisoformat(row['extraction_date']) if row['extraction_date'] else None,
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
-        )
+        Args:
+            corrections: Mapping nom actuel -> nom canonique
+            artist_id: Restreindre aux crédits des tracks de cet artiste
+            
+        Returns:
+            Nombre de crédits modifiés
+        """
+        if not corrections:
+            return 0
+        
+        with self.get_connection() as conn:
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS name_corrections (
+                    old_name TEXT PRIMARY KEY,
+                    new_name TEXT NOT NULL
+                )
+            """)
+            conn.execute("DELETE FROM name_corrections")
+            conn.executemany(
+                "INSERT OR REPLACE INTO name_corrections (old_name, new_name) VALUES (?, ?)",
+                list(corrections.items())
+            )
+            
+            query = """
+                UPDATE credits SET person_name = (
+                    SELECT new_name FROM name_corrections WHERE old_name = credits.person_name
+                )
+                WHERE person_name IN (SELECT old_name FROM name_corrections)
+            """
+            params = ()
+            if artist_id:
+                query += " AND track_id IN (SELECT id FROM tracks WHERE artist_id = ?)"
+                params = (artist_id,)
+            
+            cursor = conn.execute(query, params)
+            return cursor.rowcount
+    
+    # ==================== PERSONS ====================
+    
+    def get_person_aliases(self) -> List[Dict[str, Any]]:
+        """Récupère toutes les personnes canoniques avec leurs alias"""
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT p.id AS person_id, p.canonical_name, p.normalized_key AS person_key,
+                       a.alias, a.normalized_key AS alias_key
+                FROM persons p
+                LEFT JOIN person_aliases a ON a.person_id = p.id
+                ORDER BY p.id
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def save_person_aliases(self, canonical_names: Dict[int, tuple],
+                            aliases: List[tuple],
+                            renamed: Optional[Dict[str, str]] = None) -> Dict[int, int]:
+        """
+        Sauvegarde en une transaction les personnes et alias de l'index.
+        
+        Args:
+            canonical_names: person_id -> (nom canonique, clé normalisée).
+                Les identifiants négatifs désignent des personnes à créer.
+            aliases: Liste de (alias, clé normalisée, person_id)
+            renamed: Ancien nom canonique -> nouveau ; les crédits de tous les
+                artistes qui portent l'ancien nom sont renommés
+            
+        Returns:
+            Mapping identifiant fourni -> identifiant en base
+        """
+        id_mapping = {}
+        
+        with self.get_connection() as conn:
+            for person_id, (canonical_name, normalized_key) in canonical_names.items():
+                if person_id < 0:
+                    cursor = conn.execute(
+                        "INSERT INTO persons (canonical_name, normalized_key) VALUES (?, ?)",
+                        (canonical_name, normalized_key)
+                    )
+                    id_mapping[person_id] = cursor.lastrowid
+                else:
+                    conn.execute("""
+                        UPDATE persons SET canonical_name = ?, normalized_key = ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, (canonical_name, normalized_key, person_id))
+                    id_mapping[person_id] = person_id
+            
+            conn.executemany("""
+                INSERT OR REPLACE INTO person_aliases (alias, normalized_key, person_id)
+                VALUES (?, ?, ?)
+            """, [
+                (alias, key, id_mapping.get(person_id, person_id))
+                for alias, key, person_id in aliases
+            ])
+            
+            if renamed:
+                conn.executemany(
+                    "UPDATE credits SET person_name = ? WHERE person_name = ?",
+                    [(new_name, old_name) for old_name, new_name in renamed.items()]
+                )
+        
+        return id_mapping
+    
+    # ==================== TABLES COLONNAIRES ====================
+    
+    def get_track_table(self, artist_id: Optional[int] = None):
+        """
+        Morceaux sous forme de TrackTable (colonnes NumPy, triées par artiste).
+        
+        Les paroles ne sont pas chargées ; l'année provient de l'album.
+        """
+        from models.tables import TrackTable
+        
+        query = """
+            SELECT t.id, t.title, t.artist_id, t.artist_name, t.album_id, t.album_title,
+                   t.track_number, t.disc_number, t.genius_id, t.spotify_id,
+                   t.duration_seconds, t.bpm, t.key, t.has_lyrics,
+                   t.created_at, t.updated_at, a.release_year AS year
+            FROM tracks t
+            LEFT JOIN albums a ON a.id = t.album_id
+        """
+        params: tuple = ()
+        if artist_id is not None:
+            query += " WHERE t.artist_id = ?"
+            params = (artist_id,)
+        query += " ORDER BY t.artist_id, t.id"
+        
+        with self.get_connection() as conn:
+            return TrackTable.from_cursor(conn.execute(query, params))
+    
+    def get_credit_table(self, artist_id: Optional[int] = None):
+        """Crédits sous forme de CreditTable (colonnes NumPy, triées par artiste)"""
+        from models.tables import CreditTable
+        
+        query = """
+            SELECT c.id, c.track_id, t.artist_id, c.credit_category, c.credit_type,
+                   c.person_name, c.role_detail, c.instrument, c.is_primary,
+                   c.is_featuring, c.is_uncredited, c.data_source, c.extraction_date
+            FROM credits c
+            JOIN tracks t ON t.id = c.track_id
+        """
+        params: tuple = ()
+        if artist_id is not None:
+            query += " WHERE t.artist_id = ?"
+            params = (artist_id,)
+        query += " ORDER BY t.artist_id, c.track_id"
+        
+        with self.get_connection() as conn:
+            return CreditTable.from_cursor(conn.execute(query, params))
     
     # ==================== STATS ====================
     
@@ -979,51 +1631,383 @@ class Database:
     
     # ==================== CHECKPOINTS ====================
     
+    @profiled('db')
     def save_checkpoint(self, session_id: str, step_name: str, data: Dict[str, Any]):
-        """Sauvegarde un checkpoint"""
-        with self.get_connection() as conn:
-            conn.execute("""
-                INSERT INTO checkpoints (session_id, step_name, data)
-                VALUES (?, ?, ?)
-            """, (
-                session_id,
-                step_name,
-                json.dumps(data)
-            ))
+        """
+        Sauvegarde un checkpoint.
+        
+        Le premier checkpoint d'une étape est une base compressée, les
+        suivants des deltas compressés par rapport au précédent. Tous les
+        checkpoint_compact_every checkpoints (ou dès que les deltas pèsent
+        plus que la base), la chaîne est compactée en une nouvelle base.
+        """
+        start = time.perf_counter()
+        raw = json.dumps(data, default=str)
+        # Copie de l'état tel que sérialisé (référence du prochain delta)
+        snapshot = json.loads(raw)
+        key = (session_id, step_name)
+        
+        with self._checkpoint_lock, self.get_connection() as conn:
+            head = conn.execute(
+                "SELECT * FROM checkpoint_heads WHERE session_id = ? AND step_name = ?",
+                key
+            ).fetchone()
+            
+            previous = None
+            if head is not None:
+                previous = self._cached_checkpoint_state(key, head['latest_id'])
+                if previous is None:
+                    previous = self._load_checkpoint_chain(conn, head)
+            
+            compact = head is None or not isinstance(previous, dict) or not isinstance(snapshot, dict) or (
+                head['chain_length'] >= self.checkpoint_compact_every
+                or head['chain_size'] > head['base_size']
+            )
+            
+            if compact:
+                payload = _pack_checkpoint(snapshot)
+                checkpoint_id = self._insert_checkpoint(conn, session_id, step_name, 'base', None,
+                                                        payload, len(raw))
+                if head is not None:
+                    # Chaîne précédente (et anciens checkpoints JSON) remplacée par la base
+                    conn.execute("""
+                        DELETE FROM checkpoints
+                        WHERE session_id = ? AND step_name = ? AND id < ?
+                    """, (session_id, step_name, checkpoint_id))
+                    self._checkpoint_metrics['compactions'] += 1
+                conn.execute("""
+                    INSERT OR REPLACE INTO checkpoint_heads
+                        (session_id, step_name, base_id, latest_id, chain_length, base_size, chain_size, updated_at)
+                    VALUES (?, ?, ?, ?, 0, ?, 0, CURRENT_TIMESTAMP)
+                """, (session_id, step_name, checkpoint_id, checkpoint_id, len(payload)))
+                self._checkpoint_metrics['bases'] += 1
+            else:
+                delta = _json_delta(previous, snapshot)
+                if delta is None:
+                    # État inchangé: rien à écrire
+                    self._checkpoint_metrics['unchanged'] += 1
+                    self._remember_checkpoint_state(key, head['latest_id'], snapshot)
+                    self._record_checkpoint_save(start, len(raw), 0)
+                    return
+                
+                payload = _pack_checkpoint(delta)
+                checkpoint_id = self._insert_checkpoint(conn, session_id, step_name, 'delta',
+                                                        head['base_id'], payload, len(raw))
+                conn.execute("""
+                    UPDATE checkpoint_heads
+                    SET latest_id = ?, chain_length = chain_length + 1,
+                        chain_size = chain_size + ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE session_id = ? AND step_name = ?
+                """, (checkpoint_id, len(payload), session_id, step_name))
+                self._checkpoint_metrics['deltas'] += 1
+            
+            self._remember_checkpoint_state(key, checkpoint_id, snapshot)
+        
+        self._record_checkpoint_save(start, len(raw), len(payload))
+    
+    def _cached_checkpoint_state(self, key: tuple, latest_id: int) -> Optional[Any]:
+        """État en mémoire s'il correspond encore au dernier checkpoint (marqué récent)"""
+        cached = self._checkpoint_states.pop(key, None)
+        if cached is None or cached[0] != latest_id:
+            return None
+        self._checkpoint_states[key] = cached
+        return cached[1]
+    
+    def _remember_checkpoint_state(self, key: tuple, latest_id: int, state: Any):
+        """Garde l'état de référence, en évinçant les moins récemment utilisés"""
+        states = self._checkpoint_states
+        states.pop(key, None)
+        states[key] = (latest_id, state)
+        while len(states) > self.checkpoint_state_cache_size:
+            states.pop(next(iter(states)), None)
+    
+    def _forget_checkpoint_states(self, session_ids: set):
+        """Libère les états en mémoire des sessions terminées"""
+        for key in [key for key in list(self._checkpoint_states) if key[0] in session_ids]:
+            self._checkpoint_states.pop(key, None)
+    
+    def _insert_checkpoint(self, conn: sqlite3.Connection, session_id: str, step_name: str,
+                           kind: str, base_id: Optional[int], payload: bytes, raw_size: int) -> int:
+        cursor = conn.execute("""
+            INSERT INTO checkpoints (session_id, step_name, kind, base_id, payload, raw_size, stored_size)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (session_id, step_name, kind, base_id, payload, raw_size, len(payload)))
+        return cursor.lastrowid
+    
+    def _record_checkpoint_save(self, start: float, raw_size: int, stored_size: int):
+        metrics = self._checkpoint_metrics
+        metrics['saves'] += 1
+        metrics['raw_bytes'] += raw_size
+        metrics['stored_bytes'] += stored_size
+        metrics['save_seconds'] += time.perf_counter() - start
+    
+    def _load_checkpoint_chain(self, conn: sqlite3.Connection, head) -> Optional[Dict[str, Any]]:
+        """Reconstruit le dernier état d'une étape: base + deltas dans l'ordre"""
+        cursor = conn.execute("""
+            SELECT id, kind, payload FROM checkpoints
+            WHERE session_id = ? AND step_name = ? AND id >= ? AND id <= ?
+            ORDER BY id
+        """, (head['session_id'], head['step_name'], head['base_id'], head['latest_id']))
+        
+        state = None
+        for row in cursor:
+            if row['kind'] == 'base':
+                state = _unpack_checkpoint(row['payload'])
+            elif row['kind'] == 'delta' and state is not None:
+                _apply_json_delta(state, _unpack_checkpoint(row['payload']))
+        return state
     
     def get_checkpoint(self, session_id: str, step_name: str) -> Optional[Dict[str, Any]]:
-        """Récupère un checkpoint"""
+        """Récupère le dernier checkpoint d'une étape"""
+        start = time.perf_counter()
+        key = (session_id, step_name)
+        
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT data FROM checkpoints 
-                WHERE session_id = ? AND step_name = ?
-                ORDER BY created_at DESC LIMIT 1
-            """, (session_id, step_name))
-            row = cursor.fetchone()
+            head = conn.execute(
+                "SELECT * FROM checkpoint_heads WHERE session_id = ? AND step_name = ?",
+                key
+            ).fetchone()
             
-            if row:
-                return json.loads(row['data'])
-        return None
+            if head is not None:
+                state = self._cached_checkpoint_state(key, head['latest_id'])
+                if state is None:
+                    state = self._load_checkpoint_chain(conn, head)
+                    if state is not None:
+                        self._remember_checkpoint_state(key, head['latest_id'], state)
+                result = copy.deepcopy(state)
+            else:
+                # Checkpoints JSON antérieurs aux deltas
+                row = conn.execute("""
+                    SELECT data FROM checkpoints 
+                    WHERE session_id = ? AND step_name = ? AND data IS NOT NULL
+                    ORDER BY id DESC LIMIT 1
+                """, key).fetchone()
+                result = json.loads(row['data']) if row else None
+        
+        self._checkpoint_metrics['loads'] += 1
+        self._checkpoint_metrics['load_seconds'] += time.perf_counter() - start
+        return result
     
     def list_checkpoints(self, session_id: str) -> List[Dict[str, Any]]:
-        """Liste tous les checkpoints d'une session"""
+        """Liste tous les checkpoints d'une session (états reconstruits)"""
         with self.get_connection() as conn:
             cursor = conn.execute("""
-                SELECT step_name, data, created_at FROM checkpoints 
+                SELECT step_name, kind, data, payload, created_at FROM checkpoints 
                 WHERE session_id = ?
-                ORDER BY created_at DESC
+                ORDER BY id
             """, (session_id,))
             
             checkpoints = []
+            states: Dict[str, Any] = {}
             for row in cursor.fetchall():
+                kind = row['kind'] or 'full'
+                step_name = row['step_name']
+                if kind == 'full':
+                    data = json.loads(row['data'])
+                elif kind == 'base':
+                    data = _unpack_checkpoint(row['payload'])
+                elif step_name in states:
+                    data = _apply_json_delta(copy.deepcopy(states[step_name]),
+                                             _unpack_checkpoint(row['payload']))
+                else:
+                    continue
+                states[step_name] = data
                 checkpoints.append({
-                    'step_name': row['step_name'],
-                    'data': json.loads(row['data']),
+                    'step_name': step_name,
+                    'data': data,
                     'created_at': row['created_at']
                 })
             
+            checkpoints.reverse()
             return checkpoints
     
+    def get_checkpoint_metrics(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Métriques des checkpoints: volumes (JSON brut vs stocké), latences
+        moyennes et, pour une session, taille des chaînes de deltas.
+        """
+        metrics = dict(self._checkpoint_metrics)
+        metrics['compression_ratio'] = (
+            round(metrics['raw_bytes'] / metrics['stored_bytes'], 2) if metrics['stored_bytes'] else None
+        )
+        metrics['avg_save_ms'] = (
+            round(metrics['save_seconds'] * 1000 / metrics['saves'], 3) if metrics['saves'] else 0.0
+        )
+        metrics['avg_load_ms'] = (
+            round(metrics['load_seconds'] * 1000 / metrics['loads'], 3) if metrics['loads'] else 0.0
+        )
+        
+        if session_id:
+            with self.get_connection() as conn:
+                metrics['steps'] = {
+                    row['step_name']: {
+                        'chain_length': row['chain_length'],
+                        'base_size': row['base_size'],
+                        'chain_size': row['chain_size']
+                    }
+                    for row in conn.execute(
+                        "SELECT * FROM checkpoint_heads WHERE session_id = ?", (session_id,)
+                    )
+                }
+                row = conn.execute("""
+                    SELECT COUNT(*) AS rows_count,
+                           COALESCE(SUM(COALESCE(stored_size, LENGTH(data))), 0) AS stored_bytes
+                    FROM checkpoints WHERE session_id = ?
+                """, (session_id,)).fetchone()
+                metrics['session_rows'] = row['rows_count']
+                metrics['session_stored_bytes'] = row['stored_bytes']
+        
+        return metrics
+    
+    # ==================== FILE DE TÂCHES ====================
+    # États: pending -> leased -> done | pending (nouvel essai) | failed.
+    # Un bail expiré (worker arrêté ou planté) rend la tâche réclamable.
+    
+    @profiled('db')
+    def enqueue_tasks(self, session_id: str, track_ids: List[int], extractors: List[str],
+                      priorities: Optional[Dict[int, int]] = None) -> int:
+        """
+        Ajoute les tâches (morceau, extracteur) d'une session ; les tâches
+        existantes sont conservées avec leur état.
+        
+        Returns:
+            Nombre de tâches créées
+        """
+        priorities = priorities or {}
+        with self.get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO extraction_tasks (session_id, track_id, extractor, priority)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (session_id, track_id, extractor, priorities.get(track_id, 0))
+                for track_id in track_ids
+                for extractor in extractors
+            ])
+            return conn.total_changes - before
+    
+    @profiled('db')
+    def claim_tasks(self, session_id: str, worker_id: str, limit: int = 20,
+                    lease_seconds: float = 300.0) -> List[Dict[str, Any]]:
+        """
+        Réserve atomiquement un lot de tâches disponibles (UPDATE ... RETURNING).
+        
+        Plusieurs workers, y compris dans d'autres processus, peuvent vider
+        la même file : SQLite sérialise les UPDATE, une tâche n'est donc
+        réservée que par un seul worker à la fois.
+        """
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE extraction_tasks
+                SET state = 'leased', lease_owner = ?, lease_expires_at = ?,
+                    attempts = attempts + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN (
+                    SELECT id FROM extraction_tasks
+                    WHERE session_id = ?
+                      AND ((state = 'pending' AND available_at <= ?)
+                           OR (state = 'leased' AND lease_expires_at <= ?))
+                    ORDER BY priority DESC, id
+                    LIMIT ?
+                )
+                RETURNING id, track_id, extractor, attempts
+            """, (worker_id, now + lease_seconds, session_id, now, now, limit))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def extend_task_leases(self, task_ids: List[int], worker_id: str, lease_seconds: float = 300.0):
+        """Prolonge les baux d'un worker encore actif"""
+        if not task_ids:
+            return
+        placeholders = ','.join('?' * len(task_ids))
+        with self.get_connection() as conn:
+            conn.execute(f"""
+                UPDATE extraction_tasks SET lease_expires_at = ?
+                WHERE id IN ({placeholders}) AND lease_owner = ? AND state = 'leased'
+            """, (time.time() + lease_seconds, *task_ids, worker_id))
+    
+    @profiled('db')
+    def complete_tasks(self, task_ids: List[int], worker_id: str) -> int:
+        """Marque des tâches terminées (seulement si le bail appartient encore au worker)"""
+        if not task_ids:
+            return 0
+        placeholders = ','.join('?' * len(task_ids))
+        with self.get_connection() as conn:
+            cursor = conn.execute(f"""
+                UPDATE extraction_tasks
+                SET state = 'done', lease_owner = NULL, lease_expires_at = NULL,
+                    last_error = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN ({placeholders}) AND lease_owner = ? AND state = 'leased'
+            """, (*task_ids, worker_id))
+            return cursor.rowcount
+    
+    def fail_task(self, task_id: int, worker_id: str, error: str,
+                  retry_delay: float, max_attempts: int) -> bool:
+        """
+        Enregistre l'échec d'une tâche : nouvel essai après retry_delay, ou
+        échec définitif une fois max_attempts atteint.
+        
+        Returns:
+            True si un nouvel essai est programmé
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                UPDATE extraction_tasks
+                SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    available_at = ?, last_error = ?,
+                    lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND lease_owner = ? AND state = 'leased'
+                RETURNING state
+            """, (max_attempts, time.time() + retry_delay, error[:500], task_id, worker_id)).fetchone()
+            return bool(row) and row['state'] == 'pending'
+    
+    def release_tasks(self, task_ids: List[int], worker_id: str, delay: float = 0.0):
+        """Rend des tâches à la file sans compter d'essai (arrêt du worker, rate limit)"""
+        if not task_ids:
+            return
+        placeholders = ','.join('?' * len(task_ids))
+        with self.get_connection() as conn:
+            conn.execute(f"""
+                UPDATE extraction_tasks
+                SET state = 'pending', attempts = MAX(0, attempts - 1), available_at = ?,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN ({placeholders}) AND lease_owner = ? AND state = 'leased'
+            """, (time.time() + delay, *task_ids, worker_id))
+    
+    def get_task_queue_stats(self, session_id: str) -> Dict[str, int]:
+        """Nombre de tâches par état pour une session"""
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT state, COUNT(*) AS count FROM extraction_tasks
+                WHERE session_id = ? GROUP BY state
+            """, (session_id,))
+            stats = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+            stats.update({row['state']: row['count'] for row in cursor.fetchall()})
+            return stats
+    
+    def complete_track_tasks(self, session_id: str, track_ids: List[int]) -> int:
+        """Marque terminées les tâches non réservées de morceaux traités hors file (pipeline)"""
+        track_ids = list(track_ids)
+        if not track_ids:
+            return 0
+        placeholders = ','.join('?' * len(track_ids))
+        with self.get_connection() as conn:
+            cursor = conn.execute(f"""
+                UPDATE extraction_tasks
+                SET state = 'done', updated_at = CURRENT_TIMESTAMP
+                WHERE session_id = ? AND state = 'pending' AND track_id IN ({placeholders})
+            """, (session_id, *track_ids))
+            return cursor.rowcount
+    
+    def get_next_task_time(self, session_id: str) -> Optional[float]:
+        """Échéance (epoch) de la prochaine tâche en attente, None s'il n'y en a plus"""
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT MIN(available_at) FROM extraction_tasks
+                WHERE session_id = ? AND state = 'pending'
+            """, (session_id,)).fetchone()
+            return row[0] if row else None
+    
     # ==================== SEARCH ====================
     
     def search_tracks(self, query: str, artist_id: Optional[int] = None, 
@@ -1043,11 +2027,7 @@ class Database:
                     ORDER BY title LIMIT ?
                 """, (f"%{query}%", f"%{query}%", limit))
             
-            tracks = []
-            for row in cursor.fetchall():
-                tracks.append(self._row_to_track(row))
-            
-            return tracks
+            return self._rows_to_tracks(cursor.fetchall())
     
     def search_artists(self, query: str, limit: int = 20) -> List[Artist]:
         """Recherche d'artistes par nom"""
@@ -1152,14 +2132,12 @@ class Database:
                 
                 # Tracks
                 cursor = conn.execute("SELECT * FROM tracks")
-                for row in cursor.fetchall():
-                    track = self._row_to_track(row)
+                for track in self._rows_to_tracks(cursor.fetchall()):
                     data['tracks'].append(track.to_dict())
                 
                 # Credits
                 cursor = conn.execute("SELECT * FROM credits")
-                for row in cursor.fetchall():
-                    credit = self._row_to_credit(row)
+                for credit in self._rows_to_credits(cursor.fetchall()):
                     data['credits'].append(credit.to_dict())
         
         # Sauvegarder le JSON
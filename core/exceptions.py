@@ -275,6 +275,13 @@ class CreditExtractionError(ExtractionError):
         })
 
 
+# ===== EXCEPTIONS TRAITEMENT =====
+
+class ProcessingError(MusicDataExtractorError):
+    """Exception levée quand le traitement des données extraites échoue"""
+    pass
+
+
 # ===== EXCEPTIONS CACHE =====
 
 class CacheError(MusicDataExtractorError):
@@ -393,6 +400,7 @@ def get_exception_hierarchy() -> Dict[str, list]:
         'database': [DatabaseError, DatabaseConnectionError, DatabaseSchemaError, DatabaseIntegrityError],
         'data': [DataError, DataValidationError, DataInconsistencyError],
         'extraction': [ExtractionError, ArtistNotFoundError, TrackExtractionError, CreditExtractionError],
+        'processing': [ProcessingError],
         'cache': [CacheError, CacheExpiredError, CacheCorruptedError],
         'session': [SessionError, SessionNotFoundError, SessionCorruptedError, SessionStatusError],
         'export': [ExportError, ExportFormatError, ExportDataError]
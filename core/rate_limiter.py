@@ -1,21 +1,199 @@
 # core/rate_limiter.py - Version corrigée
+import logging
+import sqlite3
 import time
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Callable, List
+from pathlib import Path
+from typing import Any, Dict, Optional, Callable, List, Tuple
 from functools import wraps
 import threading
 
 from config.settings import settings
+from utils.profiling import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMITS = {
+    'genius': {
+        'requests_per_minute': 30,
+        'requests_per_hour': 1000
+    },
+    'spotify': {
+        'requests_per_minute': 100,
+        'requests_per_hour': 3000
+    },
+    'discogs': {
+        'requests_per_minute': 60,
+        'requests_per_hour': 1000
+    },
+    'lastfm': {
+        'requests_per_minute': 300,
+        'requests_per_hour': 5000
+    },
+    'web_scraping': {
+        'requests_per_minute': 20,
+        'requests_per_hour': 200
+    }
+}
+
+# Fenêtres des limites: type de limite -> (nom du seau, durée en secondes)
+_LIMIT_WINDOWS = {
+    'requests_per_minute': ('minute', 60.0),
+    'requests_per_hour': ('hour', 3600.0)
+}
+
+
+# ===== SEAUX DE JETONS PARTAGÉS =====
+
+class SharedTokenBucketStore:
+    """
+    Seaux de jetons partagés par tous les processus d'une machine.
+    
+    L'état des seaux (jetons restants, dernière mise à jour) est stocké dans
+    un petit fichier SQLite ; chaque prise de jeton est une transaction
+    BEGIN IMMEDIATE, sérialisée entre processus par le verrou d'écriture
+    SQLite. Un seau de capacité 1 rechargé à quota/fenêtre ne délivre jamais
+    plus que le quota sur une fenêtre glissante.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or str(settings.data_dir / "rate_limits.db")
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                bucket_key TEXT NOT NULL,
+                window TEXT NOT NULL,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (bucket_key, window)
+            )
+        """)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Connexion propre au thread (autocommit, transactions explicites)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def acquire(self, bucket_key: str, buckets: List[Tuple[str, float, float]],
+                consume: bool = True) -> float:
+        """
+        Prend un jeton dans tous les seaux d'une clé, de manière atomique.
+        
+        Args:
+            bucket_key: Clé partagée (nom de l'API)
+            buckets: (fenêtre, capacité, jetons rechargés par seconde)
+            consume: False pour seulement tester la disponibilité
+            
+        Returns:
+            0.0 si le jeton est pris (ou disponible), sinon l'attente en
+            secondes avant disponibilité
+        """
+        if not buckets:
+            return 0.0
+        
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            levels = []
+            wait_seconds = 0.0
+            
+            for window, capacity, refill_rate in buckets:
+                row = conn.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE bucket_key = ? AND window = ?",
+                    (bucket_key, window)
+                ).fetchone()
+                if row is None:
+                    level = capacity
+                else:
+                    level = min(capacity, row[0] + max(0.0, now - row[1]) * refill_rate)
+                levels.append((window, level))
+                
+                # Tolérance d'arrondi pour un seau rechargé exactement à 1 jeton
+                if level < 1.0 - 1e-9:
+                    wait_seconds = max(wait_seconds, (1.0 - level) / refill_rate)
+            
+            if consume and wait_seconds == 0.0:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO token_buckets (bucket_key, window, tokens, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(bucket_key, window, level - 1.0, now) for window, level in levels]
+                )
+                wait_seconds = 0.0
+            
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        
+        return wait_seconds
+    
+    def levels(self, bucket_key: str, buckets: List[Tuple[str, float, float]]) -> Dict[str, float]:
+        """Jetons disponibles par fenêtre (lecture seule)"""
+        now = time.time()
+        rows = dict(
+            (row[0], (row[1], row[2])) for row in self._connection().execute(
+                "SELECT window, tokens, updated_at FROM token_buckets WHERE bucket_key = ?",
+                (bucket_key,)
+            )
+        )
+        result = {}
+        for window, capacity, refill_rate in buckets:
+            if window in rows:
+                tokens, updated_at = rows[window]
+                result[window] = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+            else:
+                result[window] = capacity
+        return result
+
+
+_shared_stores: Dict[str, SharedTokenBucketStore] = {}
+_shared_stores_lock = threading.Lock()
+
+def get_shared_bucket_store(db_path: Optional[str] = None) -> SharedTokenBucketStore:
+    """Store partagé unique par fichier dans le processus"""
+    key = db_path or str(settings.data_dir / "rate_limits.db")
+    with _shared_stores_lock:
+        if key not in _shared_stores:
+            _shared_stores[key] = SharedTokenBucketStore(key)
+        return _shared_stores[key]
+
 
 class RateLimiter:
-    """Gestionnaire de limitations de taux pour les APIs"""
+    """
+    Gestionnaire de limitations de taux pour les APIs.
     
-    def __init__(self, requests_per_period: int = 60, period_seconds: int = 60):
+    Backend 'sqlite' (défaut, rate_limits.backend) : les quotas sont partagés
+    par tous les processus de la machine via SharedTokenBucketStore. Backend
+    'memory' : historique des requêtes propre au processus.
+    """
+    
+    def __init__(self, requests_per_period: int = 60, period_seconds: int = 60,
+                 calls_per_minute: Optional[int] = None, backend: Optional[str] = None,
+                 name: Optional[str] = None):
         """
         CORRECTION: Constructeur avec paramètres par défaut pour compatibilité
         avec base_extractor.py
+        
+        Args:
+            requests_per_period: Requêtes autorisées par période (limite 'default')
+            period_seconds: Durée de la période
+            calls_per_minute: Alias de requests_per_period sur 60 secondes
+            backend: 'sqlite' (partagé entre processus) ou 'memory'
+            name: Clé partagée de la limite 'default' (défaut: dérivée de la limite)
         """
+        if calls_per_minute is not None:
+            requests_per_period, period_seconds = calls_per_minute, 60
+        
         # Charger les limites depuis la config ou utiliser les paramètres
         self.api_limits = self._load_rate_limits()
         
@@ -30,34 +208,75 @@ class RateLimiter:
         
         self.request_history: Dict[str, deque] = defaultdict(lambda: deque())
         self.lock = threading.Lock()
+        
+        # Backend partagé entre processus
+        self.name = name
+        self.burst = max(1.0, float(settings.get('rate_limits.burst', 1)))
+        self.shared_store: Optional[SharedTokenBucketStore] = None
+        
+        backend = backend or settings.get('rate_limits.backend', 'sqlite')
+        if backend == 'sqlite':
+            try:
+                self.shared_store = get_shared_bucket_store()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"⚠️ Rate limiter partagé indisponible, limites par processus: {e}")
     
     def _load_rate_limits(self) -> Dict[str, Dict[str, int]]:
         """Charge les limites de taux depuis la configuration"""
-        return settings.get('rate_limits', {
-            'genius': {
-                'requests_per_minute': 30,
-                'requests_per_hour': 1000
-            },
-            'spotify': {
-                'requests_per_minute': 100,
-                'requests_per_hour': 3000
-            },
-            'discogs': {
-                'requests_per_minute': 60,
-                'requests_per_hour': 1000
-            },
-            'lastfm': {
-                'requests_per_minute': 300,
-                'requests_per_hour': 5000
-            },
-            'web_scraping': {
-                'requests_per_minute': 20,
-                'requests_per_hour': 200
-            }
-        })
+        # settings.get est mis en cache (lru_cache) : pas de défaut non hachable
+        configured = settings.get('rate_limits') or DEFAULT_RATE_LIMITS
+        # Les options globales (backend, burst) côtoient les limites par API
+        return {api: limits for api, limits in configured.items() if isinstance(limits, dict)}
+    
+    def _get_limits(self, api_name: str) -> Dict[str, int]:
+        """Limites applicables à une API"""
+        if self.custom_limit and api_name == 'default':
+            return self.custom_limit
+        return self.api_limits.get(api_name, self.custom_limit or {})
+    
+    def _limit_value(self, api_name: str, limit_type: str) -> int:
+        """Valeur d'une limite (surchargée par le limiteur adaptatif)"""
+        return self._get_limits(api_name).get(limit_type, 0)
+    
+    # ===== BACKEND PARTAGÉ =====
+    
+    def _bucket_key(self, api_name: str) -> str:
+        """Clé du seau partagé : l'API, ou la limite personnalisée pour 'default'"""
+        if api_name == 'default' and self.custom_limit:
+            return self.name or f"default:{self.custom_limit['requests_per_minute']}/min"
+        return api_name
+    
+    def _bucket_specs(self, api_name: str) -> List[Tuple[str, float, float]]:
+        """Seaux (fenêtre, capacité, recharge par seconde) d'une API"""
+        specs = []
+        for limit_type, (window, seconds) in _LIMIT_WINDOWS.items():
+            limit = self._limit_value(api_name, limit_type)
+            if limit and limit > 0:
+                specs.append((window, min(self.burst, float(limit)), limit / seconds))
+        return specs
+    
+    def _shared_wait(self, api_name: str) -> float:
+        """Attend et prend un jeton du seau partagé"""
+        start_time = time.time()
+        bucket_key = self._bucket_key(api_name)
+        specs = self._bucket_specs(api_name)
+        
+        while True:
+            wait_seconds = self.shared_store.acquire(bucket_key, specs)
+            if wait_seconds == 0.0:
+                break
+            time.sleep(wait_seconds)
+        
+        return time.time() - start_time
     
     def can_make_request(self, api_name: str = 'default') -> bool:
         """Vérifie si une requête peut être faite maintenant"""
+        if self.shared_store is not None:
+            specs = self._bucket_specs(api_name)
+            return not specs or self.shared_store.acquire(
+                self._bucket_key(api_name), specs, consume=False
+            ) == 0.0
+        
         # Utiliser la limite personnalisée si définie, sinon la limite de l'API
         if self.custom_limit and api_name == 'default':
             limits = self.custom_limit
@@ -101,6 +320,9 @@ class RateLimiter:
         if not limits:
             return 0.0
         
+        if self.shared_store is not None:
+            return self._shared_wait(api_name)
+        
         start_time = time.time()
         
         while not self.can_make_request(api_name):
@@ -111,7 +333,12 @@ class RateLimiter:
         return time.time() - start_time
     
     def record_request(self, api_name: str = 'default'):
-        """Enregistre qu'une requête a été faite"""
+        """
+        Enregistre qu'une requête a été faite.
+        
+        Avec le backend partagé, le jeton a déjà été pris par wait_if_needed :
+        seul l'historique local (statistiques) est mis à jour.
+        """
         with self.lock:
             self.request_history[api_name].append(datetime.now())
     
@@ -173,15 +400,33 @@ class RateLimiter:
             requests_last_minute = sum(1 for req_time in history if req_time > minute_ago)
             requests_last_hour = sum(1 for req_time in history if req_time > hour_ago)
             
+        if self.shared_store is not None:
+            bucket_key = self._bucket_key(api_name)
+            specs = self._bucket_specs(api_name)
+            wait_seconds = self.shared_store.acquire(bucket_key, specs, consume=False)
             return {
                 'api_name': api_name,
+                'backend': 'sqlite',
+                'bucket_key': bucket_key,
                 'requests_last_minute': requests_last_minute,
                 'requests_last_hour': requests_last_hour,
                 'limit_per_minute': limits.get('requests_per_minute'),
                 'limit_per_hour': limits.get('requests_per_hour'),
-                'can_make_request': self.can_make_request(api_name),
-                'estimated_wait_time': self._calculate_sleep_time(api_name) if not self.can_make_request(api_name) else 0
+                'shared_tokens': self.shared_store.levels(bucket_key, specs),
+                'can_make_request': wait_seconds == 0.0,
+                'estimated_wait_time': wait_seconds
             }
+        
+        return {
+            'api_name': api_name,
+            'backend': 'memory',
+            'requests_last_minute': requests_last_minute,
+            'requests_last_hour': requests_last_hour,
+            'limit_per_minute': limits.get('requests_per_minute'),
+            'limit_per_hour': limits.get('requests_per_hour'),
+            'can_make_request': self.can_make_request(api_name),
+            'estimated_wait_time': self._calculate_sleep_time(api_name) if not self.can_make_request(api_name) else 0
+        }
     
     def rate_limited_call(self, api_name: str):
         """Décorateur pour appliquer automatiquement le rate limiting"""
@@ -210,8 +455,8 @@ class RateLimiter:
 class AdaptiveRateLimiter(RateLimiter):
     """Rate limiter adaptatif qui ajuste automatiquement les limites"""
     
-    def __init__(self, requests_per_period: int = 60, period_seconds: int = 60):
-        super().__init__(requests_per_period, period_seconds)
+    def __init__(self, requests_per_period: int = 60, period_seconds: int = 60, **kwargs):
+        super().__init__(requests_per_period, period_seconds, **kwargs)
         self.error_history: Dict[str, deque] = defaultdict(lambda: deque())
         self.success_rates: Dict[str, float] = defaultdict(lambda: 1.0)
         self.adaptive_multipliers: Dict[str, float] = defaultdict(lambda: 1.0)
@@ -253,8 +498,15 @@ class AdaptiveRateLimiter(RateLimiter):
         adaptive_limit = int(base_limit * multiplier)
         return max(1, adaptive_limit)  # Au moins 1 requête
     
+    def _limit_value(self, api_name: str, limit_type: str) -> int:
+        """Limite réduite par le multiplicateur adaptatif (seaux partagés)"""
+        return self._get_adaptive_limit(api_name, limit_type)
+    
     def can_make_request(self, api_name: str = 'default') -> bool:
         """Version adaptative de can_make_request"""
+        if self.shared_store is not None:
+            return super().can_make_request(api_name)
+        
         if self.custom_limit and api_name == 'default':
             limits = self.custom_limit
         else:
@@ -298,4 +550,250 @@ class AdaptiveRateLimiter(RateLimiter):
             history.popleft()
 
 # Instance globale du rate limiter
-rate_limiter = AdaptiveRateLimiter()
\ No newline at end of file
+rate_limiter = AdaptiveRateLimiter()
+
+# ===== CONTRÔLE ADAPTATIF DE LA CONCURRENCE =====
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Valeur d'un en-tête Retry-After (secondes ou date HTTP) en secondes"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return default
+
+
+class AdaptiveConcurrencyController:
+    """
+    Limite adaptative de requêtes simultanées vers une API (AIMD / Vegas).
+    
+    - Latence saine (proche de la latence minimale observée) : la limite
+      augmente d'environ une requête par fenêtre de `limit` succès
+    - Latence qui se dégrade (file d'attente côté serveur) : légère baisse
+    - Throttling (429, Retry-After, quota restant presque épuisé) : la
+      limite est multipliée par backoff_factor et les admissions sont
+      suspendues pendant le délai indiqué par le serveur
+    
+    Une requête qui devrait attendre la fin d'une suspension n'occupe pas
+    de thread : acquire lève immédiatement APIRateLimitError(retry_after),
+    et l'ordonnanceur des lots remet le travail en file.
+    """
+    
+    # En-têtes de quota restant: (restant, total) par API
+    QUOTA_HEADERS = {
+        'discogs': ('X-Discogs-Ratelimit-Remaining', 'X-Discogs-Ratelimit'),
+    }
+    
+    def __init__(self, api_name: str, initial_limit: int = 4, min_limit: int = 1,
+                 max_limit: int = 32, backoff_factor: float = 0.5,
+                 latency_tolerance: float = 2.0, max_queue_wait: float = 1.0,
+                 quota_window_seconds: float = 60.0):
+        self.api_name = api_name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.max_queue_wait = max_queue_wait
+        self.quota_window_seconds = quota_window_seconds
+        
+        self.inflight = 0
+        self.blocked_until = 0.0
+        self.min_latency: Optional[float] = None
+        self.stats = {'requests': 0, 'throttled': 0, 'parked': 0, 'limit_decreases': 0}
+        self._cond = threading.Condition()
+    
+    @classmethod
+    def from_settings(cls, api_name: str) -> 'AdaptiveConcurrencyController':
+        """Contrôleur configuré par concurrency.<api>.* dans les settings"""
+        prefix = f'concurrency.{api_name}'
+        return cls(
+            api_name,
+            initial_limit=settings.get(f'{prefix}.initial', 4),
+            min_limit=settings.get(f'{prefix}.min', 1),
+            max_limit=settings.get(f'{prefix}.max', 32),
+            backoff_factor=settings.get(f'{prefix}.backoff_factor', 0.5),
+            max_queue_wait=settings.get(f'{prefix}.max_queue_wait', 1.0)
+        )
+    
+    def acquire(self):
+        """
+        Réserve une place parmi les requêtes simultanées.
+        
+        Raises:
+            APIRateLimitError: Admissions suspendues, ou aucune place libérée
+                dans max_queue_wait secondes
+        """
+        from core.exceptions import APIRateLimitError
+        
+        deadline = time.monotonic() + self.max_queue_wait
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                pause = self.blocked_until - now
+                if pause > 0:
+                    self.stats['parked'] += 1
+                    raise APIRateLimitError(self.api_name, pause)
+                
+                if self.inflight < int(self.limit):
+                    self.inflight += 1
+                    return
+                
+                remaining = deadline - now
+                if remaining <= 0:
+                    self.stats['parked'] += 1
+                    raise APIRateLimitError(self.api_name, self.max_queue_wait)
+                self._cond.wait(remaining)
+    
+    def release(self):
+        """Libère une place"""
+        with self._cond:
+            self.inflight = max(0, self.inflight - 1)
+            self._cond.notify()
+    
+    def on_success(self, latency: float, headers: Optional[Dict[str, str]] = None):
+        """Réponse normale : ajuste la limite selon la latence et le quota restant"""
+        with self._cond:
+            self.stats['requests'] += 1
+            if self.min_latency is None or latency < self.min_latency:
+                self.min_latency = latency
+            
+            if self._quota_nearly_exhausted(headers):
+                return
+            
+            if latency <= self.min_latency * self.latency_tolerance:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            else:
+                self.limit = max(self.min_limit, self.limit - 1.0 / self.limit)
+            self._cond.notify_all()
+    
+    def on_throttle(self, retry_after: Optional[float] = None, headers: Optional[Dict[str, str]] = None):
+        """Réponse de throttling : baisse multiplicative et suspension des admissions"""
+        with self._cond:
+            self.stats['requests'] += 1
+            self.stats['throttled'] += 1
+            self._decrease()
+            if retry_after is None and headers is not None:
+                retry_after = parse_retry_after(headers.get('Retry-After'), default=None)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        
+        logger.warning(f"🔻 Concurrence {self.api_name} réduite à {int(self.limit)}"
+                       + (f", reprise dans {retry_after:.1f}s" if retry_after else ""))
+    
+    def _decrease(self):
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_factor)
+        self.stats['limit_decreases'] += 1
+    
+    def _quota_nearly_exhausted(self, headers: Optional[Dict[str, str]]) -> bool:
+        """
+        Lit les en-têtes de quota restant (ex: Discogs). Un quota presque
+        épuisé réduit la limite et espace les admissions du temps de
+        libération d'une requête dans la fenêtre du serveur.
+        """
+        header_names = self.QUOTA_HEADERS.get(self.api_name)
+        if not headers or not header_names:
+            return False
+        
+        try:
+            remaining = int(headers.get(header_names[0]))
+            total = int(headers.get(header_names[1]) or 0)
+        except (TypeError, ValueError):
+            return False
+        
+        # Garder une marge d'environ une requête par place simultanée
+        if remaining > int(self.limit):
+            return False
+        
+        self._decrease()
+        if total > 0:
+            slot_seconds = self.quota_window_seconds / total
+            pause = slot_seconds * (int(self.limit) - remaining + 1)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+        return True
+    
+    def request(self, wait: Optional[Callable[[], Any]] = None) -> '_ControlledRequest':
+        """
+        Contexte d'une requête contrôlée :
+        
+            with controller.request(wait=lambda: rate_limiter.wait_if_needed(api)) as call:
+                response = session.get(...)
+                call.record(response.status_code, response.headers)
+        
+        Args:
+            wait: Attente du rate limiter, appelée une fois la place réservée
+                (admissions suspendues : aucun jeton consommé) et hors mesure
+                de latence
+        """
+        return _ControlledRequest(self, wait)
+    
+    def get_status(self) -> Dict[str, any]:
+        """Statut courant du contrôleur"""
+        with self._cond:
+            return {
+                'api_name': self.api_name,
+                'limit': int(self.limit),
+                'inflight': self.inflight,
+                'min_latency': self.min_latency,
+                'paused_for': max(0.0, self.blocked_until - time.monotonic()),
+                **self.stats
+            }
+
+
+class _ControlledRequest:
+    """Place réservée auprès d'un AdaptiveConcurrencyController"""
+    
+    def __init__(self, controller: AdaptiveConcurrencyController,
+                 wait: Optional[Callable[[], Any]] = None):
+        self.controller = controller
+        self.wait = wait
+        self._status_code: Optional[int] = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._start = 0.0
+        self._span = span('api', controller.api_name)
+    
+    def __enter__(self) -> '_ControlledRequest':
+        self.controller.acquire()
+        if self.wait:
+            try:
+                self.wait()
+            except BaseException:
+                self.controller.release()
+                raise
+        self._start = time.monotonic()
+        self._span.__enter__()
+        return self
+    
+    def record(self, status_code: int, headers: Optional[Dict[str, str]] = None, throttled: bool = False):
+        """Enregistre la réponse (throttled=True pour un throttling signalé dans le corps)"""
+        self._status_code = 429 if throttled else status_code
+        self._headers = headers
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._span.__exit__(exc_type, exc, tb)
+        try:
+            if self._status_code == 429:
+                self.controller.on_throttle(headers=self._headers or {})
+            elif self._status_code is not None and self._status_code < 500:
+                self.controller.on_success(time.monotonic() - self._start, self._headers)
+        finally:
+            self.controller.release()
+        return False
+
+
+_concurrency_controllers: Dict[str, AdaptiveConcurrencyController] = {}
+_concurrency_lock = threading.Lock()
+
+def get_concurrency_controller(api_name: str) -> AdaptiveConcurrencyController:
+    """Contrôleur unique par API dans le processus (partagé par les extracteurs)"""
+    with _concurrency_lock:
+        if api_name not in _concurrency_controllers:
+            _concurrency_controllers[api_name] = AdaptiveConcurrencyController.from_settings(api_name)
+        return _concurrency_controllers[api_name]
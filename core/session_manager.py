@@ -1,10 +1,12 @@
 # core/session_manager.py - Version hybride avec toutes les fonctionnalités
+import atexit
 import uuid
 import json
 import time
 import threading
+import weakref
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Sequence, Tuple
 
 from config.settings import settings
 from models.entities import Session
@@ -23,6 +25,15 @@ except ImportError:
         return dt if dt else datetime.now()
     USE_FRANCE_TZ = False
 
+# Journaux à vider à la sortie : références faibles, un seul hook atexit
+_live_managers: 'weakref.WeakSet[SessionManager]' = weakref.WeakSet()
+
+def _flush_live_managers():
+    for manager in list(_live_managers):
+        manager.flush()
+
+atexit.register(_flush_live_managers)
+
 class SessionManager:
     """Gestionnaire des sessions hybride - Simplicité + Fonctionnalités avancées"""
     
@@ -40,10 +51,22 @@ class SessionManager:
         self._last_activity_time = None
         self._save_only_if_active = settings.get('sessions.save_only_if_active', True)
         
+        # Journal d'écriture: mises à jour regroupées en mémoire, écrites
+        # en une transaction toutes les flush_interval secondes, aux
+        # changements d'étape et à l'arrêt. Sans auto-sauvegarde
+        # (sessions.enable_auto_save: false), chaque mise à jour est écrite
+        # immédiatement
+        self.flush_interval = settings.get('sessions.flush_interval', 2.0)
+        self._pending_checkpoints: Dict[tuple, Dict[str, Any]] = {}
+        self._flush_lock = threading.Lock()
+        self._journal_stats = {'updates': 0, 'flushes': 0, 'sessions_written': 0,
+                               'checkpoints_queued': 0, 'checkpoints_written': 0}
+        
         # Threading pour sauvegarde automatique (optionnel)
         self._auto_save_thread = None
         self._stop_auto_save = threading.Event()
-        self._session_lock = threading.Lock()
+        # Réentrant: _mark_session_modified est appelé sous le verrou
+        self._session_lock = threading.RLock()
         
         # Callbacks pour les événements
         self.event_callbacks: Dict[str, List[Callable]] = {
@@ -59,6 +82,7 @@ class SessionManager:
         self._load_active_sessions()
         if settings.get('sessions.enable_auto_save', True):
             self._start_auto_save()
+        _live_managers.add(self)
         
         tz_msg = "avec timezone France" if USE_FRANCE_TZ else "sans timezone (UTC)"
         auto_save_msg = "avec sauvegarde auto" if self._auto_save_thread else "sans sauvegarde auto"
@@ -95,68 +119,93 @@ class SessionManager:
         self._auto_save_thread.start()
         
         save_mode = "intelligente" if self._save_only_if_active else "systématique"
-        print(f"🔄 Auto-sauvegarde {save_mode} démarrée (intervalle: {self.auto_save_interval}s)")
+        print(f"🔄 Auto-sauvegarde {save_mode} démarrée (journal: {self.flush_interval}s, "
+              f"intervalle: {self.auto_save_interval}s)")
     
     def _auto_save_worker(self):
-        """Worker pour la sauvegarde automatique intelligente"""
-        while not self._stop_auto_save.wait(self.auto_save_interval):
+        """Worker du journal: écrit les sessions modifiées à intervalle court"""
+        last_full_save = time.monotonic()
+        while not self._stop_auto_save.wait(min(self.flush_interval, self.auto_save_interval)):
             try:
-                if self._save_only_if_active:
-                    self._smart_save_active_sessions()
-                else:
+                if (not self._save_only_if_active
+                        and time.monotonic() - last_full_save >= self.auto_save_interval):
                     self._save_active_sessions()
+                    last_full_save = time.monotonic()
+                else:
+                    self._smart_save_active_sessions()
             except Exception as e:
                 print(f"⚠️ Erreur lors de la sauvegarde automatique: {e}")
     
     def _smart_save_active_sessions(self):
-        """Sauvegarde intelligente - seulement si activité récente"""
-        with self._session_lock:
-            # Vérifier s'il y a eu de l'activité récente
-            if not self._last_activity_time:
-                return
-            
-            # Seulement sauvegarder si activité dans les dernières 5 minutes
-            current_time = self._get_current_time()
-            time_since_activity = current_time - self._last_activity_time
-            if time_since_activity.total_seconds() > 300:  # 5 minutes
-                return
-            
-            # Sauvegarder seulement les sessions modifiées
-            if not self._sessions_modified:
-                return
-            
-            saved_count = 0
-            sessions_to_remove = set()
-            
-            for session_id in self._sessions_modified:
-                if session_id in self.active_sessions:
-                    try:
-                        session = self.active_sessions[session_id]
-                        self.db.update_session(session)
-                        saved_count += 1
-                        sessions_to_remove.add(session_id)
-                    except Exception as e:
-                        print(f"⚠️ Erreur sauvegarde session {session_id}: {e}")
-            
-            # Nettoyer la liste des sessions modifiées
-            self._sessions_modified -= sessions_to_remove
-            
-            if saved_count > 0:
-                print(f"💾 {saved_count} session(s) modifiée(s) sauvegardée(s)")
+        """Sauvegarde intelligente - seulement les sessions modifiées, en une transaction"""
+        saved_count = self.flush()
+        if saved_count > 0:
+            print(f"💾 {saved_count} session(s) modifiée(s) sauvegardée(s)")
     
     def _save_active_sessions(self):
-        """Sauvegarde toutes les sessions actives"""
+        """Sauvegarde toutes les sessions actives en une transaction"""
         with self._session_lock:
-            saved_count = 0
-            for session in self.active_sessions.values():
+            self._sessions_modified.update(self.active_sessions)
+        
+        saved_count = self.flush()
+        if saved_count > 0:
+            print(f"💾 {saved_count} session(s) sauvegardée(s)")
+    
+    def flush(self) -> int:
+        """
+        Écrit le journal: toutes les sessions modifiées en une transaction,
+        puis le dernier checkpoint en attente de chaque étape.
+        
+        Returns:
+            Nombre de sessions écrites
+        """
+        with self._flush_lock:
+            with self._session_lock:
+                modified = set(self._sessions_modified)
+                sessions = [self.active_sessions[session_id] for session_id in modified
+                            if session_id in self.active_sessions]
+                self._sessions_modified.clear()
+                checkpoints, self._pending_checkpoints = self._pending_checkpoints, {}
+            
+            written = 0
+            if sessions:
                 try:
-                    self.db.update_session(session)
-                    saved_count += 1
+                    written = self.db.update_sessions(sessions)
                 except Exception as e:
-                    print(f"⚠️ Erreur sauvegarde session {session.id}: {e}")
+                    # Les sessions restent dans le journal pour la prochaine écriture
+                    with self._session_lock:
+                        self._sessions_modified.update(modified)
+                    print(f"⚠️ Erreur écriture du journal des sessions: {e}")
             
-            if saved_count > 0:
-                print(f"💾 {saved_count} session(s) sauvegardée(s)")
+            for (session_id, step_name), data in checkpoints.items():
+                try:
+                    self.db.save_checkpoint(session_id, step_name, data)
+                    self._journal_stats['checkpoints_written'] += 1
+                except Exception as e:
+                    # Remis dans le journal, sauf si un checkpoint plus récent y a été ajouté
+                    with self._session_lock:
+                        self._pending_checkpoints.setdefault((session_id, step_name), data)
+                    print(f"⚠️ Erreur création checkpoint: {e}")
+            
+            if sessions or checkpoints:
+                self._journal_stats['flushes'] += 1
+                self._journal_stats['sessions_written'] += written
+            return written
+    
+    def _journal_worker_running(self) -> bool:
+        """Vrai si le thread d'auto-sauvegarde écrit le journal périodiquement"""
+        return bool(self._auto_save_thread and self._auto_save_thread.is_alive())
+    
+    def get_journal_stats(self) -> Dict[str, Any]:
+        """Statistiques du journal (mises à jour regroupées vs écritures en base)"""
+        with self._session_lock:
+            pending = len(self._sessions_modified)
+            pending_checkpoints = len(self._pending_checkpoints)
+        return {
+            **self._journal_stats,
+            'pending_sessions': pending,
+            'pending_checkpoints': pending_checkpoints
+        }
     
     def create_session(self, artist_name: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Crée une nouvelle session avec gestion intelligente des limites"""
@@ -212,13 +261,13 @@ class SessionManager:
             # Retirer les plus anciennes (garder juste en dessous de la limite)
             sessions_to_remove = sorted_sessions[:max(1, len(sorted_sessions) - self.max_sessions + 2)]
             
+            # Sauvegarder une dernière fois (une transaction)
+            try:
+                self.db.update_sessions([session for _, session in sessions_to_remove])
+            except Exception as e:
+                print(f"⚠️ Erreur sauvegarde finale des sessions retirées: {e}")
+            
             for session_id, session in sessions_to_remove:
-                # Sauvegarder une dernière fois
-                try:
-                    self.db.update_session(session)
-                except Exception as e:
-                    print(f"⚠️ Erreur sauvegarde finale session {session_id}: {e}")
-                
                 # Retirer de la mémoire
                 del self.active_sessions[session_id]
                 self._sessions_modified.discard(session_id)
@@ -265,8 +314,16 @@ class SessionManager:
             print(f"⚠️ Erreur récupération session {session_id}: {e}")
             return None
     
-    def update_session(self, session: Session) -> bool:
-        """Met à jour une session (accepte l'objet Session directement)"""
+    def update_session(self, session: Session, flush: bool = True) -> bool:
+        """
+        Met à jour une session (accepte l'objet Session directement).
+        
+        Args:
+            session: Session modifiée
+            flush: Écrire le journal immédiatement ; sinon la mise à jour est
+                regroupée avec les suivantes jusqu'à la prochaine écriture
+                (toujours immédiate sans thread d'auto-sauvegarde)
+        """
         try:
             if not session or not session.id:
                 print("⚠️ Session invalide pour mise à jour")
@@ -278,9 +335,11 @@ class SessionManager:
                 # Mettre à jour en mémoire
                 self.active_sessions[session.id] = session
                 self._mark_session_modified(session.id)
+                self._journal_stats['updates'] += 1
             
             # Sauvegarder en base
-            self.db.update_session(session)
+            if flush or not self._journal_worker_running():
+                self.flush()
             
             self._trigger_event('session_updated', session)
             return True
@@ -297,6 +356,13 @@ class SessionManager:
                 print(f"⚠️ Session {session_id} non trouvée pour mise à jour")
                 return False
             
+            # Changement d'étape ou de statut: écriture immédiate du journal
+            boundary = any(
+                field in updates and hasattr(session, field)
+                and updates[field] != getattr(session, field)
+                for field in ('current_step', 'status')
+            )
+            
             # Appliquer les mises à jour
             for field, value in updates.items():
                 if hasattr(session, field):
@@ -304,7 +370,7 @@ class SessionManager:
                 else:
                     print(f"⚠️ Champ {field} non trouvé sur Session")
             
-            return self.update_session(session)
+            return self.update_session(session, flush=boundary)
             
         except Exception as e:
             print(f"⚠️ Erreur mise à jour session {session_id}: {e}")
@@ -347,6 +413,11 @@ class SessionManager:
                 duration = current_time - session.created_at
                 session.metadata['total_duration_seconds'] = int(duration.total_seconds())
             
+            # Fin d'étape: checkpoints du journal écrits avant la finalisation
+            with self._session_lock:
+                self._sessions_modified.discard(session_id)
+            self.flush()
+            
             with self._session_lock:
                 # Sauvegarder en base
                 self.db.update_session(session)
@@ -379,6 +450,11 @@ class SessionManager:
             session.metadata['error_message'] = error_message
             session.metadata['failed_at'] = current_time.isoformat()
             
+            # Fin d'étape: checkpoints du journal écrits avant la finalisation
+            with self._session_lock:
+                self._sessions_modified.discard(session_id)
+            self.flush()
+            
             with self._session_lock:
                 # Sauvegarder en base
                 self.db.update_session(session)
@@ -431,6 +507,62 @@ class SessionManager:
             print(f"⚠️ Erreur listage sessions: {e}")
             return []
     
+    def get_sessions_version(self) -> int:
+        """
+        Version des sessions en base, après écriture du journal.
+    
+        Sert de clé de cache aux vues du dashboard : elle change à chaque
+        création, mise à jour ou suppression de session.
+        """
+        with self._session_lock:
+            has_pending = bool(self._sessions_modified)
+        if has_pending:
+            self.flush()
+        try:
+            return self.db.get_sessions_version()
+        except Exception as e:
+            print(f"⚠️ Erreur lecture version des sessions: {e}")
+            return -1
+    
+    def query_sessions(self, statuses: Optional[Sequence[SessionStatus]] = None,
+                       since: Optional[datetime] = None, until: Optional[datetime] = None,
+                       artist: Optional[str] = None, limit: int = 50,
+                       after: Optional[Tuple[str, str]] = None) -> Tuple[List[Session], Optional[Tuple[str, str]]]:
+        """Page de sessions filtrée (voir Database.query_sessions), timestamps normalisés"""
+        try:
+            sessions, next_cursor = self.db.query_sessions(statuses, since, until, artist, limit, after)
+            for session in sessions:
+                session.created_at = self._normalize_datetime(session.created_at)
+                session.updated_at = self._normalize_datetime(session.updated_at)
+            return sessions, next_cursor
+        except Exception as e:
+            print(f"⚠️ Erreur requête sessions: {e}")
+            return [], None
+    
+    def count_sessions(self, statuses: Optional[Sequence[SessionStatus]] = None,
+                       since: Optional[datetime] = None, until: Optional[datetime] = None,
+                       artist: Optional[str] = None) -> int:
+        """Nombre de sessions correspondant aux filtres de query_sessions"""
+        try:
+            return self.db.count_sessions(statuses, since, until, artist)
+        except Exception as e:
+            print(f"⚠️ Erreur comptage sessions: {e}")
+            return 0
+    
+    def get_dashboard_stats(self, since: Optional[datetime] = None,
+                            top_artists: int = 5, recent: int = 5) -> Dict[str, Any]:
+        """Agrégats du dashboard (voir Database.get_session_dashboard_stats)"""
+        try:
+            stats = self.db.get_session_dashboard_stats(since, top_artists, recent)
+            for session in stats['recent_sessions']:
+                session.created_at = self._normalize_datetime(session.created_at)
+                session.updated_at = self._normalize_datetime(session.updated_at)
+            return stats
+        except Exception as e:
+            print(f"⚠️ Erreur statistiques sessions: {e}")
+            return {'total_sessions': 0, 'status_counts': {}, 'sessions_since': 0,
+                    'top_artists': [], 'recent_sessions': []}
+    
     def get_active_sessions(self) -> List[Session]:
         """Récupère toutes les sessions actives"""
         with self._session_lock:
@@ -438,15 +570,32 @@ class SessionManager:
     
     # ==================== NOUVELLES FONCTIONNALITÉS RÉCUPÉRÉES ====================
     
-    def create_checkpoint(self, session_id: str, step_name: str, data: Dict[str, Any]) -> bool:
-        """Crée un point de sauvegarde pour une session"""
+    def create_checkpoint(self, session_id: str, step_name: str, data: Dict[str, Any],
+                          flush: bool = False) -> bool:
+        """
+        Crée un point de sauvegarde pour une session.
+        
+        Le checkpoint est mis dans le journal (seul le dernier par étape est
+        conservé) et écrit à la prochaine écriture du journal, ou
+        immédiatement avec flush=True (fin d'étape) ou sans thread
+        d'auto-sauvegarde.
+        """
         session = self.get_session(session_id)
         if not session:
             return False
         
         try:
-            self.db.save_checkpoint(session_id, step_name, data)
-            print(f"💾 Checkpoint créé pour {session_id[:8]}: {step_name}")
+            # Copie de l'état au moment de l'appel (l'appelant peut continuer à le modifier)
+            snapshot = json.loads(json.dumps(data, default=str))
+            with self._session_lock:
+                self._pending_checkpoints[(session_id, step_name)] = snapshot
+                self._journal_stats['checkpoints_queued'] += 1
+            
+            if flush:
+                self.flush()
+                print(f"💾 Checkpoint créé pour {session_id[:8]}: {step_name}")
+            elif not self._journal_worker_running():
+                self.flush()
             return True
         except Exception as e:
             print(f"⚠️ Erreur création checkpoint: {e}")
@@ -454,6 +603,11 @@ class SessionManager:
     
     def get_checkpoint(self, session_id: str, step_name: str) -> Optional[Dict[str, Any]]:
         """Récupère un checkpoint spécifique"""
+        with self._session_lock:
+            pending = self._pending_checkpoints.get((session_id, step_name))
+        if pending is not None:
+            return json.loads(json.dumps(pending))
+        
         try:
             return self.db.get_checkpoint(session_id, step_name)
         except Exception as e:
@@ -463,11 +617,20 @@ class SessionManager:
     def list_checkpoints(self, session_id: str) -> List[Dict[str, Any]]:
         """Liste tous les checkpoints d'une session"""
         try:
+            self.flush()
             return self.db.list_checkpoints(session_id)
         except Exception as e:
             print(f"⚠️ Erreur listage checkpoints: {e}")
             return []
     
+    def get_checkpoint_metrics(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Métriques des checkpoints (tailles brutes/stockées, latences, chaînes de deltas)"""
+        try:
+            return self.db.get_checkpoint_metrics(session_id)
+        except Exception as e:
+            print(f"⚠️ Erreur métriques checkpoints: {e}")
+            return {}
+    
     def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Récupère un résumé complet d'une session"""
         session = self.get_session(session_id)
@@ -620,20 +783,12 @@ class SessionManager:
         """Sauvegarde manuelle de toutes les sessions actives"""
         try:
             with self._session_lock:
-                saved_count = 0
-                for session in self.active_sessions.values():
-                    try:
-                        self.db.update_session(session)
-                        saved_count += 1
-                    except Exception as e:
-                        print(f"⚠️ Erreur sauvegarde {session.id}: {e}")
-                
-                # Nettoyer la liste des modifiées
-                self._sessions_modified.clear()
-                
-                if saved_count > 0:
-                    print(f"💾 {saved_count} session(s) sauvegardée(s) manuellement")
-                return saved_count
+                self._sessions_modified.update(self.active_sessions)
+            
+            saved_count = self.flush()
+            if saved_count > 0:
+                print(f"💾 {saved_count} session(s) sauvegardée(s) manuellement")
+            return saved_count
                 
         except Exception as e:
             print(f"⚠️ Erreur sauvegarde globale: {e}")
@@ -710,7 +865,7 @@ class SessionManager:
             if self._auto_save_thread.is_alive():
                 self._auto_save_thread.join(timeout=5)
         
-        # Sauvegarder une dernière fois toutes les sessions actives
+        # Écrire le journal et sauvegarder une dernière fois toutes les sessions actives
         self._save_active_sessions()
         
         print("✅ Gestionnaire de sessions arrêté")
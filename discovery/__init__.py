@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional, Tuple
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -60,20 +62,30 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. GeniusDiscovery (module principal)
-_safe_import('genius_discovery', ['GeniusDiscovery', 'DiscoveryResult'])
+_lazy.register('genius_discovery', ['GeniusDiscovery', 'DiscoveryResult'])
 
 # 2. SpotifyDiscovery (optionnel)
-_safe_import('spotify_discovery', ['SpotifyDiscovery'])
+_lazy.register('spotify_discovery', ['SpotifyDiscovery'])
 
 # 3. AlbumResolver (optionnel)
-_safe_import('album_resolver', ['AlbumResolver'])
+_lazy.register('album_resolver', ['AlbumResolver'])
 
 # 4. Autres découvreurs (optionnels)
-_safe_import('lastfm_discovery', ['LastFMDiscovery'])
-_safe_import('discogs_discovery', ['DiscogsDiscovery'])
+_lazy.register('lastfm_discovery', ['LastFMDiscovery'])
+_lazy.register('discogs_discovery', ['DiscogsDiscovery'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== FONCTIONS UTILITAIRES =====
 
@@ -85,6 +97,8 @@ def get_available_discoverers() -> List[str]:
     Returns:
         Liste des classes de découverte disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if name.endswith('Discovery')]
 
 @lru_cache(maxsize=1)
@@ -95,6 +109,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -128,12 +144,12 @@ def create_discoverer(discoverer_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type de découvreur inconnu: {discoverer_type}")
         return None
     
-    if class_name not in globals():
+    discoverer_class = _lazy.get(class_name, globals())
+    if discoverer_class is None:
         logger.error(f"❌ Découvreur {class_name} non disponible")
         return None
     
     try:
-        discoverer_class = globals()[class_name]
         return discoverer_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -194,6 +210,8 @@ def run_discovery_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -237,6 +255,8 @@ def validate_discovery_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un découvreur principal est disponible
@@ -257,15 +277,9 @@ def validate_discovery_setup() -> Tuple[bool, List[str]]:
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_discovery_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration discovery:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-
-logger.info(f"✅ Module discovery initialisé: {len(__all__)} classes disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module discovery initialisé: {len(_lazy.names())} classes déclarés (import différé)")
 
 # Export des fonctions utilitaires
 __all__.extend([
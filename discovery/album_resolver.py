@@ -17,6 +17,7 @@ from models.enums import AlbumType, DataSource, ExtractionStatus
 from config.settings import settings
 from core.database import Database
 from utils.text_utils import normalize_text, calculate_similarity
+from utils.similarity import cdist, score_many
 
 
 class AlbumResolver:
@@ -294,20 +295,24 @@ class AlbumResolver:
         merged_groups = {}
         processed_titles = set()
         
-        for title1, tracks1 in album_groups.items():
+        # Matrice de similarité calculée en une passe
+        titles = list(album_groups.keys())
+        similarity_matrix = cdist(titles, score_cutoff=self.similarity_threshold)
+        
+        for index1, title1 in enumerate(titles):
             if title1 in processed_titles:
                 continue
             
             # Recherche d'albums similaires
             similar_albums = [title1]
-            all_tracks = tracks1.copy()
+            all_tracks = album_groups[title1].copy()
             
-            for title2, tracks2 in album_groups.items():
+            for index2, title2 in enumerate(titles):
                 if title2 == title1 or title2 in processed_titles:
                     continue
                 
-                # Calcul de similarité avec cache
-                similarity = self._get_album_similarity(title1, title2)
+                tracks2 = album_groups[title2]
+                similarity = similarity_matrix[index1][index2]
                 
                 if similarity >= self.similarity_threshold:
                     similar_albums.append(title2)
@@ -470,10 +475,8 @@ class AlbumResolver:
         most_common_title = title_counts.most_common(1)[0][0]
         
         # Si plusieurs variantes similaires, choisir la plus propre
-        similar_titles = []
-        for title in titles:
-            if calculate_similarity(title, most_common_title) > 0.9:
-                similar_titles.append(title)
+        scores = score_many(most_common_title, titles)
+        similar_titles = [title for title, score in zip(titles, scores) if score > 0.9]
         
         if similar_titles:
             # Préférer les titres les plus courts et propres
@@ -8,7 +8,7 @@ import logging
 import re
 import time
 from functools import lru_cache
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from urllib.parse import quote
@@ -35,6 +35,7 @@ except ImportError:
     RateLimiter = None
 
 from utils.text_utils import clean_artist_name, normalize_text
+from utils.profiling import span
 
 
 @dataclass
@@ -122,7 +123,7 @@ class GeniusDiscovery:
         if not self.api_key:
             raise APIError("Clé API Genius manquante dans la configuration")
         
-        self.base_url = "https://api.genius.com"
+        self.base_url = settings.get('apis.genius.base_url', "https://api.genius.com")
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'User-Agent': 'MusicDataExtractor/1.0',
@@ -289,13 +290,14 @@ class GeniusDiscovery:
             Données de l'artiste ou None si non trouvé
         """
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.wait_if_needed('genius')
         
         try:
             url = f"{self.base_url}/search"
             params = {'q': artist_name}
             
-            response = self.session.get(url, headers=self.headers, params=params)
+            with span('api', 'genius'):
+                response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             self.performance_metrics['total_api_calls'] += 1
@@ -325,6 +327,44 @@ class GeniusDiscovery:
             self.logger.error(f"❌ Erreur requête Genius search: {e}")
             return None
     
+    def iter_artist_track_pages(self, artist_name: str,
+                                max_tracks: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Découvre les morceaux d'un artiste page par page.
+        
+        Chaque page de l'API est filtrée et enrichie puis émise dès sa
+        réception, pour que l'extraction démarre sans attendre la dernière
+        page. Un résultat en cache est émis en une seule page.
+        
+        Args:
+            artist_name: Nom de l'artiste à rechercher
+            max_tracks: Nombre maximum de morceaux à récupérer
+            
+        Yields:
+            Morceaux filtrés et enrichis d'une page
+        """
+        normalized_artist = clean_artist_name(artist_name)
+        
+        cache_key = f"genius_discovery_{normalized_artist}_{max_tracks}"
+        if self.cache_manager:
+            cached_result = self.cache_manager.get(cache_key)
+            if cached_result:
+                self.performance_metrics['total_cache_hits'] += 1
+                self.logger.info(f"💾 Cache hit pour {normalized_artist}")
+                if cached_result.get('tracks'):
+                    yield cached_result['tracks']
+                return
+        
+        artist_data = self._search_artist(normalized_artist)
+        if not artist_data:
+            self.logger.warning(f"⚠️ Artiste '{artist_name}' non trouvé sur Genius")
+            return
+        
+        for songs in self._iter_track_pages(artist_data['id'], max_tracks):
+            filtered_tracks = self._filter_and_enrich_tracks(songs, normalized_artist)
+            if filtered_tracks:
+                yield filtered_tracks
+    
     def _fetch_artist_tracks(self, artist_id: int, max_tracks: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Récupère les morceaux d'un artiste avec pagination optimisée.
@@ -337,14 +377,27 @@ class GeniusDiscovery:
             Liste des morceaux trouvés
         """
         all_tracks = []
+        for songs in self._iter_track_pages(artist_id, max_tracks):
+            all_tracks.extend(songs)
+        return all_tracks
+    
+    def _iter_track_pages(self, artist_id: int, max_tracks: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Parcourt les pages de morceaux d'un artiste (au plus max_tracks au total).
+        
+        Yields:
+            Morceaux bruts d'une page
+        """
+        fetched = 0
         page = 1
         per_page = 50  # Maximum autorisé par Genius
         
         max_tracks = max_tracks or 200  # Valeur par défaut
+        max_pages = settings.get('apis.genius.max_pages', 20)
         
-        while len(all_tracks) < max_tracks:
+        while fetched < max_tracks:
             if self.rate_limiter:
-                self.rate_limiter.wait_if_needed()
+                self.rate_limiter.wait_if_needed('genius')
             
             try:
                 url = f"{self.base_url}/artists/{artist_id}/songs"
@@ -354,7 +407,8 @@ class GeniusDiscovery:
                     'sort': 'popularity'  # Trier par popularité
                 }
                 
-                response = self.session.get(url, headers=self.headers, params=params)
+                with span('api', 'genius'):
+                    response = self.session.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
                 
                 self.performance_metrics['total_api_calls'] += 1
@@ -363,11 +417,14 @@ class GeniusDiscovery:
                 songs = data.get('response', {}).get('songs', [])
                 
                 if not songs:
-                    self.logger.debug(f"📄 Page {page}: aucun morceau supplémentaire")
+                    self.logger.debug("📄 Page %s: aucun morceau supplémentaire", page)
                     break
                 
-                all_tracks.extend(songs)
-                self.logger.debug(f"📄 Page {page}: {len(songs)} morceaux ajoutés")
+                # Limiter au nombre demandé
+                page_tracks = songs[:max_tracks - fetched]
+                fetched += len(page_tracks)
+                self.logger.debug("📄 Page %s: %s morceaux ajoutés", page, len(page_tracks))
+                yield page_tracks
                 
                 # Condition d'arrêt si moins de morceaux que demandé
                 if len(songs) < per_page:
@@ -376,20 +433,15 @@ class GeniusDiscovery:
                 page += 1
                 
                 # Sécurité: éviter les boucles infinies
-                if page > 20:  # Max 1000 morceaux (20 pages * 50)
-                    self.logger.warning("⚠️ Limite de pages atteinte (20 pages)")
+                if page > max_pages:  # Max 1000 morceaux par défaut (20 pages * 50)
+                    self.logger.warning(f"⚠️ Limite de pages atteinte ({max_pages} pages)")
                     break
                 
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"❌ Erreur récupération page {page}: {e}")
                 break
         
-        # Limiter au nombre demandé
-        if len(all_tracks) > max_tracks:
-            all_tracks = all_tracks[:max_tracks]
-        
-        self.logger.debug(f"📊 Total récupéré: {len(all_tracks)} morceaux sur {page-1} pages")
-        return all_tracks
+        self.logger.debug("📊 Total récupéré: %s morceaux sur %s pages", fetched, page-1)
     
     def _filter_and_enrich_tracks(self, tracks: List[Dict[str, Any]], artist_name: str) -> List[Dict[str, Any]]:
         """
@@ -423,14 +475,14 @@ class GeniusDiscovery:
                 
                 # Vérifier que c'est bien l'artiste recherché
                 if track_artist != search_artist and search_artist not in track_artist:
-                    self.logger.debug(f"⏭️ Artiste différent: {primary_artist['name']} != {artist_name}")
+                    self.logger.debug("⏭️ Artiste différent: %s != %s", primary_artist['name'], artist_name)
                     continue
                 
                 # Détection des contenus suspects (signalement uniquement)
                 is_suspicious = self._is_suspicious_content(title)
                 if is_suspicious:
                     warnings_count += 1
-                    self.logger.debug(f"⚠️ Contenu suspect détecté: {title}")
+                    self.logger.debug("⚠️ Contenu suspect détecté: %s", title)
                 
                 # Enrichissement des métadonnées
                 enriched_track = self._enrich_track_metadata(track)
@@ -449,7 +501,7 @@ class GeniusDiscovery:
         if warnings_count > 0:
             self.logger.info(f"⚠️ {warnings_count} morceaux suspects détectés (gardés avec flag)")
         
-        self.logger.debug(f"🔍 Filtrage: {len(filtered_tracks)}/{len(tracks)} morceaux conservés")
+        self.logger.debug("🔍 Filtrage: %s/%s morceaux conservés", len(filtered_tracks), len(tracks))
         return filtered_tracks
     
     @lru_cache(maxsize=512)
@@ -541,10 +593,9 @@ class GeniusDiscovery:
         
         return enriched
     
-    @lru_cache(maxsize=128)
     def _assess_track_quality(self, track: Dict[str, Any]) -> str:
         """
-        Évalue la qualité des données d'un morceau avec cache.
+        Évalue la qualité des données d'un morceau.
         
         Args:
             track: Données du morceau enrichies
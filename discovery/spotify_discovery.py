@@ -86,8 +86,8 @@ class SpotifyDiscovery:
         if not self.client_id or not self.client_secret:
             raise APIError("Identifiants Spotify manquants dans la configuration")
         
-        self.base_url = "https://api.spotify.com/v1"
-        self.auth_url = "https://accounts.spotify.com/api/token"
+        self.base_url = settings.get('apis.spotify.base_url', "https://api.spotify.com/v1")
+        self.auth_url = settings.get('apis.spotify.auth_url', "https://accounts.spotify.com/api/token")
         
         # Session HTTP optimisée
         self.session = self._create_optimized_session()
@@ -305,7 +305,7 @@ class SpotifyDiscovery:
             Données de l'artiste ou None
         """
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.wait_if_needed('spotify')
         
         try:
             url = f"{self.base_url}/search"
@@ -351,7 +351,7 @@ class SpotifyDiscovery:
             Liste des albums
         """
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.wait_if_needed('spotify')
         
         try:
             url = f"{self.base_url}/artists/{artist_id}/albums"
@@ -387,7 +387,7 @@ class SpotifyDiscovery:
             Liste des top tracks
         """
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.wait_if_needed('spotify')
         
         try:
             url = f"{self.base_url}/artists/{artist_id}/top-tracks"
@@ -419,7 +419,7 @@ class SpotifyDiscovery:
             Liste des tracks de l'album
         """
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.wait_if_needed('spotify')
         
         try:
             url = f"{self.base_url}/albums/{album_id}/tracks"
@@ -690,7 +690,7 @@ class SpotifyDiscovery:
                 batch_ids = track_ids[i:i + batch_size]
                 
                 if self.rate_limiter:
-                    self.rate_limiter.wait_if_needed()
+                    self.rate_limiter.wait_if_needed('spotify')
                 
                 url = f"{self.base_url}/audio-features"
                 params = {'ids': ','.join(batch_ids)}
@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional, Tuple
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -60,24 +62,34 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. Web Scrapers (modules principaux)
-_safe_import('web_scrapers.genius_scraper', ['GeniusWebScraper'])
-_safe_import('web_scrapers.rapedia_scraper', ['RapediaScraper'])
+_lazy.register('web_scrapers.genius_scraper', ['GeniusWebScraper'])
+_lazy.register('web_scrapers.rapedia_scraper', ['RapediaScraper'])
 
 # 2. API Extractors (optionnels)
-_safe_import('api_extractors.spotify_extractor', ['SpotifyExtractor'])
-_safe_import('api_extractors.lastfm_extractor', ['LastFMExtractor'])
-_safe_import('api_extractors.discogs_extractor', ['DiscogsExtractor'])
+_lazy.register('api_extractors.spotify_extractor', ['SpotifyExtractor'])
+_lazy.register('api_extractors.lastfm_extractor', ['LastFMExtractor'])
+_lazy.register('api_extractors.discogs_extractor', ['DiscogsExtractor'])
 
 # 3. Text Processors (optionnels)
-_safe_import('text_processors.lyrics_processor', ['LyricsProcessor'])
-_safe_import('text_processors.credit_parser', ['CreditParser'])
+_lazy.register('text_processors.lyrics_processor', ['LyricsProcessor'])
+_lazy.register('text_processors.credit_parser', ['CreditParser'])
 
 # 4. Data Enrichers (optionnels)
-_safe_import('data_enrichers.metadata_enricher', ['MetadataEnricher'])
-_safe_import('data_enrichers.audio_analyzer', ['AudioAnalyzer'])
+_lazy.register('data_enrichers.metadata_enricher', ['MetadataEnricher'])
+_lazy.register('data_enrichers.audio_analyzer', ['AudioAnalyzer'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== FONCTIONS UTILITAIRES =====
 
@@ -89,6 +101,8 @@ def get_available_extractors() -> List[str]:
     Returns:
         Liste des classes d'extraction disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if any(suffix in name for suffix in ['Scraper', 'Extractor', 'Processor', 'Enricher'])]
 
 @lru_cache(maxsize=1)
@@ -99,6 +113,8 @@ def get_web_scrapers() -> List[str]:
     Returns:
         Liste des scrapers web
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if 'Scraper' in name]
 
 @lru_cache(maxsize=1)
@@ -109,6 +125,8 @@ def get_api_extractors() -> List[str]:
     Returns:
         Liste des extracteurs API
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if 'Extractor' in name]
 
 @lru_cache(maxsize=1)
@@ -119,6 +137,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -165,12 +185,12 @@ def create_extractor(extractor_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type d'extracteur inconnu: {extractor_type}")
         return None
     
-    if class_name not in globals():
+    extractor_class = _lazy.get(class_name, globals())
+    if extractor_class is None:
         logger.error(f"❌ Extracteur {class_name} non disponible")
         return None
     
     try:
-        extractor_class = globals()[class_name]
         return extractor_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -222,6 +242,8 @@ def run_extractor_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -288,6 +310,8 @@ def validate_extractor_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un extracteur principal est disponible
@@ -365,15 +389,9 @@ def batch_extract_data(sources: List[Dict[str, str]], extractor_type: str, max_w
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_extractor_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration extracteurs:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-else:
-    logger.info(f"✅ Module extracteurs initialisé: {len(get_available_extractors())} extracteurs disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module extracteurs initialisé: {len(_lazy.names())} extracteurs déclarés (import différé)")
 
 # Export final
 __all__.extend([
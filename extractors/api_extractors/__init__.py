@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional, Tuple
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -60,16 +62,26 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. Extracteurs API principaux
-_safe_import('spotify_extractor', ['SpotifyExtractor'])
-_safe_import('lastfm_extractor', ['LastFMExtractor'])
-_safe_import('discogs_extractor', ['DiscogsExtractor'])
+_lazy.register('spotify_extractor', ['SpotifyExtractor'])
+_lazy.register('lastfm_extractor', ['LastFMExtractor'])
+_lazy.register('discogs_extractor', ['DiscogsExtractor'])
 
 # 2. Extracteurs API optionnels
-_safe_import('musicbrainz_extractor', ['MusicBrainzExtractor'])
-_safe_import('deezer_extractor', ['DeezerExtractor'])
+_lazy.register('musicbrainz_extractor', ['MusicBrainzExtractor'])
+_lazy.register('deezer_extractor', ['DeezerExtractor'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== FONCTIONS UTILITAIRES =====
 
@@ -81,6 +93,8 @@ def get_available_extractors() -> List[str]:
     Returns:
         Liste des extracteurs disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if name.endswith('Extractor')]
 
 @lru_cache(maxsize=1)
@@ -91,6 +105,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -132,12 +148,12 @@ def create_extractor(extractor_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type d'extracteur API inconnu: {extractor_type}")
         return None
     
-    if class_name not in globals():
+    extractor_class = _lazy.get(class_name, globals())
+    if extractor_class is None:
         logger.error(f"❌ Extracteur {class_name} non disponible")
         return None
     
     try:
-        extractor_class = globals()[class_name]
         return extractor_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -193,6 +209,8 @@ def run_api_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -262,6 +280,8 @@ def validate_api_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un extracteur principal est disponible
@@ -333,17 +353,25 @@ def batch_extract_data(sources: List[Dict[str, str]], extractor_types: List[str]
     return results
 
 def cross_reference_data(data_sets: Dict[str, List[Dict[str, Any]]], 
-                        match_fields: List[str] = ['title', 'artist']) -> List[Dict[str, Any]]:
+                        match_fields: List[str] = ['title', 'artist'],
+                        id_fields: Tuple[str, ...] = ('isrc', 'spotify_id', 'genius_id')) -> List[Dict[str, Any]]:
     """
     Croise les données de plusieurs extracteurs pour enrichir les informations.
     
+    Jointure exacte sur les identifiants externes puis rapprochement flou par
+    blocs ; chaque enregistrement d'un extracteur n'est rattaché qu'à une
+    seule référence.
+    
     Args:
         data_sets: Données par extracteur
         match_fields: Champs utilisés pour matcher les enregistrements
+        id_fields: Identifiants externes utilisés pour la jointure exacte
         
     Returns:
         Liste des enregistrements enrichis
     """
+    from utils.record_linkage import link_records
+    
     enriched_records = []
     
     # Utiliser le premier dataset comme référence
@@ -354,62 +382,44 @@ def cross_reference_data(data_sets: Dict[str, List[Dict[str, Any]]],
     reference_data = data_sets[reference_extractor]
     
     for ref_record in reference_data:
-        enriched_record = {
+        enriched_records.append({
             'primary_source': reference_extractor,
             'data': {reference_extractor: ref_record},
             'confidence': 1.0
-        }
+        })
+    
+    # Chercher des matches dans les autres extracteurs
+    for extractor_name, extractor_data in data_sets.items():
+        if extractor_name == reference_extractor:
+            continue
         
-        # Chercher des matches dans les autres extracteurs
-        for extractor_name, extractor_data in data_sets.items():
-            if extractor_name == reference_extractor:
-                continue
-            
-            best_match = None
-            best_score = 0.0
-            
-            for record in extractor_data:
-                score = _calculate_match_score(ref_record, record, match_fields)
-                if score > best_score:
-                    best_score = score
-                    best_match = record
-            
-            if best_match and best_score > 0.7:  # Seuil de confiance
-                enriched_record['data'][extractor_name] = best_match
-                enriched_record['confidence'] *= best_score
+        matches = link_records(
+            reference_data, extractor_data,
+            match_fields=match_fields,
+            id_fields=id_fields,
+            threshold=0.7  # Seuil de confiance
+        )
         
-        enriched_records.append(enriched_record)
+        for enriched_record, match in zip(enriched_records, matches):
+            if match:
+                record_index, score = match
+                enriched_record['data'][extractor_name] = extractor_data[record_index]
+                enriched_record['confidence'] *= score
     
     return enriched_records
 
 def _calculate_match_score(record1: Dict[str, Any], record2: Dict[str, Any], 
                           match_fields: List[str]) -> float:
     """Calcule un score de correspondance entre deux enregistrements"""
-    from utils.text_utils import calculate_similarity
-    
-    scores = []
+    from utils.record_linkage import score_records
     
-    for field in match_fields:
-        value1 = str(record1.get(field, '')).lower().strip()
-        value2 = str(record2.get(field, '')).lower().strip()
-        
-        if value1 and value2:
-            similarity = calculate_similarity(value1, value2)
-            scores.append(similarity)
-    
-    return sum(scores) / len(scores) if scores else 0.0
+    return score_records(record1, [record2], match_fields)[0]
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_api_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration API extractors:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-else:
-    logger.info(f"✅ Module API extractors initialisé: {len(get_available_extractors())} extracteurs disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module API extractors initialisé: {len(_lazy.names())} extracteurs déclarés (import différé)")
 
 # Export final
 __all__.extend([
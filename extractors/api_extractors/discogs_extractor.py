@@ -17,7 +17,7 @@ from urllib3.util.retry import Retry
 
 # Imports absolus
 from core.exceptions import APIError, APIRateLimitError, APIAuthenticationError
-from core.rate_limiter import RateLimiter
+from core.rate_limiter import RateLimiter, get_concurrency_controller, parse_retry_after
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_artist_name
@@ -48,7 +48,7 @@ class DiscogsExtractor:
             self.logger.warning("⚠️ Token Discogs manquant - fonctionnalités limitées")
         
         # URLs de base
-        self.base_url = "https://api.discogs.com"
+        self.base_url = settings.get('apis.discogs.base_url', "https://api.discogs.com")
         
         # Configuration optimisée
         self.config = {
@@ -59,7 +59,7 @@ class DiscogsExtractor:
             'include_credits': settings.get('discogs.include_credits', True),
             'include_images': settings.get('discogs.include_images', True),
             'search_limit': settings.get('discogs.search_limit', 25),
-            'preferred_formats': settings.get('discogs.preferred_formats', ['Vinyl', 'CD', 'Digital']),
+            'preferred_formats': settings.get('discogs.preferred_formats', ('Vinyl', 'CD', 'Digital')),
             'country_filter': settings.get('discogs.country_filter', None)
         }
         
@@ -77,9 +77,10 @@ class DiscogsExtractor:
         self.session = self._create_session()
         
         # Rate limiter - Discogs limite à 60 req/min pour les utilisateurs authentifiés
-        self.rate_limiter = RateLimiter(
-            requests_per_second=self.config['rate_limit_requests_per_second']
-        )
+        self.rate_limiter = RateLimiter()
+        
+        # Concurrence adaptative pilotée par les en-têtes X-Discogs-Ratelimit-*
+        self.concurrency = get_concurrency_controller('discogs')
         
         # Cache manager
         self.cache_manager = CacheManager(namespace='discogs') if CacheManager else None
@@ -106,7 +107,8 @@ class DiscogsExtractor:
         retry_strategy = Retry(
             total=self.config['max_retries'],
             backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 traité par le contrôleur de concurrence (pas d'attente dans le thread)
+            status_forcelist=[500, 502, 503, 504],
             raise_on_status=False
         )
         
@@ -118,18 +120,18 @@ class DiscogsExtractor:
     
     def _make_api_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Effectue une requête API avec gestion d'erreurs et rate limiting"""
-        self.rate_limiter.wait()
-        
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
         try:
             start_time = time.time()
-            response = self.session.get(
-                url,
-                headers=self.headers,
-                params=params or {},
-                timeout=self.config['timeout']
-            )
+            with self.concurrency.request(wait=lambda: self.rate_limiter.wait_if_needed('discogs')) as call:
+                response = self.session.get(
+                    url,
+                    headers=self.headers,
+                    params=params or {},
+                    timeout=self.config['timeout']
+                )
+                call.record(response.status_code, response.headers)
             
             self.stats['api_calls_made'] += 1
             self.stats['total_time_spent'] += time.time() - start_time
@@ -141,9 +143,9 @@ class DiscogsExtractor:
                 raise APIAuthenticationError("Discogs", "DISCOGS_TOKEN")
                 
             elif response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                self.logger.warning(f"⚠️ Rate limit Discogs atteint, attente {retry_after}s")
-                time.sleep(retry_after)
+                # Pas d'attente ici : l'appelant remet la requête en file
+                retry_after = parse_retry_after(response.headers.get('Retry-After'), 60)
+                self.logger.warning(f"⚠️ Rate limit Discogs atteint, reprise dans {retry_after:.0f}s")
                 raise APIRateLimitError("Discogs", retry_after)
                 
             elif response.status_code == 404:
@@ -232,6 +234,8 @@ class DiscogsExtractor:
             self.stats['searches_performed'] += 1
             return processed_releases
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur recherche Discogs: {e}")
             return []
@@ -269,6 +273,8 @@ class DiscogsExtractor:
             self.stats['releases_extracted'] += 1
             return processed_data
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur récupération release {release_id}: {e}")
             return None
@@ -306,6 +312,8 @@ class DiscogsExtractor:
             self.stats['masters_extracted'] += 1
             return processed_data
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur récupération master {master_id}: {e}")
             return None
@@ -343,6 +351,8 @@ class DiscogsExtractor:
             self.stats['artists_extracted'] += 1
             return processed_data
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur récupération artiste {artist_id}: {e}")
             return None
@@ -704,11 +714,11 @@ class DiscogsExtractor:
         elif any(word in role_lower for word in ['mix', 'master', 'engineer', 'record']):
             return CreditCategory.ENGINEERING.value
         elif any(word in role_lower for word in ['writ', 'lyric', 'compos', 'arrang']):
-            return CreditCategory.WRITING.value
+            return CreditCategory.SONGWRITING.value
         elif any(word in role_lower for word in ['vocal', 'rap', 'sing', 'feat']):
-            return CreditCategory.PERFORMANCE.value
+            return CreditCategory.VOCALS.value
         elif any(word in role_lower for word in ['guitar', 'bass', 'drum', 'keyboard', 'piano', 'synth']):
-            return CreditCategory.INSTRUMENTATION.value
+            return CreditCategory.MUSICIAN.value
         else:
             return CreditCategory.OTHER.value
     
@@ -18,7 +18,7 @@ from urllib3.util.retry import Retry
 
 # Imports absolus
 from core.exceptions import APIError, APIRateLimitError, APIAuthenticationError
-from core.rate_limiter import RateLimiter
+from core.rate_limiter import RateLimiter, get_concurrency_controller, parse_retry_after
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_artist_name
@@ -42,13 +42,13 @@ class LastFMExtractor:
         self.logger = logging.getLogger(__name__)
         
         # Configuration API Last.fm depuis variables d'environnement
-        self.api_key = settings.last_fm_api_key
+        self.api_key = settings.lastfm_api_key
         
         if not self.api_key:
             self.logger.warning("⚠️ Clé API Last.fm manquante - fonctionnalités limitées")
         
         # URLs de base
-        self.base_url = "https://ws.audioscrobbler.com/2.0/"
+        self.base_url = settings.get('apis.lastfm.base_url', "https://ws.audioscrobbler.com/2.0/")
         
         # Configuration optimisée
         self.config = {
@@ -72,9 +72,10 @@ class LastFMExtractor:
         self.session = self._create_session()
         
         # Rate limiter
-        self.rate_limiter = RateLimiter(
-            requests_per_second=self.config['rate_limit_requests_per_second']
-        )
+        self.rate_limiter = RateLimiter()
+        
+        # Concurrence adaptative pilotée par les 429 et l'erreur 29
+        self.concurrency = get_concurrency_controller('lastfm')
         
         # Cache manager
         self.cache_manager = CacheManager(namespace='lastfm') if CacheManager else None
@@ -101,7 +102,8 @@ class LastFMExtractor:
         retry_strategy = Retry(
             total=self.config['max_retries'],
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 traité par le contrôleur de concurrence (pas d'attente dans le thread)
+            status_forcelist=[500, 502, 503, 504],
             raise_on_status=False
         )
         
@@ -117,8 +119,6 @@ class LastFMExtractor:
             self.logger.error("❌ Clé API Last.fm manquante")
             return None
         
-        self.rate_limiter.wait()
-        
         # Paramètres de base
         request_params = {
             'method': method,
@@ -133,19 +133,22 @@ class LastFMExtractor:
         
         try:
             start_time = time.time()
-            response = self.session.get(
-                self.base_url,
-                params=request_params,
-                headers=self.headers,
-                timeout=self.config['timeout']
-            )
+            with self.concurrency.request(wait=lambda: self.rate_limiter.wait_if_needed('lastfm')) as call:
+                response = self.session.get(
+                    self.base_url,
+                    params=request_params,
+                    headers=self.headers,
+                    timeout=self.config['timeout']
+                )
+                # Last.fm signale aussi le rate limit dans le corps (erreur 29)
+                data = response.json() if response.status_code == 200 else None
+                call.record(response.status_code, response.headers,
+                            throttled=isinstance(data, dict) and data.get('error') == 29)
             
             self.stats['api_calls_made'] += 1
             self.stats['total_time_spent'] += time.time() - start_time
             
             if response.status_code == 200:
-                data = response.json()
-                
                 # Vérifier les erreurs Last.fm
                 if 'error' in data:
                     error_code = data.get('error')
@@ -163,8 +166,8 @@ class LastFMExtractor:
                 return data
                 
             elif response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                self.logger.warning(f"⚠️ Rate limit atteint, attente {retry_after}s")
+                retry_after = parse_retry_after(response.headers.get('Retry-After'), 60)
+                self.logger.warning(f"⚠️ Rate limit atteint, reprise dans {retry_after:.0f}s")
                 raise APIRateLimitError("LastFM", retry_after)
             else:
                 self.logger.error(f"❌ Erreur HTTP Last.fm {response.status_code}: {response.text}")
@@ -18,11 +18,11 @@ from urllib3.util.retry import Retry
 
 # Imports absolus
 from core.exceptions import APIError, APIRateLimitError, APIAuthenticationError
-from core.rate_limiter import RateLimiter
+from core.rate_limiter import RateLimiter, get_concurrency_controller, parse_retry_after
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_artist_name
-from models.enums import DataSource, CreditType, AudioFeature
+from models.enums import DataSource, CreditType
 
 
 class SpotifyExtractor:
@@ -50,8 +50,8 @@ class SpotifyExtractor:
             raise APIAuthenticationError("Spotify", "SPOTIFY_CLIENT_ID et SPOTIFY_CLIENT_SECRET manquants")
         
         # URLs de base
-        self.base_url = "https://api.spotify.com/v1"
-        self.auth_url = "https://accounts.spotify.com/api/token"
+        self.base_url = settings.get('apis.spotify.base_url', "https://api.spotify.com/v1")
+        self.auth_url = settings.get('apis.spotify.auth_url', "https://accounts.spotify.com/api/token")
         
         # Gestion des tokens
         self.access_token = None
@@ -72,9 +72,10 @@ class SpotifyExtractor:
         self.session = self._create_session()
         
         # Rate limiter
-        self.rate_limiter = RateLimiter(
-            requests_per_second=self.config['rate_limit_requests_per_second']
-        )
+        self.rate_limiter = RateLimiter()
+        
+        # Concurrence adaptative pilotée par les 429 / Retry-After
+        self.concurrency = get_concurrency_controller('spotify')
         
         # Cache manager
         self.cache_manager = CacheManager(namespace='spotify') if CacheManager else None
@@ -103,7 +104,8 @@ class SpotifyExtractor:
         retry_strategy = Retry(
             total=self.config['max_retries'],
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 traité par le contrôleur de concurrence (pas d'attente dans le thread)
+            status_forcelist=[500, 502, 503, 504],
             raise_on_status=False
         )
         
@@ -161,8 +163,6 @@ class SpotifyExtractor:
     
     def _make_api_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Effectue une requête API avec gestion d'erreurs et rate limiting"""
-        self.rate_limiter.wait()
-        
         if not self._ensure_authenticated():
             raise APIAuthenticationError("Spotify", "Impossible de s'authentifier")
         
@@ -174,12 +174,14 @@ class SpotifyExtractor:
         
         try:
             start_time = time.time()
-            response = self.session.get(
-                url,
-                headers=headers,
-                params=params or {},
-                timeout=self.config['timeout']
-            )
+            with self.concurrency.request(wait=lambda: self.rate_limiter.wait_if_needed('spotify')) as call:
+                response = self.session.get(
+                    url,
+                    headers=headers,
+                    params=params or {},
+                    timeout=self.config['timeout']
+                )
+                call.record(response.status_code, response.headers)
             
             self.stats['api_calls_made'] += 1
             self.stats['total_time_spent'] += time.time() - start_time
@@ -187,9 +189,9 @@ class SpotifyExtractor:
             if response.status_code == 200:
                 return response.json()
             elif response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 1))
-                self.logger.warning(f"⚠️ Rate limit atteint, attente {retry_after}s")
-                time.sleep(retry_after)
+                # Pas d'attente ici : l'appelant remet la requête en file
+                retry_after = parse_retry_after(response.headers.get('Retry-After'), 1)
+                self.logger.warning(f"⚠️ Rate limit atteint, reprise dans {retry_after:.0f}s")
                 raise APIRateLimitError("Spotify", retry_after)
             elif response.status_code == 401:
                 self.logger.warning("⚠️ Token expiré, renouvellement...")
@@ -268,6 +270,8 @@ class SpotifyExtractor:
             self.stats['searches_performed'] += 1
             return processed_tracks
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur recherche Spotify: {e}")
             return []
@@ -313,6 +317,8 @@ class SpotifyExtractor:
             self.stats['tracks_extracted'] += 1
             return processed_data
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur récupération track {track_id}: {e}")
             return None
@@ -350,6 +356,8 @@ class SpotifyExtractor:
             self.stats['albums_extracted'] += 1
             return processed_data
             
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Erreur récupération album {album_id}: {e}")
             return None
@@ -361,6 +369,8 @@ class SpotifyExtractor:
             if data:
                 return self._process_audio_features(data)
             return None
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.logger.debug(f"Erreur audio features {track_id}: {e}")
             return None
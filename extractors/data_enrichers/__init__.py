@@ -6,10 +6,12 @@ Version optimisée avec imports sécurisés, cache intelligent et diagnostics.
 
 import logging
 from functools import lru_cache
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -60,16 +62,26 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. Enrichisseurs de données principaux
-_safe_import('metadata_enricher', ['MetadataEnricher'])
-_safe_import('audio_analyzer', ['AudioAnalyzer'])
+_lazy.register('metadata_enricher', ['MetadataEnricher'])
+_lazy.register('audio_analyzer', ['AudioAnalyzer'])
 
 # 2. Enrichisseurs spécialisés optionnels
-_safe_import('genre_classifier', ['GenreClassifier'])
-_safe_import('similarity_analyzer', ['SimilarityAnalyzer'])
-_safe_import('trend_analyzer', ['TrendAnalyzer'])
+_lazy.register('genre_classifier', ['GenreClassifier'])
+_lazy.register('similarity_analyzer', ['SimilarityAnalyzer'])
+_lazy.register('trend_analyzer', ['TrendAnalyzer'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== FONCTIONS UTILITAIRES =====
 
@@ -81,6 +93,8 @@ def get_available_enrichers() -> List[str]:
     Returns:
         Liste des enrichisseurs disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if any(suffix in name for suffix in ['Enricher', 'Analyzer', 'Classifier'])]
 
 @lru_cache(maxsize=1)
@@ -91,6 +105,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -131,12 +147,12 @@ def create_enricher(enricher_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type d'enrichisseur inconnu: {enricher_type}")
         return None
     
-    if class_name not in globals():
+    enricher_class = _lazy.get(class_name, globals())
+    if enricher_class is None:
         logger.error(f"❌ Enrichisseur {class_name} non disponible")
         return None
     
     try:
-        enricher_class = globals()[class_name]
         return enricher_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -192,6 +208,8 @@ def run_enrichment_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -269,6 +287,8 @@ def validate_enrichment_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un enrichisseur principal est disponible
@@ -353,9 +373,25 @@ def merge_enrichment_results(enrichment_results: Dict[str, List[Dict[str, Any]]]
     reference_enricher = list(enrichment_results.keys())[0]
     reference_data = enrichment_results[reference_enricher]
     
+    # Correspondances un-pour-un avec chaque autre enrichisseur
+    from utils.record_linkage import link_records
+    
+    reference_records = [_matching_record(item) for item in reference_data]
+    enricher_matches = {}
+    for enricher_name, enricher_data in enrichment_results.items():
+        if enricher_name == reference_enricher:
+            continue
+        enricher_matches[enricher_name] = (enricher_data, link_records(
+            reference_records,
+            [_matching_record(item) for item in enricher_data],
+            match_fields=_MATCH_FIELDS,
+            id_fields=_MATCH_ID_FIELDS,
+            threshold=0.8
+        ))
+    
     merged_results = []
     
-    for ref_item in reference_data:
+    for ref_index, ref_item in enumerate(reference_data):
         merged_item = {
             'original_data': ref_item.get('original_data', {}),
             'enrichments': {
@@ -367,14 +403,10 @@ def merge_enrichment_results(enrichment_results: Dict[str, List[Dict[str, Any]]]
             'merge_strategy': merge_strategy
         }
         
-        # Chercher des correspondances dans les autres enrichisseurs
-        for enricher_name, enricher_data in enrichment_results.items():
-            if enricher_name == reference_enricher:
-                continue
-            
-            # Trouver l'élément correspondant (basé sur l'ID ou similarité)
-            matching_item = _find_matching_item(ref_item, enricher_data)
-            if matching_item:
+        # Ajouter l'élément correspondant de chaque autre enrichisseur (basé sur l'ID ou similarité)
+        for enricher_name, (enricher_data, matches) in enricher_matches.items():
+            if matches[ref_index]:
+                matching_item = enricher_data[matches[ref_index][0]]
                 merged_item['enrichments'][enricher_name] = matching_item
                 merged_item['confidence_scores'][enricher_name] = matching_item.get('confidence', 1.0)
         
@@ -391,30 +423,26 @@ def merge_enrichment_results(enrichment_results: Dict[str, List[Dict[str, Any]]]
     
     return merged_results
 
+# Champs de rapprochement des éléments enrichis (données d'origine)
+_MATCH_ID_FIELDS = ('id', 'track_id', 'isrc', 'spotify_id', 'genius_id')
+_MATCH_FIELDS = ('title', 'artist')
+
+def _matching_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Données d'origine d'un élément enrichi, utilisées pour le rapprochement"""
+    return item.get('original_data') or {}
+
 def _find_matching_item(reference_item: Dict[str, Any], candidate_items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """Trouve l'élément correspondant dans une liste de candidats"""
-    ref_original = reference_item.get('original_data', {})
-    ref_id = ref_original.get('id') or ref_original.get('track_id') or ref_original.get('title', '')
-    
-    for candidate in candidate_items:
-        cand_original = candidate.get('original_data', {})
-        cand_id = cand_original.get('id') or cand_original.get('track_id') or cand_original.get('title', '')
-        
-        # Correspondance exacte par ID
-        if ref_id and cand_id and ref_id == cand_id:
-            return candidate
-        
-        # Correspondance par similarité de titre (fallback)
-        if ref_id and cand_id:
-            try:
-                from utils.text_utils import calculate_similarity
-                similarity = calculate_similarity(str(ref_id).lower(), str(cand_id).lower())
-                if similarity > 0.8:
-                    return candidate
-            except ImportError:
-                pass
-    
-    return None
+    from utils.record_linkage import find_best_match
+    
+    match = find_best_match(
+        _matching_record(reference_item),
+        [_matching_record(item) for item in candidate_items],
+        match_fields=_MATCH_FIELDS,
+        id_fields=_MATCH_ID_FIELDS,
+        threshold=0.8
+    )
+    return candidate_items[match[0]] if match else None
 
 def analyze_enrichment_quality(enrichment_results: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
     """
@@ -740,15 +768,9 @@ class EnrichmentPipeline:
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_enrichment_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration data enrichers:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-else:
-    logger.info(f"✅ Module data enrichers initialisé: {len(get_available_enrichers())} enrichisseurs disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module data enrichers initialisé: {len(_lazy.names())} enrichisseurs déclarés (import différé)")
 
 # Export final
 __all__.extend([
@@ -5,9 +5,17 @@ Version optimisée avec cache intelligent, analyse avancée et détection de pat
 """
 
 import logging
+import multiprocessing
 import os
-from functools import lru_cache
-from typing import Dict, List, Optional, Any, Tuple, Union
+import json
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache, cached_property
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable
 from datetime import datetime
 import warnings
 
@@ -33,12 +41,328 @@ except ImportError:
     SCIPY_AVAILABLE = False
 
 # Imports absolus
-from core.cache import CacheManager
 from config.settings import settings
-from models.enums import DataSource, AudioFeature
+from models.enums import DataSource
 from utils.text_utils import normalize_text
 
 
+ANALYZER_VERSION = '1.0.0'
+
+# Analyses effectuées par défaut et analyses disponibles en mode flux
+DEFAULT_ANALYSIS_TYPES = ('basic', 'rhythm', 'harmonic', 'spectral', 'energy')
+STREAMING_ANALYSIS_TYPES = ('basic', 'rhythm', 'spectral', 'energy')
+
+# Paramètres STFT par défaut de librosa (ceux des appels historiques sans argument)
+_DEFAULT_N_FFT = 2048
+_DEFAULT_HOP_LENGTH = 512
+
+# Profils de tonalité simplifiés de Krumhansl-Schmuckler
+_KEY_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+_MAJOR_PROFILE = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
+_MINOR_PROFILE = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
+
+# Taille des blocs de lignes pour la matrice d'auto-similarité (mémoire bornée)
+_SIMILARITY_BLOCK_FRAMES = 1024
+
+
+def _build_key_profile_matrix() -> Tuple[List[str], np.ndarray]:
+    """
+    Construit les 24 profils de tonalité (12 rotations x 2 modes), dans
+    l'ordre C_major, C_minor, C#_major...
+
+    Returns:
+        (noms des tonalités, matrice 24 x 12 des profils centrés-réduits) :
+        un produit matriciel avec un chroma centré-réduit donne directement
+        les 24 coefficients de corrélation de Pearson
+    """
+    names = []
+    rows = []
+    for shift, key_name in enumerate(_KEY_NAMES):
+        for mode, profile in (('major', _MAJOR_PROFILE), ('minor', _MINOR_PROFILE)):
+            names.append(f'{key_name}_{mode}')
+            rows.append(np.roll(profile, shift))
+
+    profiles = np.array(rows)
+    profiles = profiles - profiles.mean(axis=1, keepdims=True)
+    profiles /= np.linalg.norm(profiles, axis=1, keepdims=True)
+    return names, profiles
+
+
+_KEY_LABELS, _KEY_PROFILE_MATRIX = _build_key_profile_matrix()
+
+
+def _run_lengths(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Segmente un masque booléen en plages consécutives.
+
+    Returns:
+        (indices de début, indices de fin exclus) des plages à True
+    """
+    padded = np.concatenate(([0], np.asarray(mask, dtype=np.int8), [0]))
+    changes = np.flatnonzero(np.diff(padded))
+    return changes[0::2], changes[1::2]
+
+
+class AudioFeatureContext:
+    """
+    Contexte d'analyse d'un fichier audio.
+    
+    Spectrogrammes, enveloppe d'onsets, séparation HPSS et chromagrammes sont
+    calculés à la première demande puis partagés par tous les analyseurs :
+    chaque représentation n'est calculée qu'une fois par fichier. Les
+    paramètres sont ceux des appels librosa historiques, les valeurs obtenues
+    sont donc identiques.
+    """
+    
+    def __init__(self, audio_data: np.ndarray, sr: int):
+        self.audio_data = audio_data
+        self.sr = sr
+        self.duration = len(audio_data) / sr
+        self._by_hop: Dict[Tuple[str, int], Any] = {}
+    
+    def _memo(self, name: str, hop_length: int, compute):
+        """Mémoïse une représentation dépendant du hop_length"""
+        key = (name, hop_length)
+        if key not in self._by_hop:
+            self._by_hop[key] = compute()
+        return self._by_hop[key]
+    
+    # ----- Spectrogrammes -----
+    
+    def magnitude(self, hop_length: int = _DEFAULT_HOP_LENGTH) -> np.ndarray:
+        """Spectrogramme d'amplitude |STFT| (n_fft par défaut)"""
+        return self._memo('magnitude', hop_length, lambda: np.abs(
+            librosa.stft(self.audio_data, n_fft=_DEFAULT_N_FFT, hop_length=hop_length)
+        ))
+    
+    @cached_property
+    def power(self) -> np.ndarray:
+        """Spectrogramme de puissance"""
+        return self.magnitude() ** 2
+    
+    @cached_property
+    def log_mel(self) -> np.ndarray:
+        """Mel-spectrogramme en dB (entrée commune MFCC / enveloppe d'onsets)"""
+        return librosa.power_to_db(librosa.feature.melspectrogram(S=self.power, sr=self.sr))
+    
+    # ----- Features de trame -----
+    
+    @cached_property
+    def rms(self) -> np.ndarray:
+        return librosa.feature.rms(y=self.audio_data)[0]
+    
+    @cached_property
+    def zero_crossing_rate(self) -> np.ndarray:
+        return librosa.feature.zero_crossing_rate(self.audio_data)[0]
+    
+    @cached_property
+    def spectral_centroid(self) -> np.ndarray:
+        return librosa.feature.spectral_centroid(S=self.magnitude(), sr=self.sr)[0]
+    
+    @cached_property
+    def spectral_rolloff(self) -> np.ndarray:
+        return librosa.feature.spectral_rolloff(S=self.magnitude(), sr=self.sr)[0]
+    
+    @cached_property
+    def spectral_bandwidth(self) -> np.ndarray:
+        return librosa.feature.spectral_bandwidth(S=self.magnitude(), sr=self.sr)[0]
+    
+    @cached_property
+    def spectral_flatness(self) -> np.ndarray:
+        return librosa.feature.spectral_flatness(S=self.magnitude())[0]
+    
+    @cached_property
+    def spectral_contrast(self) -> np.ndarray:
+        return librosa.feature.spectral_contrast(S=self.magnitude(), sr=self.sr)
+    
+    def mfcc(self, n_mfcc: int = 13) -> np.ndarray:
+        return self._memo('mfcc', n_mfcc, lambda: librosa.feature.mfcc(S=self.log_mel, n_mfcc=n_mfcc))
+    
+    @cached_property
+    def chroma(self) -> np.ndarray:
+        """Chromagramme du signal complet"""
+        return librosa.feature.chroma_stft(S=self.power, sr=self.sr)
+    
+    # ----- Rythme -----
+    
+    def onset_envelope(self, hop_length: int = _DEFAULT_HOP_LENGTH) -> np.ndarray:
+        """Enveloppe de force des onsets"""
+        def compute():
+            if hop_length == _DEFAULT_HOP_LENGTH:
+                return librosa.onset.onset_strength(S=self.log_mel, sr=self.sr)
+            return librosa.onset.onset_strength(y=self.audio_data, sr=self.sr, hop_length=hop_length)
+        return self._memo('onset_envelope', hop_length, compute)
+    
+    def beat_track(self, hop_length: int = _DEFAULT_HOP_LENGTH) -> Tuple[Any, np.ndarray]:
+        """(tempo, trames des beats)"""
+        return self._memo('beat_track', hop_length, lambda: librosa.beat.beat_track(
+            onset_envelope=self.onset_envelope(hop_length), sr=self.sr, hop_length=hop_length
+        ))
+    
+    def onset_times(self, hop_length: int = _DEFAULT_HOP_LENGTH) -> np.ndarray:
+        """Instants des onsets (secondes)"""
+        return self._memo('onset_times', hop_length, lambda: librosa.onset.onset_detect(
+            onset_envelope=self.onset_envelope(hop_length), sr=self.sr,
+            units='time', hop_length=hop_length
+        ))
+    
+    def high_frequency_onset_times(self, hop_length: int) -> np.ndarray:
+        """Onsets du signal pré-accentué (hi-hats)"""
+        return self._memo('high_frequency_onsets', hop_length, lambda: librosa.onset.onset_detect(
+            y=librosa.effects.preemphasis(self.audio_data), sr=self.sr,
+            units='time', hop_length=hop_length
+        ))
+    
+    # ----- Harmonique -----
+    
+    @cached_property
+    def hpss(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Séparation (harmonique, percussive)"""
+        return librosa.effects.hpss(self.audio_data)
+    
+    @cached_property
+    def harmonic_magnitude(self) -> np.ndarray:
+        """Spectrogramme d'amplitude de la composante harmonique"""
+        return np.abs(librosa.stft(self.hpss[0], n_fft=_DEFAULT_N_FFT, hop_length=_DEFAULT_HOP_LENGTH))
+    
+    @cached_property
+    def harmonic_chroma(self) -> np.ndarray:
+        """Chromagramme de la composante harmonique"""
+        return librosa.feature.chroma_stft(S=self.harmonic_magnitude ** 2, sr=self.sr)
+    
+    @cached_property
+    def harmonic_spectral_centroid(self) -> np.ndarray:
+        return librosa.feature.spectral_centroid(S=self.harmonic_magnitude, sr=self.sr)[0]
+
+
+class RunningStats:
+    """
+    Moyenne, écart-type, min et max cumulés par blocs (algorithme de Chan),
+    sans conserver les valeurs : mémoire constante quelle que soit la durée.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        
+        block_count = values.size
+        block_mean = float(values.mean())
+        block_m2 = float(((values - block_mean) ** 2).sum())
+        
+        total = self.count + block_count
+        delta = block_mean - self.mean
+        self.mean += delta * block_count / total
+        self._m2 += block_m2 + delta ** 2 * self.count * block_count / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+    
+    @property
+    def std(self) -> float:
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+class AudioResultCache:
+    """
+    Cache disque des résultats d'analyse, indexé par le contenu audio.
+    
+    Un fichier par clé (pickle), écrit de façon atomique : plusieurs
+    processus d'analyse peuvent partager le même répertoire.
+    """
+    
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+    
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path_for(key)
+        try:
+            with open(path, 'rb') as handle:
+                return pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Entrée de cache audio illisible {path}: {e}")
+            return None
+    
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def clear(self) -> int:
+        """Supprime toutes les entrées. Retourne le nombre de fichiers supprimés."""
+        removed = 0
+        if self.directory.exists():
+            for path in self.directory.glob('*/*.pkl'):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def hash_audio_content(file_path: Union[str, Path], block_size: int = 1 << 20) -> str:
+    """Empreinte du contenu d'un fichier audio (indépendante du nom et de l'emplacement)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as handle:
+        for block in iter(lambda: handle.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ===== EXÉCUTION EN PROCESSUS =====
+
+_worker_analyzer = None
+
+
+def _init_analysis_worker():
+    """Initialise un analyseur par processus de travail"""
+    global _worker_analyzer
+    warnings.filterwarnings('ignore')
+    _worker_analyzer = AudioAnalyzer()
+
+
+def _analyze_in_worker(file_path: str, analysis_types: Optional[List[str]],
+                       known_hashes: Dict[Tuple[str, int, float], str]) -> Dict[str, Any]:
+    """Analyse un fichier dans un processus de travail (empreinte déjà calculée par le parent)"""
+    _worker_analyzer._content_hashes.update(known_hashes)
+    return _worker_analyzer.analyze_audio(file_path, analysis_types)
+
+
+def _recycling_mp_context():
+    """
+    Contexte des processus recyclés (max_tasks_per_child).
+    
+    ProcessPoolExecutor refuse fork dans ce cas. forkserver (POSIX) démarre
+    un serveur qui importe une fois ce module (librosa, numpy) puis forke
+    les processus de travail ; spawn, seul disponible ailleurs, réimporte
+    tout à chaque recyclage.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
 class AudioAnalyzer:
     """
     Analyseur spécialisé pour les caractéristiques audio des morceaux.
@@ -69,11 +393,22 @@ class AudioAnalyzer:
             'enable_rhythm_analysis': settings.get('audio.rhythm_analysis', True),
             'enable_spectral_analysis': settings.get('audio.spectral_analysis', True),
             'cache_audio_features': settings.get('audio.cache_features', True),
-            'supported_formats': settings.get('audio.supported_formats', ['.mp3', '.wav', '.flac', '.m4a', '.ogg'])
+            'batch_workers': settings.get('audio.batch_workers', max(1, (os.cpu_count() or 2) - 1)),
+            'batch_max_tasks_per_child': settings.get('audio.batch_max_tasks_per_child', 20),
+            # Analyse en flux sur option : durée (secondes) au-delà de laquelle analyze_audio
+            # passe en mode flux, sans limite max_duration (None = désactivé)
+            'streaming_threshold': settings.get('audio.streaming_threshold', None),
+            'streaming_block_seconds': settings.get('audio.streaming_block_seconds', 10),
+            'streaming_tempo_window': settings.get('audio.streaming_tempo_window', 30),
+            'streaming_min_seconds': settings.get('audio.streaming_min_seconds', 60),
+            'streaming_tolerance': settings.get('audio.streaming_tolerance', 0.01),
+            'streaming_patience': settings.get('audio.streaming_patience', 3),
+            'supported_formats': settings.get('audio.supported_formats', ('.mp3', '.wav', '.flac', '.m4a', '.ogg'))
         }
         
-        # Cache manager
-        self.cache_manager = CacheManager(namespace='audio_analysis') if CacheManager else None
+        # Cache disque des résultats, indexé par le contenu audio
+        self.result_cache = AudioResultCache(settings.cache_dir / 'audio_analysis')
+        self._content_hashes: Dict[Tuple[str, int, float], str] = {}
         
         # Configuration d'analyse spécialisée pour le rap/hip-hop
         self.rap_analysis_config = self._load_rap_analysis_config()
@@ -157,15 +492,19 @@ class AudioAnalyzer:
         if not audio_path:
             return self._empty_result("Source audio invalide")
         
-        # Génération de la clé de cache
+        # Fichiers longs (mixtapes, DJ sets) : décodage par blocs, sur option et
+        # seulement si toutes les analyses demandées existent en mode flux
+        requested_types = analysis_types if analysis_types is not None else DEFAULT_ANALYSIS_TYPES
+        if set(requested_types) <= set(STREAMING_ANALYSIS_TYPES) and self._should_stream(audio_path):
+            return self.analyze_audio_streaming(audio_path, analysis_types=analysis_types)
+        
+        # Génération de la clé de cache (contenu audio + paramètres d'analyse)
         cache_key = self._generate_cache_key(audio_path, analysis_types)
         
         # Vérifier le cache
-        if self.cache_manager and self.config['cache_audio_features']:
-            cached_result = self.cache_manager.get(cache_key)
-            if cached_result:
-                self.stats['cache_hits'] += 1
-                return cached_result
+        cached_result = self._get_cached_result(cache_key, audio_path)
+        if cached_result:
+            return cached_result
         
         try:
             # Chargement du fichier audio
@@ -173,35 +512,38 @@ class AudioAnalyzer:
             if audio_data is None:
                 return self._empty_result("Impossible de charger le fichier audio")
             
+            # Contexte partagé : chaque représentation calculée une seule fois
+            context = AudioFeatureContext(audio_data, sr)
+            
             # Types d'analyses à effectuer
             if analysis_types is None:
-                analysis_types = ['basic', 'rhythm', 'harmonic', 'spectral', 'energy']
+                analysis_types = list(DEFAULT_ANALYSIS_TYPES)
             
             analysis_results = {}
             
             # 1. Analyse de base (BPM, durée, etc.)
             if 'basic' in analysis_types:
-                analysis_results['basic'] = self._analyze_basic_features(audio_data, sr)
+                analysis_results['basic'] = self._analyze_basic_features(context, sr)
             
             # 2. Analyse rythmique (BPM précis, patterns)
             if 'rhythm' in analysis_types and self.config['enable_rhythm_analysis']:
-                analysis_results['rhythm'] = self._analyze_rhythm_features(audio_data, sr)
+                analysis_results['rhythm'] = self._analyze_rhythm_features(context, sr)
             
             # 3. Analyse harmonique (tonalité, accords)
             if 'harmonic' in analysis_types and self.config['enable_harmonic_analysis']:
-                analysis_results['harmonic'] = self._analyze_harmonic_features(audio_data, sr)
+                analysis_results['harmonic'] = self._analyze_harmonic_features(context, sr)
             
             # 4. Analyse spectrale (timbres, textures)
             if 'spectral' in analysis_types and self.config['enable_spectral_analysis']:
-                analysis_results['spectral'] = self._analyze_spectral_features(audio_data, sr)
+                analysis_results['spectral'] = self._analyze_spectral_features(context, sr)
             
             # 5. Analyse énergétique (dynamics, intensité)
             if 'energy' in analysis_types:
-                analysis_results['energy'] = self._analyze_energy_features(audio_data, sr)
+                analysis_results['energy'] = self._analyze_energy_features(context, sr)
             
             # 6. Analyse spécialisée rap/hip-hop
             if 'rap_specific' in analysis_types:
-                analysis_results['rap_specific'] = self._analyze_rap_features(audio_data, sr)
+                analysis_results['rap_specific'] = self._analyze_rap_features(context, sr)
             
             # Compilation des résultats
             result = {
@@ -212,7 +554,7 @@ class AudioAnalyzer:
                 'quality_assessment': self._assess_analysis_quality(analysis_results),
                 'processing_metadata': {
                     'analyzed_at': datetime.now().isoformat(),
-                    'analyzer_version': '1.0.0',
+                    'analyzer_version': ANALYZER_VERSION,
                     'processing_time': time.time() - start_time,
                     'sample_rate': sr,
                     'duration_seconds': len(audio_data) / sr,
@@ -221,8 +563,11 @@ class AudioAnalyzer:
             }
             
             # Mise en cache
-            if self.cache_manager and self.config['cache_audio_features']:
-                self.cache_manager.set(cache_key, result, ttl=7200)  # Cache 2h
+            if self.config['cache_audio_features']:
+                try:
+                    self.result_cache.set(cache_key, result)
+                except Exception as e:
+                    self.logger.debug(f"Mise en cache audio impossible: {e}")
             
             self.stats['files_analyzed'] += 1
             self.stats['features_extracted'] += len(analysis_results)
@@ -261,6 +606,239 @@ class AudioAnalyzer:
         
         return None
     
+    def _should_stream(self, audio_path: str) -> bool:
+        """Indique si le fichier dépasse le seuil d'analyse en flux (désactivé par défaut)"""
+        threshold = self.config['streaming_threshold']
+        if not threshold:
+            return False
+        try:
+            return librosa.get_duration(path=audio_path) > threshold
+        except Exception:
+            return False
+    
+    def analyze_audio_streaming(self, audio_source: Union[str, Dict[str, Any]],
+                                stop_on_convergence: bool = True,
+                                analysis_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Analyse un fichier long par blocs de taille fixe.
+        
+        Le fichier est décodé bloc par bloc (librosa.stream, fréquence
+        d'échantillonnage native) ; seules des statistiques cumulées et une
+        fenêtre glissante d'enveloppe d'onsets sont conservées, la mémoire
+        reste donc constante. L'analyse peut s'arrêter dès que les estimations
+        (RMS, centroïde, tempo) sont stables.
+        
+        Contrairement à analyze_audio, la durée analysée n'est pas limitée par
+        audio.max_duration : c'est l'objet de ce mode. Les analyses harmonic et
+        rap_specific ne sont pas disponibles en flux.
+        
+        Args:
+            audio_source: Chemin vers le fichier ou dictionnaire avec metadata
+            stop_on_convergence: Arrêter dès la convergence des estimations
+            analysis_types: Analyses à retourner parmi STREAMING_ANALYSIS_TYPES
+                (None = toutes)
+            
+        Returns:
+            Résultat au format d'analyze_audio
+        """
+        import time
+        start_time = time.time()
+        
+        if not LIBROSA_AVAILABLE:
+            return self._empty_result("Librosa non disponible pour l'analyse audio")
+        
+        audio_path = self._prepare_audio_source(audio_source)
+        if not audio_path:
+            return self._empty_result("Source audio invalide")
+        
+        cache_key = self._generate_cache_key(audio_path, analysis_types, variant='streaming')
+        cached_result = self._get_cached_result(cache_key, audio_path)
+        if cached_result:
+            return cached_result
+        
+        try:
+            n_fft = self.config['frame_length']
+            hop_length = self.config['hop_length']
+            sr = librosa.get_samplerate(audio_path)
+            block_length = max(1, int(self.config['streaming_block_seconds'] * sr / hop_length))
+            
+            freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+            frequency_bands = self.rap_analysis_config['energy_analysis']['frequency_bands']
+            band_indices = {
+                band_name: np.where((freqs >= low) & (freqs <= high))[0]
+                for band_name, (low, high) in frequency_bands.items()
+            }
+            band_sums = {band_name: 0.0 for band_name in band_indices}
+            
+            statistics = {name: RunningStats() for name in (
+                'rms', 'zcr', 'centroid', 'bandwidth', 'rolloff', 'flatness'
+            )}
+            
+            window_frames = int(self.config['streaming_tempo_window'] * sr / hop_length)
+            onset_window = deque(maxlen=window_frames)
+            tempo_estimates: List[float] = []
+            
+            total_frames = 0
+            blocks = 0
+            stable_blocks = 0
+            converged = False
+            previous_snapshot = None
+            
+            stream = librosa.stream(
+                audio_path, block_length=block_length,
+                frame_length=n_fft, hop_length=hop_length
+            )
+            
+            for block in stream:
+                # Dernier bloc tronqué : ignoré s'il ne contient pas une trame complète
+                if len(block) < n_fft:
+                    break
+                
+                magnitude = np.abs(librosa.stft(block, n_fft=n_fft, hop_length=hop_length, center=False))
+                
+                statistics['rms'].update(librosa.feature.rms(
+                    y=block, frame_length=n_fft, hop_length=hop_length, center=False
+                ))
+                statistics['zcr'].update(librosa.feature.zero_crossing_rate(
+                    block, frame_length=n_fft, hop_length=hop_length, center=False
+                ))
+                statistics['centroid'].update(librosa.feature.spectral_centroid(S=magnitude, sr=sr))
+                statistics['bandwidth'].update(librosa.feature.spectral_bandwidth(S=magnitude, sr=sr))
+                statistics['rolloff'].update(librosa.feature.spectral_rolloff(S=magnitude, sr=sr))
+                statistics['flatness'].update(librosa.feature.spectral_flatness(S=magnitude))
+                
+                for band_name, indices in band_indices.items():
+                    if len(indices) > 0:
+                        band_sums[band_name] += float(magnitude[indices, :].mean(axis=0).sum())
+                
+                # Enveloppe d'onsets sur fenêtre glissante, tempo estimé par bloc
+                log_mel = librosa.power_to_db(librosa.feature.melspectrogram(S=magnitude ** 2, sr=sr))
+                onset_window.extend(librosa.onset.onset_strength(S=log_mel, sr=sr, center=False))
+                if len(onset_window) >= window_frames // 2:
+                    tempo = librosa.feature.tempo(
+                        onset_envelope=np.fromiter(onset_window, dtype=np.float32),
+                        sr=sr, hop_length=hop_length
+                    )
+                    tempo_estimates.append(float(np.atleast_1d(tempo)[0]))
+                
+                total_frames += magnitude.shape[1]
+                blocks += 1
+                
+                # Convergence : variations relatives sous la tolérance plusieurs blocs de suite
+                snapshot = (
+                    statistics['rms'].mean,
+                    statistics['centroid'].mean,
+                    float(np.median(tempo_estimates)) if tempo_estimates else 0.0
+                )
+                if previous_snapshot is not None and tempo_estimates:
+                    changes = [
+                        abs(current - previous) / abs(previous) if previous else 0.0
+                        for current, previous in zip(snapshot, previous_snapshot)
+                    ]
+                    stable_blocks = stable_blocks + 1 if max(changes) < self.config['streaming_tolerance'] else 0
+                previous_snapshot = snapshot
+                
+                analyzed_seconds = total_frames * hop_length / sr
+                if (stop_on_convergence and stable_blocks >= self.config['streaming_patience']
+                        and analyzed_seconds >= self.config['streaming_min_seconds']):
+                    converged = True
+                    break
+            
+            if total_frames == 0:
+                return self._empty_result("Impossible de décoder le fichier audio")
+            
+            analysis_results = self._compile_streaming_results(
+                statistics, band_sums, band_indices, tempo_estimates, total_frames
+            )
+            analyzed_seconds = total_frames * hop_length / sr
+            duration_seconds = librosa.get_duration(path=audio_path)
+            analysis_results['basic']['duration_seconds'] = duration_seconds
+            analysis_results['basic']['duration_ms'] = int(duration_seconds * 1000)
+            if analysis_types is not None:
+                analysis_results = {
+                    name: features for name, features in analysis_results.items() if name in analysis_types
+                }
+            
+            result = {
+                'success': True,
+                'audio_file': audio_path,
+                'analysis_results': analysis_results,
+                'summary_features': self._compile_summary_features(analysis_results),
+                'quality_assessment': self._assess_analysis_quality(analysis_results),
+                'processing_metadata': {
+                    'analyzed_at': datetime.now().isoformat(),
+                    'analyzer_version': ANALYZER_VERSION,
+                    'processing_time': time.time() - start_time,
+                    'sample_rate': sr,
+                    'duration_seconds': duration_seconds,
+                    'analysis_types': list(analysis_results),
+                    'streaming': True,
+                    'blocks_processed': blocks,
+                    'analyzed_seconds': analyzed_seconds,
+                    'converged': converged
+                }
+            }
+            
+            if self.config['cache_audio_features']:
+                try:
+                    self.result_cache.set(cache_key, result)
+                except Exception as e:
+                    self.logger.debug(f"Mise en cache audio impossible: {e}")
+            
+            self.stats['files_analyzed'] += 1
+            self.stats['features_extracted'] += len(analysis_results)
+            self.stats['analysis_time_total'] += time.time() - start_time
+            self.stats['average_analysis_time'] = self.stats['analysis_time_total'] / self.stats['files_analyzed']
+            
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erreur analyse audio en flux: {e}")
+            self.stats['failed_analyses'] += 1
+            return self._empty_result(f"Erreur d'analyse en flux: {str(e)}")
+    
+    def _compile_streaming_results(self, statistics: Dict[str, RunningStats],
+                                   band_sums: Dict[str, float], band_indices: Dict[str, np.ndarray],
+                                   tempo_estimates: List[float], total_frames: int) -> Dict[str, Any]:
+        """Convertit les statistiques cumulées au format des analyses complètes"""
+        rms = statistics['rms']
+        
+        basic = {
+            'rms_energy': rms.mean,
+            'rms_std': rms.std,
+            'zero_crossing_rate': statistics['zcr'].mean,
+            'spectral_centroid': statistics['centroid'].mean,
+            'spectral_rolloff': statistics['rolloff'].mean
+        }
+        
+        spectral = {}
+        for feature_name in ('centroid', 'bandwidth', 'rolloff', 'flatness'):
+            spectral[f'spectral_{feature_name}_mean'] = statistics[feature_name].mean
+            spectral[f'spectral_{feature_name}_std'] = statistics[feature_name].std
+        
+        energy = {
+            f'{band_name}_energy': band_sums[band_name] / total_frames
+            for band_name, indices in band_indices.items() if len(indices) > 0
+        }
+        dynamic_range = rms.max - rms.min
+        energy['dynamic_range'] = dynamic_range
+        if dynamic_range > 0:
+            energy['compression_ratio'] = rms.std / dynamic_range
+        
+        rhythm = {}
+        if tempo_estimates:
+            tempo = float(np.median(tempo_estimates))
+            bpm_range = self.rap_analysis_config['bpm_range']
+            rhythm = {
+                'bpm': tempo,
+                'tempo_estimates_count': len(tempo_estimates),
+                'tempo_stability': float(np.std(tempo_estimates)),
+                'bpm_valid_for_rap': bpm_range['min'] <= tempo <= bpm_range['max'],
+                'bpm_confidence': 'high' if bpm_range['min'] <= tempo <= bpm_range['max'] else 'low'
+            }
+        
+        return {'basic': basic, 'rhythm': rhythm, 'spectral': spectral, 'energy': energy}
+    
     def _load_audio_file(self, file_path: str) -> Tuple[Optional[np.ndarray], Optional[int]]:
         """Charge un fichier audio avec librosa"""
         try:
@@ -285,31 +863,40 @@ class AudioAnalyzer:
             self.logger.error(f"❌ Erreur chargement audio {file_path}: {e}")
             return None, None
     
-    def _analyze_basic_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _feature_context(self, audio_data: Union[np.ndarray, AudioFeatureContext],
+                         sr: int) -> AudioFeatureContext:
+        """Retourne le contexte d'analyse (créé si un signal brut est fourni)"""
+        if isinstance(audio_data, AudioFeatureContext):
+            return audio_data
+        return AudioFeatureContext(audio_data, sr)
+    
+    def _analyze_basic_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse les caractéristiques de base"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Durée
-            duration_seconds = len(audio_data) / sr
+            duration_seconds = context.duration
             features['duration_seconds'] = duration_seconds
             features['duration_ms'] = int(duration_seconds * 1000)
             
             # RMS Energy (volume moyen)
-            rms = librosa.feature.rms(y=audio_data)[0]
+            rms = context.rms
             features['rms_energy'] = float(np.mean(rms))
             features['rms_std'] = float(np.std(rms))
             
             # Zero Crossing Rate (indicateur de percussions)
-            zcr = librosa.feature.zero_crossing_rate(audio_data)[0]
+            zcr = context.zero_crossing_rate
             features['zero_crossing_rate'] = float(np.mean(zcr))
             
             # Centroide spectral (brillance)
-            spectral_centroids = librosa.feature.spectral_centroid(y=audio_data, sr=sr)[0]
+            spectral_centroids = context.spectral_centroid
             features['spectral_centroid'] = float(np.mean(spectral_centroids))
             
             # Rolloff spectral
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=audio_data, sr=sr)[0]
+            spectral_rolloff = context.spectral_rolloff
             features['spectral_rolloff'] = float(np.mean(spectral_rolloff))
             
         except Exception as e:
@@ -317,21 +904,19 @@ class AudioAnalyzer:
         
         return features
     
-    def _analyze_rhythm_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_rhythm_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse les caractéristiques rythmiques"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Détection du tempo (BPM)
-            tempo, beats = librosa.beat.beat_track(
-                y=audio_data, 
-                sr=sr, 
-                hop_length=self.config['hop_length']
-            )
+            tempo, beats = context.beat_track(self.config['hop_length'])
             
             features['bpm'] = float(tempo)
             features['beats_count'] = len(beats)
-            features['beats_per_second'] = len(beats) / (len(audio_data) / sr)
+            features['beats_per_second'] = len(beats) / context.duration
             
             # Validation BPM pour le rap
             bpm_range = self.rap_analysis_config['bpm_range']
@@ -359,20 +944,22 @@ class AudioAnalyzer:
             
             # Détection de patterns trap (hi-hats rapides)
             if self.rap_analysis_config['rhythm_patterns']['trap_hi_hat_detection']:
-                features['trap_pattern_detected'] = self._detect_trap_patterns(audio_data, sr, beats)
+                features['trap_pattern_detected'] = self._detect_trap_patterns(context, sr, beats)
             
         except Exception as e:
             self.logger.debug(f"Erreur analyse rythmique: {e}")
         
         return features
     
-    def _analyze_harmonic_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_harmonic_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse les caractéristiques harmoniques"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Séparation harmonique/percussive
-            y_harmonic, y_percussive = librosa.effects.hpss(audio_data)
+            y_harmonic, y_percussive = context.hpss
             
             # Ratio harmonique/percussif
             harmonic_energy = np.sum(y_harmonic ** 2)
@@ -382,27 +969,23 @@ class AudioAnalyzer:
                 features['harmonic_percussive_ratio'] = float(harmonic_energy / percussive_energy)
             
             # Détection de tonalité avec chromagram
-            chroma = librosa.feature.chroma_stft(y=y_harmonic, sr=sr)
+            chroma = context.harmonic_chroma
             
             # Profil de tonalité moyen
             chroma_mean = np.mean(chroma, axis=1)
             
-            # Détection de la tonalité principale
-            key_profiles = self._get_key_profiles()
-            key_correlations = {}
-            
-            for key_name, profile in key_profiles.items():
-                correlation = np.corrcoef(chroma_mean, profile)[0, 1]
-                if not np.isnan(correlation):
-                    key_correlations[key_name] = correlation
+            # Détection de la tonalité principale : corrélations avec les 24
+            # profils en un seul produit matriciel
+            key_correlations = self._key_correlations(chroma_mean)
             
-            if key_correlations:
-                detected_key = max(key_correlations.items(), key=lambda x: x[1])
-                features['detected_key'] = detected_key[0]
-                features['key_confidence'] = float(detected_key[1])
+            if key_correlations is not None:
+                best_index = int(np.argmax(key_correlations))
+                detected_key = _KEY_LABELS[best_index]
+                features['detected_key'] = detected_key
+                features['key_confidence'] = float(key_correlations[best_index])
                 
                 # Validation pour le rap (préférence mineure)
-                if 'minor' in detected_key[0].lower():
+                if 'minor' in detected_key.lower():
                     features['key_confidence'] *= self.rap_analysis_config['key_detection']['minor_preference']
             
             # Analyse de la complexité harmonique
@@ -413,22 +996,24 @@ class AudioAnalyzer:
         
         return features
     
-    def _analyze_spectral_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_spectral_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse les caractéristiques spectrales"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # MFCC (Mel-frequency cepstral coefficients)
-            mfccs = librosa.feature.mfcc(y=audio_data, sr=sr, n_mfcc=13)
+            mfccs = context.mfcc(n_mfcc=13)
             features['mfcc_mean'] = np.mean(mfccs, axis=1).tolist()
             features['mfcc_std'] = np.std(mfccs, axis=1).tolist()
             
             # Spectral features
             spectral_features = {
-                'centroid': librosa.feature.spectral_centroid(y=audio_data, sr=sr)[0],
-                'bandwidth': librosa.feature.spectral_bandwidth(y=audio_data, sr=sr)[0],
-                'rolloff': librosa.feature.spectral_rolloff(y=audio_data, sr=sr)[0],
-                'flatness': librosa.feature.spectral_flatness(y=audio_data)[0]
+                'centroid': context.spectral_centroid,
+                'bandwidth': context.spectral_bandwidth,
+                'rolloff': context.spectral_rolloff,
+                'flatness': context.spectral_flatness
             }
             
             for feature_name, feature_values in spectral_features.items():
@@ -436,7 +1021,7 @@ class AudioAnalyzer:
                 features[f'spectral_{feature_name}_std'] = float(np.std(feature_values))
             
             # Contrast spectral (utile pour la musique avec voix)
-            contrast = librosa.feature.spectral_contrast(y=audio_data, sr=sr)
+            contrast = context.spectral_contrast
             features['spectral_contrast_mean'] = np.mean(contrast, axis=1).tolist()
             
         except Exception as e:
@@ -444,17 +1029,18 @@ class AudioAnalyzer:
         
         return features
     
-    def _analyze_energy_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_energy_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse les caractéristiques énergétiques"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Analyse par bandes de fréquences spécialisées rap
             frequency_bands = self.rap_analysis_config['energy_analysis']['frequency_bands']
             
-            # Calcul du spectrogramme
-            stft = librosa.stft(audio_data, hop_length=self.config['hop_length'])
-            magnitude = np.abs(stft)
+            # Spectrogramme partagé
+            magnitude = context.magnitude(self.config['hop_length'])
             
             # Fréquences correspondantes
             freqs = librosa.fft_frequencies(sr=sr, n_fft=self.config['frame_length'])
@@ -482,7 +1068,7 @@ class AudioAnalyzer:
             
             # Dynamic range
             if self.rap_analysis_config['energy_analysis']['dynamic_range_analysis']:
-                rms = librosa.feature.rms(y=audio_data)[0]
+                rms = context.rms
                 dynamic_range = float(np.max(rms) - np.min(rms))
                 features['dynamic_range'] = dynamic_range
                 
@@ -495,29 +1081,31 @@ class AudioAnalyzer:
         
         return features
     
-    def _analyze_rap_features(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_rap_features(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse spécialisée pour les caractéristiques rap/hip-hop"""
         features = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Détection de la structure vocale
             if self.rap_analysis_config['vocal_analysis']['detect_vocal_segments']:
-                vocal_segments = self._detect_vocal_segments(audio_data, sr)
+                vocal_segments = self._detect_vocal_segments(context, sr)
                 features['vocal_segments'] = vocal_segments
                 
                 if vocal_segments:
                     total_vocal_time = sum(seg['duration'] for seg in vocal_segments)
-                    total_duration = len(audio_data) / sr
+                    total_duration = context.duration
                     features['vocal_density'] = total_vocal_time / total_duration
             
             # Analyse du flow (variations rythmiques)
-            features['flow_analysis'] = self._analyze_rap_flow(audio_data, sr)
+            features['flow_analysis'] = self._analyze_rap_flow(context, sr)
             
             # Détection de samples (patterns répétitifs)
-            features['sample_detection'] = self._detect_samples(audio_data, sr)
+            features['sample_detection'] = self._detect_samples(context, sr)
             
             # Classification de sous-genre rap
-            features['rap_subgenre_hints'] = self._classify_rap_subgenre(audio_data, sr)
+            features['rap_subgenre_hints'] = self._classify_rap_subgenre(context, sr)
             
         except Exception as e:
             self.logger.debug(f"Erreur analyse rap spécialisée: {e}")
@@ -526,24 +1114,20 @@ class AudioAnalyzer:
     
     # ===== MÉTHODES UTILITAIRES SPÉCIALISÉES =====
     
-    def _detect_trap_patterns(self, audio_data: np.ndarray, sr: int, beats: np.ndarray) -> bool:
+    def _detect_trap_patterns(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int,
+                              beats: np.ndarray) -> bool:
         """Détecte les patterns caractéristiques de la trap"""
         try:
-            # Analyser les hautes fréquences pour détecter les hi-hats rapides
-            high_freq_cutoff = 8000
-            high_freq_audio = librosa.effects.preemphasis(audio_data)
-            
-            # Onset detection sur les hautes fréquences
-            onsets = librosa.onset.onset_detect(
-                y=high_freq_audio, 
-                sr=sr, 
-                units='time',
-                hop_length=self.config['hop_length'] // 2  # Plus de résolution
+            context = self._feature_context(audio_data, sr)
+            
+            # Onset detection sur les hautes fréquences (signal pré-accentué)
+            onsets = context.high_frequency_onset_times(
+                self.config['hop_length'] // 2  # Plus de résolution
             )
             
             # Calculer la densité d'onsets
-            if len(onsets) > 0 and len(audio_data) > 0:
-                onset_density = len(onsets) / (len(audio_data) / sr)
+            if len(onsets) > 0 and len(context.audio_data) > 0:
+                onset_density = len(onsets) / context.duration
                 
                 # Pattern trap typique: beaucoup d'onsets sur les hautes fréquences
                 return onset_density > 8  # Plus de 8 onsets/seconde
@@ -553,101 +1137,94 @@ class AudioAnalyzer:
         
         return False
     
-    @lru_cache(maxsize=1)
     def _get_key_profiles(self) -> Dict[str, np.ndarray]:
-        """Retourne les profils de tonalité avec cache"""
-        # Profils simplifiés de Krumhansl-Schmuckler
-        major_profile = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
-        minor_profile = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
-        
+        """Retourne les profils de tonalité (rotations des profils de référence)"""
         keys = {}
-        key_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        for i, key_name in enumerate(key_names):
-            # Rotation du profil pour chaque tonalité
-            keys[f'{key_name}_major'] = np.roll(major_profile, i)
-            keys[f'{key_name}_minor'] = np.roll(minor_profile, i)
-        
+        for shift, key_name in enumerate(_KEY_NAMES):
+            keys[f'{key_name}_major'] = np.roll(_MAJOR_PROFILE, shift)
+            keys[f'{key_name}_minor'] = np.roll(_MINOR_PROFILE, shift)
         return keys
     
-    def _detect_vocal_segments(self, audio_data: np.ndarray, sr: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _key_correlations(chroma_mean: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Corrélations de Pearson du chroma moyen avec les 24 profils de
+        tonalité (ordre de _KEY_LABELS), None si le chroma est constant.
+        """
+        centered = np.asarray(chroma_mean, dtype=np.float64) - np.mean(chroma_mean)
+        norm = np.linalg.norm(centered)
+        if not norm or not np.isfinite(norm):
+            return None
+        return _KEY_PROFILE_MATRIX @ (centered / norm)
+    
+    def _detect_vocal_segments(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> List[Dict[str, Any]]:
         """Détecte les segments vocaux dans l'audio"""
         segments = []
         
         try:
-            # Séparation harmonique/percussive pour isoler les voix
-            y_harmonic, _ = librosa.effects.hpss(audio_data)
+            context = self._feature_context(audio_data, sr)
             
-            # Centroide spectral pour détecter les caractéristiques vocales
-            spectral_centroids = librosa.feature.spectral_centroid(y=y_harmonic, sr=sr)[0]
+            # Centroide spectral de la composante harmonique (isole les voix)
+            spectral_centroids = context.harmonic_spectral_centroid
             
             # Seuillage adaptatif pour détecter les segments vocaux
             centroid_threshold = np.mean(spectral_centroids) + 0.5 * np.std(spectral_centroids)
             vocal_frames = spectral_centroids > centroid_threshold
             
-            # Convertir en segments temporels
-            frame_times = librosa.frames_to_time(
-                np.arange(len(vocal_frames)), 
-                sr=sr, 
-                hop_length=self.config['hop_length']
-            )
+            # Plages de frames consécutives ; une plage encore ouverte en fin
+            # de morceau n'est pas fermée et donc pas retenue
+            starts, ends = _run_lengths(vocal_frames)
+            closed = ends < len(vocal_frames)
+            starts, ends = starts[closed], ends[closed]
             
-            # Grouper les frames consécutifs
-            in_vocal_segment = False
-            segment_start = 0
-            
-            for i, is_vocal in enumerate(vocal_frames):
-                if is_vocal and not in_vocal_segment:
-                    # Début de segment vocal
-                    segment_start = frame_times[i]
-                    in_vocal_segment = True
-                elif not is_vocal and in_vocal_segment:
-                    # Fin de segment vocal
-                    segment_end = frame_times[i]
-                    duration = segment_end - segment_start
-                    
-                    if duration > 0.5:  # Segments d'au moins 0.5 seconde
-                        segments.append({
-                            'start_time': segment_start,
-                            'end_time': segment_end,
-                            'duration': duration
-                        })
-                    
-                    in_vocal_segment = False
+            # Convertir en segments temporels
+            start_times = librosa.frames_to_time(starts, sr=sr, hop_length=self.config['hop_length'])
+            end_times = librosa.frames_to_time(ends, sr=sr, hop_length=self.config['hop_length'])
+            durations = end_times - start_times
+            
+            # Segments d'au moins 0.5 seconde
+            for start_time, end_time, duration in zip(
+                start_times.tolist(), end_times.tolist(), durations.tolist()
+            ):
+                if duration > 0.5:
+                    segments.append({
+                        'start_time': start_time,
+                        'end_time': end_time,
+                        'duration': duration
+                    })
             
         except Exception as e:
             self.logger.debug(f"Erreur détection segments vocaux: {e}")
         
         return segments
     
-    def _analyze_rap_flow(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_rap_flow(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Analyse le flow du rap (variations rythmiques)"""
         flow_analysis = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Onset detection pour analyser les attaques
-            onsets = librosa.onset.onset_detect(
-                y=audio_data, 
-                sr=sr, 
-                units='time',
-                hop_length=self.config['hop_length']
-            )
+            onsets = context.onset_times(self.config['hop_length'])
             
             if len(onsets) > 1:
                 # Analyse des intervalles entre onsets
                 onset_intervals = np.diff(onsets)
+                interval_mean = float(np.mean(onset_intervals))
+                interval_std = float(np.std(onset_intervals))
                 
                 flow_analysis.update({
-                    'onset_density': len(onsets) / (len(audio_data) / sr),
-                    'flow_regularity': float(1.0 - np.std(onset_intervals) / np.mean(onset_intervals)),
-                    'flow_complexity': float(np.std(onset_intervals)),
-                    'average_onset_interval': float(np.mean(onset_intervals))
+                    'onset_density': len(onsets) / context.duration,
+                    'flow_regularity': float(1.0 - interval_std / interval_mean),
+                    'flow_complexity': interval_std,
+                    'average_onset_interval': interval_mean
                 })
                 
                 # Classification du style de flow
-                if np.std(onset_intervals) < 0.1:
+                if interval_std < 0.1:
                     flow_analysis['flow_style'] = 'regular'
-                elif np.std(onset_intervals) > 0.3:
+                elif interval_std > 0.3:
                     flow_analysis['flow_style'] = 'complex'
                 else:
                     flow_analysis['flow_style'] = 'moderate'
@@ -657,28 +1234,33 @@ class AudioAnalyzer:
         
         return flow_analysis
     
-    def _detect_samples(self, audio_data: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _detect_samples(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, Any]:
         """Détecte la présence de samples (patterns répétitifs)"""
         sample_detection = {}
         
         try:
-            # Analyse de la self-similarity matrix pour détecter les répétitions
-            chroma = librosa.feature.chroma_stft(y=audio_data, sr=sr)
+            context = self._feature_context(audio_data, sr)
             
-            # Matrice de similarité
-            similarity_matrix = np.dot(chroma.T, chroma)
+            # Analyse de la self-similarity matrix pour détecter les répétitions
+            chroma = context.chroma
+            n_frames = chroma.shape[1]
             
-            # Normalisation
-            similarity_matrix = similarity_matrix / np.max(similarity_matrix)
+            # Le maximum de la matrice chroma.T @ chroma est sur la diagonale
+            # (Cauchy-Schwarz) : normalisation connue sans construire la matrice
+            max_similarity = float(np.max(np.einsum('ij,ij->j', chroma, chroma)))
             
-            # Détection de patterns répétitifs
-            # Chercher des diagonales dans la matrice de similarité
+            # Détection de patterns répétitifs : comptage par blocs de lignes
+            # au-dessus du seuil, la matrice N x N n'est jamais matérialisée
             high_similarity_threshold = 0.8
-            repetitive_segments = np.where(similarity_matrix > high_similarity_threshold)
+            repetitive_count = 0
+            for block_start in range(0, n_frames, _SIMILARITY_BLOCK_FRAMES):
+                block = chroma[:, block_start:block_start + _SIMILARITY_BLOCK_FRAMES]
+                similarity_block = np.dot(block.T, chroma) / max_similarity
+                repetitive_count += int(np.count_nonzero(similarity_block > high_similarity_threshold))
             
-            if len(repetitive_segments[0]) > 0:
+            if repetitive_count > 0:
                 sample_detection['repetitive_patterns_detected'] = True
-                sample_detection['repetition_density'] = len(repetitive_segments[0]) / similarity_matrix.size
+                sample_detection['repetition_density'] = repetitive_count / (n_frames * n_frames)
             else:
                 sample_detection['repetitive_patterns_detected'] = False
                 sample_detection['repetition_density'] = 0.0
@@ -688,28 +1270,29 @@ class AudioAnalyzer:
         
         return sample_detection
     
-    def _classify_rap_subgenre(self, audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+    def _classify_rap_subgenre(self, audio_data: Union[np.ndarray, AudioFeatureContext], sr: int) -> Dict[str, float]:
         """Classifie le sous-genre de rap basé sur les caractéristiques audio"""
         subgenre_scores = {}
         
         try:
+            context = self._feature_context(audio_data, sr)
+            
             # Caractéristiques pour différents sous-genres
             
             # 1. Trap - BPM modéré, beaucoup de hi-hats, sub-bass prononcé
             trap_score = 0.0
             
             # BPM dans la plage trap (130-150)
-            tempo, _ = librosa.beat.beat_track(y=audio_data, sr=sr)
+            tempo, _ = context.beat_track()
             if 130 <= tempo <= 150:
                 trap_score += 0.3
             
             # Détection de patterns trap
-            if self._detect_trap_patterns(audio_data, sr, np.array([])):
+            if self._detect_trap_patterns(context, sr, np.array([])):
                 trap_score += 0.4
             
             # Sub-bass fort
-            stft = librosa.stft(audio_data)
-            magnitude = np.abs(stft)
+            magnitude = context.magnitude()
             freqs = librosa.fft_frequencies(sr=sr, n_fft=self.config['frame_length'])
             sub_bass_indices = np.where((freqs >= 20) & (freqs <= 60))[0]
             
@@ -728,7 +1311,7 @@ class AudioAnalyzer:
                 boom_bap_score += 0.4
             
             # Analyse du ratio harmonique/percussif
-            y_harmonic, y_percussive = librosa.effects.hpss(audio_data)
+            y_harmonic, y_percussive = context.hpss
             perc_energy = np.sum(y_percussive ** 2)
             harm_energy = np.sum(y_harmonic ** 2)
             
@@ -870,71 +1453,207 @@ class AudioAnalyzer:
     # ===== MÉTHODES BATCH ET UTILITAIRES =====
     
     def batch_analyze_audio_files(self, file_paths: List[str], 
-                                 analysis_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                                 analysis_types: Optional[List[str]] = None,
+                                 max_workers: Optional[int] = None,
+                                 progress_callback: Optional[Callable] = None) -> List[Dict[str, Any]]:
         """
         Analyse plusieurs fichiers audio en lot.
         
+        Les fichiers déjà en cache (même contenu, mêmes paramètres) ne sont pas
+        réanalysés ; les autres sont répartis sur un pool de processus
+        (librosa est limité par le CPU).
+        
         Args:
             file_paths: Liste des chemins vers les fichiers
             analysis_types: Types d'analyses à effectuer
+            max_workers: Nombre de processus (1 = analyse séquentielle)
+            progress_callback: Appelé avec ("audio_analysis", terminés, total)
             
         Returns:
-            Liste des résultats d'analyse
+            Liste des résultats d'analyse (dans l'ordre de file_paths)
         """
-        results = []
+        total = len(file_paths)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        completed = 0
         
-        self.logger.info(f"🎵 Analyse en lot de {len(file_paths)} fichiers audio")
+        self.logger.info(f"🎵 Analyse en lot de {total} fichiers audio")
         
+        def finish(index: int, result: Dict[str, Any]):
+            nonlocal completed
+            result['batch_info'] = {
+                'batch_index': index,
+                'batch_size': total,
+                'file_name': os.path.basename(file_paths[index])
+            }
+            results[index] = result
+            completed += 1
+            if progress_callback:
+                progress_callback("audio_analysis", completed, total)
+        
+        def failure(index: int, error: Exception) -> Dict[str, Any]:
+            self.logger.error(f"❌ Erreur analyse {file_paths[index]}: {error}")
+            return {'success': False, 'error': str(error), 'audio_file': file_paths[index]}
+        
+        # Résultats déjà en cache : aucun envoi vers le pool
+        pending = []
         for i, file_path in enumerate(file_paths):
             try:
-                self.logger.info(f"📁 Analyse {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
-                
-                result = self.analyze_audio(file_path, analysis_types)
-                result['batch_info'] = {
-                    'batch_index': i,
-                    'batch_size': len(file_paths),
-                    'file_name': os.path.basename(file_path)
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Erreur analyse {file_path}: {e}")
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'audio_file': file_path,
-                    'batch_info': {
-                        'batch_index': i,
-                        'batch_size': len(file_paths),
-                        'file_name': os.path.basename(file_path)
-                    }
-                })
+                cached_result = self._get_cached_result(
+                    self._generate_cache_key(file_path, analysis_types), file_path
+                )
+            except Exception:
+                cached_result = None
+            
+            if cached_result:
+                finish(i, cached_result)
+            else:
+                pending.append(i)
+        
+        workers = max_workers if max_workers is not None else self.config['batch_workers']
+        workers = max(1, min(workers, len(pending)))
+        
+        if workers <= 1:
+            for i in pending:
+                try:
+                    self.logger.info(f"📁 Analyse {i+1}/{total}: {os.path.basename(file_paths[i])}")
+                    finish(i, self.analyze_audio(file_paths[i], analysis_types))
+                except Exception as e:
+                    finish(i, failure(i, e))
+        else:
+            self._run_process_pool(pending, file_paths, analysis_types, workers, finish, failure)
         
         # Statistiques du lot
         successful_analyses = [r for r in results if r.get('success', False)]
         
-        self.logger.info(f"🏁 Analyse en lot terminée: {len(successful_analyses)}/{len(file_paths)} succès")
+        self.logger.info(f"🏁 Analyse en lot terminée: {len(successful_analyses)}/{total} succès")
         
         return results
     
+    def _run_process_pool(self, pending: List[int], file_paths: List[str],
+                          analysis_types: Optional[List[str]], workers: int,
+                          finish: Callable, failure: Callable):
+        """
+        Répartit les analyses sur un pool de processus.
+        
+        La mémoire reste bornée : au plus 2 tâches en attente par processus, et
+        chaque processus est recyclé après batch_max_tasks_per_child analyses.
+        Le recyclage exclut fork : les processus partent d'un forkserver
+        (spawn hors POSIX). batch_max_tasks_per_child à 0 garde fork, sans
+        recyclage.
+        """
+        pool_kwargs = {'max_workers': workers, 'initializer': _init_analysis_worker}
+        max_tasks_per_child = self.config['batch_max_tasks_per_child']
+        if max_tasks_per_child:
+            pool_kwargs['max_tasks_per_child'] = max_tasks_per_child
+            pool_kwargs['mp_context'] = _recycling_mp_context()
+        
+        try:
+            executor = ProcessPoolExecutor(**pool_kwargs)
+        except TypeError:
+            # Python < 3.11 : pas de recyclage des processus, fork reste possible
+            pool_kwargs.pop('max_tasks_per_child', None)
+            pool_kwargs.pop('mp_context', None)
+            executor = ProcessPoolExecutor(**pool_kwargs)
+        
+        queue = iter(pending)
+        in_flight = {}
+        
+        def submit_next() -> bool:
+            index = next(queue, None)
+            if index is None:
+                return False
+            future = executor.submit(_analyze_in_worker, file_paths[index], analysis_types,
+                                     self._known_content_hash(file_paths[index]))
+            in_flight[future] = index
+            return True
+        
+        with executor:
+            for _ in range(workers * 2):
+                if not submit_next():
+                    break
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                        if result.get('success'):
+                            self.stats['files_analyzed'] += 1
+                        else:
+                            self.stats['failed_analyses'] += 1
+                    except Exception as e:
+                        self.stats['failed_analyses'] += 1
+                        result = failure(index, e)
+                    finish(index, result)
+                    submit_next()
+    
     # ===== MÉTHODES UTILITAIRES =====
     
-    def _generate_cache_key(self, audio_path: str, analysis_types: Optional[List[str]] = None) -> str:
-        """Génère une clé de cache pour l'analyse audio"""
-        import hashlib
+    def _generate_cache_key(self, audio_path: str, analysis_types: Optional[List[str]] = None,
+                            variant: Optional[str] = None) -> str:
+        """
+        Génère une clé de cache pour l'analyse audio.
+        
+        La clé dépend du contenu du fichier (pas de son chemin) et des
+        paramètres d'analyse : un fichier renommé ou réimporté est retrouvé.
+        """
+        try:
+            signature = self._file_signature(audio_path)
+            content_hash = self._content_hashes.get(signature)
+            if content_hash is None:
+                content_hash = hash_audio_content(audio_path)
+                self._content_hashes[signature] = content_hash
+        except OSError:
+            content_hash = audio_path
+        
+        parameters = {
+            'version': ANALYZER_VERSION,
+            'sample_rate': self.config['sample_rate'],
+            'hop_length': self.config['hop_length'],
+            'frame_length': self.config['frame_length'],
+            'max_duration': self.config['max_duration'],
+            'harmonic': self.config['enable_harmonic_analysis'],
+            'rhythm': self.config['enable_rhythm_analysis'],
+            'spectral': self.config['enable_spectral_analysis'],
+            'analysis_types': sorted(analysis_types) if analysis_types else None,
+            'variant': variant
+        }
+        if variant == 'streaming':
+            parameters.update({
+                key: value for key, value in self.config.items() if key.startswith('streaming_')
+            })
         
-        # Utiliser le chemin du fichier et sa taille/date de modification
+        key_source = content_hash + json.dumps(parameters, sort_keys=True)
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _file_signature(audio_path: str) -> Tuple[str, int, float]:
+        """Identifie une version d'un fichier (chemin, taille, date de modification)"""
+        stat = os.stat(audio_path)
+        return (os.path.abspath(audio_path), stat.st_size, stat.st_mtime)
+    
+    def _known_content_hash(self, audio_path: str) -> Dict[Tuple[str, int, float], str]:
+        """Empreinte déjà calculée d'un fichier, à transmettre à un processus de travail"""
         try:
-            stat = os.stat(audio_path)
-            file_signature = f"{audio_path}_{stat.st_size}_{stat.st_mtime}"
+            signature = self._file_signature(audio_path)
         except OSError:
-            file_signature = audio_path
+            return {}
+        content_hash = self._content_hashes.get(signature)
+        return {signature: content_hash} if content_hash else {}
+    
+    def _get_cached_result(self, cache_key: str, audio_path: str) -> Optional[Dict[str, Any]]:
+        """Retourne le résultat en cache, rattaché au chemin courant du fichier"""
+        if not self.config['cache_audio_features']:
+            return None
         
-        if analysis_types:
-            file_signature += "_" + "_".join(sorted(analysis_types))
+        cached_result = self.result_cache.get(cache_key)
+        if not cached_result:
+            return None
         
-        return hashlib.md5(file_signature.encode()).hexdigest()[:16]
+        self.stats['cache_hits'] += 1
+        cached_result['audio_file'] = audio_path
+        return cached_result
     
     def _empty_result(self, error_message: str) -> Dict[str, Any]:
         """Retourne un résultat vide avec message d'erreur"""
@@ -952,7 +1671,7 @@ class AudioAnalyzer:
             },
             'processing_metadata': {
                 'analyzed_at': datetime.now().isoformat(),
-                'analyzer_version': '1.0.0'
+                'analyzer_version': ANALYZER_VERSION
             }
         }
     
@@ -962,13 +1681,13 @@ class AudioAnalyzer:
     
     def clear_cache(self) -> bool:
         """Vide le cache de l'analyseur"""
-        if self.cache_manager:
-            return self.cache_manager.clear()
+        self.result_cache.clear()
+        self._content_hashes.clear()
         return True
     
     def get_supported_formats(self) -> List[str]:
         """Retourne la liste des formats audio supportés"""
-        return self.config['supported_formats'].copy()
+        return list(self.config['supported_formats'])
     
     def health_check(self) -> Dict[str, Any]:
         """Vérifie l'état de santé de l'analyseur"""
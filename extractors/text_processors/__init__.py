@@ -6,10 +6,12 @@ Version optimisée avec imports sécurisés, cache intelligent et diagnostics.
 
 import logging
 from functools import lru_cache
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -60,15 +62,25 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. Processeurs de texte principaux
-_safe_import('lyrics_processor', ['LyricsProcessor'])
-_safe_import('credit_parser', ['CreditParser'])
+_lazy.register('lyrics_processor', ['LyricsProcessor'])
+_lazy.register('credit_parser', ['CreditParser'])
 
 # 2. Processeurs de texte optionnels
-_safe_import('metadata_normalizer', ['MetadataNormalizer'])
-_safe_import('text_classifier', ['TextClassifier'])
+_lazy.register('metadata_normalizer', ['MetadataNormalizer'])
+_lazy.register('text_classifier', ['TextClassifier'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== FONCTIONS UTILITAIRES =====
 
@@ -80,6 +92,8 @@ def get_available_processors() -> List[str]:
     Returns:
         Liste des processeurs disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if any(suffix in name for suffix in ['Processor', 'Parser', 'Normalizer', 'Classifier'])]
 
 @lru_cache(maxsize=1)
@@ -90,6 +104,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -130,12 +146,12 @@ def create_processor(processor_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type de processeur inconnu: {processor_type}")
         return None
     
-    if class_name not in globals():
+    processor_class = _lazy.get(class_name, globals())
+    if processor_class is None:
         logger.error(f"❌ Processeur {class_name} non disponible")
         return None
     
     try:
-        processor_class = globals()[class_name]
         return processor_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -191,6 +207,8 @@ def run_text_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -260,6 +278,8 @@ def validate_text_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un processeur principal est disponible
@@ -671,15 +691,9 @@ def _format_report_html(report_data: Dict[str, Any]) -> str:
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_text_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration text processors:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-else:
-    logger.info(f"✅ Module text processors initialisé: {len(get_available_processors())} processeurs disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module text processors initialisé: {len(_lazy.names())} processeurs déclarés (import différé)")
 
 # Export final
 __all__.extend([
@@ -15,6 +15,7 @@ from collections import defaultdict
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_artist_name, calculate_similarity
+from utils.keyword_matcher import KeywordMatcher
 from models.enums import DataSource, CreditType, CreditCategory
 
 class CreditParser:
@@ -36,6 +37,7 @@ class CreditParser:
         self.patterns = self._compile_patterns()
         self.role_mappings = self._load_role_mappings()
         self.instrument_keywords = self._load_instrument_keywords()
+        self.role_matcher = self._build_role_matcher()
         self.stats = {
             'credits_parsed': 0,
             'roles_normalized': 0,
@@ -157,6 +159,16 @@ class CreditParser:
             'flûte', 'harmonica', 'accordion', 'accordéon', 'organ', 'orgue'
         }
     
+    def _build_role_matcher(self) -> KeywordMatcher:
+        """Automate des mots-clés de rôles (toutes catégories en un passage)"""
+        return KeywordMatcher({
+            'production': ['produc', 'beat', 'instrumental'],
+            'engineering': ['mix', 'master', 'engineer', 'record'],
+            'writing': ['writ', 'compos', 'lyric', 'author'],
+            'performance': ['vocal', 'rap', 'sing', 'feat'],
+            'instrument': self.instrument_keywords
+        })
+    
     # ===== MÉTHODES PRINCIPALES =====
     
     def parse_credits(self, credit_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -439,46 +451,56 @@ class CreditParser:
     def _detect_role_by_keywords(self, role: str) -> Optional[str]:
         """Détecte un rôle par mots-clés avec cache"""
         role_lower = role.lower()
+        keywords = self.role_matcher.present_keywords(role_lower)
+        categories = self._role_categories(keywords)
         
         # Production
-        if any(word in role_lower for word in ['produc', 'beat', 'instrumental']):
+        if 'production' in categories:
             return 'Producer'
         
         # Engineering
-        elif any(word in role_lower for word in ['mix', 'master', 'engineer', 'record']):
-            if 'mix' in role_lower:
+        elif 'engineering' in categories:
+            if 'mix' in keywords:
                 return 'Mixing Engineer'
-            elif 'master' in role_lower:
+            elif 'master' in keywords:
                 return 'Mastering Engineer'
-            elif 'record' in role_lower:
+            elif 'record' in keywords:
                 return 'Recording Engineer'
             else:
                 return 'Sound Engineer'
         
         # Writing
-        elif any(word in role_lower for word in ['writ', 'compos', 'lyric', 'author']):
-            if 'lyric' in role_lower:
+        elif 'writing' in categories:
+            if 'lyric' in keywords:
                 return 'Lyricist'
-            elif 'compos' in role_lower:
+            elif 'compos' in keywords:
                 return 'Composer'
             else:
                 return 'Songwriter'
         
         # Performance
-        elif any(word in role_lower for word in ['vocal', 'rap', 'sing', 'feat']):
-            if 'rap' in role_lower:
+        elif 'performance' in categories:
+            if 'rap' in keywords:
                 return 'Rapper'
-            elif 'feat' in role_lower:
+            elif 'feat' in keywords:
                 return 'Featured Artist'
             else:
                 return 'Vocalist'
         
         # Instruments
-        elif any(instrument in role_lower for instrument in self.instrument_keywords):
+        elif 'instrument' in categories:
             return self._get_instrument_role(role_lower)
         
         return None
     
+    def _role_categories(self, keywords: Set[str]) -> Set[str]:
+        """Catégories de rôle couvertes par les mots-clés trouvés"""
+        return {
+            category
+            for keyword in keywords
+            for category in self.role_matcher.keyword_categories[keyword]
+        }
+    
     def _get_instrument_role(self, role: str) -> str:
         """Détermine le rôle spécifique d'un instrument"""
         if 'guitar' in role or 'guitare' in role:
@@ -499,18 +521,18 @@ class CreditParser:
     @lru_cache(maxsize=64)
     def _categorize_role(self, role: str) -> str:
         """Catégorise un rôle de crédit"""
-        role_lower = role.lower()
+        categories = self._role_categories(self.role_matcher.present_keywords(role.lower()))
         
-        if any(word in role_lower for word in ['produc', 'beat', 'instrumental']):
+        if 'production' in categories:
             return CreditCategory.PRODUCTION.value
-        elif any(word in role_lower for word in ['mix', 'master', 'engineer', 'record']):
+        elif 'engineering' in categories:
             return CreditCategory.ENGINEERING.value
-        elif any(word in role_lower for word in ['writ', 'compos', 'lyric', 'author']):
-            return CreditCategory.WRITING.value
-        elif any(word in role_lower for word in ['vocal', 'rap', 'sing', 'feat']):
-            return CreditCategory.PERFORMANCE.value
-        elif any(instrument in role_lower for instrument in self.instrument_keywords):
-            return CreditCategory.INSTRUMENTATION.value
+        elif 'writing' in categories:
+            return CreditCategory.SONGWRITING.value
+        elif 'performance' in categories:
+            return CreditCategory.VOCALS.value
+        elif 'instrument' in categories:
+            return CreditCategory.MUSICIAN.value
         else:
             return CreditCategory.OTHER.value
     
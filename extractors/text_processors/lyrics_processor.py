@@ -6,8 +6,8 @@ Version optimisée avec cache intelligent, analyse sémantique et détection de
 
 import logging
 import re
-from functools import lru_cache
-from typing import Dict, List, Optional, Any, Tuple, Set
+from functools import lru_cache, cached_property
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable, Iterator, Union
 from datetime import datetime
 from collections import Counter, defaultdict
 
@@ -15,9 +15,76 @@ from collections import Counter, defaultdict
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_text
+from utils.keyword_matcher import KeywordMatcher
 from models.enums import DataSource, Genre, LyricsFeature
 
 
+# Ponctuation retirée des mots selon l'analyse
+_BASIC_STRIP_CHARS = '.,!?;:'
+_WORD_STRIP_CHARS = '.,!?;:()[]'
+_VOCABULARY_STRIP_CHARS = '.,!?;:()[]"\''
+
+# Mots explicites, recherchés avec les mots-clés thématiques (même automate)
+_EXPLICIT_WORDS = [
+    'shit', 'fuck', 'bitch', 'ass', 'damn', 'hell',
+    'merde', 'putain', 'connard', 'salope', 'bordel'
+]
+_EXPLICIT_CATEGORY = 'explicit'
+
+
+class LyricsTokens:
+    """
+    Représentation tokenisée d'un texte de paroles, construite une seule fois
+    et partagée par tous les analyseurs.
+    
+    Les vues dérivées (minuscules, mots nettoyés, fréquences) sont calculées
+    à la première utilisation puis conservées.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lines: List[str] = text.split('\n')
+        self.words: List[str] = text.split()
+        # Occurrences de mots-clés par catégorie (remplies par LyricsProcessor)
+        self.keyword_hits: Optional[Dict[str, List[str]]] = None
+    
+    @cached_property
+    def lower_text(self) -> str:
+        """Texte en minuscules"""
+        return self.text.lower()
+    
+    @cached_property
+    def stripped_lines(self) -> List[str]:
+        """Lignes non vides, sans espaces de bord"""
+        return [line.strip() for line in self.lines if line.strip()]
+    
+    @cached_property
+    def lower_words(self) -> List[str]:
+        """Mots en minuscules (même ordre que words)"""
+        return self.lower_text.split()
+    
+    @cached_property
+    def normalized_words(self) -> List[str]:
+        """Mots en minuscules sans ponctuation de bord"""
+        return [word.strip(_WORD_STRIP_CHARS) for word in self.lower_words]
+    
+    @cached_property
+    def word_counts(self) -> Counter:
+        """Fréquences des mots normalisés"""
+        return Counter(self.normalized_words)
+    
+    @cached_property
+    def unique_basic_words(self) -> Set[str]:
+        """Mots distincts (ponctuation de phrase retirée)"""
+        return {word.strip(_BASIC_STRIP_CHARS) for word in self.lower_words}
+    
+    @cached_property
+    def vocabulary_words(self) -> List[str]:
+        """Mots nettoyés (ponctuation et guillemets retirés), non vides"""
+        stripped = (word.strip(_VOCABULARY_STRIP_CHARS) for word in self.lower_words)
+        return [word for word in stripped if word]
+
+
 class LyricsProcessor:
     """
     Processeur spécialisé pour l'analyse des paroles de rap/hip-hop.
@@ -57,6 +124,12 @@ class LyricsProcessor:
         # Dictionnaires de mots-clés pour analyse thématique
         self.theme_keywords = self._load_theme_keywords()
         
+        # Automate unique thèmes + contenu explicite (un seul passage par texte)
+        self.keyword_matcher = KeywordMatcher(
+            {**self.theme_keywords, _EXPLICIT_CATEGORY: _EXPLICIT_WORDS},
+            whole_words=True
+        )
+        
         # Mots vides français et anglais
         self.stop_words = self._load_stop_words()
         
@@ -98,10 +171,7 @@ class LyricsProcessor:
             'internal_rhymes': re.compile(r'\b(\w+)\b.*?\b(\w+)\b', re.IGNORECASE),
             
             # Détection explicite
-            'explicit_words': re.compile(r'\b(' + '|'.join([
-                'shit', 'fuck', 'bitch', 'ass', 'damn', 'hell',
-                'merde', 'putain', 'connard', 'salope', 'bordel'
-            ]) + r')\b', re.IGNORECASE),
+            'explicit_words': re.compile(r'\b(' + '|'.join(_EXPLICIT_WORDS) + r')\b', re.IGNORECASE),
             
             # URLs et mentions
             'urls': re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'),
@@ -197,11 +267,12 @@ class LyricsProcessor:
                 return cached_result
         
         try:
-            # 1. Nettoyage et normalisation
+            # 1. Nettoyage et normalisation, tokenisation unique partagée par les analyses
             cleaned_lyrics = self._clean_lyrics(lyrics)
+            tokens = LyricsTokens(cleaned_lyrics)
             
             # 2. Analyse de base
-            basic_analysis = self._analyze_basic_stats(cleaned_lyrics)
+            basic_analysis = self._analyze_basic_stats(tokens)
             
             # 3. Détection de structure
             structure_analysis = {}
@@ -212,12 +283,12 @@ class LyricsProcessor:
             # 4. Analyse des rimes
             rhyme_analysis = {}
             if self.config['analyze_rhymes']:
-                rhyme_analysis = self._analyze_rhymes(cleaned_lyrics)
+                rhyme_analysis = self._analyze_rhymes(tokens)
             
             # 5. Extraction des thèmes
             theme_analysis = {}
             if self.config['extract_themes']:
-                theme_analysis = self._extract_themes(cleaned_lyrics)
+                theme_analysis = self._extract_themes(tokens)
                 self.stats['themes_extracted'] += 1
             
             # 6. Détection des featuring
@@ -230,17 +301,17 @@ class LyricsProcessor:
             # 7. Détection de langue
             language_analysis = {}
             if self.config['language_detection']:
-                language_analysis = self._detect_language(cleaned_lyrics)
+                language_analysis = self._detect_language(tokens)
             
             # 8. Détection de contenu explicite
             explicit_analysis = {}
             if self.config['explicit_detection']:
-                explicit_analysis = self._detect_explicit_content(cleaned_lyrics)
+                explicit_analysis = self._detect_explicit_content(tokens)
             
             # 9. Analyse du vocabulaire
             vocabulary_analysis = {}
             if self.config['vocabulary_analysis']:
-                vocabulary_analysis = self._analyze_vocabulary(cleaned_lyrics)
+                vocabulary_analysis = self._analyze_vocabulary(tokens)
             
             # Compilation du résultat
             result = {
@@ -276,6 +347,35 @@ class LyricsProcessor:
             self.logger.error(f"❌ Erreur traitement paroles: {e}")
             return self._empty_result(f"Erreur de traitement: {str(e)}")
     
+    def process_lyrics_many(self, lyrics_items: Iterable[Union[str, Tuple[str, Optional[Dict[str, Any]]]]]
+                            ) -> Iterator[Dict[str, Any]]:
+        """
+        Traite une série de paroles (ex: discographie d'un artiste) en flux.
+        
+        Args:
+            lyrics_items: Paroles seules ou tuples (paroles, métadonnées)
+            
+        Yields:
+            Résultat de process_lyrics pour chaque élément, dans l'ordre
+        """
+        for item in lyrics_items:
+            if isinstance(item, tuple):
+                lyrics, track_metadata = item
+            else:
+                lyrics, track_metadata = item, None
+            yield self.process_lyrics(lyrics, track_metadata)
+    
+    @staticmethod
+    def _tokenize(lyrics: Union[str, LyricsTokens]) -> LyricsTokens:
+        """Retourne la représentation tokenisée (construite si nécessaire)"""
+        return lyrics if isinstance(lyrics, LyricsTokens) else LyricsTokens(lyrics)
+    
+    def _keyword_hits(self, tokens: LyricsTokens) -> Dict[str, List[str]]:
+        """Occurrences des mots-clés (thèmes, explicite), calculées une fois par texte"""
+        if tokens.keyword_hits is None:
+            tokens.keyword_hits = self.keyword_matcher.match_categories(tokens.lower_text)
+        return tokens.keyword_hits
+    
     def _clean_lyrics(self, lyrics: str) -> str:
         """Nettoie et normalise les paroles"""
         try:
@@ -310,25 +410,26 @@ class LyricsProcessor:
             self.logger.debug(f"Erreur nettoyage paroles: {e}")
             return lyrics.strip()
     
-    def _analyze_basic_stats(self, lyrics: str) -> Dict[str, Any]:
+    def _analyze_basic_stats(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Analyse les statistiques de base des paroles"""
-        lines = lyrics.split('\n')
-        words = lyrics.split()
+        tokens = self._tokenize(lyrics)
+        lines = tokens.lines
+        words = tokens.words
         
         # Compter les lignes non vides
         non_empty_lines = [line for line in lines if line.strip()]
         
         # Compter les mots uniques
-        unique_words = set(word.lower().strip('.,!?;:') for word in words if word.strip())
+        unique_words = tokens.unique_basic_words
         
         # Longueur moyenne des lignes
         avg_line_length = sum(len(line) for line in non_empty_lines) / len(non_empty_lines) if non_empty_lines else 0
         
         # Longueur moyenne des mots
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
+        avg_word_length = sum(map(len, words)) / len(words) if words else 0
         
         return {
-            'total_characters': len(lyrics),
+            'total_characters': len(tokens.text),
             'total_lines': len(lines),
             'non_empty_lines': len(non_empty_lines),
             'total_words': len(words),
@@ -339,7 +440,7 @@ class LyricsProcessor:
             'lines_per_word': round(len(non_empty_lines) / len(words), 4) if words else 0
         }
     
-    def _analyze_structure(self, lyrics: str) -> Dict[str, Any]:
+    def _analyze_structure(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Analyse la structure des paroles (couplets, refrains, etc.)"""
         structure = {
             'sections': [],
@@ -352,14 +453,18 @@ class LyricsProcessor:
         }
         
         try:
-            lines = lyrics.split('\n')
+            tokens = self._tokenize(lyrics)
+            lines = tokens.lines
             current_section = None
             section_content = []
             
             for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
+                # Détecter les marqueurs de section (tous entre crochets)
+                if '[' not in line:
+                    if line.strip():
+                        section_content.append(line)
+                    continue
                 
-                # Détecter les marqueurs de section
                 if self.patterns['verse_markers'].search(line):
                     if current_section:
                         structure['sections'].append({
@@ -422,16 +527,16 @@ class LyricsProcessor:
             
             # Estimation de structure si pas de marqueurs explicites
             if not structure['sections']:
-                structure['estimated_structure'] = self._estimate_structure(lyrics)
+                structure['estimated_structure'] = self._estimate_structure(tokens)
             
         except Exception as e:
             self.logger.debug(f"Erreur analyse structure: {e}")
         
         return structure
     
-    def _estimate_structure(self, lyrics: str) -> List[Dict[str, Any]]:
+    def _estimate_structure(self, lyrics: Union[str, LyricsTokens]) -> List[Dict[str, Any]]:
         """Estime la structure basée sur la répétition de lignes"""
-        lines = [line.strip() for line in lyrics.split('\n') if line.strip()]
+        lines = self._tokenize(lyrics).stripped_lines
         
         if len(lines) < 4:
             return []
@@ -472,7 +577,7 @@ class LyricsProcessor:
         
         return estimated_sections
     
-    def _analyze_rhymes(self, lyrics: str) -> Dict[str, Any]:
+    def _analyze_rhymes(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Analyse les schémas de rimes"""
         rhyme_analysis = {
             'end_rhymes': [],
@@ -483,7 +588,7 @@ class LyricsProcessor:
         }
         
         try:
-            lines = [line.strip() for line in lyrics.split('\n') if line.strip()]
+            lines = self._tokenize(lyrics).stripped_lines
             
             # Extraire les mots de fin de ligne
             end_words = []
@@ -524,7 +629,7 @@ class LyricsProcessor:
         
         return rhyme_analysis
     
-    def _extract_themes(self, lyrics: str) -> Dict[str, Any]:
+    def _extract_themes(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Extrait les thèmes principaux des paroles"""
         theme_analysis = {
             'detected_themes': {},
@@ -534,16 +639,13 @@ class LyricsProcessor:
         }
         
         try:
-            words = lyrics.lower().split()
-            word_count = len(words)
+            tokens = self._tokenize(lyrics)
+            keyword_hits = self._keyword_hits(tokens)
+            word_count = len(tokens.words)
             
             # Analyser chaque thème
-            for theme, keywords in self.theme_keywords.items():
-                matches = []
-                for word in words:
-                    clean_word = word.strip('.,!?;:()[]')
-                    if clean_word in keywords:
-                        matches.append(clean_word)
+            for theme in self.theme_keywords:
+                matches = keyword_hits.get(theme)
                 
                 if matches:
                     frequency = len(matches)
@@ -611,7 +713,7 @@ class LyricsProcessor:
         
         return featuring_analysis
     
-    def _detect_language(self, lyrics: str) -> Dict[str, Any]:
+    def _detect_language(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Détecte la langue principale des paroles"""
         language_analysis = {
             'primary_language': 'unknown',
@@ -620,7 +722,7 @@ class LyricsProcessor:
         }
         
         try:
-            words = [word.lower().strip('.,!?;:()[]') for word in lyrics.split()]
+            tokens = self._tokenize(lyrics)
             
             # Mots indicateurs de langue française
             french_indicators = {
@@ -638,11 +740,12 @@ class LyricsProcessor:
                 'their', 'me', 'him', 'us', 'them', 'am', 'is', 'are', 'was', 'were'
             }
             
-            # Compter les occurrences
-            french_count = sum(1 for word in words if word in french_indicators)
-            english_count = sum(1 for word in words if word in english_indicators)
+            # Compter les occurrences à partir des fréquences partagées
+            word_counts = tokens.word_counts
+            french_count = sum(word_counts[word] for word in french_indicators if word in word_counts)
+            english_count = sum(word_counts[word] for word in english_indicators if word in word_counts)
             
-            total_words = len(words)
+            total_words = len(tokens.words)
             french_ratio = french_count / total_words if total_words > 0 else 0
             english_ratio = english_count / total_words if total_words > 0 else 0
             
@@ -667,7 +770,7 @@ class LyricsProcessor:
         
         return language_analysis
     
-    def _detect_explicit_content(self, lyrics: str) -> Dict[str, Any]:
+    def _detect_explicit_content(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Détecte le contenu explicite dans les paroles"""
         explicit_analysis = {
             'is_explicit': False,
@@ -678,15 +781,16 @@ class LyricsProcessor:
         }
         
         try:
+            tokens = self._tokenize(lyrics)
+            
             # Rechercher les mots explicites
-            matches = self.patterns['explicit_words'].findall(lyrics.lower())
-            explicit_words = [match for match in matches if match]
+            explicit_words = self._keyword_hits(tokens).get(_EXPLICIT_CATEGORY, [])
             
             explicit_analysis['explicit_words_found'] = list(set(explicit_words))
             explicit_analysis['explicit_word_count'] = len(explicit_words)
             
             # Calculer la densité
-            total_words = len(lyrics.split())
+            total_words = len(tokens.words)
             if total_words > 0:
                 explicit_analysis['explicit_density'] = len(explicit_words) / total_words
             
@@ -708,7 +812,7 @@ class LyricsProcessor:
         
         return explicit_analysis
     
-    def _analyze_vocabulary(self, lyrics: str) -> Dict[str, Any]:
+    def _analyze_vocabulary(self, lyrics: Union[str, LyricsTokens]) -> Dict[str, Any]:
         """Analyse le vocabulaire et la complexité linguistique"""
         vocabulary_analysis = {
             'unique_words': 0,
@@ -722,11 +826,10 @@ class LyricsProcessor:
         
         try:
             # Nettoyage et extraction des mots
-            words = []
-            for word in lyrics.lower().split():
-                clean_word = word.strip('.,!?;:()[]"\'')
-                if clean_word and clean_word not in self.stop_words:
-                    words.append(clean_word)
+            words = [
+                word for word in self._tokenize(lyrics).vocabulary_words
+                if word not in self.stop_words
+            ]
             
             if not words:
                 return vocabulary_analysis
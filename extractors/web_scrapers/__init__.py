@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional, Tuple, Callable
 import importlib
 import sys
 
+from utils.lazy_import import LazyImporter
+
 __version__ = "1.0.0"
 __all__ = []
 
@@ -61,16 +63,26 @@ def _safe_import(module_name: str, class_names: List[str]) -> Tuple[bool, Option
         logger.error(f"❌ Erreur inattendue lors de l'import {module_name}: {e}")
         return False, e
 
-# ===== IMPORTS PRINCIPAUX =====
+# ===== IMPORTS DIFFÉRÉS =====
+# Les sous-modules ne sont importés qu'au premier accès à leurs classes (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import)
 
 # 1. Scrapers web principaux
-_safe_import('genius_scraper', ['GeniusWebScraper'])
-_safe_import('rapedia_scraper', ['RapediaScraper'])
+_lazy.register('genius_scraper', ['GeniusWebScraper'])
+_lazy.register('rapedia_scraper', ['RapediaScraper'])
 
 # 2. Scrapers web additionnels (optionnels)
-_safe_import('lastfm_scraper', ['LastFMScraper'])
-_safe_import('discogs_scraper', ['DiscogsScraper'])
-_safe_import('bandcamp_scraper', ['BandcampScraper'])
+_lazy.register('lastfm_scraper', ['LastFMScraper'])
+_lazy.register('discogs_scraper', ['DiscogsScraper'])
+_lazy.register('bandcamp_scraper', ['BandcampScraper'])
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une classe à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
 
 # ===== IMPORTS UTILITAIRES SÉCURISÉS =====
 
@@ -192,6 +204,8 @@ def get_available_scrapers() -> List[str]:
     Returns:
         Liste des classes de scraping disponibles
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if name.endswith('Scraper')]
 
 @lru_cache(maxsize=1)
@@ -202,6 +216,8 @@ def get_utility_functions() -> List[str]:
     Returns:
         Liste des fonctions utilitaires
     """
+    _lazy.load_all()
+    
     return [name for name in __all__ if not name.endswith('Scraper')]
 
 @lru_cache(maxsize=1)
@@ -212,6 +228,8 @@ def get_import_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire des statistiques d'import
     """
+    _lazy.load_all()
+    
     return {
         'total_modules_attempted': _import_stats['total_attempts'],
         'successful_imports': len(_import_stats['successful']),
@@ -252,12 +270,12 @@ def create_scraper(scraper_type: str, **kwargs) -> Optional[Any]:
         logger.error(f"❌ Type de scraper inconnu: {scraper_type}")
         return None
     
-    if class_name not in globals():
+    scraper_class = _lazy.get(class_name, globals())
+    if scraper_class is None:
         logger.error(f"❌ Scraper {class_name} non disponible")
         return None
     
     try:
-        scraper_class = globals()[class_name]
         return scraper_class(**kwargs)
     except Exception as e:
         logger.error(f"❌ Erreur création {class_name}: {e}")
@@ -326,6 +344,8 @@ def run_scraper_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _lazy.load_all()
+    
     diagnostics = {
         'module_info': {
             'version': __version__,
@@ -397,6 +417,8 @@ def validate_scraper_setup() -> Tuple[bool, List[str]]:
     Returns:
         Tuple (configuration_valide, liste_problèmes)
     """
+    _lazy.load_all()
+    
     issues = []
     
     # Vérifier qu'au moins un scraper principal est disponible
@@ -605,15 +627,9 @@ def extract_rapedia_data(artist_name: str) -> Dict[str, Any]:
 
 # ===== INITIALISATION =====
 
-# Validation automatique au chargement
-_setup_valid, _setup_issues = validate_scraper_setup()
-
-if not _setup_valid:
-    logger.warning("⚠️ Problèmes détectés dans la configuration web scrapers:")
-    for issue in _setup_issues:
-        logger.warning(f"  - {issue}")
-
-logger.info(f"✅ Module web_scrapers initialisé: {len(get_available_scrapers())} scrapers disponibles")
+# Validation à la demande (validate_*_setup, run_*_diagnostics) : la lancer
+# ici importerait tous les sous-modules dès le chargement du package
+logger.debug(f"Module web_scrapers initialisé: {len(_lazy.names())} scrapers déclarés (import différé)")
 
 # Export des fonctions utilitaires
 __all__.extend([
@@ -32,6 +32,7 @@ from core.exceptions import ScrapingError, ElementNotFoundError
 from core.cache import CacheManager
 from config.settings import settings
 from utils.text_utils import normalize_text, clean_artist_name
+from utils.profiling import profiled, span
 from models.enums import DataSource, CreditType, CreditCategory
 
 
@@ -230,15 +231,16 @@ class GeniusWebScraper:
         return compiled_patterns
     
     @contextmanager
-    def _timing_context(self, operation_name: str):
-        """Context manager pour mesurer les performances"""
-        start_time = time.time()
+    def _timing_context(self, operation_name: str, detail: str = ""):
+        """Context manager pour mesurer les performances (span 'scrape' du profilage)"""
+        start_time = time.monotonic()
         try:
-            yield
+            with span('scrape', operation_name):
+                yield
         finally:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             self.stats['total_time_spent'] += duration
-            self.logger.debug(f"⏱️ {operation_name}: {duration:.2f}s")
+            self.logger.debug("⏱️ %s(%s): %.2fs", operation_name, detail, duration)
     
     def scrape_track_credits(self, track_url: str, max_retries: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -253,7 +255,7 @@ class GeniusWebScraper:
         """
         max_retries = max_retries or self.config['max_retries']
         
-        with self._timing_context(f"scrape_track_credits({track_url})"):
+        with self._timing_context("scrape_track_credits", track_url):
             # Vérification du cache
             cache_key = self._url_to_cache_key(track_url)
             
@@ -442,7 +444,7 @@ class GeniusWebScraper:
                                 # Attendre que le contenu se charge
                                 time.sleep(self.config['wait_after_expand'])
                                 
-                                self.logger.debug(f"🔍 Bouton expand cliqué: {selector_group}")
+                                self.logger.debug("🔍 Bouton expand cliqué: %s", selector_group)
                                 
                         except (ElementClickInterceptedException, StaleElementReferenceException) as e:
                             # Tentative de clic via JavaScript
@@ -450,7 +452,7 @@ class GeniusWebScraper:
                                 driver.execute_script("arguments[0].click();", button)
                                 expanded_count += 1
                                 time.sleep(self.config['wait_after_expand'])
-                                self.logger.debug(f"🔍 Bouton expand cliqué via JS: {selector_group}")
+                                self.logger.debug("🔍 Bouton expand cliqué via JS: %s", selector_group)
                             except Exception as js_error:
                                 self.logger.debug(f"Erreur clic JS: {js_error}")
                         
@@ -503,7 +505,7 @@ class GeniusWebScraper:
                     if js_expanded:
                         expanded_count += js_expanded
                         time.sleep(self.config['wait_after_expand'] * 2)  # Plus de temps pour le JS
-                        self.logger.debug(f"🔍 {js_expanded} boutons expandés via JavaScript")
+                        self.logger.debug("🔍 %s boutons expandés via JavaScript", js_expanded)
                 
                 except Exception as e:
                     self.logger.debug(f"Erreur expansion JavaScript: {e}")
@@ -515,6 +517,7 @@ class GeniusWebScraper:
         
         return expanded_count
     
+    @profiled('parse', 'genius_credits')
     def _extract_all_credits(self, driver) -> List[Dict[str, Any]]:
         """Extrait tous les crédits de la page (maintenant étendus)"""
         credits = []
@@ -554,7 +557,7 @@ class GeniusWebScraper:
             # Déduplication et nettoyage
             credits = self._clean_and_deduplicate_credits(credits)
             
-            self.logger.debug(f"🎯 Total crédits extraits: {len(credits)}")
+            self.logger.debug("🎯 Total crédits extraits: %s", len(credits))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur extraction crédits: {e}")
@@ -681,6 +684,7 @@ class GeniusWebScraper:
         
         return credits
     
+    @profiled('parse', 'genius_credits_text')
     def _extract_credits_from_text(self, text: str, base_role: str) -> List[Dict[str, Any]]:
         """Extrait les crédits depuis un texte en utilisant les patterns"""
         credits = []
@@ -790,11 +794,11 @@ class GeniusWebScraper:
         if any(word in role_lower for word in ['produc', 'beat', 'instrumental']):
             return CreditCategory.PRODUCTION.value
         elif any(word in role_lower for word in ['writ', 'lyric', 'compos']):
-            return CreditCategory.WRITING.value
+            return CreditCategory.SONGWRITING.value
         elif any(word in role_lower for word in ['mix', 'master', 'engineer', 'record']):
             return CreditCategory.ENGINEERING.value
         elif any(word in role_lower for word in ['vocal', 'perform', 'feat', 'sing']):
-            return CreditCategory.PERFORMANCE.value
+            return CreditCategory.VOCALS.value
         
         return CreditCategory.OTHER.value
     
@@ -832,7 +836,7 @@ class GeniusWebScraper:
                 
                 cleaned_credits.append(cleaned_credit)
         
-        self.logger.debug(f"🧹 Nettoyage: {len(cleaned_credits)}/{len(credits)} crédits conservés")
+        self.logger.debug("🧹 Nettoyage: %s/%s crédits conservés", len(cleaned_credits), len(credits))
         return cleaned_credits
     
     def _extract_track_metadata(self, driver) -> Dict[str, Any]:
@@ -46,7 +46,7 @@ class RapediaScraper:
         self.logger = logging.getLogger(__name__)
         
         # Configuration optimisée
-        self.base_url = "https://rapedia.fr"
+        self.base_url = settings.get('apis.rapedia.base_url', "https://rapedia.fr")
         self.search_url = f"{self.base_url}/rechercher"
         
         # Headers pour éviter la détection de bot
@@ -63,7 +63,7 @@ class RapediaScraper:
         }
         
         # Composants optimisés
-        self.rate_limiter = RateLimiter(requests_per_period=15, period_seconds=60)  # Respectueux
+        self.rate_limiter = RateLimiter(requests_per_period=15, period_seconds=60, name='rapedia')  # Respectueux
         self.cache_manager = CacheManager() if CacheManager else None
         
         # Session HTTP optimisée avec retry
@@ -642,11 +642,11 @@ class RapediaScraper:
         if 'producer' in category.lower():
             return CreditCategory.PRODUCTION.value
         elif 'writing' in category.lower():
-            return CreditCategory.WRITING.value
+            return CreditCategory.SONGWRITING.value
         elif 'engineering' in category.lower():
             return CreditCategory.ENGINEERING.value
         elif 'featuring' in category.lower():
-            return CreditCategory.PERFORMANCE.value
+            return CreditCategory.VOCALS.value
         
         return CreditCategory.OTHER.value
     
@@ -38,7 +38,8 @@ class SongBPMScraper:
         self.cache_manager = CacheManager()
         self.rate_limiter = RateLimiter(
             requests_per_period=settings.get('rate_limits.songbpm.requests_per_minute', 30),
-            period_seconds=60
+            period_seconds=60,
+            name='songbpm'
         )
         self.session = self._create_session()
         self.config = {
@@ -9,18 +9,18 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
-from ...core.exceptions import ExtractionError, RateLimitError
-from ...core.cache import CacheManager
-from ...core.rate_limiter import RateLimiter
-from ...config.settings import settings
-from ...utils.text_utils import normalize_text
+from core.exceptions import ExtractionError
+from core.cache import CacheManager
+from core.rate_limiter import RateLimiter
+from config.settings import settings
+from utils.text_utils import normalize_text
 
 class TuneBatScraper:
     """
     Scraper spécialisé pour TuneBat.com.
     """
     def __init__(self):
-        self.base_url = "https://tunebat.com"
+        self.base_url = settings.get('apis.tunebat.base_url', "https://tunebat.com")
         self.search_url = f"{self.base_url}/Search"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -39,11 +39,12 @@ class TuneBatScraper:
         self.cache_manager = CacheManager()
         self.rate_limiter = RateLimiter(
             requests_per_period=settings.get('rate_limits.tunebat.requests_per_minute', 20),
-            period_seconds=60
+            period_seconds=60,
+            name='tunebat'
         )
         self.session = self._create_session()
         self.config = {
-            'delay_between_requests': 3,  # TuneBat est plus strict
+            'delay_between_requests': settings.get('tunebat.delay_between_requests', 3),  # TuneBat est plus strict
             'max_search_results': 15,
             'timeout': 30,
             'enable_caching': True,
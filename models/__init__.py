@@ -1,10 +1,13 @@
 # models/__init__.py
 """Modèles de données et entités du projet - Version optimisée"""
 
+import importlib
 import logging
 from typing import List, Dict, Any, Optional, Type
 from functools import lru_cache
 
+from utils.lazy_import import LazyImporter
+
 # Configuration du logging pour le module models
 logger = logging.getLogger(__name__)
 
@@ -14,7 +17,7 @@ _import_errors = {}  # Tracking des erreurs d'import
 def _safe_import(module_name: str, class_names: List[str], description: str) -> bool:
     """Import sécurisé avec gestion d'erreurs centralisée"""
     try:
-        module = __import__(f".{module_name}", package=__name__, fromlist=class_names)
+        module = importlib.import_module(f".{module_name}", package=__name__)
         
         # Ajouter les classes à __all__ et aux globals
         for class_name in class_names:
@@ -57,6 +60,17 @@ _schemas_imported = _safe_import("schemas", [
     "QualityCheckSchema", "ExtractionSessionSchema", "ExportSchema", "StatsSchema"
 ], "Validation schemas")
 
+# Import des tables colonnaires (NumPy) différé au premier accès
+_lazy = LazyImporter(__name__, _safe_import)
+_lazy.register("tables", ["TrackTable", "CreditTable", "Categorical"],
+               "tables", ["TrackTable", "CreditTable", "Categorical"], "Columnar tables")
+
+def __getattr__(name: str):
+    return _lazy.resolve(name, globals())
+
+def __dir__():
+    return _lazy.dir(globals())
+
 # ===== FONCTIONS UTILITAIRES =====
 
 @lru_cache(maxsize=1)
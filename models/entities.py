@@ -1,6 +1,6 @@
 # models/entities.py
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from dataclasses import dataclass, field, fields, MISSING
+from typing import List, Optional, Dict, Any, Union, Callable, Iterable, Tuple, Type
 from datetime import datetime
 import re
 from urllib.parse import urlparse
@@ -14,6 +14,70 @@ from models.enums import (
 )
 
 
+# ===== NORMALISATION =====
+
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_BRACKETED_PATTERN = re.compile(r'\s*[\(\[][^)\]]*[\)\]]\s*')
+
+
+@lru_cache(maxsize=16384)
+def normalize_search_name(name: str) -> str:
+    """Normalise un nom pour la recherche (minuscules, sans ponctuation) - avec cache"""
+    if not name:
+        return ""
+    
+    normalized = _NON_WORD_PATTERN.sub('', name.lower())
+    return _WHITESPACE_PATTERN.sub(' ', normalized).strip()
+
+
+@lru_cache(maxsize=16384)
+def normalize_track_title(title: str) -> str:
+    """Normalise un titre de morceau, sans les éléments entre parenthèses/crochets (feat, remix...)"""
+    if not title:
+        return ""
+    
+    return normalize_search_name(_BRACKETED_PATTERN.sub(' ', title))
+
+
+# ===== CHAMPS DIFFÉRÉS =====
+
+def _deferred_updated_at(entity: Any) -> datetime:
+    """updated_at non fourni : l'instant présent, jamais antérieur à created_at"""
+    entity.created_at  # matérialise d'abord created_at (différé lui aussi)
+    return datetime.now()
+
+
+class _DeferredFieldsMixin:
+    """
+    Champs calculés au premier accès (nom normalisé, timestamps...).
+    
+    Réservé aux entités à slots : un slot laissé non initialisé lève
+    AttributeError à la lecture : __getattr__ prend alors le relais,
+    calcule la valeur, la stocke sur l'instance et la retourne. Les lectures
+    suivantes ne passent plus par ici.
+    """
+    __slots__ = ()
+    
+    # Nom du champ -> fonction de calcul (reçoit l'instance)
+    _deferred_fields: Dict[str, Callable[[Any], Any]] = {}
+    
+    def _defer_unset_fields(self, names: Tuple[str, ...]):
+        """Laisse non initialisés les champs différés reçus sans valeur (appelé par __post_init__)"""
+        for name in names:
+            if not getattr(self, name):
+                delattr(self, name)
+    
+    def __getattr__(self, name: str) -> Any:
+        factory = type(self)._deferred_fields.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        value = factory(self)
+        object.__setattr__(self, name, value)
+        return value
+
+
 @dataclass
 class Artist:
     """Entité représentant un artiste avec optimisations"""
@@ -57,17 +121,9 @@ class Artist:
         if not self.normalized_name and self.name:
             self.normalized_name = self._normalize_name(self.name)
     
-    @lru_cache(maxsize=128)
     def _normalize_name(self, name: str) -> str:
         """Normalise le nom pour la recherche - avec cache"""
-        if not name:
-            return ""
-        
-        # Supprimer les caractères spéciaux, convertir en minuscules
-        normalized = re.sub(r'[^\w\s]', '', name.lower())
-        # Remplacer les espaces multiples par un seul
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_search_name(name)
     
     @property
     def extraction_progress(self) -> float:
@@ -123,6 +179,7 @@ class Album:
     # Métadonnées album
     album_type: AlbumType = AlbumType.ALBUM
     release_date: Optional[datetime] = None
+    release_year: Optional[int] = None
     track_count: int = 0
     genre: Optional[Genre] = None
     
@@ -156,15 +213,9 @@ class Album:
         if not self.normalized_title and self.title:
             self.normalized_title = self._normalize_title(self.title)
     
-    @lru_cache(maxsize=128)
     def _normalize_title(self, title: str) -> str:
         """Normalise le titre pour la recherche"""
-        if not title:
-            return ""
-        
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_search_name(title)
     
     @property
     def duration_formatted(self) -> str:
@@ -214,9 +265,14 @@ class Album:
         }
 
 
-@dataclass
-class Track:
-    """Entité représentant un morceau avec optimisations"""
+@dataclass(slots=True)
+class Track(_DeferredFieldsMixin):
+    """
+    Entité représentant un morceau avec optimisations.
+    
+    Instances à slots (pas de __dict__) : aucun attribut hors des champs
+    déclarés ne peut être ajouté.
+    """
     id: Optional[int] = None
     title: str = ""
     normalized_title: Optional[str] = None
@@ -234,6 +290,7 @@ class Track:
     # Informations album
     track_number: Optional[int] = None
     disc_number: Optional[int] = None
+    release_date: Optional[str] = None
     
     # IDs externes
     genius_id: Optional[str] = None
@@ -245,6 +302,10 @@ class Track:
     has_lyrics: bool = False
     is_instrumental: bool = False
     
+    # Participants
+    featuring_artists: List[str] = field(default_factory=list)
+    credits: List['Credit'] = field(default_factory=list)
+    
     # Qualité des données
     quality_score: float = 0.0
     quality_level: QualityLevel = QualityLevel.UNKNOWN
@@ -260,37 +321,60 @@ class Track:
     
     # Métadonnées d'extraction
     extraction_status: ExtractionStatus = ExtractionStatus.PENDING
+    extraction_date: Optional[datetime] = None
     source: DataSource = DataSource.UNKNOWN
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Calculés au premier accès s'ils ne sont pas fournis (les listes et
+    # métadonnées ne sont différées que par build_entities)
+    _deferred_fields = {
+        'normalized_title': lambda track: normalize_track_title(track.title),
+        'created_at': lambda track: datetime.now(),
+        'updated_at': _deferred_updated_at,
+        'featuring_artists': lambda track: [],
+        'credits': lambda track: [],
+        'metadata': lambda track: {}
+    }
+
     def __post_init__(self):
-        """Initialisation post-création"""
-        current_time = datetime.now()
-        
-        if self.created_at is None:
-            self.created_at = current_time
-        self.updated_at = current_time
-        
-        # Générer le titre normalisé
-        if not self.normalized_title and self.title:
-            self.normalized_title = self._normalize_title(self.title)
+        """Initialisation post-création : normalisation et timestamps différés"""
+        self._defer_unset_fields(('normalized_title', 'created_at', 'updated_at'))
         
         # Mise à jour automatique has_lyrics
-        self.has_lyrics = bool(self.lyrics and self.lyrics.strip())
+        self.has_lyrics = bool(self.lyrics and not self.lyrics.isspace())
     
-    @lru_cache(maxsize=256)
     def _normalize_title(self, title: str) -> str:
         """Normalise le titre pour la recherche"""
-        if not title:
-            return ""
-        
-        # Supprimer les éléments entre parenthèses/crochets (feat, remix, etc.)
-        normalized = re.sub(r'\s*[\(\[][^)\]]*[\)\]]\s*', ' ', title)
-        # Supprimer les caractères spéciaux
-        normalized = re.sub(r'[^\w\s]', '', normalized.lower())
-        # Nettoyer les espaces
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_track_title(title)
+    
+    # ===== ALIAS (noms des colonnes en base) =====
+    
+    @property
+    def album_title(self) -> Optional[str]:
+        """Alias de album_name"""
+        return self.album_name
+    
+    @album_title.setter
+    def album_title(self, value: Optional[str]):
+        self.album_name = value
+    
+    @property
+    def duration(self) -> Optional[int]:
+        """Alias de duration_seconds"""
+        return self.duration_seconds
+    
+    @duration.setter
+    def duration(self, value: Optional[int]):
+        self.duration_seconds = value
+    
+    @property
+    def key(self) -> Optional[str]:
+        """Alias de key_signature"""
+        return self.key_signature
+    
+    @key.setter
+    def key(self, value: Optional[str]):
+        self.key_signature = value
     
     @property
     def duration_formatted(self) -> str:
@@ -342,6 +426,8 @@ class Track:
             'time_signature': self.time_signature,
             'track_number': self.track_number,
             'disc_number': self.disc_number,
+            'release_date': self.release_date,
+            'featuring_artists': self.featuring_artists,
             'external_ids': {
                 'genius': self.genius_id,
                 'spotify': self.spotify_id,
@@ -354,6 +440,7 @@ class Track:
             'quality_score': self.quality_score,
             'quality_level': self.quality_level.value,
             'extraction_status': self.extraction_status.value,
+            'extraction_date': self.extraction_date.isoformat() if self.extraction_date else None,
             'source': self.source.value,
             'is_complete': self.is_complete,
             'unique_identifier': self.unique_identifier,
@@ -363,9 +450,14 @@ class Track:
         }
 
 
-@dataclass
-class Credit:
-    """Entité représentant un crédit musical avec optimisations"""
+@dataclass(slots=True)
+class Credit(_DeferredFieldsMixin):
+    """
+    Entité représentant un crédit musical avec optimisations.
+    
+    Instances à slots (pas de __dict__) : aucun attribut hors des champs
+    déclarés ne peut être ajouté.
+    """
     id: Optional[int] = None
     track_id: Optional[int] = None
     person_name: str = ""
@@ -380,37 +472,41 @@ class Credit:
     instrument: Optional[str] = None
     is_primary: bool = False
     is_featuring: bool = False
+    is_uncredited: bool = False
     
     # Métadonnées
     source: DataSource = DataSource.UNKNOWN
     confidence_score: float = 0.0
     raw_data: Optional[str] = None
+    extraction_date: Optional[datetime] = None
     
     # Timestamps
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Calculés au premier accès s'ils ne sont pas fournis
+    _deferred_fields = {
+        'normalized_name': lambda credit: normalize_search_name(credit.person_name),
+        'created_at': lambda credit: datetime.now(),
+        'updated_at': _deferred_updated_at
+    }
+
     def __post_init__(self):
-        """Initialisation post-création"""
-        current_time = datetime.now()
-        
-        if self.created_at is None:
-            self.created_at = current_time
-        self.updated_at = current_time
-        
-        # Générer le nom normalisé
-        if not self.normalized_name and self.person_name:
-            self.normalized_name = self._normalize_name(self.person_name)
+        """Initialisation post-création : normalisation et timestamps différés"""
+        self._defer_unset_fields(('normalized_name', 'created_at', 'updated_at'))
     
-    @lru_cache(maxsize=256)
     def _normalize_name(self, name: str) -> str:
         """Normalise le nom de la personne"""
-        if not name:
-            return ""
-        
-        normalized = re.sub(r'[^\w\s]', '', name.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_search_name(name)
+    
+    @property
+    def data_source(self) -> DataSource:
+        """Alias de source (nom de la colonne en base)"""
+        return self.source
+    
+    @data_source.setter
+    def data_source(self, value: DataSource):
+        self.source = value
     
     @property
     def is_high_confidence(self) -> bool:
@@ -445,11 +541,13 @@ class Credit:
             'instrument': self.instrument,
             'is_primary': self.is_primary,
             'is_featuring': self.is_featuring,
+            'is_uncredited': self.is_uncredited,
             'source': self.source.value,
             'confidence_score': self.confidence_score,
             'is_high_confidence': self.is_high_confidence,
             'display_name': self.display_name,
             'raw_data': self.raw_data,
+            'extraction_date': self.extraction_date.isoformat() if self.extraction_date else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
@@ -464,6 +562,7 @@ class Session:
     
     # Configuration de la session
     max_tracks: Optional[int] = None
+    current_step: Optional[str] = None
     current_track_index: int = 0
     total_tracks_found: int = 0
     
@@ -472,6 +571,8 @@ class Session:
     tracks_successful: int = 0
     tracks_failed: int = 0
     credits_extracted: int = 0
+    tracks_with_credits: int = 0
+    tracks_with_albums: int = 0
     
     # Timestamps
     created_at: Optional[datetime] = None
@@ -666,4 +767,104 @@ class ExtractionResult:
             'duration_seconds': self.duration_seconds,
             'cache_used': self.cache_used,
             'quality_score': self.quality_score
-        }
\ No newline at end of file
+        }
+
+# ===== CONSTRUCTION EN LOT =====
+
+# (classe, colonnes, convertisseurs) -> fonction de construction
+_ROW_BUILDERS: Dict[Tuple[Any, ...], Callable[[Iterable[Any]], List[Any]]] = {}
+
+
+def _compile_row_builder(entity_class: Type, columns: Tuple[Tuple[str, Any], ...],
+                         converters: Tuple[Tuple[str, Callable[[Any], Any]], ...]) -> Callable:
+    """
+    Prépare la fonction de construction en lot d'une entité.
+    
+    Le plan d'affectation (valeurs par défaut, fabriques, colonnes à lire)
+    est résolu une fois par mapping : la boucle ne fait plus que des
+    affectations directes, sans __init__ ni __post_init__.
+    """
+    entity_fields = {entity_field.name: entity_field for entity_field in fields(entity_class)}
+    deferred = getattr(entity_class, '_deferred_fields', {})
+    converter_map = dict(converters)
+    mapped = dict(columns)
+
+    unknown = [name for name in mapped if name not in entity_fields]
+    unknown += [name for name in converter_map if name not in mapped]
+    if unknown:
+        raise ValueError(f"Champs inconnus pour {entity_class.__name__}: {unknown}")
+
+    defaults: List[Tuple[str, Any]] = []
+    factories: List[Tuple[str, Callable[[], Any]]] = []
+    # (champ, clé, conversion, ignorer si NULL, valeur si NULL)
+    assignments: List[Tuple[str, Any, Optional[Callable[[Any], Any]], bool, Any]] = []
+
+    for name, entity_field in entity_fields.items():
+        if name in mapped:
+            fallback = entity_field.default if name in converter_map and entity_field.default is not MISSING else None
+            # Champ différé NULL en base : calculé au premier accès
+            assignments.append((name, mapped[name], converter_map.get(name), name in deferred, fallback))
+        elif name in deferred:
+            continue
+        elif entity_field.default is not MISSING:
+            defaults.append((name, entity_field.default))
+        elif entity_field.default_factory is not MISSING:
+            factories.append((name, entity_field.default_factory))
+        else:
+            raise ValueError(f"Champ obligatoire non fourni pour {entity_class.__name__}: {name}")
+
+    new = object.__new__
+
+    def build(rows: Iterable[Any]) -> List[Any]:
+        entities = []
+        append = entities.append
+        for row in rows:
+            entity = new(entity_class)
+            for name, value in defaults:
+                setattr(entity, name, value)
+            for name, factory in factories:
+                setattr(entity, name, factory())
+            for name, key, convert, skip_null, fallback in assignments:
+                value = row[key]
+                if value is None:
+                    if skip_null:
+                        continue
+                    value = fallback
+                elif convert is not None:
+                    value = convert(value)
+                setattr(entity, name, value)
+            append(entity)
+        return entities
+
+    return build
+
+
+def build_entities(entity_class: Type, rows: Iterable[Any], columns: Dict[str, Any],
+                   converters: Optional[Dict[str, Callable[[Any], Any]]] = None) -> List[Any]:
+    """
+    Construit des entités en lot depuis des lignes déjà normalisées (base de données).
+    
+    Contourne __init__/__post_init__ : les champs différés (nom normalisé,
+    timestamps, listes vides) non fournis ou NULL ne sont calculés qu'au
+    premier accès, les autres champs non mappés reçoivent leur valeur par défaut.
+    
+    Args:
+        entity_class: Classe d'entité (dataclass)
+        rows: Lignes indexables par clé ou position (sqlite3.Row, dict, tuple)
+        columns: Champ de l'entité -> clé de la colonne dans la ligne
+        converters: Champ -> conversion des valeurs non NULL (les NULL
+            prennent la valeur par défaut du champ)
+    
+    Returns:
+        Liste des entités, dans l'ordre des lignes
+    """
+    column_items = tuple(columns.items())
+    converter_items = tuple(sorted((converters or {}).items()))
+    cache_key = (entity_class, column_items, converter_items)
+
+    builder = _ROW_BUILDERS.get(cache_key)
+    if builder is None:
+        builder = _compile_row_builder(entity_class, column_items, converter_items)
+        _ROW_BUILDERS[cache_key] = builder
+
+    return builder(rows)
@@ -0,0 +1,437 @@
+# models/tables.py
+"""
+Tables colonnaires (NumPy) pour les traitements par lots.
+
+Alternative compacte aux listes de Track/Credit : une table stocke chaque
+colonne dans un tableau NumPy et se construit directement depuis un curseur
+SQLite, sans passer par les entités.
+
+- numériques : entiers (-1 si NULL) ou flottants (NaN si NULL)
+- chaînes répétées (artiste, album, rôle...) : catégorielles (codes int32 +
+  catégories partagées)
+- chaînes uniques (titres, IDs) : tableaux d'objets, chaînes internées
+- dates : datetime64 (NaT si NULL)
+
+Les lignes sont triées par clé de groupe (artist_id par défaut) : la table
+d'un artiste est une vue sans copie des tableaux de la table globale.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Valeur des colonnes entières pour NULL
+MISSING_INT = -1
+
+_FETCH_CHUNK_SIZE = 10000
+
+
+class Categorical:
+    """
+    Colonne catégorielle : codes int32 (-1 si NULL) vers une liste de catégories.
+
+    Les vues et filtres d'une table partagent les catégories de la table
+    d'origine ; seuls les codes sont découpés.
+    """
+
+    __slots__ = ('codes', 'categories', '_lookup')
+
+    def __init__(self, codes: 'np.ndarray', categories: 'np.ndarray'):
+        self.codes = codes
+        self.categories = categories
+        self._lookup: Optional[Dict[Any, int]] = None
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> 'Categorical':
+        """Encode une séquence de valeurs (None -> code -1)"""
+        index: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (MISSING_INT if value is None else index.setdefault(value, len(index)) for value in values),
+            dtype=np.int32, count=len(values)
+        )
+        categories = np.empty(len(index), dtype=object)
+        categories[:] = list(index)
+        return cls(codes, categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            code = self.codes[key]
+            return None if code < 0 else self.categories[code]
+        return Categorical(self.codes[key], self.categories)
+
+    def code_of(self, value: Any) -> int:
+        """Code d'une catégorie (-2 si absente : ne correspond à aucune ligne)"""
+        if self._lookup is None:
+            self._lookup = {category: code for code, category in enumerate(self.categories)}
+        return self._lookup.get(value, -2)
+
+    def equals(self, value: Any) -> 'np.ndarray':
+        """Masque des lignes égales à value"""
+        return self.codes == self.code_of(value)
+
+    def isin(self, values: Iterable[Any]) -> 'np.ndarray':
+        """Masque des lignes dont la valeur appartient à values"""
+        return np.isin(self.codes, [self.code_of(value) for value in values])
+
+    def is_missing(self) -> 'np.ndarray':
+        return self.codes < 0
+
+    def value_counts(self) -> Dict[Any, int]:
+        """Occurrences par catégorie présente, par ordre décroissant"""
+        present = self.codes[self.codes >= 0]
+        counts = np.bincount(present, minlength=len(self.categories))
+        order = np.argsort(-counts, kind='stable')
+        return {self.categories[code]: int(counts[code]) for code in order if counts[code]}
+
+    def to_list(self) -> List[Any]:
+        values = np.empty(len(self.codes), dtype=object)
+        present = self.codes >= 0
+        values[present] = self.categories[self.codes[present]]
+        return values.tolist()
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(sys.getsizeof(category) for category in self.categories)
+
+
+class ColumnarTable:
+    """
+    Table colonnaire construite depuis un curseur SQLite.
+
+    Les sous-classes déclarent SCHEMA (colonne -> type : 'int', 'float',
+    'bool', 'category', 'text', 'datetime') et GROUP_BY (clé de tri et de
+    découpage en vues). Les colonnes du schéma absentes du curseur sont
+    entièrement manquantes ; les colonnes du curseur hors schéma sont ignorées.
+
+    Args:
+        columns: Colonne -> tableau (ou Categorical), tous de même longueur
+        group_by: Colonne de groupe (défaut: GROUP_BY) ; les lignes doivent
+            déjà être triées selon cette colonne
+    """
+
+    SCHEMA: Dict[str, str] = {}
+    GROUP_BY: Optional[str] = None
+
+    def __init__(self, columns: Dict[str, Any], group_by: Optional[str] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy requis pour les tables colonnaires")
+
+        self.columns = columns
+        self.group_by = group_by if group_by is not None else self.GROUP_BY
+        self._length = len(next(iter(columns.values()))) if columns else 0
+        self._group_bounds: Optional[Dict[int, Tuple[int, int]]] = None
+
+    # ===== CONSTRUCTION =====
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]], names: Sequence[str],
+                  group_by: Optional[str] = None) -> 'ColumnarTable':
+        """
+        Construit la table depuis des lignes (tuples, sqlite3.Row).
+
+        Args:
+            rows: Lignes, valeurs dans l'ordre de names
+            names: Noms des colonnes des lignes
+            group_by: Colonne de groupe (défaut: GROUP_BY)
+        """
+        positions = {name: index for index, name in enumerate(names)}
+        transposed = list(zip(*rows)) if rows else [()] * len(names)
+        count = len(rows)
+
+        columns = {}
+        for name, kind in cls.SCHEMA.items():
+            position = positions.get(name)
+            values = transposed[position] if position is not None else (None,) * count
+            columns[name] = _build_column(kind, values)
+
+        group_column = group_by if group_by is not None else cls.GROUP_BY
+        table = cls(columns, group_by=group_column)
+        if group_column and count and not _is_sorted(columns[group_column]):
+            table = table.take(np.argsort(columns[group_column], kind='stable'))
+        return table
+
+    @classmethod
+    def from_cursor(cls, cursor, group_by: Optional[str] = None,
+                    chunk_size: int = _FETCH_CHUNK_SIZE) -> 'ColumnarTable':
+        """
+        Construit la table depuis un curseur SQLite exécuté.
+
+        Les lignes sont lues par paquets (fetchmany) ; les colonnes sont
+        nommées d'après cursor.description.
+        """
+        names = [description[0] for description in cursor.description]
+        rows: List[Tuple[Any, ...]] = []
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            rows.extend(tuple(row) for row in chunk)
+        return cls.from_rows(rows, names, group_by=group_by)
+
+    # ===== ACCÈS =====
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self._length}, columns={len(self.columns)})"
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Ligne sous forme de dictionnaire (valeurs Python, None si NULL)"""
+        return {name: _python_value(self.SCHEMA.get(name), column[index])
+                for name, column in self.columns.items()}
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._length):
+            yield self.row(index)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les colonnes (octets, chaînes comprises)"""
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, Categorical):
+                total += column.nbytes
+            elif column.dtype == object:
+                total += column.nbytes + sum(sys.getsizeof(value) for value in set(column.tolist()))
+            else:
+                total += column.nbytes
+        return total
+
+    # ===== SÉLECTION =====
+
+    def take(self, indices: Any) -> 'ColumnarTable':
+        """
+        Sous-table des lignes indexées (tranche, masque booléen ou indices).
+
+        Une tranche produit des vues sans copie ; masques et indices copient.
+        """
+        return type(self)({name: column[indices] for name, column in self.columns.items()},
+                          group_by=self.group_by)
+
+    def filter(self, mask: 'np.ndarray') -> 'ColumnarTable':
+        """Sous-table des lignes du masque (ordre et tri de groupe conservés)"""
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def is_missing(self, name: str) -> 'np.ndarray':
+        """Masque des valeurs NULL d'une colonne"""
+        column = self.columns[name]
+        kind = self.SCHEMA.get(name)
+        if isinstance(column, Categorical):
+            return column.is_missing()
+        if kind == 'int':
+            return column == MISSING_INT
+        if kind == 'float':
+            return np.isnan(column)
+        if kind == 'datetime':
+            return np.isnat(column)
+        if kind == 'text':
+            return np.equal(column, None)
+        return np.zeros(self._length, dtype=bool)
+
+    def is_present(self, name: str) -> 'np.ndarray':
+        """Masque des valeurs renseignées d'une colonne"""
+        return ~self.is_missing(name)
+
+    # ===== GROUPES =====
+
+    def _bounds(self) -> Dict[int, Tuple[int, int]]:
+        if self._group_bounds is None:
+            if not self.group_by:
+                raise ValueError(f"{type(self).__name__} sans colonne de groupe")
+            keys, starts, counts = np.unique(self.columns[self.group_by],
+                                             return_index=True, return_counts=True)
+            self._group_bounds = {
+                int(key): (int(start), int(start + count))
+                for key, start, count in zip(keys, starts, counts)
+            }
+        return self._group_bounds
+
+    def group_keys(self) -> List[int]:
+        """Valeurs de la colonne de groupe présentes"""
+        return list(self._bounds())
+
+    def group(self, key: int) -> 'ColumnarTable':
+        """Vue sans copie des lignes d'un groupe (table vide si absent)"""
+        start, stop = self._bounds().get(int(key), (0, 0))
+        return self.take(slice(start, stop))
+
+    def groups(self) -> Iterator[Tuple[int, 'ColumnarTable']]:
+        """Parcourt les groupes : (clé, vue)"""
+        for key, (start, stop) in self._bounds().items():
+            yield key, self.take(slice(start, stop))
+
+    # ===== AGRÉGATS =====
+
+    def describe(self, name: str) -> Dict[str, Any]:
+        """Statistiques d'une colonne numérique, valeurs NULL exclues"""
+        values = self.columns[name][self.is_present(name)].astype(np.float64)
+        if not len(values):
+            return {'count': 0, 'mean': None, 'std': None, 'min': None, 'median': None, 'max': None}
+        return {
+            'count': int(len(values)),
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'min': float(values.min()),
+            'median': float(np.median(values)),
+            'max': float(values.max())
+        }
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """Occurrences des valeurs d'une colonne (NULL exclues)"""
+        column = self.columns[name]
+        if isinstance(column, Categorical):
+            return column.value_counts()
+        present = column[self.is_present(name)]
+        values, counts = np.unique(present.astype(str) if column.dtype == object else present,
+                                   return_counts=True)
+        order = np.argsort(-counts, kind='stable')
+        return {_python_value(self.SCHEMA.get(name), values[i]): int(counts[i]) for i in order}
+
+
+class TrackTable(ColumnarTable):
+    """
+    Morceaux en colonnes, triés par artiste.
+
+    La colonne year provient de la jointure avec les albums (release_year)
+    si le curseur la fournit.
+    """
+
+    SCHEMA = {
+        'id': 'int',
+        'artist_id': 'int',
+        'album_id': 'int',
+        'track_number': 'int',
+        'disc_number': 'int',
+        'year': 'int',
+        'duration_seconds': 'float',
+        'bpm': 'float',
+        'has_lyrics': 'bool',
+        'title': 'text',
+        'genius_id': 'text',
+        'spotify_id': 'text',
+        'artist_name': 'category',
+        'album_title': 'category',
+        'key': 'category',
+        'created_at': 'datetime',
+        'updated_at': 'datetime'
+    }
+    GROUP_BY = 'artist_id'
+
+    def for_artist(self, artist_id: int) -> 'TrackTable':
+        """Vue sans copie des morceaux d'un artiste"""
+        return self.group(artist_id)
+
+    def duration_mask(self, min_seconds: float, max_seconds: float) -> 'np.ndarray':
+        """Masque des durées renseignées comprises dans [min_seconds, max_seconds]"""
+        durations = self.columns['duration_seconds']
+        with np.errstate(invalid='ignore'):
+            return (durations >= min_seconds) & (durations <= max_seconds)
+
+
+class CreditTable(ColumnarTable):
+    """
+    Crédits en colonnes, triés par artiste (colonne artist_id de la jointure
+    avec les morceaux) ou par morceau.
+    """
+
+    SCHEMA = {
+        'id': 'int',
+        'track_id': 'int',
+        'artist_id': 'int',
+        'is_primary': 'bool',
+        'is_featuring': 'bool',
+        'is_uncredited': 'bool',
+        'person_name': 'category',
+        'credit_type': 'category',
+        'credit_category': 'category',
+        'instrument': 'category',
+        'data_source': 'category',
+        'role_detail': 'text',
+        'extraction_date': 'datetime'
+    }
+    GROUP_BY = 'artist_id'
+
+    def for_artist(self, artist_id: int) -> 'CreditTable':
+        """Vue sans copie des crédits d'un artiste (table groupée par artiste)"""
+        if self.group_by != 'artist_id':
+            return self.filter(self.columns['artist_id'] == artist_id)
+        return self.group(artist_id)
+
+    def for_track(self, track_id: int) -> 'CreditTable':
+        """Crédits d'un morceau"""
+        if self.group_by == 'track_id':
+            return self.group(track_id)
+        return self.filter(self.columns['track_id'] == track_id)
+
+    def track_ids_with(self, credit_type: Any = None, mask: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """
+        IDs distincts des morceaux ayant au moins un crédit du type donné
+        (ou vérifiant le masque).
+        """
+        selection = np.ones(self._length, dtype=bool) if mask is None else mask
+        if credit_type is not None:
+            selection = selection & self.columns['credit_type'].equals(getattr(credit_type, 'value', credit_type))
+        return np.unique(self.columns['track_id'][selection])
+
+    def count_per_track(self, track_ids: 'np.ndarray') -> 'np.ndarray':
+        """Nombre de crédits de chaque morceau, aligné sur track_ids"""
+        keys, counts = np.unique(self.columns['track_id'], return_counts=True)
+        if not len(keys):
+            return np.zeros(len(track_ids), dtype=np.int64)
+        positions = np.clip(np.searchsorted(keys, track_ids), 0, len(keys) - 1)
+        return np.where(keys[positions] == track_ids, counts[positions], 0)
+
+
+# ===== CONVERSIONS =====
+
+def _build_column(kind: str, values: Sequence[Any]) -> Any:
+    """Tableau d'une colonne selon son type de schéma"""
+    count = len(values)
+    if kind == 'int':
+        return np.fromiter((MISSING_INT if value is None else int(value) for value in values),
+                           dtype=np.int64, count=count)
+    if kind == 'float':
+        return np.fromiter((np.nan if value is None else float(value) for value in values),
+                           dtype=np.float64, count=count)
+    if kind == 'bool':
+        return np.fromiter((bool(value) for value in values), dtype=bool, count=count)
+    if kind == 'category':
+        return Categorical.from_values(values)
+    if kind == 'datetime':
+        return np.array([value or None for value in values], dtype='datetime64[s]')
+
+    column = np.empty(count, dtype=object)
+    column[:] = [sys.intern(value) if isinstance(value, str) else value for value in values]
+    return column
+
+
+def _python_value(kind: Optional[str], value: Any) -> Any:
+    """Valeur Python d'une cellule (None pour les marqueurs de NULL)"""
+    if kind == 'int':
+        return None if value == MISSING_INT else int(value)
+    if kind == 'float':
+        return None if np.isnan(value) else float(value)
+    if kind == 'bool':
+        return bool(value)
+    if kind == 'datetime':
+        return None if np.isnat(value) else value.astype('datetime64[s]').item()
+    return value
+
+
+def _is_sorted(values: 'np.ndarray') -> bool:
+    return bool(np.all(values[:-1] <= values[1:])) if len(values) > 1 else True
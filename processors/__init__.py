@@ -6,7 +6,7 @@ Gère la validation, le nettoyage et l'enrichissement des données musicales.
 
 import logging
 from functools import lru_cache
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, List, Optional, Tuple, Type
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -15,6 +15,7 @@ from ..utils.text_utils import (
     similarity_ratio, extract_featured_artists_from_title,
     clean_credit_role, validate_artist_name
 )
+from .person_index import PersonAliasIndex
 
 @dataclass
 class CleaningStats:
@@ -60,6 +61,9 @@ class DataCleaner:
         # Cache pour éviter les recalculs
         self._normalized_names_cache = {}
         
+        # Index global des personnes (chargé à la première fusion)
+        self._person_index: Optional[PersonAliasIndex] = None
+        
         self.logger.info("DataCleaner initialisé")
     
     def _load_cleaning_patterns(self) -> Dict[str, Any]:
@@ -502,71 +506,40 @@ class DataCleaner:
             self.logger.error(f"Erreur suppression doublons pour artiste {artist_id}: {e}")
             return 0
     
+    @property
+    def person_index(self) -> PersonAliasIndex:
+        """Index persistant des personnes, partagé entre tous les artistes"""
+        if self._person_index is None:
+            self._person_index = PersonAliasIndex(
+                self.database, self.config['similarity_threshold']
+            )
+        return self._person_index
+    
     def _merge_similar_credit_names(self, artist_id: int) -> int:
-        """Fusionne les noms de crédits similaires"""
-        names_merged = 0
-        
+        """Fusionne les noms de crédits similaires via l'index global des personnes"""
         try:
-            tracks = self.database.get_tracks_by_artist_id(artist_id)
+            all_names = self.database.get_credit_person_names(artist_id)
             
-            # Collecter tous les noms de crédits
-            all_names = set()
-            for track in tracks:
-                for credit in track.credits:
-                    if credit.person_name:
-                        all_names.add(credit.person_name)
-            
-            # Grouper les noms similaires
-            name_groups = self._group_similar_names(list(all_names))
-            
-            # Créer un mapping de correction
-            name_corrections = {}
-            for group in name_groups:
-                if len(group) > 1:
-                    # Prendre le nom le plus fréquent comme référence
-                    canonical_name = max(group, key=len)  # ou une autre logique
-                    for name in group:
-                        if name != canonical_name:
-                            name_corrections[name] = canonical_name
-                            names_merged += 1
-            
-            # Appliquer les corrections
+            # Résolution de chaque nom vers sa forme canonique
+            name_corrections = self.person_index.build_corrections(all_names)
+            self.person_index.save()
+            
+            # Application des corrections en un seul UPDATE
             if name_corrections:
-                for track in tracks:
-                    track_modified = False
-                    for credit in track.credits:
-                        if credit.person_name in name_corrections:
-                            credit.person_name = name_corrections[credit.person_name]
-                            track_modified = True
-                    
-                    if track_modified:
-                        self.database.update_track(track)
+                self.database.rename_credit_persons(name_corrections, artist_id)
             
-            return names_merged
+            return len(name_corrections)
             
         except Exception as e:
             self.logger.error(f"Erreur fusion noms similaires pour artiste {artist_id}: {e}")
             return 0
     
     def _group_similar_names(self, names: List[str]) -> List[List[str]]:
-        """Groupe les noms similaires"""
-        groups = []
-        threshold = self.config['similarity_threshold']
-        
+        """Groupe les noms similaires (index en mémoire, sans persistance)"""
+        index = PersonAliasIndex(similarity_threshold=self.config['similarity_threshold'])
         for name in names:
-            added_to_group = False
-            
-            for group in groups:
-                # Vérifier la similarité avec le premier nom du groupe
-                if similarity_ratio(name, group[0]) >= threshold:
-                    group.append(name)
-                    added_to_group = True
-                    break
-            
-            if not added_to_group:
-                groups.append([name])
-        
-        return groups
+            index.register(name)
+        return index.groups()
     
     def clean_all_data(self) -> CleaningStats:
         """Nettoie toutes les données de la base"""
@@ -655,7 +628,7 @@ class DataCleaner:
                 # Obtenir tous les tracks (méthode à ajouter à Database)
                 with self.database.get_connection() as conn:
                     cursor = conn.execute("SELECT * FROM tracks")
-                    tracks = [self.database._row_to_track(row) for row in cursor.fetchall()]
+                    tracks = self.database._rows_to_tracks(cursor.fetchall())
             
             report = {
                 'total_tracks': len(tracks),
@@ -522,7 +522,7 @@ class DataEnricher:
                         ORDER BY RANDOM() 
                         LIMIT 1000
                     """)
-                    tracks = [self.database._row_to_track(row) for row in cursor.fetchall()]
+                    tracks = self.database._rows_to_tracks(cursor.fetchall())
                 scope = "Échantillon global"
             
             if not tracks:
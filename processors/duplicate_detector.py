@@ -7,14 +7,18 @@ from dataclasses import dataclass
 from enum import Enum
 from difflib import SequenceMatcher
 
-from ..models.entities import Track, Credit, Artist, Album
-from ..models.enums import CreditType, CreditCategory, DataSource
-from ..core.database import Database
-from ..config.settings import settings
-from ..utils.text_utils import (
+from models.entities import Track, Credit, Artist, Album
+from models.enums import CreditType, CreditCategory, DataSource
+from core.database import Database
+from config.settings import settings
+from utils.text_utils import (
     normalize_title, clean_artist_name, similarity_ratio,
     extract_featured_artists_from_title
 )
+from utils.similarity import score_many
+
+# Similarité minimale des titres sans featuring pour une variante featuring
+FEATURING_SIMILARITY_THRESHOLD = 0.95
 
 class DuplicateType(Enum):
     """Types de doublons détectés"""
@@ -88,6 +92,11 @@ class DuplicateDetector:
         # Patterns pour les variantes
         self.variant_patterns = self._load_variant_patterns()
         
+        # Titres de base et featuring par titre, réutilisés d'une paire à l'autre
+        # pendant detect_track_duplicates (vidés à la fin)
+        self._base_titles: Dict[str, str] = {}
+        self._featuring_parts: Dict[str, Tuple[str, List[str]]] = {}
+        
         self.logger.info("DuplicateDetector initialisé")
     
     def _load_variant_patterns(self) -> Dict[str, List[str]]:
@@ -145,25 +154,48 @@ class DuplicateDetector:
                 with self.database.get_connection() as conn:
                     cursor = conn.execute("SELECT * FROM tracks ORDER BY artist_id, title")
                     tracks = []
-                    for row in cursor.fetchall():
-                        track = self.database._row_to_track(row)
+                    for track in self.database._rows_to_tracks(cursor.fetchall()):
                         track.credits = self.database.get_credits_by_track_id(track.id)
                         track.featuring_artists = self.database.get_features_by_track_id(track.id)
                         tracks.append(track)
                 self.logger.info(f"Détection doublons globale: {len(tracks)} tracks")
             
-            # Comparaison par paires
-            for i in range(len(tracks)):
-                for j in range(i + 1, len(tracks)):
-                    track1, track2 = tracks[i], tracks[j]
-                    
-                    # Skip si artistes différents (sauf si détection globale)
-                    if artist_id is None and track1.artist_id != track2.artist_id:
-                        continue
-                    
-                    match = self._compare_tracks(track1, track2)
-                    if match:
-                        matches.append(match)
+            # En détection globale, seuls les tracks d'un même artiste sont comparés
+            if artist_id:
+                track_groups = [tracks]
+            else:
+                groups_by_artist: Dict[Any, List[Track]] = {}
+                for track in tracks:
+                    groups_by_artist.setdefault(track.artist_id, []).append(track)
+                track_groups = list(groups_by_artist.values())
+            
+            # Comparaison par paires, similarités calculées en lot colonne par
+            # colonne (pas de matrice N x N) avec le plus petit seuil configuré
+            title_cutoff = self._min_threshold()
+            for group in track_groups:
+                titles = [self._comparison_title(track) for track in group]
+                base_titles = None
+                if self.config['ignore_featuring_differences']:
+                    base_titles = [self._split_featuring(track.title)[0] for track in group]
+                
+                group_matches = []
+                for j in range(1, len(group)):
+                    # score_many(fixe, variables) = ratio(titles[i], titles[j]) pour i < j
+                    title_scores = score_many(titles[j], titles[:j], score_cutoff=title_cutoff)
+                    base_scores = (score_many(base_titles[j], base_titles[:j],
+                                              score_cutoff=FEATURING_SIMILARITY_THRESHOLD)
+                                   if base_titles else None)
+                    for i in range(j):
+                        match = self._compare_tracks(
+                            group[i], group[j], title_scores[i],
+                            base_scores[i] if base_scores else None
+                        )
+                        if match:
+                            group_matches.append((i, j, match))
+                
+                # Ordre historique des paires (i, j)
+                group_matches.sort(key=lambda item: (item[0], item[1]))
+                matches.extend(match for _, _, match in group_matches)
             
             self.logger.info(f"Détection terminée: {len(matches)} doublons potentiels trouvés")
             return matches
@@ -171,16 +203,35 @@ class DuplicateDetector:
         except Exception as e:
             self.logger.error(f"Erreur détection doublons tracks: {e}")
             return []
+        
+        finally:
+            self._base_titles.clear()
+            self._featuring_parts.clear()
+    
+    def _min_threshold(self) -> float:
+        """Plus petit seuil configuré : sous ce score, un résultat de lot vaut 0.0"""
+        return min(self.config['exact_match_threshold'], self.config['high_similarity_threshold'],
+                   self.config['medium_similarity_threshold'], self.config['low_similarity_threshold'])
     
-    def _compare_tracks(self, track1: Track, track2: Track) -> Optional[DuplicateMatch]:
-        """Compare deux tracks pour détecter les doublons"""
+    def _comparison_title(self, track: Track) -> str:
+        """Titre utilisé pour la comparaison (normalisé selon la configuration)"""
+        return normalize_title(track.title) if self.config['normalize_before_compare'] else track.title
+    
+    def _compare_tracks(self, track1: Track, track2: Track,
+                        title_similarity: Optional[float] = None,
+                        base_title_similarity: Optional[float] = None) -> Optional[DuplicateMatch]:
+        """
+        Compare deux tracks pour détecter les doublons.
         
-        # Normalisation des titres pour comparaison
-        title1_norm = normalize_title(track1.title) if self.config['normalize_before_compare'] else track1.title
-        title2_norm = normalize_title(track2.title) if self.config['normalize_before_compare'] else track2.title
+        Les similarités calculées en lot peuvent valoir 0.0 sous leur seuil :
+        elles ne servent qu'aux comparaisons à ces seuils.
+        """
         
-        # Calcul de similarité des titres
-        title_similarity = similarity_ratio(title1_norm, title2_norm)
+        # Calcul de similarité des titres (sauf si déjà calculée en lot)
+        if title_similarity is None:
+            title_similarity = similarity_ratio(
+                self._comparison_title(track1), self._comparison_title(track2)
+            )
         
         # Détection doublons exacts
         if title_similarity >= self.config['exact_match_threshold']:
@@ -203,6 +254,11 @@ class DuplicateDetector:
         
         # Détection variantes de remix/version
         if self._is_remix_variant(track1.title, track2.title):
+            if not title_similarity:
+                # Score sous le seuil du lot : recalculé pour les détails
+                title_similarity = similarity_ratio(
+                    self._comparison_title(track1), self._comparison_title(track2)
+                )
             return DuplicateMatch(
                 entity1_id=track1.id,
                 entity2_id=track2.id,
@@ -220,7 +276,7 @@ class DuplicateDetector:
             )
         
         # Détection variantes featuring
-        featuring_match = self._compare_featuring_variants(track1, track2)
+        featuring_match = self._compare_featuring_variants(track1, track2, base_title_similarity)
         if featuring_match:
             return featuring_match
         
@@ -272,34 +328,49 @@ class DuplicateDetector:
         return False
     
     def _extract_base_title(self, title: str) -> str:
-        """Extrait le titre de base en supprimant les indicateurs de variante"""
-        base_title = title
+        """Extrait le titre de base en supprimant les indicateurs de variante (mémoïsé)"""
+        base_title = self._base_titles.get(title)
+        if base_title is not None:
+            return base_title
         
+        base_title = title
         # Supprimer tous les indicateurs de variante
         for pattern_list in self.variant_patterns.values():
             for pattern in pattern_list:
                 base_title = re.sub(pattern, '', base_title, flags=re.IGNORECASE)
         
-        return base_title.strip()
+        base_title = base_title.strip()
+        self._base_titles[title] = base_title
+        return base_title
     
-    def _compare_featuring_variants(self, track1: Track, track2: Track) -> Optional[DuplicateMatch]:
+    def _split_featuring(self, title: str) -> Tuple[str, List[str]]:
+        """Titre sans featuring et artistes en featuring (mémoïsé)"""
+        parts = self._featuring_parts.get(title)
+        if parts is None:
+            parts = extract_featured_artists_from_title(title)
+            self._featuring_parts[title] = parts
+        return parts
+    
+    def _compare_featuring_variants(self, track1: Track, track2: Track,
+                                    title_similarity: Optional[float] = None) -> Optional[DuplicateMatch]:
         """Compare les tracks pour détecter les variantes featuring"""
         
         if not self.config['ignore_featuring_differences']:
             return None
         
         # Extraire titres et featuring
-        title1_clean, feat1 = extract_featured_artists_from_title(track1.title)
-        title2_clean, feat2 = extract_featured_artists_from_title(track2.title)
+        title1_clean, feat1 = self._split_featuring(track1.title)
+        title2_clean, feat2 = self._split_featuring(track2.title)
         
         # Ajouter les featuring explicites
         all_feat1 = set(feat1 + (track1.featuring_artists or []))
         all_feat2 = set(feat2 + (track2.featuring_artists or []))
         
         # Si les titres de base sont identiques mais featuring différent
-        title_similarity = similarity_ratio(title1_clean, title2_clean)
+        if title_similarity is None:
+            title_similarity = similarity_ratio(title1_clean, title2_clean)
         
-        if title_similarity >= 0.95 and all_feat1 != all_feat2:
+        if title_similarity >= FEATURING_SIMILARITY_THRESHOLD and all_feat1 != all_feat2:
             return DuplicateMatch(
                 entity1_id=track1.id,
                 entity2_id=track2.id,
@@ -364,8 +435,7 @@ class DuplicateDetector:
                         JOIN credits c ON t.id = c.track_id
                     """)
                     tracks = []
-                    for row in cursor.fetchall():
-                        track = self.database._row_to_track(row)
+                    for track in self.database._rows_to_tracks(cursor.fetchall()):
                         track.credits = self.database.get_credits_by_track_id(track.id)
                         tracks.append(track)
             
@@ -483,13 +553,21 @@ class DuplicateDetector:
             
             self.logger.info(f"Détection doublons artistes: {len(artists)} artistes")
             
-            # Comparaison par paires
-            for i in range(len(artists)):
-                for j in range(i + 1, len(artists)):
-                    artist1, artist2 = artists[i], artists[j]
-                    match = self._compare_artists(artist1, artist2)
+            # Comparaison par paires, similarités des noms calculées en lot
+            # colonne par colonne avec le plus petit seuil configuré
+            names = [self._comparison_name(artist) for artist in artists]
+            name_cutoff = self._min_threshold()
+            
+            artist_matches = []
+            for j in range(1, len(artists)):
+                name_scores = score_many(names[j], names[:j], score_cutoff=name_cutoff)
+                for i in range(j):
+                    match = self._compare_artists(artists[i], artists[j], name_scores[i])
                     if match:
-                        matches.append(match)
+                        artist_matches.append((i, j, match))
+            
+            artist_matches.sort(key=lambda item: (item[0], item[1]))
+            matches.extend(match for _, _, match in artist_matches)
             
             self.logger.info(f"Détection artistes terminée: {len(matches)} doublons trouvés")
             return matches
@@ -498,14 +576,19 @@ class DuplicateDetector:
             self.logger.error(f"Erreur détection doublons artistes: {e}")
             return []
     
-    def _compare_artists(self, artist1: Artist, artist2: Artist) -> Optional[DuplicateMatch]:
+    def _comparison_name(self, artist: Artist) -> str:
+        """Nom utilisé pour la comparaison (normalisé selon la configuration)"""
+        return clean_artist_name(artist.name) if self.config['normalize_before_compare'] else artist.name
+    
+    def _compare_artists(self, artist1: Artist, artist2: Artist,
+                         name_similarity: Optional[float] = None) -> Optional[DuplicateMatch]:
         """Compare deux artistes pour détecter les doublons"""
         
-        # Normalisation des noms
-        name1_norm = clean_artist_name(artist1.name) if self.config['normalize_before_compare'] else artist1.name
-        name2_norm = clean_artist_name(artist2.name) if self.config['normalize_before_compare'] else artist2.name
-        
-        name_similarity = similarity_ratio(name1_norm, name2_norm)
+        # Calcul de similarité des noms (sauf si déjà calculée en lot)
+        if name_similarity is None:
+            name_similarity = similarity_ratio(
+                self._comparison_name(artist1), self._comparison_name(artist2)
+            )
         
         # Doublons exacts
         if name_similarity >= self.config['exact_match_threshold']:
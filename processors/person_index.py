@@ -0,0 +1,385 @@
+# processors/person_index.py
+"""
+Index persistant de canonicalisation des noms de personnes (crédits).
+
+Les noms sont ramenés à une clé normalisée (accents, préfixes "Prod. by",
+initiales), puis recherchés dans un BK-tree : seuls les candidats proches en
+distance d'édition sont comparés avec SequenceMatcher. Les alias sont stockés
+en base et partagés entre tous les artistes.
+"""
+
+import logging
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple, Iterable
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from utils.text_utils import normalize_text
+
+# ===== NORMALISATION DES CLÉS =====
+
+# Préfixes/suffixes de crédit à retirer avant comparaison
+_CREDIT_PREFIX_PATTERN = re.compile(
+    r'^(?:prod(?:uced)?\.?\s*by|prod\.?|par|by|mix(?:ed)?\s*by|mix[ée]\s*par|'
+    r'master(?:ed)?\s*by|masteris[ée]\s*par|written\s*by|[ée]crit\s*par)\s+',
+    re.IGNORECASE
+)
+_CREDIT_SUFFIX_PATTERN = re.compile(
+    r'\s*[\(\[](?:uncredited|non\s*cr[ée]dit[ée])[\)\]]\s*$',
+    re.IGNORECASE
+)
+# "D.J." / "J.Cole" -> "D. J. " / "J. Cole" pour isoler les initiales
+_INITIAL_DOT_PATTERN = re.compile(r'\.(?=\w)')
+
+
+def _merge_initials(tokens: List[str]) -> List[str]:
+    """Fusionne les suites d'initiales isolées en un seul token"""
+    merged: List[str] = []
+    run: List[str] = []
+    for token in tokens:
+        if len(token) == 1:
+            run.append(token)
+            continue
+        if run:
+            merged.append(''.join(run))
+            run = []
+        merged.append(token)
+    if run:
+        merged.append(''.join(run))
+    return merged
+
+
+@lru_cache(maxsize=4096)
+def normalize_person_key(name: str) -> str:
+    """
+    Construit la clé de comparaison d'un nom de personne.
+
+    Args:
+        name: Nom brut tel qu'extrait (ex: "Prod. by Kézah", "D.J. Mustard")
+
+    Returns:
+        Clé normalisée (ex: "kezah", "dj mustard")
+    """
+    if not name or not isinstance(name, str):
+        return ""
+
+    key = name.strip()
+    key = _CREDIT_PREFIX_PATTERN.sub('', key)
+    key = _CREDIT_SUFFIX_PATTERN.sub('', key)
+    key = _INITIAL_DOT_PATTERN.sub('. ', key)
+    key = key.replace('-', ' ').replace("'", '')
+
+    # Pliage des accents et minuscules
+    key = normalize_text(unicodedata.normalize('NFKD', key), aggressive=True)
+
+    return ' '.join(_merge_initials(key.split()))
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Distance de Levenshtein avec sortie anticipée.
+
+    Returns:
+        La distance, ou max_distance + 1 dès qu'elle est dépassée
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return previous[-1]
+
+
+class BKTree:
+    """
+    BK-tree sur la distance de Levenshtein.
+
+    Une recherche de rayon r n'explore que les branches dont la distance au
+    nœud est dans [d - r, d + r], soit un nombre de comparaisons quasi
+    logarithmique pour les petits rayons utilisés ici.
+    """
+
+    def __init__(self):
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> bool:
+        """Ajoute une clé. Retourne False si elle était déjà présente."""
+        if not key:
+            return False
+
+        if self._root is None:
+            self._root = (key, {})
+            self._size = 1
+            return True
+
+        node_key, children = self._root
+        while True:
+            distance = _edit_distance(key, node_key, max(len(key), len(node_key)))
+            if distance == 0:
+                return False
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (key, {})
+                self._size += 1
+                return True
+            node_key, children = child
+
+    def search(self, key: str, radius: int) -> List[Tuple[int, str]]:
+        """Retourne les (distance, clé) à distance <= radius, triés par distance"""
+        if self._root is None or not key:
+            return []
+
+        results = []
+        stack = [self._root]
+        while stack:
+            node_key, children = stack.pop()
+            distance = _edit_distance(key, node_key, max(len(key), len(node_key)))
+            if distance <= radius:
+                results.append((distance, node_key))
+            low, high = distance - radius, distance + radius
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+
+        results.sort()
+        return results
+
+
+# ===== INDEX DES ALIAS =====
+
+class PersonAliasIndex:
+    """
+    Index global personne canonique <-> alias.
+
+    Responsabilités :
+    - Résolution d'un nom de crédit vers son nom canonique
+    - Enregistrement des nouveaux alias détectés par similarité
+    - Persistance des personnes/alias en base (tables persons, person_aliases)
+    """
+
+    def __init__(self, database=None, similarity_threshold: float = 0.9):
+        self.logger = logging.getLogger(__name__)
+        self.database = database
+        self.similarity_threshold = similarity_threshold
+
+        # clé normalisée -> person_id ; person_id -> nom canonique
+        self._key_to_person: Dict[str, int] = {}
+        self._canonical_names: Dict[int, str] = {}
+        self._alias_to_person: Dict[str, int] = {}
+        self._tree = BKTree()
+
+        # Modifications en attente de persistance
+        self._pending_aliases: Dict[str, int] = {}
+        self._pending_canonical: Dict[int, str] = {}
+        # Ancien nom canonique -> nouveau, pour les crédits déjà canonicalisés
+        self._renamed_canonicals: Dict[str, str] = {}
+        self._next_temp_id = -1
+
+        if self.database is not None:
+            self._load()
+
+    def _load(self):
+        """Charge l'index depuis la base"""
+        try:
+            for row in self.database.get_person_aliases():
+                person_id = row['person_id']
+                self._canonical_names[person_id] = row['canonical_name']
+                self._key_to_person.setdefault(row['person_key'], person_id)
+                self._tree.add(row['person_key'])
+                if row['alias']:
+                    self._alias_to_person[row['alias']] = person_id
+                    if row['alias_key']:
+                        self._key_to_person.setdefault(row['alias_key'], person_id)
+                        self._tree.add(row['alias_key'])
+
+            self.logger.debug(
+                f"Index des personnes chargé: {len(self._canonical_names)} personnes, "
+                f"{len(self._alias_to_person)} alias"
+            )
+        except Exception as e:
+            self.logger.warning(f"Impossible de charger l'index des personnes: {e}")
+
+    def __len__(self) -> int:
+        return len(self._canonical_names)
+
+    def _search_radius(self, key: str) -> int:
+        """
+        Rayon de recherche garantissant de ne perdre aucun candidat dont le
+        ratio SequenceMatcher atteint le seuil (d <= (la + lb) * (1 - t)).
+        """
+        threshold = self.similarity_threshold
+        if threshold >= 1.0:
+            return 0
+        max_other_length = len(key) * (2 - threshold) / threshold
+        return int((len(key) + max_other_length) * (1 - threshold))
+
+    def _find_person(self, key: str) -> Optional[int]:
+        """Trouve la personne correspondant à une clé (exacte puis floue)"""
+        person_id = self._key_to_person.get(key)
+        if person_id is not None:
+            return person_id
+
+        best_score = 0.0
+        for _, candidate in self._tree.search(key, self._search_radius(key)):
+            score = SequenceMatcher(None, key, candidate).ratio()
+            if score >= self.similarity_threshold and score > best_score:
+                best_score = score
+                person_id = self._key_to_person[candidate]
+
+        return person_id
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Retourne le nom canonique d'une personne déjà connue.
+
+        Args:
+            name: Nom tel qu'il apparaît dans un crédit
+
+        Returns:
+            Nom canonique ou None si la personne est inconnue
+        """
+        if not name:
+            return None
+
+        person_id = self._alias_to_person.get(name)
+        if person_id is None:
+            person_id = self._find_person(normalize_person_key(name))
+        return self._canonical_names.get(person_id) if person_id is not None else None
+
+    def register(self, name: str) -> str:
+        """
+        Enregistre un nom et retourne son nom canonique.
+
+        Un nom inconnu crée une nouvelle personne ; un nom proche d'une personne
+        existante devient son alias. Comme auparavant, le nom le plus long d'un
+        groupe (hors préfixes de crédit) est retenu comme canonique ; un
+        changement de canonique est reporté sur les crédits par save().
+        """
+        if not name:
+            return name
+
+        person_id = self._alias_to_person.get(name)
+        if person_id is not None:
+            return self._canonical_names[person_id]
+
+        key = normalize_person_key(name)
+        if not key:
+            return name
+
+        person_id = self._find_person(key)
+        if person_id is None:
+            person_id = self._next_temp_id
+            self._next_temp_id -= 1
+            self._canonical_names[person_id] = name
+            self._pending_canonical[person_id] = name
+        elif len(key) > len(normalize_person_key(self._canonical_names[person_id])):
+            self._rename_canonical(self._canonical_names[person_id], name)
+            self._canonical_names[person_id] = name
+            self._pending_canonical[person_id] = name
+
+        self._alias_to_person[name] = person_id
+        self._pending_aliases[name] = person_id
+        if key not in self._key_to_person:
+            self._key_to_person[key] = person_id
+            self._tree.add(key)
+
+        return self._canonical_names[person_id]
+
+    def _rename_canonical(self, old_name: str, new_name: str):
+        """Note le changement de nom canonique (les renommages en chaîne sont aplatis)"""
+        for previous_name, current_name in self._renamed_canonicals.items():
+            if current_name == old_name:
+                self._renamed_canonicals[previous_name] = new_name
+        self._renamed_canonicals[old_name] = new_name
+        self._renamed_canonicals.pop(new_name, None)
+
+    def build_corrections(self, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Enregistre une série de noms et retourne le mapping nom -> canonique
+        pour ceux qui doivent être renommés.
+        """
+        names = [name for name in names if name]
+        for name in names:
+            self.register(name)
+
+        corrections = {}
+        for name in names:
+            canonical = self.resolve(name)
+            if canonical and canonical != name:
+                corrections[name] = canonical
+        return corrections
+
+    def groups(self) -> List[List[str]]:
+        """Retourne les groupes d'alias (canonique en tête)"""
+        grouped: Dict[int, List[str]] = {}
+        for alias, person_id in self._alias_to_person.items():
+            grouped.setdefault(person_id, []).append(alias)
+
+        result = []
+        for person_id, aliases in grouped.items():
+            canonical = self._canonical_names[person_id]
+            result.append([canonical] + [alias for alias in aliases if alias != canonical])
+        return result
+
+    def save(self) -> int:
+        """
+        Persiste les personnes et alias ajoutés depuis le dernier appel et,
+        dans la même transaction, renomme les crédits portant un ancien nom
+        canonique.
+
+        Returns:
+            Nombre d'alias persistés
+        """
+        if self.database is None or not self._pending_aliases:
+            return 0
+
+        try:
+            id_mapping = self.database.save_person_aliases(
+                canonical_names={
+                    person_id: (name, normalize_person_key(name))
+                    for person_id, name in self._pending_canonical.items()
+                },
+                aliases=[
+                    (alias, normalize_person_key(alias), person_id)
+                    for alias, person_id in self._pending_aliases.items()
+                ],
+                renamed=self._renamed_canonicals
+            )
+        except Exception as e:
+            self.logger.error(f"Erreur sauvegarde de l'index des personnes: {e}")
+            return 0
+
+        # Remplacement des identifiants temporaires par ceux de la base
+        for temp_id, person_id in id_mapping.items():
+            if temp_id == person_id:
+                continue
+            self._canonical_names[person_id] = self._canonical_names.pop(temp_id)
+            for mapping in (self._key_to_person, self._alias_to_person):
+                for key, value in mapping.items():
+                    if value == temp_id:
+                        mapping[key] = person_id
+
+        saved = len(self._pending_aliases)
+        self._pending_aliases.clear()
+        self._pending_canonical.clear()
+        self._renamed_canonicals.clear()
+        return saved
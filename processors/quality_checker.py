@@ -18,6 +18,8 @@ from core.database import Database
 from config.settings import settings
 from utils.text_utils import validate_artist_name
 
+import numpy as np
+
 
 class QualityMetric(Enum):
     """Métriques de qualité"""
@@ -104,9 +106,9 @@ class QualityChecker:
             'max_duration': settings.get('quality.max_track_duration', 600),
             'min_bpm': settings.get('quality.min_bpm', 60),
             'max_bpm': settings.get('quality.max_bpm', 200),
-            'required_fields': settings.get('quality.required_fields', [
+            'required_fields': settings.get('quality.required_fields', (
                 'title', 'artist_name', 'duration_seconds'
-            ]),
+            )),
             'data_freshness_days': settings.get('quality.data_freshness_days', 30)
         }
         
@@ -394,11 +396,12 @@ class QualityChecker:
         return consistency_score, issues
     
     def _check_freshness(self, track: Track) -> float:
-        """Vérifie la fraîcheur des données"""
-        if not track.extraction_date:
+        """Vérifie la fraîcheur des données (date d'extraction, sinon dernière mise à jour)"""
+        reference_date = track.extraction_date or track.updated_at
+        if not reference_date:
             return 0.0
         
-        days_old = (datetime.now() - track.extraction_date).days
+        days_old = (datetime.now() - reference_date).days
         freshness_threshold = self.config['data_freshness_days']
         
         if days_old <= freshness_threshold:
@@ -673,6 +676,9 @@ class QualityChecker:
         """
         Calcule les métriques de qualité globales.
         
+        Calcul vectorisé (masques NumPy) sur les tables colonnaires
+        TrackTable/CreditTable de l'ensemble des morceaux.
+        
         Args:
             artist_id: ID de l'artiste (optionnel, sinon global)
             
@@ -682,81 +688,58 @@ class QualityChecker:
         try:
             metrics = QualityMetrics()
             
-            # Récupérer les tracks
-            if artist_id:
-                all_tracks = self.database.get_tracks_by_artist_id(artist_id)
-            else:
-                # Échantillon global
-                with self.database.get_connection() as conn:
-                    cursor = conn.execute("SELECT * FROM tracks LIMIT 1000")
-                    all_tracks = [self.database._row_to_track(row) for row in cursor.fetchall()]
-            
-            if not all_tracks:
+            tracks = self.database.get_track_table(artist_id)
+            if not len(tracks):
                 return metrics
+            credits = self.database.get_credit_table(artist_id)
+            
+            track_ids = tracks['id']
+            durations = np.nan_to_num(tracks['duration_seconds'])
+            album_titles = tracks['album_title']
+            
+            metrics.total_tracks = len(tracks)
+            metrics.tracks_with_producer = int(np.isin(track_ids, credits.track_ids_with(CreditType.PRODUCER)).sum())
+            metrics.tracks_with_bpm = int((np.nan_to_num(tracks['bpm']) != 0).sum())
+            metrics.tracks_with_duration = int((durations != 0).sum())
+            metrics.tracks_with_valid_duration = int(
+                ((durations != 0) & tracks.duration_mask(self.config['min_duration'], self.config['max_duration'])).sum()
+            )
+            metrics.tracks_with_album = int((~album_titles.is_missing() & ~album_titles.equals('')).sum())
+            metrics.tracks_with_lyrics = int(tracks['has_lyrics'].sum())
             
-            metrics.total_tracks = len(all_tracks)
+            # Crédits par morceau
+            credit_counts = credits.count_per_track(track_ids)
+            metrics.tracks_with_credits = int((credit_counts > 0).sum())
+            metrics.average_credits_per_track = float(credit_counts.sum()) / metrics.total_tracks
             
-            # Analyser chaque track
-            for track in all_tracks:
-                # Producteur
-                if any(c.credit_type == CreditType.PRODUCER for c in track.credits):
-                    metrics.tracks_with_producer += 1
-                
-                # BPM
-                if track.bpm:
-                    metrics.tracks_with_bpm += 1
-                
-                # Durée
-                if track.duration_seconds:
-                    metrics.tracks_with_duration += 1
-                    # Durée valide
-                    if self.config['min_duration'] <= track.duration_seconds <= self.config['max_duration']:
-                        metrics.tracks_with_valid_duration += 1
-                
-                # Album
-                if track.album_title:
-                    metrics.tracks_with_album += 1
-                
-                # Lyrics
-                if track.has_lyrics:
-                    metrics.tracks_with_lyrics += 1
-                
-                # Crédits
-                if track.credits:
-                    metrics.tracks_with_credits += 1
-            
-            # Moyenne crédits par track
-            total_credits = sum(len(track.credits) for track in all_tracks)
-            metrics.average_credits_per_track = total_credits / metrics.total_tracks
-            
-            # Score de fraîcheur des données
-            fresh_tracks = 0
-            freshness_threshold = timedelta(days=self.config['data_freshness_days'])
-            cutoff_date = datetime.now() - freshness_threshold
-            
-            for track in all_tracks:
-                if track.extraction_date and track.extraction_date > cutoff_date:
-                    fresh_tracks += 1
-            
-            metrics.data_freshness_score = (fresh_tracks / metrics.total_tracks) * 100
-            
-            # Score global de qualité (estimation rapide)
-            quality_factors = [
-                metrics.tracks_with_producer / metrics.total_tracks,
-                metrics.tracks_with_duration / metrics.total_tracks,
-                metrics.tracks_with_credits / metrics.total_tracks,
-                metrics.tracks_with_album / metrics.total_tracks,
-                metrics.data_freshness_score / 100
-            ]
+            # Fraîcheur : morceau mis à jour depuis moins de data_freshness_days
+            # (credits.extraction_date n'est renseigné par aucune étape)
+            cutoff_date = np.datetime64(datetime.now() - timedelta(days=self.config['data_freshness_days']), 's')
+            fresh_tracks = int((tracks['updated_at'] > cutoff_date).sum())
             
-            metrics.overall_quality_score = mean(quality_factors) * 100
-            
-            return metrics
+            return self._finalize_quality_metrics(metrics, fresh_tracks)
             
         except Exception as e:
             self.logger.error(f"Erreur calcul métriques globales: {e}")
             return QualityMetrics()
     
+    def _finalize_quality_metrics(self, metrics: QualityMetrics, fresh_tracks: int) -> QualityMetrics:
+        """Score de fraîcheur et score global à partir des compteurs"""
+        metrics.data_freshness_score = (fresh_tracks / metrics.total_tracks) * 100
+        
+        # Score global de qualité (estimation rapide)
+        quality_factors = [
+            metrics.tracks_with_producer / metrics.total_tracks,
+            metrics.tracks_with_duration / metrics.total_tracks,
+            metrics.tracks_with_credits / metrics.total_tracks,
+            metrics.tracks_with_album / metrics.total_tracks,
+            metrics.data_freshness_score / 100
+        ]
+        
+        metrics.overall_quality_score = mean(quality_factors) * 100
+        
+        return metrics
+    
     def create_quality_report_for_track(self, track: Track) -> QualityReport:
         """
         Crée un rapport de qualité pour un track.
@@ -1,10 +1,13 @@
 # steps/__init__.py
 """Étapes de traitement du pipeline d'extraction - Version optimisée"""
 
+import importlib
 import logging
 from typing import List, Dict, Any, Optional, Type
 from functools import lru_cache
 
+from utils.lazy_import import LazyImporter
+
 # Configuration du logging pour le module steps
 logger = logging.getLogger(__name__)
 
@@ -15,7 +18,7 @@ _step_classes = {}   # Cache des classes d'étapes
 def _safe_import_step(step_name: str, module_name: str, class_name: str) -> bool:
     """Import sécurisé d'une étape avec gestion d'erreurs"""
     try:
-        module = __import__(f".{module_name}", package=__name__, fromlist=[class_name])
+        module = importlib.import_module(f".{module_name}", package=__name__)
         
         if hasattr(module, class_name):
             step_class = getattr(module, class_name)
@@ -42,33 +45,58 @@ def _safe_import_step(step_name: str, module_name: str, class_name: str) -> bool
         logger.error(f"❌ {error_msg}")
         return False
 
-# ===== IMPORTS SÉCURISÉS DES ÉTAPES =====
+# ===== IMPORTS DIFFÉRÉS DES ÉTAPES =====
+# Chaque étape n'est importée qu'au premier accès à sa classe (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import_step)
+
+# Étapes du pipeline
+_lazy.register("discovery", ["DiscoveryStep"], "discovery", "step1_discover", "DiscoveryStep")
+_lazy.register("extraction", ["ExtractionStep"], "extraction", "step2_extract", "ExtractionStep")
+_lazy.register("processing", ["ProcessingStep"], "processing", "step3_process", "ProcessingStep")
+_lazy.register("export", ["ExportStep"], "export", "step4_export", "ExportStep")
+
+# Orchestrateur découverte -> extraction en flux
+_lazy.register("pipeline", ["ExtractionPipeline"], "pipeline", "pipeline", "ExtractionPipeline")
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'une étape à son premier accès"""
+    return _lazy.resolve(name, globals())
 
-# Import des étapes du pipeline
-_step1_imported = _safe_import_step("discovery", "step1_discover", "DiscoveryStep")
-_step2_imported = _safe_import_step("extraction", "step2_extract", "ExtractionStep")
-_step3_imported = _safe_import_step("processing", "step3_process", "ProcessingStep")
-_step4_imported = _safe_import_step("export", "step4_export", "ExportStep")
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
+
+def _imported_steps() -> Dict[str, bool]:
+    """Importe toutes les étapes et retourne leur disponibilité"""
+    _lazy.load_all()
+    return {
+        step_name: step_name in _step_classes
+        for step_name in ('discovery', 'extraction', 'processing', 'export')
+    }
 
 # ===== FONCTIONS UTILITAIRES =====
 
 @lru_cache(maxsize=1)
 def get_available_steps() -> List[str]:
     """Retourne la liste des étapes disponibles - avec cache"""
+    _lazy.load_all()
     return list(_step_classes.keys())
 
 @lru_cache(maxsize=1)
 def get_available_step_classes() -> List[str]:
     """Retourne la liste des classes d'étapes disponibles"""
+    _lazy.load_all()
     return sorted(__all__)
 
 @lru_cache(maxsize=1)
 def get_import_errors() -> Dict[str, str]:
     """Retourne les erreurs d'import pour diagnostic"""
+    _lazy.load_all()
     return _import_errors.copy()
 
 def get_steps_status() -> Dict[str, Any]:
     """Retourne le statut complet du module steps"""
+    imported = _imported_steps()
     total_steps = 4  # discovery, extraction, processing, export
     available_steps = len(_step_classes)
     
@@ -90,12 +118,7 @@ def get_steps_status() -> Dict[str, Any]:
             'critical_steps_ok': critical_available,
             'completion_rate': round((available_steps / total_steps) * 100, 1)
         },
-        'steps': {
-            'discovery': _step1_imported,
-            'extraction': _step2_imported,
-            'processing': _step3_imported,
-            'export': _step4_imported
-        }
+        'steps': imported
     }
 
 # ===== IMPORTS DYNAMIQUES POUR ÉVITER LES IMPORTS CIRCULAIRES =====
@@ -159,27 +182,28 @@ def get_step_by_name(step_name: str) -> Optional[Type]:
 def validate_steps_dependencies() -> List[str]:
     """Valide les dépendances entre étapes"""
     issues = []
+    imported = _imported_steps()
     
     # Vérifier que les étapes critiques sont disponibles
-    if not _step1_imported:
+    if not imported['discovery']:
         issues.append("DiscoveryStep indisponible - impossible de découvrir les morceaux")
     
-    if not _step2_imported:
+    if not imported['extraction']:
         issues.append("ExtractionStep indisponible - impossible d'extraire les données")
     
     # Vérifier les dépendances logiques
-    if _step2_imported and not _step1_imported:
+    if imported['extraction'] and not imported['discovery']:
         issues.append("ExtractionStep disponible mais DiscoveryStep manquant - pipeline incomplet")
     
-    if _step4_imported and not _step3_imported:
+    if imported['export'] and not imported['processing']:
         issues.append("ExportStep disponible mais ProcessingStep manquant - pipeline incomplet")
     
     # Avertissements pour étapes optionnelles
     optional_warnings = []
-    if not _step3_imported:
+    if not imported['processing']:
         optional_warnings.append("ProcessingStep indisponible - pas de traitement post-extraction")
     
-    if not _step4_imported:
+    if not imported['export']:
         optional_warnings.append("ExportStep indisponible - pas d'export automatique")
     
     if optional_warnings:
@@ -236,13 +260,14 @@ class PipelineOrchestrator:
 
 def analyze_steps_performance() -> Dict[str, Any]:
     """Analyse les performances des étapes"""
+    imported = _imported_steps()
     analysis = {
         'total_steps': len(_step_classes),
         'import_success_rate': 0.0,
         'critical_steps_ok': len([s for s in ['discovery', 'extraction'] if s not in _import_errors]) == 2,
         'optional_steps_available': {
-            'processing': _step3_imported,
-            'export': _step4_imported
+            'processing': imported['processing'],
+            'export': imported['export']
         }
     }
     
@@ -277,14 +302,9 @@ def run_steps_diagnostics() -> Dict[str, Any]:
 
 # ===== LOGGING ET ÉTAT =====
 
-# Affichage du statut au chargement du module
-if logger.isEnabledFor(logging.DEBUG):
-    status = get_steps_status()
-    logger.info(f"🔧 Module steps chargé - {status['status']['overall']} "
-               f"({status['step_count']['available']}/{status['step_count']['total']} étapes)")
-    
-    if _import_errors:
-        logger.warning(f"⚠️ Étapes avec erreurs: {list(_import_errors.keys())}")
+# Le statut complet (get_steps_status) importe toutes les étapes : il n'est
+# plus calculé au chargement du module
+logger.debug(f"🔧 Module steps chargé - {len(_lazy.names())} étapes déclarées (import différé)")
 
 # Export des fonctions utilitaires
 __all__.extend([
@@ -0,0 +1,343 @@
+# steps/pipeline.py
+"""
+Exécution en pipeline des étapes découverte -> extraction -> traitement.
+
+Au lieu d'attendre la fin de la découverte pour lancer l'extraction, chaque
+étape consomme la sortie de la précédente au fil de l'eau :
+
+    découverte (thread, page par page)
+        --file bornée de morceaux--> lots d'extraction (pool de l'ExtractionStep)
+        --file bornée de lots extraits--> consommateur des lots (thread)
+
+Les files bornées assurent la contre-pression : une découverte plus rapide
+que l'extraction se met en attente au lieu d'accumuler les morceaux, et
+l'extraction attend un consommateur trop lent.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from config.settings import settings
+from core.database import Database
+from core.session_manager import SessionManager, get_session_manager
+from models.entities import Track
+from steps.step1_discover import DiscoveryStep, DiscoveryStats
+from steps.step2_extract import ExtractionStep, ExtractionBatch, ExtractionStats
+
+# Marqueur de fin de flux dans les files
+_END_OF_STREAM = object()
+
+# Période de vérification de l'arrêt pendant une attente sur file pleine
+_QUEUE_POLL_SECONDS = 0.2
+
+
+@dataclass
+class PipelineStats:
+    """Statistiques d'une exécution en pipeline"""
+    tracks_discovered: int = 0
+    tracks_submitted: int = 0
+    batches_submitted: int = 0
+    batches_completed: int = 0
+    batches_failed: int = 0
+
+    # Latences (secondes depuis le démarrage)
+    time_to_first_track: Optional[float] = None
+    time_to_first_result: Optional[float] = None
+    total_time_seconds: float = 0.0
+
+    discovery: DiscoveryStats = field(default_factory=DiscoveryStats)
+    extraction: ExtractionStats = field(default_factory=ExtractionStats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit en dictionnaire pour export"""
+        return {
+            'tracks_discovered': self.tracks_discovered,
+            'tracks_submitted': self.tracks_submitted,
+            'batches_submitted': self.batches_submitted,
+            'batches_completed': self.batches_completed,
+            'batches_failed': self.batches_failed,
+            'time_to_first_track': self.time_to_first_track,
+            'time_to_first_result': self.time_to_first_result,
+            'total_time_seconds': self.total_time_seconds,
+            'discovery': self.discovery.to_dict(),
+            'extraction': self.extraction.to_dict()
+        }
+
+
+class ExtractionPipeline:
+    """
+    Orchestrateur découverte -> extraction -> traitement en flux.
+
+    Réutilise DiscoveryStep (découverte page par page via
+    iter_discovered_tracks) et ExtractionStep (lots traités dans son pool de
+    threads) ; le traitement des lots extraits est délégué à un consommateur
+    optionnel appelé dans un thread dédié, dans l'ordre de fin des lots.
+    """
+
+    def __init__(self, session_manager: Optional[SessionManager] = None,
+                 database: Optional[Database] = None,
+                 discovery_step: Optional[DiscoveryStep] = None,
+                 extraction_step: Optional[ExtractionStep] = None):
+        self.logger = logging.getLogger(__name__)
+
+        self.session_manager = session_manager or get_session_manager()
+        self.database = database or Database()
+        self.discovery_step = discovery_step or DiscoveryStep(self.session_manager, self.database)
+        self.extraction_step = extraction_step or ExtractionStep(self.session_manager, self.database)
+
+        self.config = {
+            'track_queue_size': settings.get('pipeline.track_queue_size', 200),
+            'result_queue_size': settings.get('pipeline.result_queue_size', 8),
+            'max_inflight_batches': settings.get(
+                'pipeline.max_inflight_batches',
+                self.extraction_step.config['max_concurrent_extractions']
+            )
+        }
+
+    def run(self, artist_name: str,
+            session_id: Optional[str] = None,
+            max_tracks: Optional[int] = None,
+            batch_consumer: Optional[Callable[[Dict[str, Any]], None]] = None,
+            progress_callback: Optional[Callable[[str, int, int], None]] = None
+            ) -> Tuple[Dict[str, Any], PipelineStats]:
+        """
+        Découvre et extrait les morceaux d'un artiste en pipeline.
+
+        Args:
+            artist_name: Nom de l'artiste
+            session_id: ID de session optionnel (progression mise à jour)
+            max_tracks: Limite de morceaux (optionnel)
+            batch_consumer: Traitement de chaque lot extrait (dictionnaire
+                tracks/lyrics/credits/albums/metadata)
+            progress_callback: Callback (étape, lots terminés, lots soumis)
+
+        Returns:
+            Tuple[Dict[str, Any], PipelineStats]: Résultats agrégés et statistiques
+        """
+        start = time.perf_counter()
+        stats = PipelineStats()
+        stop_event = threading.Event()
+
+        track_queue: queue.Queue = queue.Queue(maxsize=self.config['track_queue_size'])
+        result_queue: queue.Queue = queue.Queue(maxsize=self.config['result_queue_size'])
+        errors: List[BaseException] = []
+        results: Dict[str, List[Any]] = {
+            'tracks': [], 'lyrics': [], 'credits': [], 'albums': [], 'metadata': []
+        }
+
+        producer = threading.Thread(
+            target=self._discover_into_queue,
+            args=(artist_name, session_id, max_tracks, stats, track_queue, stop_event, errors),
+            name='pipeline-discovery', daemon=True
+        )
+        consumer = threading.Thread(
+            target=self._consume_results,
+            args=(result_queue, results, stats, start, batch_consumer, progress_callback, session_id),
+            name='pipeline-processing', daemon=True
+        )
+
+        self.logger.info(f"🚀 Pipeline démarré pour {artist_name}")
+        producer.start()
+        consumer.start()
+
+        try:
+            self._dispatch_batches(track_queue, result_queue, stats, start, session_id, stop_event)
+        except BaseException:
+            stop_event.set()
+            raise
+        finally:
+            result_queue.put(_END_OF_STREAM)
+            consumer.join()
+            producer.join(timeout=5.0)
+
+            stats.total_time_seconds = time.perf_counter() - start
+            stats.extraction.extraction_time_seconds = stats.total_time_seconds
+            self.extraction_step._update_performance_stats(stats.extraction)
+
+        if errors:
+            raise errors[0]
+
+        self.logger.info(
+            f"✅ Pipeline terminé: {stats.tracks_discovered} morceaux découverts, "
+            f"{stats.extraction.tracks_successful}/{stats.tracks_submitted} extraits "
+            f"en {stats.total_time_seconds:.2f}s"
+        )
+        return results, stats
+
+    # ===== ÉTAPES =====
+
+    def _discover_into_queue(self, artist_name: str, session_id: Optional[str],
+                             max_tracks: Optional[int], stats: PipelineStats,
+                             track_queue: queue.Queue, stop_event: threading.Event,
+                             errors: List[BaseException]):
+        """Thread de découverte : émet les morceaux dans la file bornée"""
+        try:
+            for page_tracks in self.discovery_step.iter_discovered_tracks(
+                artist_name, session_id, max_tracks, stats=stats.discovery
+            ):
+                for track in page_tracks:
+                    if not self._put(track_queue, track, stop_event):
+                        return
+        except Exception as e:
+            self.logger.error(f"❌ Erreur découverte en pipeline pour {artist_name}: {e}")
+            errors.append(e)
+        finally:
+            self._put(track_queue, _END_OF_STREAM, stop_event)
+
+    def _dispatch_batches(self, track_queue: queue.Queue, result_queue: queue.Queue,
+                          stats: PipelineStats, start: float, session_id: Optional[str],
+                          stop_event: threading.Event):
+        """
+        Forme les lots d'extraction au fil de la découverte.
+
+        Un lot part dès qu'il est plein, ou dès que la file est vide (pas
+        d'attente de la page suivante pour les premiers morceaux). Avec une
+        session, les tâches du lot sont d'abord inscrites dans la file
+        persistante : un arrêt en cours de pipeline se reprend avec
+        ExtractionStep.process_task_queue.
+        """
+        batch_size = self.extraction_step.config['batch_size']
+        pending: List[Track] = []
+        inflight: Set[Future] = set()
+        discovery_done = False
+
+        while not discovery_done:
+            item = track_queue.get()
+            if item is _END_OF_STREAM:
+                discovery_done = True
+            else:
+                if stats.time_to_first_track is None:
+                    stats.time_to_first_track = time.perf_counter() - start
+                stats.tracks_discovered += 1
+                pending.extend(self.extraction_step._filter_tracks_for_extraction([item]))
+
+            while len(pending) >= batch_size or (pending and (discovery_done or track_queue.empty())):
+                batch_tracks, pending = pending[:batch_size], pending[batch_size:]
+                if session_id:
+                    self.extraction_step.enqueue_extraction_tasks(session_id, batch_tracks)
+                inflight = self._wait_for_slot(inflight)
+                inflight.add(self._submit_batch(batch_tracks, result_queue, stats, stop_event))
+
+        # Chaque lot dépose son résultat avant de se terminer : une fois les
+        # futures terminées, tous les résultats précèdent le marqueur de fin
+        if inflight:
+            wait(inflight)
+
+    def _submit_batch(self, tracks: List[Track], result_queue: queue.Queue,
+                      stats: PipelineStats, stop_event: threading.Event) -> Future:
+        """Soumet un lot au pool de l'ExtractionStep ; le résultat part vers la file de traitement"""
+        stats.batches_submitted += 1
+        stats.tracks_submitted += len(tracks)
+        stats.extraction.total_tracks += len(tracks)
+
+        batch = ExtractionBatch(
+            tracks=tracks,
+            batch_id=f"stream_batch_{stats.batches_submitted}",
+            priority=self.extraction_step._calculate_batch_priority(tracks)
+        )
+        return self.extraction_step.thread_pool.submit(
+            self._extract_batch, batch, result_queue, stats, stop_event
+        )
+
+    def _extract_batch(self, batch: ExtractionBatch, result_queue: queue.Queue,
+                       stats: PipelineStats, stop_event: threading.Event):
+        """
+        Extrait un lot (thread du pool) et dépose le résultat dans la file de traitement.
+
+        Le thread d'extraction attend si la file est pleine ; si le pipeline
+        est arrêté, le résultat est abandonné au lieu de bloquer le pool.
+        """
+        try:
+            outcome = (batch, self.extraction_step._process_single_batch(batch, stats.extraction), None)
+        except Exception as e:
+            outcome = (batch, None, e)
+        self._put(result_queue, outcome, stop_event)
+
+    def _wait_for_slot(self, inflight: Set[Future]) -> Set[Future]:
+        """Attend qu'un lot se termine si le nombre de lots en cours est au maximum"""
+        while len(inflight) >= self.config['max_inflight_batches']:
+            _, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+        return inflight
+
+    def _consume_results(self, result_queue: queue.Queue, results: Dict[str, List[Any]],
+                         stats: PipelineStats, start: float,
+                         batch_consumer: Optional[Callable[[Dict[str, Any]], None]],
+                         progress_callback: Optional[Callable[[str, int, int], None]],
+                         session_id: Optional[str]):
+        """Thread de traitement : agrège les lots extraits et appelle le consommateur"""
+        while True:
+            item = result_queue.get()
+            if item is _END_OF_STREAM:
+                return
+
+            batch, batch_result, error = item
+            if error is not None:
+                stats.batches_failed += 1
+                self.logger.error(f"❌ Erreur lot {batch.batch_id}: {error}")
+                continue
+
+            try:
+                self._handle_batch_result(batch, batch_result, results, stats, start,
+                                          batch_consumer, progress_callback, session_id)
+            except Exception as e:
+                # Le thread continue de vider la file : les lots en cours ne restent pas bloqués
+                self.logger.error(f"❌ Erreur traitement lot {batch.batch_id}: {e}")
+
+    def _handle_batch_result(self, batch: ExtractionBatch, batch_result: Dict[str, Any],
+                             results: Dict[str, List[Any]], stats: PipelineStats, start: float,
+                             batch_consumer: Optional[Callable[[Dict[str, Any]], None]],
+                             progress_callback: Optional[Callable[[str, int, int], None]],
+                             session_id: Optional[str]):
+        """Agrège un lot extrait, clôt ses tâches et appelle le consommateur"""
+        stats.batches_completed += 1
+        batch_result.pop('retry_after', None)
+        rate_limited = batch_result.pop('rate_limited', [])
+        if rate_limited:
+            # Morceaux laissés en attente dans la file de tâches pour une reprise
+            stats.extraction.tracks_skipped += len(rate_limited)
+            self.logger.warning(f"⏳ Rate limit: {len(rate_limited)} morceaux reportés ({batch.batch_id})")
+
+        if session_id:
+            deferred = {id(track) for track in rate_limited}
+            self.database.complete_track_tasks(
+                session_id, [track.id for track in batch.tracks if id(track) not in deferred and track.id]
+            )
+
+        if stats.time_to_first_result is None:
+            stats.time_to_first_result = time.perf_counter() - start
+
+        for key, value in batch_result.items():
+            if isinstance(value, list):
+                results.setdefault(key, []).extend(value)
+
+        if batch_consumer:
+            try:
+                batch_consumer(batch_result)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur traitement lot {batch.batch_id}: {e}")
+
+        if progress_callback:
+            progress_callback("extraction", stats.batches_completed, stats.batches_submitted)
+
+        if session_id:
+            self.session_manager.update_progress(
+                session_id,
+                tracks_processed=stats.extraction.tracks_processed,
+                current_step='pipeline_extraction'
+            )
+
+    @staticmethod
+    def _put(target_queue: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+        """Dépôt bloquant interruptible ; False si le pipeline a été arrêté"""
+        while not stop_event.is_set():
+            try:
+                target_queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
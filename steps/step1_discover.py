@@ -1,11 +1,13 @@
 # steps/step1_discover.py
 import logging
-from typing import Dict, List, Optional, Any, Set, Tuple
+import re
+import bisect
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterator
 from datetime import datetime
 from dataclasses import dataclass
 from functools import lru_cache
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 
 # IMPORTS ABSOLUS - CORRECTION MAJEURE
 from models.entities import Track, Artist, Session
@@ -15,6 +17,8 @@ from core.session_manager import SessionManager, get_session_manager
 from core.exceptions import ExtractionError, ArtistNotFoundError
 from core.cache import smart_cache
 from config.settings import settings
+from utils.similarity import similarity, normalize_for_similarity
+from utils.record_linkage import blocking_keys
 
 # Imports conditionnels pour les modules de découverte
 try:
@@ -77,6 +81,83 @@ class DiscoveryStats:
         }
 
 
+class _DedupIndex:
+    """
+    État incrémental de la déduplication : chaque morceau ajouté n'est
+    comparé qu'aux morceaux déjà retenus partageant une clé de bloc de titre
+    (utils.record_linkage.blocking_keys, index inversé) ou voisins dans
+    l'ordre alphabétique des titres.
+    
+    Utilisé en un seul passage (_deduplicate_tracks) ou page par page
+    (iter_discovered_tracks).
+    """
+    
+    def __init__(self, step: 'DiscoveryStep'):
+        self._step = step
+        self.threshold = step.config['similarity_threshold']
+        self.window = step.config['dedup_neighborhood_window']
+        
+        # Un score titre < (seuil - 0.3) / 0.7 ne peut pas atteindre le seuil
+        self.title_cutoff = max(0.0, (self.threshold - 0.3) / 0.7)
+        
+        # Titres/artistes normalisés des morceaux retenus (alignés sur unique_tracks)
+        self.unique_tracks: List[Track] = []
+        self.unique_titles: List[str] = []
+        self.unique_artists: List[str] = []
+        self.seen_signatures: Set[str] = set()
+        self.token_index: Dict[str, List[int]] = {}
+        self.sorted_titles: List[Tuple[str, int]] = []
+        self.duplicate_count = 0
+    
+    def add(self, track: Track) -> bool:
+        """Retient le morceau s'il ne double aucun morceau déjà retenu"""
+        step = self._step
+        
+        # Génération de signature unique
+        signature = step._generate_track_signature(track)
+        
+        if signature in self.seen_signatures:
+            self.duplicate_count += 1
+            return False
+        
+        norm_title = step._normalize_track_title(track.title)
+        norm_artist = step._normalize_artist_name(track.artist_name)
+        comparison_title = normalize_for_similarity(norm_title)
+        tokens = blocking_keys(norm_title)
+        
+        # Vérification de similarité avec les seuls candidats
+        candidates = step._find_dedup_candidates(
+            comparison_title, tokens, self.token_index, self.sorted_titles, self.window
+        )
+        
+        # Même ordre de comparaison que _calculate_track_similarity (nouveau morceau
+        # en premier) : SequenceMatcher n'est pas symétrique
+        for candidate in candidates:
+            title_score = similarity(norm_title, self.unique_titles[candidate],
+                                     score_cutoff=self.title_cutoff)
+            if not title_score and self.title_cutoff:
+                continue
+            artist_score = similarity(norm_artist, self.unique_artists[candidate])
+            track_similarity = (title_score * 0.7) + (artist_score * 0.3)
+            
+            if track_similarity >= self.threshold:
+                self.duplicate_count += 1
+                step.logger.debug(f"Doublon détecté: '{track.title}' "
+                                  f"(similarité: {track_similarity:.2f})")
+                return False
+        
+        index = len(self.unique_tracks)
+        self.unique_tracks.append(track)
+        self.unique_titles.append(norm_title)
+        self.unique_artists.append(norm_artist)
+        self.seen_signatures.add(signature)
+        
+        for token in tokens:
+            self.token_index.setdefault(token, []).append(index)
+        bisect.insort(self.sorted_titles, (comparison_title, index))
+        return True
+
+
 class DiscoveryStep:
     """
     Étape 1 : Découverte optimisée des morceaux d'un artiste.
@@ -129,7 +210,8 @@ class DiscoveryStep:
             'parallel_discovery': settings.get('discovery.parallel_discovery', True),
             'cache_discovery_results': settings.get('discovery.cache_results', True),
             'max_concurrent_sources': settings.get('discovery.max_concurrent_sources', 3),
-            'timeout_per_source': settings.get('discovery.timeout_per_source', 60)
+            'timeout_per_source': settings.get('discovery.timeout_per_source', 60),
+            'dedup_neighborhood_window': settings.get('discovery.dedup_neighborhood_window', 8)
         }
     
     @smart_cache.cache_result("artist_discovery", expire_days=7)
@@ -208,6 +290,108 @@ class DiscoveryStep:
             self.logger.error(f"❌ Erreur lors de la découverte pour {artist_name}: {e}")
             raise ExtractionError(f"Échec de la découverte: {e}")
     
+    def iter_discovered_tracks(self, artist_name: str,
+                               session_id: Optional[str] = None,
+                               max_tracks: Optional[int] = None,
+                               stats: Optional[DiscoveryStats] = None) -> Iterator[List[Track]]:
+        """
+        Découverte en flux pour l'exécution en pipeline (steps.pipeline).
+        
+        Les morceaux sont dédupliqués, sauvegardés et émis page par page.
+        Genius (source prioritaire) est parcouru page par page pendant que
+        Rapedia est interrogé en tâche de fond ; les morceaux Rapedia sont
+        émis après Genius pour conserver la priorité des sources dans la
+        déduplication.
+        
+        Args:
+            artist_name: Nom de l'artiste
+            session_id: ID de session optionnel
+            max_tracks: Limite de morceaux (optionnel)
+            stats: Statistiques à remplir au fil de la découverte (optionnel)
+            
+        Yields:
+            List[Track]: Morceaux sauvegardés (avec ID) d'une page
+        """
+        start_time = datetime.now()
+        stats = stats if stats is not None else DiscoveryStats()
+        
+        normalized_artist = self._normalize_artist_name(artist_name)
+        if not normalized_artist:
+            raise ArtistNotFoundError(artist_name)
+        
+        self.logger.info(f"🔍 Découverte en flux pour '{artist_name}' (normalisé: '{normalized_artist}')")
+        
+        artist = self._get_or_create_artist(normalized_artist)
+        dedup = _DedupIndex(self)
+        saved_count = 0
+        
+        def save_unique(tracks: List[Track]) -> List[Track]:
+            nonlocal saved_count
+            unique_tracks = [track for track in tracks if dedup.add(track)]
+            if max_tracks:
+                unique_tracks = unique_tracks[:max(0, max_tracks - saved_count)]
+            saved_tracks = self._save_track_chunk(artist, unique_tracks) if unique_tracks else []
+            saved_count += len(saved_tracks)
+            return saved_tracks
+        
+        def limit_reached() -> bool:
+            return bool(max_tracks) and saved_count >= max_tracks
+        
+        # Rapedia en tâche de fond pendant le parcours des pages Genius
+        rapedia_executor = None
+        rapedia_future = None
+        if self.config['enable_rapedia'] and self.rapedia_scraper:
+            rapedia_executor = ThreadPoolExecutor(max_workers=1)
+            rapedia_future = rapedia_executor.submit(
+                self._safe_discover_wrapper, self._discover_from_rapedia, artist, max_tracks
+            )
+        
+        try:
+            if self.config['enable_genius'] and self.genius_discovery:
+                stats.sources_used.append('genius')
+                
+                for page_tracks in self._iter_genius_pages(artist, max_tracks):
+                    stats.genius_found += len(page_tracks)
+                    stats.total_found += len(page_tracks)
+                    stats.api_calls += 1
+                    
+                    saved_tracks = save_unique(page_tracks)
+                    if saved_tracks:
+                        yield saved_tracks
+                    if limit_reached():
+                        break
+            
+            if rapedia_future is not None and not limit_reached():
+                stats.sources_used.append('rapedia')
+                try:
+                    rapedia_tracks = rapedia_future.result(timeout=self.config['timeout_per_source'])
+                except FutureTimeoutError:
+                    self.logger.error("❌ Rapedia: délai dépassé")
+                    rapedia_tracks = []
+                
+                stats.rapedia_found = len(rapedia_tracks)
+                stats.total_found += len(rapedia_tracks)
+                if rapedia_tracks:
+                    stats.api_calls += 1
+                    saved_tracks = save_unique(rapedia_tracks)
+                    if saved_tracks:
+                        yield saved_tracks
+        finally:
+            if rapedia_executor is not None:
+                rapedia_executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Mettre à jour le compteur de morceaux de l'artiste
+        artist.total_tracks = saved_count
+        self.database.update_artist(artist)
+        
+        stats.duplicates_removed = dedup.duplicate_count
+        stats.final_count = saved_count
+        stats.discovery_time_seconds = (datetime.now() - start_time).total_seconds()
+        self._update_performance_stats(stats.discovery_time_seconds)
+        
+        self.logger.info(f"✅ Découverte en flux terminée: {stats.final_count} morceaux "
+                       f"en {stats.discovery_time_seconds:.2f}s")
+    
     def _discover_parallel_sources(self, artist: Artist, stats: DiscoveryStats, 
                                  max_tracks: Optional[int]) -> List[Track]:
         """Découverte parallèle depuis toutes les sources"""
@@ -333,14 +517,32 @@ class DiscoveryStep:
             self.logger.error(f"Erreur Rapedia pour {artist.name}: {e}")
             return []
     
+    def _iter_genius_pages(self, artist: Artist, max_tracks: Optional[int]) -> Iterator[List[Track]]:
+        """Découverte Genius page par page"""
+        if not self.genius_discovery:
+            return
+        
+        try:
+            for page in self.genius_discovery.iter_artist_track_pages(
+                artist.name,
+                max_tracks=max_tracks or self.config['max_tracks_per_source']
+            ):
+                yield self._convert_genius_tracks(artist, page)
+        except Exception as e:
+            self.logger.error(f"Erreur Genius pour {artist.name}: {e}")
+    
     def _convert_genius_results_to_tracks(self, artist: Artist, results) -> List[Track]:
         """Convertit les résultats Genius en entités Track"""
-        tracks = []
-        
         if not results or not hasattr(results, 'tracks'):
-            return tracks
+            return []
+        
+        return self._convert_genius_tracks(artist, results.tracks)
+    
+    def _convert_genius_tracks(self, artist: Artist, genius_tracks: List[Dict[str, Any]]) -> List[Track]:
+        """Convertit des morceaux Genius (dictionnaires de l'API) en entités Track"""
+        tracks = []
         
-        for genius_track in results.tracks:
+        for genius_track in genius_tracks:
             try:
                 track = Track(
                     title=genius_track.get('title', ''),
@@ -385,37 +587,33 @@ class DiscoveryStep:
     @lru_cache(maxsize=512)
     def _calculate_track_similarity(self, title1: str, title2: str, artist1: str, artist2: str) -> float:
         """Calcule la similarité entre deux morceaux - avec cache"""
-        try:
-            from utils.text_utils import calculate_similarity
-            
-            # Normalisation des titres
-            norm_title1 = self._normalize_track_title(title1)
-            norm_title2 = self._normalize_track_title(title2)
-            
-            # Normalisation des artistes
-            norm_artist1 = self._normalize_artist_name(artist1)
-            norm_artist2 = self._normalize_artist_name(artist2)
-            
-            # Calcul de similarité pondérée
-            title_similarity = calculate_similarity(norm_title1, norm_title2)
-            artist_similarity = calculate_similarity(norm_artist1, norm_artist2)
-            
-            # Pondération: titre = 70%, artiste = 30%
-            return (title_similarity * 0.7) + (artist_similarity * 0.3)
-            
-        except ImportError:
-            # Fallback simple si utils.text_utils non disponible
-            return 1.0 if (title1.lower() == title2.lower() and artist1.lower() == artist2.lower()) else 0.0
+        # Normalisation des titres
+        norm_title1 = self._normalize_track_title(title1)
+        norm_title2 = self._normalize_track_title(title2)
+        
+        # Normalisation des artistes
+        norm_artist1 = self._normalize_artist_name(artist1)
+        norm_artist2 = self._normalize_artist_name(artist2)
+        
+        # Calcul de similarité pondérée
+        title_similarity = similarity(norm_title1, norm_title2)
+        artist_similarity = similarity(norm_artist1, norm_artist2)
+        
+        # Pondération: titre = 70%, artiste = 30%
+        return (title_similarity * 0.7) + (artist_similarity * 0.3)
     
     def _deduplicate_tracks(self, tracks: List[Track], stats: DiscoveryStats) -> List[Track]:
-        """Déduplication avancée des morceaux avec algorithme optimisé"""
+        """
+        Déduplication des morceaux en temps quasi linéaire.
+        
+        Après le contrôle de signature, chaque morceau n'est comparé qu'aux
+        candidats réels : morceaux partageant un préfixe de token de titre
+        (index inversé, mots vides exclus) et voisins dans l'ordre alphabétique
+        des titres (fenêtre glissante).
+        """
         if not tracks:
             return []
         
-        unique_tracks = []
-        seen_signatures = set()
-        duplicate_count = 0
-        
         # Trier les morceaux par priorité de source
         source_priority = {
             DataSource.GENIUS: 1,
@@ -423,45 +621,42 @@ class DiscoveryStep:
             DataSource.UNKNOWN: 3
         }
         
-        sorted_tracks = sorted(tracks, key=lambda t: source_priority.get(t.source, 999))
+        dedup = _DedupIndex(self)
+        for track in sorted(tracks, key=lambda t: source_priority.get(t.source, 999)):
+            dedup.add(track)
         
-        for track in sorted_tracks:
-            # Génération de signature unique
-            signature = self._generate_track_signature(track)
-            
-            if signature not in seen_signatures:
-                # Vérification de similarité avec les morceaux existants
-                is_duplicate = False
-                
-                for existing_track in unique_tracks:
-                    similarity = self._calculate_track_similarity(
-                        track.title, existing_track.title,
-                        track.artist_name, existing_track.artist_name
-                    )
-                    
-                    if similarity >= self.config['similarity_threshold']:
-                        is_duplicate = True
-                        duplicate_count += 1
-                        self.logger.debug(f"Doublon détecté: '{track.title}' "
-                                        f"(similarité: {similarity:.2f})")
-                        break
-                
-                if not is_duplicate:
-                    unique_tracks.append(track)
-                    seen_signatures.add(signature)
-            else:
-                duplicate_count += 1
+        stats.duplicates_removed = dedup.duplicate_count
+        
+        self.logger.info(f"🔄 Déduplication: {len(tracks)} -> {len(dedup.unique_tracks)} "
+                        f"({dedup.duplicate_count} doublons supprimés)")
+        
+        return dedup.unique_tracks
+    
+    def _find_dedup_candidates(self, comparison_title: str, tokens: Set[str],
+                               token_index: Dict[str, List[int]],
+                               sorted_titles: List[Tuple[str, int]],
+                               window: int) -> List[int]:
+        """
+        Candidats à comparer pour la déduplication.
+        
+        Returns:
+            Index (triés) des morceaux retenus partageant une clé de titre
+            ou voisins dans l'ordre trié des titres
+        """
+        candidates: Set[int] = set()
         
-        stats.duplicates_removed = duplicate_count
+        for token in tokens:
+            candidates.update(token_index.get(token, ()))
         
-        self.logger.info(f"🔄 Déduplication: {len(tracks)} -> {len(unique_tracks)} "
-                        f"({duplicate_count} doublons supprimés)")
+        # Voisinage trié : rattrape les variantes sans préfixe commun (fautes en début de mot)
+        position = bisect.bisect_left(sorted_titles, (comparison_title, -1))
+        for _, index in sorted_titles[max(0, position - window):position + window]:
+            candidates.add(index)
         
-        return unique_tracks
+        return sorted(candidates)
     
-    @lru_cache(maxsize=1024)
     def _generate_track_signature(self, track: Track) -> str:
-        """Génère une signature unique pour un morceau - avec cache"""
+        """Génère une signature unique pour un morceau (normalisations en cache)"""
         import hashlib
         
         # Normalisation pour signature
@@ -519,10 +714,9 @@ class DiscoveryStep:
             )
             
             # Sauvegarde en base
-            artist_id = self.database.save_artist(artist)
-            artist.id = artist_id
+            artist = self.database.save_artist(artist)
             
-            self.logger.info(f"➕ Nouvel artiste créé: {artist_name} (ID: {artist_id})")
+            self.logger.info(f"➕ Nouvel artiste créé: {artist_name} (ID: {artist.id})")
         else:
             self.logger.info(f"👤 Artiste existant trouvé: {artist_name} (ID: {artist.id})")
         
@@ -530,27 +724,32 @@ class DiscoveryStep:
         self._artist_cache[artist_name] = artist
         return artist
     
+    def _save_track_chunk(self, artist: Artist, tracks: List[Track]) -> List[Track]:
+        """Sauvegarde un lot de morceaux (les morceaux existants sont complétés)"""
+        saved_tracks = []
+        
+        for track in tracks:
+            # Vérifier si le morceau existe déjà
+            existing_track = self.database.get_track_by_title_and_artist(
+                track.title, artist.id
+            )
+            
+            if existing_track:
+                # Mettre à jour les données manquantes
+                self._update_existing_track(existing_track, track)
+                saved_tracks.append(existing_track)
+            else:
+                # Sauvegarder nouveau morceau
+                saved_tracks.append(self.database.save_track(track))
+        
+        return saved_tracks
+    
     def _save_tracks_to_database(self, artist: Artist, tracks: List[Track]) -> List[Track]:
         """Sauvegarde les morceaux en base de données avec gestion des doublons"""
         saved_tracks = []
         
         try:
-            with self.database.get_connection() as conn:
-                for track in tracks:
-                    # Vérifier si le morceau existe déjà
-                    existing_track = self.database.get_track_by_title_and_artist(
-                        track.title, artist.id
-                    )
-                    
-                    if existing_track:
-                        # Mettre à jour les données manquantes
-                        self._update_existing_track(existing_track, track)
-                        saved_tracks.append(existing_track)
-                    else:
-                        # Sauvegarder nouveau morceau
-                        track_id = self.database.save_track(track)
-                        track.id = track_id
-                        saved_tracks.append(track)
+            saved_tracks = self._save_track_chunk(artist, tracks)
             
             # Mettre à jour le compteur de morceaux de l'artiste
             artist.total_tracks = len(saved_tracks)
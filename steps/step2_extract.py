@@ -3,10 +3,17 @@
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+import heapq
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
 
 from core.database import Database
@@ -17,27 +24,34 @@ from core.exceptions import ExtractionError, APIRateLimitError
 from models.entities import Artist, Album, Track, Credit, Session
 from models.enums import ExtractionStatus, SessionStatus, DataSource, CreditType
 from config.settings import settings
+from utils.profiling import profiled, span
+from utils.text_utils import normalize_text
 
 # Imports conditionnels des extracteurs
 try:
-    from extractors.genius_extractor import GeniusExtractor
+    from extractors.web_scrapers.genius_scraper import GeniusWebScraper
 except ImportError:
-    GeniusExtractor = None
+    GeniusWebScraper = None
 
 try:
-    from extractors.spotify_extractor import SpotifyExtractor
+    from extractors.api_extractors.spotify_extractor import SpotifyExtractor
 except ImportError:
     SpotifyExtractor = None
 
 try:
-    from extractors.credit_extractor import CreditExtractor
+    from extractors.api_extractors.lastfm_extractor import LastFMExtractor
 except ImportError:
-    CreditExtractor = None
+    LastFMExtractor = None
 
 try:
-    from extractors.lyric_extractor import LyricExtractor
+    from extractors.api_extractors.discogs_extractor import DiscogsExtractor
 except ImportError:
-    LyricExtractor = None
+    DiscogsExtractor = None
+
+try:
+    from extractors.web_scrapers.tunebat_scraper import TuneBatScraper
+except ImportError:
+    TuneBatScraper = None
 
 @dataclass
 class ExtractionBatch:
@@ -45,6 +59,7 @@ class ExtractionBatch:
     tracks: List[Track]
     batch_id: str
     priority: int = 0
+    attempts: int = 0
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
@@ -125,6 +140,44 @@ class ExtractionStats:
         }
 
 
+class _AdmissionWindow:
+    """
+    Fenêtre d'admission des lots de l'ordonnanceur d'extraction.
+
+    Un rate limit divise la fenêtre par deux et suspend les admissions
+    (Retry-After ou délai de backoff) ; la fenêtre regagne ensuite un lot
+    après chaque série de lots terminés sans rate limit.
+    """
+
+    def __init__(self, max_size: int, backoff_seconds: float):
+        self.max_size = max(1, max_size)
+        self.size = self.max_size
+        self.backoff_seconds = backoff_seconds
+        self.paused_until = 0.0
+        self._clean_batches = 0
+
+    def on_rate_limit(self, retry_after: Optional[float] = None):
+        """Ralentit l'admission après un rate limit"""
+        self.size = max(1, self.size // 2)
+        self._clean_batches = 0
+        pause = retry_after if retry_after else self.backoff_seconds
+        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+    def on_success(self):
+        """Élargit progressivement la fenêtre"""
+        if self.size >= self.max_size:
+            return
+        self._clean_batches += 1
+        if self._clean_batches >= self.size:
+            self.size += 1
+            self._clean_batches = 0
+
+    @property
+    def delay(self) -> float:
+        """Temps restant avant la prochaine admission autorisée"""
+        return max(0.0, self.paused_until - time.monotonic())
+
+
 class ExtractionStep:
     """
     Étape 2: Extraction optimisée des données musicales détaillées.
@@ -145,11 +198,12 @@ class ExtractionStep:
         self.database = database or Database()
         self.rate_limiter = RateLimiter()
         
-        # Extracteurs avec vérification de disponibilité
-        self.genius_extractor = GeniusExtractor() if GeniusExtractor else None
-        self.spotify_extractor = SpotifyExtractor() if SpotifyExtractor else None
-        self.credit_extractor = CreditExtractor() if CreditExtractor else None
-        self.lyric_extractor = LyricExtractor() if LyricExtractor else None
+        # Extracteurs avec vérification de disponibilité (dépendances et clés API)
+        self.genius_scraper = self._create_extractor('Genius', GeniusWebScraper)
+        self.spotify_extractor = self._create_extractor('Spotify', SpotifyExtractor)
+        self.lastfm_extractor = self._create_extractor('Last.fm', LastFMExtractor)
+        self.discogs_extractor = self._create_extractor('Discogs', DiscogsExtractor)
+        self.tunebat_scraper = self._create_extractor('TuneBat', TuneBatScraper)
         
         # Configuration optimisée
         self.config = self._load_optimized_config()
@@ -163,6 +217,12 @@ class ExtractionStep:
             max_workers=self.config['max_concurrent_extractions']
         )
         
+        # Appels simultanés maximum par source (API Genius, Spotify, scraping)
+        self._source_slots = {
+            source: threading.BoundedSemaphore(max(1, limit))
+            for source, limit in self.config['source_concurrency'].items()
+        }
+        
         # Statistiques de performance
         self.performance_stats = {
             'total_extractions': 0,
@@ -172,10 +232,21 @@ class ExtractionStep:
         }
         
         self.logger.info(f"ExtractionStep optimisé initialisé "
-                        f"(Genius: {bool(self.genius_extractor)}, "
+                        f"(Genius: {bool(self.genius_scraper)}, "
                         f"Spotify: {bool(self.spotify_extractor)}, "
-                        f"Credits: {bool(self.credit_extractor)}, "
-                        f"Lyrics: {bool(self.lyric_extractor)})")
+                        f"Last.fm: {bool(self.lastfm_extractor)}, "
+                        f"Discogs: {bool(self.discogs_extractor)}, "
+                        f"TuneBat: {bool(self.tunebat_scraper)})")
+    
+    def _create_extractor(self, name: str, extractor_class: Optional[type]) -> Optional[Any]:
+        """Instancie un extracteur optionnel ; None s'il est absent ou non configuré"""
+        if extractor_class is None:
+            return None
+        try:
+            return extractor_class()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Extracteur {name} indisponible: {e}")
+            return None
     
     def _load_optimized_config(self) -> Dict[str, Any]:
         """Charge la configuration optimisée"""
@@ -192,7 +263,17 @@ class ExtractionStep:
             'retry_delay': settings.get('extraction.retry_delay', 5.0),
             'skip_failed_permanently': settings.get('extraction.skip_failed_permanently', True),
             'rate_limit_backoff': settings.get('extraction.rate_limit_backoff', 30),
-            'prefer_cached_data': settings.get('extraction.prefer_cached_data', True)
+            'prefer_cached_data': settings.get('extraction.prefer_cached_data', True),
+            'task_claim_size': settings.get('extraction.task_claim_size', 20),
+            'task_lease_seconds': settings.get('extraction.task_lease_seconds', 300),
+            'task_poll_interval': settings.get('extraction.task_poll_interval', 2.0),
+            'source_concurrency': {
+                'genius': settings.get('extraction.source_concurrency.genius', 2),
+                'spotify': settings.get('extraction.source_concurrency.spotify', 4),
+                'lastfm': settings.get('extraction.source_concurrency.lastfm', 4),
+                'discogs': settings.get('extraction.source_concurrency.discogs', 2),
+                'scraping': settings.get('extraction.source_concurrency.scraping', 2)
+            }
         }
     
     @smart_cache.cache_result("track_extraction", expire_days=14)
@@ -230,13 +311,25 @@ class ExtractionStep:
             tracks_to_process = self._filter_tracks_for_extraction(tracks)
             self.logger.info(f"📋 {len(tracks_to_process)} morceaux à traiter")
             
-            # Traitement par lots pour optimiser les performances
-            batches = self._create_extraction_batches(tracks_to_process)
-            
-            # Extraction parallèle par lots
-            extraction_results = await self._process_batches_parallel(
-                batches, stats, progress_callback
-            )
+            if session_id:
+                # File de tâches persistante: reprise exacte après arrêt
+                self.enqueue_extraction_tasks(session_id, tracks_to_process)
+                loop = asyncio.get_event_loop()
+                extraction_results, queue_stats = await loop.run_in_executor(
+                    None, self.process_task_queue, session_id, None, progress_callback
+                )
+                for name in ('tracks_processed', 'tracks_successful', 'tracks_failed',
+                             'lyrics_extracted', 'credits_extracted', 'metadata_extracted',
+                             'albums_extracted', 'rate_limit_hits'):
+                    setattr(stats, name, getattr(queue_stats, name))
+            else:
+                # Traitement par lots pour optimiser les performances
+                batches = self._create_extraction_batches(tracks_to_process)
+                
+                # Extraction parallèle par lots
+                extraction_results = await self._process_batches_parallel(
+                    batches, stats, progress_callback
+                )
             
             # Finalisation des statistiques
             end_time = datetime.now()
@@ -303,32 +396,34 @@ class ExtractionStep:
     
     def _sort_tracks_by_priority(self, tracks: List[Track]) -> List[Track]:
         """Trie les morceaux par priorité d'extraction"""
-        def priority_score(track: Track) -> int:
-            score = 0
-            
-            # Priorité aux morceaux avec des IDs externes
-            if track.genius_id:
-                score += 10
-            if track.spotify_id:
-                score += 5
-            
-            # Priorité aux morceaux sans données extraites
-            if not track.lyrics:
-                score += 3
-            if track.extraction_status == ExtractionStatus.PENDING:
-                score += 2
-            
-            # Priorité selon la source
-            source_priority = {
-                DataSource.GENIUS: 5,
-                DataSource.SPOTIFY: 3,
-                DataSource.RAPEDIA: 1
-            }
-            score += source_priority.get(track.source, 0)
-            
-            return score
+        return sorted(tracks, key=self._track_priority, reverse=True)
+    
+    @staticmethod
+    def _track_priority(track: Track) -> int:
+        """Score de priorité d'extraction d'un morceau"""
+        score = 0
         
-        return sorted(tracks, key=priority_score, reverse=True)
+        # Priorité aux morceaux avec des IDs externes
+        if track.genius_id:
+            score += 10
+        if track.spotify_id:
+            score += 5
+        
+        # Priorité aux morceaux sans données extraites
+        if not track.lyrics:
+            score += 3
+        if track.extraction_status == ExtractionStatus.PENDING:
+            score += 2
+        
+        # Priorité selon la source
+        source_priority = {
+            DataSource.GENIUS: 5,
+            DataSource.SPOTIFY: 3,
+            DataSource.RAPEDIA: 1
+        }
+        score += source_priority.get(track.source, 0)
+        
+        return score
     
     def _calculate_batch_priority(self, tracks: List[Track]) -> int:
         """Calcule la priorité d'un lot"""
@@ -336,13 +431,19 @@ class ExtractionStep:
             return 0
         
         # Moyenne des priorités individuelles
-        individual_priorities = [self._sort_tracks_by_priority([track])[0] for track in tracks]
-        return sum(individual_priorities) // len(individual_priorities)
+        return sum(self._track_priority(track) for track in tracks) // len(tracks)
     
     async def _process_batches_parallel(self, batches: List[ExtractionBatch], 
                                       stats: ExtractionStats,
                                       progress_callback: Optional[callable] = None) -> Dict[str, Any]:
-        """Traite les lots en parallèle de manière optimisée"""
+        """
+        Ordonnance les lots avec une fenêtre bornée de lots en cours.
+        
+        Les lots sont admis par priorité décroissante dès qu'un worker se
+        libère ; la progression est publiée à chaque lot terminé. Les morceaux
+        interrompus par un rate limit sont remis en file et la fenêtre
+        d'admission est réduite (voir _AdmissionWindow).
+        """
         
         results = {
             'tracks': [],
@@ -352,40 +453,88 @@ class ExtractionStep:
             'metadata': []
         }
         
-        # Traitement parallèle des lots
         loop = asyncio.get_event_loop()
+        window = _AdmissionWindow(self.config['max_concurrent_extractions'],
+                                  self.config['rate_limit_backoff'])
         
-        # Créer les tâches pour chaque lot
-        tasks = []
-        for batch in batches:
-            task = loop.run_in_executor(
-                self.thread_pool,
-                self._process_single_batch,
-                batch, stats
-            )
-            tasks.append(task)
+        # File de priorité: (priorité inversée, ordre d'arrivée, lot)
+        queue = [(-batch.priority, order, batch) for order, batch in enumerate(batches)]
+        heapq.heapify(queue)
+        next_order = len(queue)
         
-        # Exécuter et collecter les résultats
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        inflight: Dict[asyncio.Future, ExtractionBatch] = {}
+        total_tracks = sum(len(batch.tracks) for batch in batches)
+        settled_tracks = 0
         
-        # Agrégation des résultats
-        for i, batch_result in enumerate(batch_results):
-            if isinstance(batch_result, Exception):
-                self.logger.error(f"❌ Erreur lot {batches[i].batch_id}: {batch_result}")
+        while queue or inflight:
+            # Admission des lots dans la fenêtre
+            while queue and len(inflight) < window.size:
+                delay = window.delay
+                if delay > 0:
+                    if inflight:
+                        break
+                    self.logger.info(f"⏳ Admission suspendue {delay:.1f}s (rate limit)")
+                    await asyncio.sleep(delay)
+                    continue
+                
+                _, _, batch = heapq.heappop(queue)
+                future = loop.run_in_executor(
+                    self.thread_pool, self._process_single_batch, batch, stats
+                )
+                inflight[future] = batch
+            
+            if not inflight:
                 continue
             
-            # Fusion des résultats
-            for key, value in batch_result.items():
-                if isinstance(value, list):
-                    results[key].extend(value)
+            done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
             
-            # Callback de progression
-            if progress_callback:
-                progress = ((i + 1) / len(batches)) * 100
-                progress_callback("extraction", int(progress), 100)
+            for future in done:
+                batch = inflight.pop(future)
+                try:
+                    batch_result = future.result()
+                except Exception as e:
+                    self.logger.error(f"❌ Erreur lot {batch.batch_id}: {e}")
+                    settled_tracks += len(batch.tracks)
+                    continue
+                
+                rate_limited = batch_result.pop('rate_limited', [])
+                retry_after = batch_result.pop('retry_after', None)
+                
+                # Fusion des résultats
+                for key, value in batch_result.items():
+                    if isinstance(value, list):
+                        results[key].extend(value)
+                
+                if rate_limited:
+                    window.on_rate_limit(retry_after)
+                    if batch.attempts < self.config['max_retries']:
+                        retry_batch = ExtractionBatch(
+                            tracks=rate_limited,
+                            batch_id=f"{batch.batch_id}_retry{batch.attempts + 1}",
+                            priority=batch.priority,
+                            attempts=batch.attempts + 1
+                        )
+                        heapq.heappush(queue, (-retry_batch.priority, next_order, retry_batch))
+                        next_order += 1
+                        self.logger.info(f"🔁 {len(rate_limited)} morceaux remis en file "
+                                         f"(fenêtre: {window.size} lots)")
+                    else:
+                        # Morceaux laissés au statut RETRY pour une prochaine exécution
+                        stats.tracks_skipped += len(rate_limited)
+                        settled_tracks += len(rate_limited)
+                else:
+                    window.on_success()
+                
+                settled_tracks += len(batch.tracks) - len(rate_limited)
+                
+                # Callback de progression
+                if progress_callback and total_tracks:
+                    progress = (settled_tracks / total_tracks) * 100
+                    progress_callback("extraction", int(progress), 100)
         
         return results
     
+    @profiled('step', 'extraction_batch')
     def _process_single_batch(self, batch: ExtractionBatch, 
                             stats: ExtractionStats) -> Dict[str, Any]:
         """Traite un lot unique de morceaux"""
@@ -401,7 +550,7 @@ class ExtractionStep:
         
         self.logger.info(f"🔄 Traitement lot {batch.batch_id}: {len(batch.tracks)} morceaux")
         
-        for track in batch.tracks:
+        for position, track in enumerate(batch.tracks):
             try:
                 # Extraction des données pour ce morceau
                 track_data = self._extract_single_track_data(track, stats)
@@ -433,6 +582,14 @@ class ExtractionStep:
                 
                 stats.tracks_processed += 1
                 
+            except APIRateLimitError as e:
+                # Fin du lot: le morceau et les suivants sont rendus à l'ordonnanceur
+                self.logger.warning(f"⏳ Rate limit atteint pour {track.title}")
+                stats.rate_limit_hits += 1
+                batch_results['rate_limited'] = batch.tracks[position:]
+                batch_results['retry_after'] = e.retry_after
+                break
+                
             except Exception as e:
                 self.logger.error(f"❌ Erreur morceau {track.title}: {e}")
                 stats.tracks_failed += 1
@@ -444,6 +601,211 @@ class ExtractionStep:
         self.logger.info(f"✅ Lot {batch.batch_id} terminé en {batch.duration_seconds:.2f}s")
         return batch_results
     
+    # ===== FILE DE TÂCHES PERSISTANTE =====
+    
+    # Extracteur d'une tâche -> méthode d'extraction
+    TASK_EXTRACTORS = {
+        'lyrics': '_extract_track_lyrics',
+        'credits': '_extract_track_credits',
+        'metadata': '_extract_track_metadata',
+        'albums': '_extract_track_albums'
+    }
+    
+    def _enabled_task_extractors(self) -> List[str]:
+        """Extracteurs activés dans la configuration"""
+        return [name for name in self.TASK_EXTRACTORS if self.config[f'extract_{name}']]
+    
+    def enqueue_extraction_tasks(self, session_id: str, tracks: List[Track]) -> int:
+        """
+        Ajoute à la file persistante une tâche par morceau et extracteur activé.
+        
+        Returns:
+            Nombre de tâches créées (les tâches déjà présentes sont conservées)
+        """
+        tracks = [track for track in self._filter_tracks_for_extraction(tracks) if track.id]
+        created = self.database.enqueue_tasks(
+            session_id,
+            [track.id for track in tracks],
+            self._enabled_task_extractors(),
+            {track.id: self._track_priority(track) for track in tracks}
+        )
+        self.logger.info(f"📥 {created} tâches d'extraction ajoutées ({len(tracks)} morceaux)")
+        return created
+    
+    def process_task_queue(self, session_id: str, worker_id: Optional[str] = None,
+                           progress_callback: Optional[callable] = None) -> Tuple[Dict[str, Any], ExtractionStats]:
+        """
+        Vide la file de tâches d'une session.
+        
+        Le worker réserve des lots de tâches (bail renouvelable) ; d'autres
+        workers, y compris dans d'autres processus, peuvent vider la même
+        file. Les tâches d'un worker arrêté redeviennent disponibles à
+        l'expiration du bail. Le worker s'arrête quand il ne reste plus de
+        tâche en attente.
+        
+        Args:
+            session_id: Session dont la file est traitée
+            worker_id: Identifiant du worker (défaut: hôte:pid:aléatoire)
+            progress_callback: Callback (étape, tâches terminées, total)
+            
+        Returns:
+            Tuple[Dict[str, Any], ExtractionStats]: Données extraites et statistiques
+        """
+        worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        stats = ExtractionStats()
+        results = {'tracks': [], 'lyrics': [], 'credits': [], 'albums': [], 'metadata': []}
+        start = time.monotonic()
+        
+        while True:
+            tasks = self.database.claim_tasks(
+                session_id, worker_id,
+                limit=self.config['task_claim_size'],
+                lease_seconds=self.config['task_lease_seconds']
+            )
+            
+            if not tasks:
+                next_time = self.database.get_next_task_time(session_id)
+                if next_time is None:
+                    break
+                # Nouveaux essais programmés plus tard (backoff)
+                time.sleep(min(max(next_time - time.time(), 0.05), self.config['task_poll_interval']))
+                continue
+            
+            self._run_claimed_tasks(tasks, worker_id, stats, results)
+            
+            if progress_callback:
+                queue_stats = self.database.get_task_queue_stats(session_id)
+                total = sum(queue_stats.values())
+                progress_callback("extraction", queue_stats['done'] + queue_stats['failed'], total)
+        
+        stats.extraction_time_seconds = time.monotonic() - start
+        self._update_performance_stats(stats)
+        
+        queue_stats = self.database.get_task_queue_stats(session_id)
+        self.logger.info(f"✅ File de tâches {session_id[:8]} traitée par {worker_id}: "
+                         f"{queue_stats['done']} terminées, {queue_stats['failed']} en échec")
+        return results, stats
+    
+    def _run_claimed_tasks(self, tasks: List[Dict[str, Any]], worker_id: str,
+                           stats: ExtractionStats, results: Dict[str, List[Any]]):
+        """
+        Exécute un lot de tâches réservées, regroupées par morceau, dans le pool de threads.
+        
+        Les baux des morceaux non terminés sont prolongés tous les tiers de
+        task_lease_seconds : un lot plus long que le bail n'est pas repris
+        par un autre worker tant que celui-ci est actif.
+        """
+        tasks_by_track: Dict[int, List[Dict[str, Any]]] = {}
+        for task in tasks:
+            tasks_by_track.setdefault(task['track_id'], []).append(task)
+        
+        tracks = {track.id: track for track in self.database.get_tracks_by_ids(tasks_by_track)}
+        
+        task_ids_by_future = {
+            self.thread_pool.submit(
+                self._run_track_tasks, tracks.get(track_id), track_tasks, worker_id, stats
+            ): [task['id'] for task in track_tasks]
+            for track_id, track_tasks in tasks_by_track.items()
+        }
+        
+        lease_seconds = self.config['task_lease_seconds']
+        renew_interval = lease_seconds / 3
+        next_renewal = time.monotonic() + renew_interval
+        pending = set(task_ids_by_future)
+        
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, next_renewal - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            
+            if pending and time.monotonic() >= next_renewal:
+                self.database.extend_task_leases(
+                    [task_id for future in pending for task_id in task_ids_by_future[future]],
+                    worker_id, lease_seconds
+                )
+                next_renewal = time.monotonic() + renew_interval
+            
+            for future in done:
+                track_data = future.result()
+                if not track_data:
+                    continue
+                
+                results['tracks'].append(track_data['track'])
+                results['lyrics'].extend(track_data.get('lyrics') or [])
+                results['credits'].extend(track_data.get('credits') or [])
+                results['albums'].extend(track_data.get('albums') or [])
+                if track_data.get('metadata'):
+                    results['metadata'].append(track_data['metadata'])
+    
+    def _run_track_tasks(self, track: Optional[Track], tasks: List[Dict[str, Any]],
+                         worker_id: str, stats: ExtractionStats) -> Optional[Dict[str, Any]]:
+        """Exécute les tâches réservées d'un morceau et publie leur état dans la file"""
+        task_ids = [task['id'] for task in tasks]
+        
+        if track is None:
+            # Morceau supprimé depuis la mise en file
+            self.database.complete_tasks(task_ids, worker_id)
+            return None
+        
+        track_data: Dict[str, Any] = {'track': track}
+        completed: List[int] = []
+        
+        for position, task in enumerate(tasks):
+            method = getattr(self, self.TASK_EXTRACTORS.get(task['extractor'], ''), None)
+            if method is None:
+                self.database.fail_task(task['id'], worker_id, f"Extracteur inconnu: {task['extractor']}", 0, 0)
+                continue
+            
+            try:
+                data = method(track, stats)
+            except APIRateLimitError as e:
+                # Tâches rendues à la file sans compter d'essai
+                stats.rate_limit_hits += 1
+                self.database.release_tasks(
+                    [pending['id'] for pending in tasks[position:]], worker_id,
+                    delay=e.retry_after or self.config['rate_limit_backoff']
+                )
+                break
+            except Exception as e:
+                retry_delay = self.config['retry_delay'] * 2 ** max(0, task['attempts'] - 1)
+                retried = self.database.fail_task(
+                    task['id'], worker_id, str(e), retry_delay, self.config['max_retries']
+                )
+                self.logger.warning(f"⚠️ Tâche {task['extractor']} {track.title}: {e}"
+                                    + (f" (nouvel essai dans {retry_delay:.0f}s)" if retried else ""))
+                continue
+            
+            completed.append(task['id'])
+            if data:
+                track_data[task['extractor']] = data
+        
+        self.database.complete_tasks(completed, worker_id)
+        
+        if len(track_data) == 1:
+            if completed:
+                stats.tracks_processed += 1
+            return None
+        
+        # Application des données extraites au morceau
+        if track_data.get('lyrics'):
+            track.lyrics = track_data['lyrics'][0].get('text', '')
+            track.has_lyrics = bool(track.lyrics)
+            stats.lyrics_extracted += len(track_data['lyrics'])
+        if track_data.get('credits'):
+            stats.credits_extracted += len(track_data['credits'])
+        if track_data.get('albums'):
+            stats.albums_extracted += len(track_data['albums'])
+        if track_data.get('metadata'):
+            self._update_track_with_metadata(track, track_data['metadata'])
+            stats.metadata_extracted += 1
+        
+        track.extraction_status = ExtractionStatus.COMPLETED
+        track.updated_at = datetime.now()
+        self.database.update_track(track)
+        
+        stats.tracks_processed += 1
+        stats.tracks_successful += 1
+        return track_data
+    
     def _extract_single_track_data(self, track: Track, stats: ExtractionStats) -> Optional[Dict[str, Any]]:
         """Extrait toutes les données pour un morceau unique"""
         
@@ -458,8 +820,9 @@ class ExtractionStep:
         
         try:
             # Extraction des paroles
-            if self.config['extract_lyrics'] and self.lyric_extractor:
-                lyrics = self._extract_track_lyrics(track, stats)
+            if self.config['extract_lyrics'] and self.genius_scraper:
+                with span('extract', 'lyrics'):
+                    lyrics = self._extract_or_log('paroles', self._extract_track_lyrics, track, stats)
                 if lyrics:
                     track_data['lyrics'] = lyrics
                     track.lyrics = lyrics[0].get('text', '') if lyrics else None
@@ -467,15 +830,17 @@ class ExtractionStep:
                     extraction_successful = True
             
             # Extraction des crédits
-            if self.config['extract_credits'] and self.credit_extractor:
-                credits = self._extract_track_credits(track, stats)
+            if self.config['extract_credits'] and (self.genius_scraper or self.discogs_extractor):
+                with span('extract', 'credits'):
+                    credits = self._extract_or_log('crédits', self._extract_track_credits, track, stats)
                 if credits:
                     track_data['credits'] = credits
                     extraction_successful = True
             
             # Extraction des métadonnées
             if self.config['extract_metadata']:
-                metadata = self._extract_track_metadata(track, stats)
+                with span('extract', 'metadata'):
+                    metadata = self._extract_or_log('métadonnées', self._extract_track_metadata, track, stats)
                 if metadata:
                     track_data['metadata'] = metadata
                     # Mise à jour du track avec les métadonnées
@@ -484,7 +849,8 @@ class ExtractionStep:
             
             # Extraction des informations d'album
             if self.config['extract_albums']:
-                albums = self._extract_track_albums(track, stats)
+                with span('extract', 'albums'):
+                    albums = self._extract_track_albums(track, stats)
                 if albums:
                     track_data['albums'] = albums
                     extraction_successful = True
@@ -506,14 +872,11 @@ class ExtractionStep:
                 self.database.update_track(track)
                 return None
                 
-        except APIRateLimitError as e:
-            self.logger.warning(f"⏳ Rate limit atteint pour {track.title}")
-            stats.rate_limit_hits += 1
-            # Programmer une nouvelle tentative
-            if self.config['retry_failed']:
-                track.extraction_status = ExtractionStatus.RETRY
-                self.database.update_track(track)
-            return None
+        except APIRateLimitError:
+            # Nouvelle tentative programmée par l'ordonnanceur des lots
+            track.extraction_status = ExtractionStatus.RETRY
+            self.database.update_track(track)
+            raise
             
         except Exception as e:
             self.logger.error(f"❌ Erreur extraction {track.title}: {e}")
@@ -521,68 +884,165 @@ class ExtractionStep:
             self.database.update_track(track)
             return None
     
-    def _extract_track_lyrics(self, track: Track, stats: ExtractionStats) -> Optional[List[Dict]]:
-        """Extrait les paroles d'un morceau"""
-        if not self.lyric_extractor:
-            return None
-        
+    def _extract_or_log(self, label: str, extractor: Callable[[Track, ExtractionStats], Any],
+                        track: Track, stats: ExtractionStats) -> Any:
+        """Extraction en lot : une source en échec est journalisée sans bloquer les suivantes"""
         try:
-            lyrics_result = self.lyric_extractor.extract_lyrics(track)
-            if lyrics_result and lyrics_result.success:
-                return [{'text': lyrics_result.data.get('lyrics', ''), 'source': lyrics_result.source}]
+            return extractor(track, stats)
+        except APIRateLimitError:
+            raise
         except Exception as e:
-            self.logger.warning(f"Erreur extraction paroles {track.title}: {e}")
+            self.logger.warning(f"Erreur extraction {label} {track.title}: {e}")
+            return None
+    
+    @contextmanager
+    def _source_slot(self, source: str):
+        """Limite les appels simultanés vers une même source"""
+        slot = self._source_slots.get(source)
+        if slot is None:
+            yield
+            return
+        with slot:
+            yield
+    
+    def _extract_track_lyrics(self, track: Track, stats: ExtractionStats) -> Optional[List[Dict]]:
+        """Extrait les paroles d'un morceau (les erreurs remontent à l'appelant)"""
+        page = self._scrape_genius_page(track)
+        if page and page.get('lyrics'):
+            return [{'text': page['lyrics'], 'source': DataSource.GENIUS.value}]
         
         return None
     
     def _extract_track_credits(self, track: Track, stats: ExtractionStats) -> Optional[List[Dict]]:
-        """Extrait les crédits d'un morceau"""
-        if not self.credit_extractor:
-            return None
+        """
+        Extrait les crédits d'un morceau : page Genius (crédits complets), à
+        défaut crédits de la piste dans sa release Discogs. Les erreurs
+        remontent à l'appelant.
+        """
+        page = self._scrape_genius_page(track)
+        if page and page.get('credits'):
+            return page['credits']
         
-        try:
-            credits_result = self.credit_extractor.extract_credits(track)
-            if credits_result and credits_result.success:
-                return credits_result.data.get('credits', [])
-        except Exception as e:
-            self.logger.warning(f"Erreur extraction crédits {track.title}: {e}")
+        if self.discogs_extractor:
+            return self._discogs_track_credits(track) or None
         
         return None
     
+    def _scrape_genius_page(self, track: Track) -> Optional[Dict[str, Any]]:
+        """Page Genius d'un morceau : paroles et crédits (mise en cache par le scraper)"""
+        if not self.genius_scraper or not track.genius_url:
+            return None
+        
+        with self._source_slot('scraping'):
+            result = self.genius_scraper.scrape_track_credits(track.genius_url)
+        return result if result and result.get('success') else None
+    
+    def _discogs_track_credits(self, track: Track) -> List[Dict[str, Any]]:
+        """Crédits de la piste dans la release Discogs trouvée par son titre"""
+        with self._source_slot('discogs'):
+            releases = self.discogs_extractor.search_release(track.title, artist=track.artist_name)
+            if not releases:
+                return []
+            release = self.discogs_extractor.get_release_details(releases[0]['discogs_id'])
+        
+        wanted_title = normalize_text(track.title)
+        for entry in (release or {}).get('tracklist', []):
+            if normalize_text(entry.get('title') or '') == wanted_title:
+                return [{**credit, 'source': DataSource.DISCOGS.value}
+                        for credit in entry.get('extraartists', [])]
+        return []
+    
     def _extract_track_metadata(self, track: Track, stats: ExtractionStats) -> Optional[Dict]:
-        """Extrait les métadonnées d'un morceau"""
-        metadata = {}
+        """
+        Extrait les métadonnées d'un morceau : Spotify, Last.fm, puis TuneBat
+        pour le BPM et la tonalité quand Spotify ne les fournit pas.
         
-        # Extraction depuis Spotify
-        if self.spotify_extractor and track.spotify_id:
-            try:
-                spotify_data = self.spotify_extractor.get_track_info(track.spotify_id)
-                if spotify_data:
-                    metadata.update({
-                        'duration_ms': spotify_data.get('duration_ms'),
-                        'bpm': spotify_data.get('audio_features', {}).get('tempo'),
-                        'key': spotify_data.get('audio_features', {}).get('key'),
-                        'popularity': spotify_data.get('popularity'),
-                        'spotify_data': spotify_data
-                    })
-            except Exception as e:
-                self.logger.warning(f"Erreur métadonnées Spotify {track.title}: {e}")
+        Une source en échec n'empêche pas les autres ; l'erreur remonte à
+        l'appelant si aucune source n'a fourni de métadonnées.
+        """
+        metadata = {}
+        error: Optional[Exception] = None
         
-        # Extraction depuis Genius
-        if self.genius_extractor and track.genius_id:
+        sources = [
+            ('Spotify', self.spotify_extractor, self._spotify_metadata),
+            ('Last.fm', self.lastfm_extractor, self._lastfm_metadata),
+            ('TuneBat', self.tunebat_scraper, self._tunebat_metadata)
+        ]
+        for label, extractor, fetch in sources:
+            if not extractor:
+                continue
             try:
-                genius_data = self.genius_extractor.get_song_info(track.genius_id)
-                if genius_data:
-                    metadata.update({
-                        'genius_stats': genius_data.get('stats'),
-                        'release_date': genius_data.get('release_date_for_display'),
-                        'genius_data': genius_data
-                    })
+                metadata.update(fetch(track, metadata) or {})
+            except APIRateLimitError:
+                raise
             except Exception as e:
-                self.logger.warning(f"Erreur métadonnées Genius {track.title}: {e}")
+                self.logger.warning(f"Erreur métadonnées {label} {track.title}: {e}")
+                error = e
         
+        if not metadata and error is not None:
+            raise error
         return metadata if metadata else None
     
+    def _spotify_metadata(self, track: Track, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Métadonnées Spotify (morceau recherché par titre si son ID est inconnu)"""
+        with self._source_slot('spotify'):
+            spotify_id = track.spotify_id
+            if not spotify_id:
+                results = self.spotify_extractor.search_track(track.title, artist=track.artist_name, limit=5)
+                spotify_id = results[0].get('spotify_id') if results else None
+            if not spotify_id:
+                return None
+            spotify_data = self.spotify_extractor.get_track_details(
+                spotify_id, include_audio_features=self.spotify_extractor.config['include_audio_features']
+            )
+        if not spotify_data:
+            return None
+        
+        track.spotify_id = spotify_id
+        audio_features = spotify_data.get('audio_features') or {}
+        return self._present_values({
+            'duration_ms': spotify_data.get('duration_ms'),
+            'bpm': audio_features.get('bpm'),
+            'key': audio_features.get('key_name'),
+            'popularity': spotify_data.get('popularity'),
+            'spotify_data': spotify_data
+        })
+    
+    def _lastfm_metadata(self, track: Track, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Écoutes et tags Last.fm"""
+        with self._source_slot('lastfm'):
+            lastfm_data = self.lastfm_extractor.get_track_info(track.artist_name or '', track.title)
+        if not lastfm_data:
+            return None
+        
+        return self._present_values({
+            'lastfm_listeners': lastfm_data.get('listeners'),
+            'lastfm_playcount': lastfm_data.get('playcount'),
+            'tags': lastfm_data.get('tags') or None,
+            'lastfm_data': lastfm_data
+        })
+    
+    def _tunebat_metadata(self, track: Track, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """BPM et tonalité TuneBat, seulement s'ils manquent encore"""
+        if metadata.get('bpm') and metadata.get('key'):
+            return None
+        
+        with self._source_slot('scraping'):
+            tunebat_data = self.tunebat_scraper.search_track(track.artist_name or '', track.title)
+        if not tunebat_data:
+            return None
+        
+        return self._present_values({
+            'bpm': metadata.get('bpm') or tunebat_data.get('bpm'),
+            'key': metadata.get('key') or tunebat_data.get('key'),
+            'tunebat_data': tunebat_data
+        })
+    
+    @staticmethod
+    def _present_values(values: Dict[str, Any]) -> Dict[str, Any]:
+        """Écarte les valeurs absentes : une source ne masque pas une autre"""
+        return {key: value for key, value in values.items() if value is not None}
+    
     def _extract_track_albums(self, track: Track, stats: ExtractionStats) -> Optional[List[Dict]]:
         """Extrait les informations d'album d'un morceau"""
         # À implémenter selon les besoins spécifiques
@@ -642,10 +1102,11 @@ class ExtractionStep:
         return {
             **self.performance_stats,
             'extractors_available': {
-                'genius': bool(self.genius_extractor),
+                'genius': bool(self.genius_scraper),
                 'spotify': bool(self.spotify_extractor),
-                'credits': bool(self.credit_extractor),
-                'lyrics': bool(self.lyric_extractor)
+                'lastfm': bool(self.lastfm_extractor),
+                'discogs': bool(self.discogs_extractor),
+                'tunebat': bool(self.tunebat_scraper)
             },
             'config': self.config,
             'cache_size': len(self._extraction_cache),
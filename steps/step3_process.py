@@ -6,7 +6,6 @@ import asyncio
 from typing import Dict, List, Optional, Any, Tuple, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 
 from core.database import Database
@@ -16,6 +15,7 @@ from core.exceptions import DataValidationError, ProcessingError
 from models.entities import Artist, Track, Credit, Album, QualityReport
 from models.enums import ExtractionStatus, QualityLevel, CreditType, CreditCategory
 from config.settings import settings
+from utils.profiling import profiled
 
 # Imports conditionnels pour les processeurs
 try:
@@ -289,6 +289,7 @@ class ProcessingStep:
             self.logger.error(f"❌ Erreur traitement pour {artist_name}: {e}")
             raise ProcessingError(f"Échec traitement: {e}")
     
+    @profiled('step', 'processing_validation')
     async def _process_validation_phase(self, tracks: List[Track], credits: List[Credit],
                                       albums: List[Album], stats: ProcessingStats,
                                       progress_callback: Optional[callable] = None) -> Dict[str, Any]:
@@ -352,6 +353,7 @@ class ProcessingStep:
         
         return validation_results
     
+    @profiled('step', 'processing_cleaning')
     async def _process_cleaning_phase(self, tracks: List[Track], credits: List[Credit],
                                     albums: List[Album], stats: ProcessingStats,
                                     progress_callback: Optional[callable] = None) -> Dict[str, Any]:
@@ -429,6 +431,7 @@ class ProcessingStep:
         
         return cleaning_results
     
+    @profiled('step', 'processing_enrichment')
     async def _process_enrichment_phase(self, tracks: List[Track], credits: List[Credit],
                                       albums: List[Album], stats: ProcessingStats,
                                       progress_callback: Optional[callable] = None) -> Dict[str, Any]:
@@ -465,6 +468,7 @@ class ProcessingStep:
         
         return enrichment_results
     
+    @profiled('step', 'processing_quality')
     async def _process_quality_phase(self, tracks: List[Track], credits: List[Credit],
                                    albums: List[Album], stats: ProcessingStats,
                                    progress_callback: Optional[callable] = None) -> Dict[str, Any]:
@@ -523,9 +527,8 @@ class ProcessingStep:
         
         return quality_results
     
-    @lru_cache(maxsize=512)
     def _validate_single_track(self, track: Track) -> Dict[str, Any]:
-        """Valide un morceau unique - avec cache"""
+        """Valide un morceau unique"""
         validation_result = {
             'track_id': track.id,
             'is_valid': True,
@@ -556,9 +559,8 @@ class ProcessingStep:
         
         return validation_result
     
-    @lru_cache(maxsize=512)
     def _validate_single_credit(self, credit: Credit) -> Dict[str, Any]:
-        """Valide un crédit unique - avec cache"""
+        """Valide un crédit unique"""
         validation_result = {
             'credit_id': credit.id,
             'is_valid': True,
@@ -635,7 +637,7 @@ class ProcessingStep:
         # Remplir les album_name manquants si on a l'album_id
         for track in tracks:
             if track.album_id and not track.album_name:
-                album = self.database.get_album(track.album_id)
+                album = self.database.get_album_by_id(track.album_id)
                 if album:
                     track.album_name = album.title
                     filled_count += 1
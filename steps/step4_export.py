@@ -21,6 +21,7 @@ from core.exceptions import ExportError
 from models.entities import Artist, Track, Credit, Album, Session
 from models.enums import ExportFormat, QualityLevel, SessionStatus
 from config.settings import settings
+from utils.profiling import profiled
 
 # Imports conditionnels pour les exporters
 try:
@@ -430,6 +431,7 @@ class ExportStep:
         
         return normalized
     
+    @profiled('step', 'export_gather')
     async def _gather_export_data(self, artist_name: str, 
                                 options: Dict[str, Any], 
                                 stats: ExportStats) -> Dict[str, Any]:
@@ -645,6 +647,7 @@ class ExportStep:
         
         return file_paths
     
+    @profiled('step', 'export_format')
     def _export_single_format(self, export_data: Dict[str, Any],
                             format_type: ExportFormat,
                             export_dir: Path,
@@ -253,6 +253,45 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ===== REQUÊTES DES SESSIONS EN CACHE =====
+# Les vues des sessions passent par st.cache_data avec pour clé le chemin de la base
+# et la version des sessions (incrémentée par trigger à chaque écriture) : tant que
+# rien n'est écrit, les reruns ne relisent pas la table.
+
+SESSIONS_PAGE_SIZE = 25
+
+SESSION_STATUS_LABELS = {
+    'PENDING': "En attente",
+    'IN_PROGRESS': "En cours",
+    'PAUSED': "En pause",
+    'COMPLETED': "Terminée",
+    'FAILED': "Échouée",
+    'CANCELLED': "Annulée"
+}
+
+def session_status_label(status) -> str:
+    """Libellé français d'un SessionStatus"""
+    return SESSION_STATUS_LABELS.get(getattr(status, 'name', str(status)), str(status))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def load_session_page(_session_manager, db_path: str, version: int, statuses: tuple,
+                      since: Optional[datetime], artist: str, after: Optional[tuple], limit: int):
+    """Page de sessions filtrée (curseur after) pour une version des sessions"""
+    return _session_manager.query_sessions(list(statuses) or None, since=since, artist=artist or None,
+                                           limit=limit, after=after)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_session_count(_session_manager, db_path: str, version: int, statuses: tuple,
+                       since: Optional[datetime], artist: str) -> int:
+    """Nombre de sessions filtrées pour une version des sessions"""
+    return _session_manager.count_sessions(list(statuses) or None, since=since, artist=artist or None)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_dashboard_stats(_session_manager, db_path: str, version: int,
+                         since: Optional[datetime]) -> Dict[str, Any]:
+    """Agrégats du dashboard (statuts, top artistes, sessions récentes) pour une version des sessions"""
+    return _session_manager.get_dashboard_stats(since=since)
+
 class StreamlitInterface:
     """Interface Streamlit principale"""
     
@@ -345,13 +384,9 @@ class StreamlitInterface:
                 # Statut de la base de données
                 st.success("✅ Base de données connectée")
                 
-                # Sessions actives
-                sessions = st.session_state.session_manager.list_sessions()
-                active_sessions = len([s for s in sessions if s.status == SessionStatus.IN_PROGRESS])
-                st.info(f"🔄 {active_sessions} session(s) active(s)")
-                
                 # Métriques rapides
                 stats = self.get_quick_stats()
+                st.info(f"🔄 {stats.get('active_sessions', 0)} session(s) active(s)")
                 st.metric("Artistes", stats.get('total_artists', 0))
                 st.metric("Morceaux", stats.get('total_tracks', 0))
                 
@@ -456,11 +491,11 @@ class StreamlitInterface:
         col1, col2, col3, col4 = st.columns(4)
         
         stats = self.get_detailed_stats()
+        session_stats = self.get_session_dashboard_stats()
         
         with col1:
             # Nombre de sessions actives
-            active_sessions = len([s for s in st.session_state.session_manager.list_sessions() 
-                                 if s.status == SessionStatus.IN_PROGRESS])
+            active_sessions = session_stats['status_counts'].get(SessionStatus.IN_PROGRESS, 0)
             st.metric("Sessions actives", active_sessions)
         
         with col2:
@@ -481,8 +516,7 @@ class StreamlitInterface:
         
         with col4:
             # Sessions totales
-            total_sessions = len(st.session_state.session_manager.list_sessions())
-            st.metric("Sessions totales", total_sessions)
+            st.metric("Sessions totales", session_stats['total_sessions'])
         
         # Graphiques et statistiques
         col1, col2 = st.columns(2)
@@ -499,8 +533,7 @@ class StreamlitInterface:
         st.subheader("📈 Activité récente")
         
         # Sessions récentes
-        sessions = st.session_state.session_manager.list_sessions()
-        recent_sessions = sorted(sessions, key=lambda s: s.created_at or datetime.min, reverse=True)[:5]
+        recent_sessions = session_stats['recent_sessions']
         
         if recent_sessions:
             st.write("**Dernières sessions:**")
@@ -512,7 +545,7 @@ class StreamlitInterface:
                     SessionStatus.PAUSED: "⏸️"
                 }.get(session.status, "❓")
                 
-                st.write(f"{status_color} **{session.artist_name}** - {session.status.value}")
+                st.write(f"{status_color} **{session.artist_name}** - {session_status_label(session.status)}")
         else:
             st.info("Aucune session récente. Commencez par une nouvelle extraction !")
         
@@ -1394,7 +1427,7 @@ class StreamlitInterface:
         st.header("📝 Gestion des sessions")
         
         # Filtres
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             status_filter = st.selectbox(
@@ -1409,18 +1442,33 @@ class StreamlitInterface:
             )
         
         with col3:
+            artist_filter = st.text_input("Artiste", placeholder="Filtrer par nom...").strip()
+        
+        with col4:
             if st.button("🔄 Actualiser les sessions"):
                 st.rerun()
         
+        # Pagination par curseur : pile des curseurs des pages visitées, remise à zéro
+        # quand les filtres changent
+        filters = (status_filter, date_filter, artist_filter)
+        if st.session_state.get('sessions_filters') != filters:
+            st.session_state.sessions_filters = filters
+            st.session_state.sessions_page_cursors = [None]
+        cursors = st.session_state.sessions_page_cursors
+        
         # Liste des sessions avec actions
-        sessions = self.get_filtered_sessions(status_filter, date_filter)
+        sessions, next_cursor = self.get_filtered_sessions(status_filter, date_filter, artist_filter,
+                                                           after=cursors[-1])
         
         if not sessions:
             st.info("Aucune session trouvée avec ces critères.")
             return
         
         # Affichage des sessions avec actions individuelles
-        st.subheader(f"📋 {len(sessions)} session(s) trouvée(s)")
+        total_sessions = self.count_filtered_sessions(status_filter, date_filter, artist_filter)
+        first_index = (len(cursors) - 1) * SESSIONS_PAGE_SIZE
+        st.subheader(f"📋 {total_sessions} session(s) trouvée(s)")
+        st.caption(f"Page {len(cursors)} - sessions {first_index + 1} à {first_index + len(sessions)}")
         
         for i, session in enumerate(sessions):
             with st.container():
@@ -1439,7 +1487,7 @@ class StreamlitInterface:
                         SessionStatus.PAUSED: "⏸️"
                     }.get(session.status, "❓")
                     
-                    st.write(f"{status_emoji} {session.status.value.replace('_', ' ').title()}")
+                    st.write(f"{status_emoji} {session_status_label(session.status)}")
                     if session.current_step:
                         st.caption(session.current_step)
                 
@@ -1472,15 +1520,30 @@ class StreamlitInterface:
                 
                 st.markdown("---")
         
+        # Navigation entre les pages
+        nav_col1, nav_col2 = st.columns(2)
+        with nav_col1:
+            if len(cursors) > 1 and st.button("⬅️ Page précédente"):
+                cursors.pop()
+                st.rerun()
+        with nav_col2:
+            if next_cursor and st.button("Page suivante ➡️"):
+                cursors.append(next_cursor)
+                st.rerun()
+        
         # Affichage des détails de session si demandé (en pleine largeur)
         if st.session_state.get('show_session_details'):
-            session_to_show = next((s for s in sessions if s.id == st.session_state.show_session_details), None)
+            session_id = st.session_state.show_session_details
+            session_to_show = (next((s for s in sessions if s.id == session_id), None)
+                               or st.session_state.session_manager.get_session(session_id))
             if session_to_show:
                 self.render_session_details_fullwidth(session_to_show)
         
         # Affichage de la confirmation de suppression si demandé (en pleine largeur)
         if st.session_state.get('confirm_delete_session'):
-            session_to_delete = next((s for s in sessions if s.id == st.session_state.confirm_delete_session), None)
+            session_id = st.session_state.confirm_delete_session
+            session_to_delete = (next((s for s in sessions if s.id == session_id), None)
+                                 or st.session_state.session_manager.get_session(session_id))
             if session_to_delete:
                 self.render_delete_confirmation_fullwidth(session_to_delete)
         
@@ -1491,7 +1554,7 @@ class StreamlitInterface:
                 session_data.append({
                     "ID": session.id[:8] + "...",
                     "Artiste": session.artist_name,
-                    "Statut": session.status.value,
+                    "Statut": session_status_label(session.status),
                     "Morceaux": f"{session.tracks_processed}/{session.total_tracks_found}" if session.total_tracks_found > 0 else "N/A",
                     "Créé le": session.created_at.strftime("%d/%m/%Y %H:%M") if session.created_at else "N/A"
                 })
@@ -2716,7 +2779,7 @@ class StreamlitInterface:
             st.metric("Exports créés", system_stats.get('exports_count', 0))
         
         with col4:
-            st.metric("Sessions totales", len(st.session_state.session_manager.list_sessions()))
+            st.metric("Sessions totales", self.get_session_dashboard_stats()['total_sessions'])
         
         # Actions de maintenance
         st.subheader("🧹 Maintenance")
@@ -2782,8 +2845,8 @@ class StreamlitInterface:
         """Récupère les statistiques rapides avec gestion d'erreurs"""
         try:
             # Statistiques de sessions
-            sessions = st.session_state.session_manager.list_sessions()
-            active_sessions = len([s for s in sessions if s.status == SessionStatus.IN_PROGRESS])
+            session_stats = self.get_session_dashboard_stats()
+            active_sessions = session_stats['status_counts'].get(SessionStatus.IN_PROGRESS, 0)
             
             # Statistiques de base de données - avec vérification des méthodes
             total_artists = 0
@@ -2820,7 +2883,7 @@ class StreamlitInterface:
                 'active_sessions': active_sessions,
                 'total_artists': total_artists,
                 'total_tracks': total_tracks,
-                'total_sessions': len(sessions)
+                'total_sessions': session_stats['total_sessions']
             }
         except Exception as e:
             print(f"Erreur dans get_quick_stats: {e}")
@@ -2829,14 +2892,7 @@ class StreamlitInterface:
     def get_detailed_stats(self) -> Dict[str, Any]:
         """Récupère les statistiques détaillées"""
         try:
-            sessions = st.session_state.session_manager.list_sessions()
-            
-            # Calculs temporels
-            now = datetime.now()
-            week_ago = now - timedelta(days=7)
-            
-            sessions_this_week = len([s for s in sessions 
-                                    if s.created_at and s.created_at >= week_ago])
+            sessions_this_week = self.get_session_dashboard_stats()['sessions_since']
             
             # Statistiques de base
             quick_stats = self.get_quick_stats()
@@ -2862,13 +2918,12 @@ class StreamlitInterface:
     def render_sessions_chart(self):
         """Affiche le graphique des sessions par statut"""
         try:
-            sessions = st.session_state.session_manager.list_sessions()
-            
-            # Compter par statut
-            status_counts = {}
-            for session in sessions:
-                status_name = session.status.value.replace('_', ' ').title()
-                status_counts[status_name] = status_counts.get(status_name, 0) + 1
+            # Comptes par statut agrégés en SQL
+            status_counts = {
+                session_status_label(status): count
+                for status, count in self.get_session_dashboard_stats()['status_counts'].items()
+                if count
+            }
             
             if status_counts:
                 data = {
@@ -2893,17 +2948,10 @@ class StreamlitInterface:
     def render_top_artists_chart(self):
         """Affiche le graphique des top artistes"""
         try:
-            sessions = st.session_state.session_manager.list_sessions()
-            
-            # Compter les morceaux par artiste
-            artist_tracks = {}
-            for session in sessions:
-                if session.total_tracks_found > 0:
-                    artist_tracks[session.artist_name] = session.total_tracks_found
+            # Top 5 artistes (morceaux trouvés), agrégé en SQL
+            top_artists = self.get_session_dashboard_stats()['top_artists']
             
-            if artist_tracks:
-                # Top 5 artistes
-                top_artists = sorted(artist_tracks.items(), key=lambda x: x[1], reverse=True)[:5]
+            if top_artists:
                 
                 data = {
                     'Artiste': [item[0] for item in top_artists],
@@ -2926,34 +2974,56 @@ class StreamlitInterface:
         except Exception as e:
             st.error(f"Erreur génération graphique: {e}")
     
-    def get_filtered_sessions(self, status_filter: str, date_filter: str) -> List:
-        """Filtre les sessions selon les critères"""
-        all_sessions = st.session_state.session_manager.list_sessions()
-        
-        # Filtre par statut
-        if status_filter != "Tous":
-            status_map = {
-                "En cours": SessionStatus.IN_PROGRESS,
-                "Terminées": SessionStatus.COMPLETED,
-                "Échouées": SessionStatus.FAILED,
-                "En pause": SessionStatus.PAUSED
-            }
-            if status_filter in status_map:
-                all_sessions = [s for s in all_sessions if s.status == status_map[status_filter]]
+    def _sessions_cache_key(self) -> tuple:
+        """(gestionnaire, chemin de la base, version des sessions) pour les accesseurs en cache"""
+        session_manager = st.session_state.session_manager
+        return session_manager, str(session_manager.db.db_path), session_manager.get_sessions_version()
+    
+    def _period_start(self, date_filter: str) -> Optional[datetime]:
+        """
+        Début de la période filtrée, en heure locale.
         
-        # Filtre par date
-        now = datetime.now()
+        Arrondi à la minute pour que la clé de cache reste stable entre deux reruns.
+        """
+        now = datetime.now().astimezone().replace(second=0, microsecond=0)
         if date_filter == "Aujourd'hui":
-            cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            all_sessions = [s for s in all_sessions if s.created_at and s.created_at >= cutoff]
+            return now.replace(hour=0, minute=0)
         elif date_filter == "Cette semaine":
-            cutoff = now - timedelta(days=7)
-            all_sessions = [s for s in all_sessions if s.created_at and s.created_at >= cutoff]
+            return now - timedelta(days=7)
         elif date_filter == "Ce mois":
-            cutoff = now - timedelta(days=30)
-            all_sessions = [s for s in all_sessions if s.created_at and s.created_at >= cutoff]
+            return now - timedelta(days=30)
+        return None
+    
+    def _session_query_filters(self, status_filter: str, date_filter: str, artist_filter: str) -> tuple:
+        """Traduit les filtres de l'interface en (statuts, depuis, artiste)"""
+        status_map = {
+            "En cours": SessionStatus.IN_PROGRESS,
+            "Terminées": SessionStatus.COMPLETED,
+            "Échouées": SessionStatus.FAILED,
+            "En pause": SessionStatus.PAUSED
+        }
+        statuses = (status_map[status_filter],) if status_filter in status_map else ()
+        return statuses, self._period_start(date_filter), artist_filter
+    
+    def get_session_dashboard_stats(self) -> Dict[str, Any]:
+        """Agrégats des sessions du dashboard, en cache jusqu'à la prochaine écriture"""
+        return load_dashboard_stats(*self._sessions_cache_key(), self._period_start("Cette semaine"))
+    
+    def get_filtered_sessions(self, status_filter: str, date_filter: str, artist_filter: str = "",
+                              after: Optional[tuple] = None) -> tuple:
+        """
+        Page de sessions selon les critères, la plus récemment mise à jour en premier.
         
-        return sorted(all_sessions, key=lambda x: x.updated_at or datetime.min, reverse=True)
+        Returns:
+            (sessions de la page, curseur de la page suivante ou None)
+        """
+        filters = self._session_query_filters(status_filter, date_filter, artist_filter)
+        return load_session_page(*self._sessions_cache_key(), *filters, after, SESSIONS_PAGE_SIZE)
+    
+    def count_filtered_sessions(self, status_filter: str, date_filter: str, artist_filter: str = "") -> int:
+        """Nombre total de sessions selon les critères"""
+        filters = self._session_query_filters(status_filter, date_filter, artist_filter)
+        return load_session_count(*self._sessions_cache_key(), *filters)
     
     def show_sessions_stats(self, sessions):
         """Affiche les statistiques détaillées des sessions"""
@@ -3062,12 +3132,11 @@ class StreamlitInterface:
         
         # Sessions échouées récentes
         try:
-            failed_sessions = [s for s in st.session_state.session_manager.list_sessions() 
-                             if s.status == SessionStatus.FAILED]
+            failed_sessions = self.get_session_dashboard_stats()['status_counts'].get(SessionStatus.FAILED, 0)
             if failed_sessions:
                 alerts.append({
                     'type': 'warning',
-                    'message': f'{len(failed_sessions)} session(s) échouée(s) récemment',
+                    'message': f'{failed_sessions} session(s) échouée(s) récemment',
                     'action': 'Voir Sessions pour plus de détails'
                 })
         except:
@@ -0,0 +1,91 @@
+# tests/test_discovery_dedup.py
+"""
+Déduplication de la découverte : l'index inversé (_DedupIndex) doit retenir
+exactement les mêmes morceaux que la comparaison exhaustive par paires qu'il
+remplace, sur un jeu de morceaux enregistré (tests/fixtures).
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault('MDE_DATA_DIR', tempfile.mkdtemp(prefix='mde_tests_'))
+
+import pytest
+
+from models.entities import Track
+from models.enums import DataSource
+from steps.step1_discover import DiscoveryStats, DiscoveryStep
+from utils.record_linkage import blocking_keys
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+def _make_step(similarity_threshold=None) -> DiscoveryStep:
+    """DiscoveryStep sans découvreurs ni base : seule la déduplication est utilisée"""
+    step = DiscoveryStep.__new__(DiscoveryStep)
+    step.logger = logging.getLogger(__name__)
+    step.genius_discovery = None
+    step.rapedia_scraper = None
+    step.config = step._load_optimized_config()
+    if similarity_threshold is not None:
+        step.config['similarity_threshold'] = similarity_threshold
+    return step
+
+
+def _load_tracks():
+    with open(FIXTURES_DIR / 'discovery_tracks.json', encoding='utf-8') as f:
+        fixture = json.load(f)
+    return [
+        Track(title=entry['title'], artist_name=entry['artist_name'], source=DataSource(entry['source']))
+        for entry in fixture['tracks']
+    ]
+
+
+def _pairwise_deduplicate(step: DiscoveryStep, tracks):
+    """Implémentation historique : chaque morceau comparé à tous les morceaux retenus"""
+    source_priority = {DataSource.GENIUS: 1, DataSource.RAPEDIA: 2, DataSource.UNKNOWN: 3}
+    unique_tracks, seen_signatures = [], set()
+
+    for track in sorted(tracks, key=lambda t: source_priority.get(t.source, 999)):
+        signature = step._generate_track_signature(track)
+        if signature in seen_signatures:
+            continue
+        is_duplicate = any(
+            step._calculate_track_similarity(track.title, existing.title,
+                                             track.artist_name, existing.artist_name)
+            >= step.config['similarity_threshold']
+            for existing in unique_tracks
+        )
+        if not is_duplicate:
+            unique_tracks.append(track)
+            seen_signatures.add(signature)
+    return unique_tracks
+
+
+# Seuils de production (discovery.similarity_threshold vaut 0.85 par défaut). Plus bas,
+# la comparaison exhaustive fusionnait des titres sans mot commun sur un simple
+# suffixe partagé ("La pluie - Live" / "Dégaine - Live"), ce que l'index ne reproduit pas
+@pytest.mark.parametrize('threshold', [0.85, 0.9, 0.95])
+def test_index_matches_pairwise_deduplication(threshold):
+    step = _make_step(threshold)
+    tracks = _load_tracks()
+
+    expected = _pairwise_deduplicate(step, tracks)
+    stats = DiscoveryStats()
+    result = step._deduplicate_tracks(tracks, stats)
+
+    assert [id(track) for track in result] == [id(track) for track in expected]
+    assert stats.duplicates_removed == len(tracks) - len(expected)
+    # Le jeu contient des variantes : la déduplication doit réellement agir
+    assert 0 < len(expected) < len(tracks)
+
+
+def test_blocking_keys_skip_stopwords():
+    # Mots vides ignorés, préfixe du titre sans espaces conservé
+    assert blocking_keys("La vie de la rue") == {'vie', 'rue', 'lavi'}
+    assert blocking_keys("Bâtiment (feat. Nekfeu)") == {'bati', 'nekf'}
+    assert blocking_keys("Mavie") & blocking_keys("Ma vie")
+    assert blocking_keys("Le la") == {'lela'}
@@ -0,0 +1,28 @@
+# tests/test_import_budget.py
+"""
+Budget d'import : les packages doivent rester légers à l'import à froid
+(chargement paresseux des extracteurs, aucune dépendance lourde importée).
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault('MDE_DATA_DIR', tempfile.mkdtemp(prefix='mde_tests_'))
+
+from utils.lazy_import import check_import_budget
+
+
+def test_packages_within_import_budget():
+    report = check_import_budget()
+
+    failures = {
+        name: {
+            'success': result['success'],
+            'import_seconds': result['import_seconds'],
+            'budget_seconds': result['budget_seconds'],
+            'heavy_modules_loaded': result['heavy_modules_loaded'],
+        }
+        for name, result in report['results'].items()
+        if not result['passed']
+    }
+    assert report['passed'], f"Budget d'import dépassé : {failures}"
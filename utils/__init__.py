@@ -4,9 +4,12 @@ Module utilitaires pour Music Data Extractor.
 Fonctions helper, exports, manipulation de texte et configuration de logging.
 """
 
+import importlib
 import logging
 from functools import lru_cache
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from .lazy_import import LazyImporter
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -19,7 +22,7 @@ _available_modules = {}
 def _safe_import_utility(util_name: str, module_name: str, items: List[str]) -> bool:
     """Import sécurisé d'un module utilitaire avec gestion d'erreurs"""
     try:
-        module = __import__(f".{module_name}", package=__name__, fromlist=items)
+        module = importlib.import_module(f".{module_name}", package=__name__)
         
         imported_items = []
         for item_name in items:
@@ -72,29 +75,57 @@ def _safe_import_utility(util_name: str, module_name: str, items: List[str]) ->
         logger.error(f"❌ {error_msg}")
         return False
 
-# ===== IMPORTS SÉCURISÉS DES MODULES UTILITAIRES =====
+# ===== IMPORTS DIFFÉRÉS DES MODULES UTILITAIRES =====
+# Chaque module n'est importé qu'au premier accès à l'un de ses noms (PEP 562)
+
+_lazy = LazyImporter(__name__, _safe_import_utility)
+
+def _register_utility(util_name: str, module_name: str, items: List[str]) -> None:
+    """Déclare un module utilitaire à importer au premier accès"""
+    _lazy.register(util_name, items, util_name, module_name, items)
 
 # Import des fonctions de manipulation de texte
-_text_utils_imported = _safe_import_utility(
-    "text_utils", 
-    "text_utils", 
+_register_utility(
+    "text_utils",
+    "text_utils",
     [
         'clean_artist_name', 'normalize_title', 'extract_featured_artists_from_title',
         'parse_artist_list', 'clean_album_title', 'detect_language', 'similarity_ratio',
-        'validate_artist_name', 'normalize_text', 'clean_text', 'extract_parenthetical_info',
+        'calculate_similarity', 'validate_artist_name', 'normalize_text', 'clean_text', 'extract_parenthetical_info',
         'remove_special_chars', 'split_featured_artists', 'normalize_featuring'
     ]
 )
 
+# Import du noyau de similarité
+_register_utility(
+    "similarity",
+    "similarity",
+    ['similarity', 'score_many', 'extract', 'extract_one', 'cdist', 'get_backend', 'set_backend']
+)
+
+# Import du moteur de rapprochement d'enregistrements
+_register_utility(
+    "record_linkage",
+    "record_linkage",
+    ['link_records', 'find_best_match', 'score_records']
+)
+
+# Import de l'automate de mots-clés
+_register_utility(
+    "keyword_matcher",
+    "keyword_matcher",
+    ['KeywordMatcher']
+)
+
 # Import du gestionnaire d'exports
-_export_utils_imported = _safe_import_utility(
+_register_utility(
     "export_utils",
     "export_utils",
     ['ExportManager', 'export_all_formats', 'cleanup_old_exports']
 )
 
 # Import de la configuration de logging
-_logging_config_imported = _safe_import_utility(
+_register_utility(
     "logging_config",
     "logging_config",
     [
@@ -104,38 +135,67 @@ _logging_config_imported = _safe_import_utility(
 )
 
 # Import des utilitaires de validation (si disponibles)
-_validation_utils_imported = _safe_import_utility(
+_register_utility(
     "validation_utils",
     "validation_utils",
     ['validate_url', 'validate_email', 'sanitize_filename', 'check_file_permissions']
 )
 
 # Import des utilitaires de performance (si disponibles)
-_performance_utils_imported = _safe_import_utility(
+_register_utility(
     "performance_utils",
     "performance_utils",
     ['profile_function', 'measure_time', 'memory_usage', 'benchmark']
 )
 
+# Import de l'instrumentation des chemins chauds
+_register_utility(
+    "profiling",
+    "profiling",
+    ['span', 'profiled', 'enable_profiling', 'disable_profiling', 'get_profile_report', 'export_profile']
+)
+
+# Import du chargement différé et du benchmark d'import
+_register_utility(
+    "lazy_import",
+    "lazy_import",
+    ['LazyImporter', 'measure_import_time', 'check_import_budget']
+)
+
+def __getattr__(name: str) -> Any:
+    """Import différé d'un utilitaire à son premier accès"""
+    return _lazy.resolve(name, globals())
+
+def __dir__() -> List[str]:
+    return _lazy.dir(globals())
+
+def _load_all_utils() -> None:
+    """Importe tous les modules utilitaires (listes et diagnostics complets)"""
+    _lazy.load_all()
+
 # ===== FONCTIONS UTILITAIRES PUBLIQUES =====
 
 @lru_cache(maxsize=1)
 def get_available_utils() -> List[str]:
     """Retourne la liste des utilitaires disponibles - avec cache"""
+    _load_all_utils()
     return sorted(__all__)
 
 @lru_cache(maxsize=1)
 def get_available_modules() -> Dict[str, Dict[str, Any]]:
     """Retourne les informations sur les modules disponibles"""
+    _load_all_utils()
     return _available_modules.copy()
 
 @lru_cache(maxsize=1)
 def get_import_errors() -> Dict[str, str]:
     """Retourne les erreurs d'import pour diagnostic"""
+    _load_all_utils()
     return _import_errors.copy()
 
 def get_utils_status() -> Dict[str, Any]:
     """Retourne le statut complet du module utils"""
+    _load_all_utils()
     total_modules = len(_available_modules)
     successful_modules = len([m for m in _available_modules.values() if m['status'] == 'success'])
     success_rate = (successful_modules / max(total_modules, 1)) * 100
@@ -154,6 +214,7 @@ def get_utils_status() -> Dict[str, Any]:
 def list_text_utils() -> List[str]:
     """Liste les fonctions de manipulation de texte disponibles"""
     text_funcs = []
+    _lazy.load('text_utils')
     if 'text_utils' in _available_modules:
         text_funcs = _available_modules['text_utils']['items']
     return text_funcs
@@ -161,6 +222,7 @@ def list_text_utils() -> List[str]:
 def list_export_utils() -> List[str]:
     """Liste les utilitaires d'export disponibles"""
     export_funcs = []
+    _lazy.load('export_utils')
     if 'export_utils' in _available_modules:
         export_funcs = _available_modules['export_utils']['items']
     return export_funcs
@@ -168,6 +230,7 @@ def list_export_utils() -> List[str]:
 def list_logging_utils() -> List[str]:
     """Liste les utilitaires de logging disponibles"""
     logging_funcs = []
+    _lazy.load('logging_config')
     if 'logging_config' in _available_modules:
         logging_funcs = _available_modules['logging_config']['items']
     return logging_funcs
@@ -181,6 +244,8 @@ def run_utils_diagnostics() -> Dict[str, Any]:
     Returns:
         Rapport de diagnostic détaillé
     """
+    _load_all_utils()
+    
     diagnostics = {
         'module_info': {
             'total_functions': len(__all__),
@@ -250,6 +315,7 @@ def validate_utils_setup() -> Tuple[bool, List[str]]:
         Tuple (configuration_valide, liste_problèmes)
     """
     issues = []
+    _load_all_utils()
     
     # Vérifier que les utilitaires critiques sont disponibles
     critical_utils = ['text_utils', 'export_utils', 'logging_config']
@@ -271,17 +337,19 @@ def validate_utils_setup() -> Tuple[bool, List[str]]:
 
 def quick_text_clean(text: str) -> str:
     """Fonction de convenance pour nettoyage rapide de texte"""
-    if 'normalize_text' in globals():
-        return normalize_text(text)
+    normalize = _lazy.get('normalize_text', globals())
+    if normalize is not None:
+        return normalize(text)
     else:
         # Fallback basique si text_utils n'est pas disponible
         return text.strip() if text else ""
 
 def quick_export(data: Any, format_type: str = "json", filename: Optional[str] = None) -> Optional[str]:
     """Fonction de convenance pour export rapide"""
-    if 'ExportManager' in globals():
+    export_manager_class = _lazy.get('ExportManager', globals())
+    if export_manager_class is not None:
         try:
-            manager = ExportManager()
+            manager = export_manager_class()
             return manager.export_data(data, format_type, filename)
         except Exception as e:
             logger.error(f"Erreur export rapide: {e}")
@@ -308,10 +376,9 @@ def get_text_utils_help() -> str:
 
 # ===== LOGGING ET INITIALISATION =====
 
-logger.info(f"Module utils initialisé - {len(__all__)} fonctions disponibles")
-
-if _import_errors:
-    logger.warning(f"⚠️ Erreurs d'import détectées: {list(_import_errors.keys())}")
+# Les modules sont importés à la demande : les erreurs d'import éventuelles
+# sont journalisées au premier accès et exposées par get_import_errors()
+logger.debug(f"Module utils initialisé - {len(_lazy.names())} fonctions déclarées (import différé)")
 
 # ===== EXEMPLES D'UTILISATION =====
 """
@@ -6,9 +6,10 @@ Supporte JSON, CSV, Excel, HTML et XML avec optimisations de performance.
 
 import json
 import csv
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 from functools import lru_cache
@@ -23,7 +24,7 @@ except ImportError:
 from config.settings import settings
 from models.entities import Artist, Track, Album, Credit
 from models.enums import ExportFormat
-from core.exceptions import ExportError, ExportPermissionError, ExportFormatError
+from core.exceptions import ExportError, ExportFormatError
 
 class ExportManager:
     """
@@ -0,0 +1,154 @@
+# utils/keyword_matcher.py
+"""
+Recherche multi-motifs de mots-clés classés par catégories.
+
+Tous les mots-clés de toutes les catégories sont trouvés en un seul passage
+sur le texte :
+- mode sous-chaîne : automate Aho-Corasick (occurrences chevauchantes
+  comprises, ex: "bass" et "basse" dans "basse électrique")
+- mode mot entier : une seule expression régulière d'alternance compilée
+"""
+
+import re
+from collections import Counter, deque
+from typing import Dict, List, Iterable, Iterator, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Automate de recherche de mots-clés partagé par les processeurs de texte
+    (thèmes et contenu explicite des paroles, rôles des crédits).
+
+    Args:
+        keyword_groups: Catégorie -> mots-clés (un mot-clé peut appartenir à
+            plusieurs catégories)
+        whole_words: Ne retenir que les occurrences délimitées comme des mots
+        case_sensitive: Respecter la casse (sinon texte et mots-clés en minuscules)
+    """
+
+    def __init__(self, keyword_groups: Dict[str, Iterable[str]], whole_words: bool = False,
+                 case_sensitive: bool = False):
+        self.whole_words = whole_words
+        self.case_sensitive = case_sensitive
+
+        # Mot-clé -> catégories
+        self.keyword_categories: Dict[str, Tuple[str, ...]] = {}
+        for category, keywords in keyword_groups.items():
+            for keyword in keywords:
+                keyword = self._fold(keyword)
+                if not keyword:
+                    continue
+                categories = self.keyword_categories.get(keyword, ())
+                if category not in categories:
+                    self.keyword_categories[keyword] = categories + (category,)
+
+        self._pattern: Optional[re.Pattern] = None
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._outputs: List[Tuple[str, ...]] = []
+
+        if whole_words:
+            self._build_regex()
+        else:
+            self._build_automaton()
+
+    def __len__(self) -> int:
+        return len(self.keyword_categories)
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    # ===== CONSTRUCTION =====
+
+    def _build_regex(self):
+        """Alternance unique, mots-clés les plus longs en premier"""
+        keywords = sorted(self.keyword_categories, key=lambda keyword: (-len(keyword), keyword))
+        if keywords:
+            alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+            self._pattern = re.compile(r'\b(?:' + alternation + r')\b')
+
+    def _build_automaton(self):
+        """Construit l'automate Aho-Corasick (trie + liens d'échec)"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[str]] = [[]]
+
+        for keyword in self.keyword_categories:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword)
+
+        # Liens d'échec en largeur ; les sorties héritent de celles du lien
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+
+    # ===== RECHERCHE =====
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Parcourt le texte une seule fois.
+
+        Yields:
+            (position de début, mot-clé) pour chaque occurrence
+        """
+        if not text or not self.keyword_categories:
+            return
+
+        text = self._fold(text)
+
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                yield match.start(), match.group()
+            return
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in outputs[state]:
+                yield position - len(keyword) + 1, keyword
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Toutes les occurrences de mots-clés, dans l'ordre du texte"""
+        if self._pattern is not None:
+            return self._pattern.findall(self._fold(text)) if text else []
+        return [keyword for _, keyword in self.iter_matches(text)]
+
+    def match_categories(self, text: str) -> Dict[str, List[str]]:
+        """
+        Occurrences regroupées par catégorie.
+
+        Returns:
+            Catégorie -> mots-clés trouvés (une entrée par occurrence)
+        """
+        hits: Dict[str, List[str]] = {}
+        for keyword, count in Counter(self.find_keywords(text)).items():
+            for category in self.keyword_categories[keyword]:
+                hits.setdefault(category, []).extend([keyword] * count)
+        return hits
+
+    def present_keywords(self, text: str) -> Set[str]:
+        """Ensemble des mots-clés présents dans le texte"""
+        return set(self.find_keywords(text))
@@ -0,0 +1,216 @@
+# utils/lazy_import.py
+"""
+Imports différés des sous-modules d'un package (PEP 562).
+
+Le package déclare ses noms publics sans importer les sous-modules ; le
+sous-module n'est chargé qu'au premier accès à l'un de ses noms via le
+__getattr__ du module. Les dépendances lourdes (selenium, librosa/numpy,
+pandas, BeautifulSoup) ne sont ainsi importées que par le code qui s'en sert.
+
+Usage dans un __init__.py:
+
+    _lazy = LazyImporter(__name__, _safe_import)
+    _lazy.register('genius_scraper', ['GeniusWebScraper'])
+
+    def __getattr__(name):
+        return _lazy.resolve(name, globals())
+
+    def __dir__():
+        return _lazy.dir(globals())
+"""
+
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+
+class LazyImporter:
+    """
+    Registre des imports différés d'un package.
+
+    Chaque sous-module est importé au plus une fois par le loader du package
+    (son _safe_import habituel), qui reste responsable des statistiques et
+    diagnostics d'import.
+
+    Args:
+        package: Nom du package (__name__)
+        loader: Fonction d'import du package, appelée avec les arguments
+            enregistrés (par défaut: nom du module, liste des noms)
+    """
+
+    def __init__(self, package: str, loader: Callable[..., Any]):
+        self.package = package
+        self._loader = loader
+        self._modules: Dict[str, Tuple[Any, ...]] = {}
+        self._names: Dict[str, str] = {}
+        self._results: Dict[str, Any] = {}
+        self._loading: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def register(self, module_key: str, names: Sequence[str], *loader_args: Any) -> None:
+        """
+        Déclare un sous-module et les noms qu'il fournit.
+
+        Args:
+            module_key: Identifiant du sous-module dans le package
+            names: Noms publics fournis par le sous-module
+            *loader_args: Arguments du loader (défaut: module_key, names)
+        """
+        self._modules[module_key] = loader_args or (module_key, list(names))
+        for name in names:
+            self._names.setdefault(name, module_key)
+
+    def names(self) -> List[str]:
+        """Noms déclarés, chargés ou non"""
+        return list(self._names)
+
+    def is_loaded(self, module_key: str) -> bool:
+        """Indique si l'import du sous-module a déjà été tenté"""
+        return module_key in self._results
+
+    def load(self, module_key: str) -> Any:
+        """Importe le sous-module (une seule tentative) et retourne le résultat du loader"""
+        if module_key in self._results:
+            return self._results[module_key]
+
+        with self._lock:
+            # Accès réentrant pendant l'import du sous-module (import circulaire)
+            if module_key in self._loading:
+                return None
+            if module_key not in self._results:
+                self._loading.add(module_key)
+                try:
+                    self._results[module_key] = self._loader(*self._modules[module_key])
+                finally:
+                    self._loading.discard(module_key)
+        return self._results[module_key]
+
+    def load_all(self) -> None:
+        """Importe tous les sous-modules déclarés (diagnostics, listes complètes)"""
+        for module_key in self._modules:
+            self.load(module_key)
+
+    def resolve(self, name: str, namespace: Dict[str, Any]) -> Any:
+        """
+        Résout un nom pour le __getattr__ du package.
+
+        Raises:
+            AttributeError: Nom inconnu ou sous-module indisponible
+        """
+        module_key = self._names.get(name)
+        if module_key is not None:
+            self.load(module_key)
+            if name in namespace:
+                return namespace[name]
+        raise AttributeError(f"module {self.package!r} has no attribute {name!r}")
+
+    def get(self, name: str, namespace: Dict[str, Any], default: Any = None) -> Any:
+        """Comme resolve, avec une valeur par défaut si le nom est indisponible"""
+        try:
+            return namespace[name] if name in namespace else self.resolve(name, namespace)
+        except AttributeError:
+            return default
+
+    def dir(self, namespace: Dict[str, Any]) -> List[str]:
+        """Contenu de dir() du package, noms différés compris"""
+        return sorted(set(namespace) | set(self._names))
+
+
+# ===== BENCHMARK =====
+
+def measure_import_time(module_name: str, runs: int = 3) -> Dict[str, Any]:
+    """
+    Mesure le temps d'import à froid d'un module dans un interpréteur neuf
+    (python -X importtime).
+
+    Args:
+        module_name: Module à importer (ex: 'extractors')
+        runs: Nombre d'exécutions (la meilleure est retenue)
+
+    Returns:
+        Temps total, modules les plus coûteux et dépendances lourdes chargées
+    """
+    import subprocess
+    from pathlib import Path
+
+    project_root = Path(__file__).resolve().parent.parent
+    heavy_modules = ('selenium', 'librosa', 'numpy', 'pandas', 'bs4', 'spotipy', 'streamlit')
+
+    best: Optional[Dict[str, Any]] = None
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+            cwd=str(project_root), capture_output=True, text=True
+        )
+        wall_time = time.perf_counter() - start
+
+        cumulative: Dict[str, int] = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            parts = line[len('import time:'):].split('|')
+            try:
+                cumulative[parts[2].strip()] = int(parts[1])
+            except (IndexError, ValueError):
+                continue
+
+        result = {
+            'module': module_name,
+            'success': completed.returncode == 0,
+            'wall_seconds': round(wall_time, 4),
+            'import_seconds': round(cumulative.get(module_name, 0) / 1e6, 4),
+            'modules_loaded': len(cumulative),
+            'heavy_modules_loaded': sorted(name for name in heavy_modules if name in cumulative),
+            'slowest_imports': sorted(
+                ((name, round(micros / 1e6, 4)) for name, micros in cumulative.items()),
+                key=lambda item: -item[1]
+            )[:10]
+        }
+        if best is None or result['wall_seconds'] < best['wall_seconds']:
+            best = result
+
+    return best
+
+
+def check_import_budget(budgets: Optional[Dict[str, float]] = None, runs: int = 3) -> Dict[str, Any]:
+    """
+    Contrôle de non-régression du temps d'import des packages.
+
+    Un package dépasse son budget si son import à froid est plus lent que
+    prévu ou s'il charge une dépendance lourde.
+
+    Args:
+        budgets: Package -> temps d'import maximal en secondes
+        runs: Exécutions par package
+
+    Returns:
+        Rapport {'passed': bool, 'results': {...}}
+    """
+    budgets = budgets or {
+        'utils': 0.3,
+        'discovery': 0.3,
+        'steps': 0.3,
+        'extractors': 0.3,
+        'extractors.web_scrapers': 0.3,
+        'extractors.api_extractors': 0.3,
+        'extractors.text_processors': 0.3,
+        'extractors.data_enrichers': 0.3
+    }
+
+    results = {}
+    for module_name, budget in budgets.items():
+        measure = measure_import_time(module_name, runs)
+        measure['budget_seconds'] = budget
+        measure['passed'] = (
+            measure['success']
+            and measure['import_seconds'] <= budget
+            and not measure['heavy_modules_loaded']
+        )
+        results[module_name] = measure
+
+    return {
+        'passed': all(result['passed'] for result in results.values()),
+        'results': results
+    }
@@ -2,28 +2,180 @@
 """
 Configuration optimisée du système de logging pour Music Data Extractor.
 Gestion des logs par session, niveaux configurables et nettoyage automatique.
+
+Les loggers n'écrivent pas eux-mêmes : un QueueHandler dépose les
+enregistrements dans une file bornée, et un unique thread (QueueListener)
+les formate, les aiguille vers le fichier de leur logger et vide les
+fichiers par lots. Une file pleine fait perdre les enregistrements de
+faible niveau (comptés) plutôt que de bloquer l'extraction.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from functools import lru_cache
 import threading
 import json
 
 from config.settings import settings
 
+# ===== PIPELINE ASYNCHRONE =====
+
+class _DeferredFlushMixin:
+    """Handler dont le vidage est laissé au listener (un vidage par lot, pas par ligne)"""
+    
+    def flush(self):
+        pass
+    
+    def flush_now(self):
+        super().flush()
+
+
+class BatchedRotatingFileHandler(_DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler vidé par lots"""
+
+
+class BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """StreamHandler (console) vidé par lots"""
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler sur file bornée.
+    
+    File pleine : les enregistrements WARNING et plus attendent au plus
+    block_timeout secondes, les autres sont perdus immédiatement ; les
+    pertes sont comptées par niveau.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, block_timeout: float = 0.5):
+        super().__init__(log_queue)
+        self.block_timeout = block_timeout
+        self.dropped: Dict[str, int] = {}
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Seul le message est figé ici (les arguments peuvent changer après
+        # l'appel) ; le formatage complet se fait dans le thread du listener.
+        # Pas de copie : les loggers routés n'ont que ce handler.
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.message = f"{record.message}\n{record.exc_text}"
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+
+class _RoutingHandler(logging.Handler):
+    """Aiguille, dans le thread du listener, chaque enregistrement vers les handlers de son logger"""
+    
+    def __init__(self):
+        super().__init__()
+        self._routes: Dict[str, List[logging.Handler]] = {}
+        self._resolved: Dict[str, List[logging.Handler]] = {}
+    
+    def add_route(self, logger_name: str, handlers: List[logging.Handler]):
+        self._routes[logger_name] = list(handlers)
+        self._resolved = {}
+    
+    def route_handlers(self) -> List[logging.Handler]:
+        """Handlers de toutes les routes, sans doublon"""
+        unique = {}
+        for handlers in list(self._routes.values()):
+            for handler in handlers:
+                unique[id(handler)] = handler
+        return list(unique.values())
+    
+    def _resolve(self, logger_name: str) -> List[logging.Handler]:
+        # Loggers enfants (propagation) : route du plus proche parent
+        handlers = self._resolved.get(logger_name)
+        if handlers is None:
+            key = logger_name
+            while key and key not in self._routes:
+                key = key.rpartition('.')[0]
+            handlers = self._routes.get(key, [])
+            self._resolved[logger_name] = handlers
+        return handlers
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self._resolve(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener qui traite la file par lots et vide les fichiers une fois par lot"""
+    
+    def __init__(self, log_queue: queue.Queue, router: _RoutingHandler, batch_size: int = 256):
+        super().__init__(log_queue, router, respect_handler_level=False)
+        self.router = router
+        self.batch_size = batch_size
+        self.batches_written = 0
+    
+    def _monitor(self):
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, 'task_done')
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+                if has_task_done:
+                    log_queue.task_done()
+            
+            self.flush_handlers()
+            self.batches_written += 1
+            if stop:
+                return
+    
+    def flush_handlers(self):
+        for handler in self.router.route_handlers():
+            flush = getattr(handler, 'flush_now', handler.flush)
+            try:
+                flush()
+            except Exception:
+                handler.handleError(None)
+
+
 class MusicDataLogger:
     """
     Gestionnaire de logging optimisé pour Music Data Extractor.
     Supporte les logs par session, rotation automatique et nettoyage.
     """
     
-    def __init__(self):
-        self.logs_dir = settings.logs_dir
+    def __init__(self, logs_dir: Optional[Path] = None, async_enabled: Optional[bool] = None,
+                 configure_main_logger: bool = True):
+        self.logs_dir = Path(logs_dir) if logs_dir else settings.logs_dir
         self.logs_dir.mkdir(exist_ok=True)
         
         # Configuration du logging
@@ -32,6 +184,22 @@ class MusicDataLogger:
         self.backup_count = settings.get('logging.backup_count', 5)
         self.retention_days = settings.get('logging.retention_days', 30)
         
+        # Pipeline asynchrone : file bornée + un seul thread d'écriture
+        self.async_enabled = (settings.get('logging.async_enabled', True)
+                              if async_enabled is None else async_enabled)
+        self.queue_size = settings.get('logging.queue_size', 10000)
+        self.batch_size = settings.get('logging.batch_size', 256)
+        self.block_timeout = settings.get('logging.block_timeout', 0.5)
+        
+        # Vidage par lots réservé au mode asynchrone : sans listener, personne
+        # d'autre ne viderait les handlers
+        if self.async_enabled:
+            self._file_handler_class = BatchedRotatingFileHandler
+            self._stream_handler_class = BatchedStreamHandler
+        else:
+            self._file_handler_class = logging.handlers.RotatingFileHandler
+            self._stream_handler_class = logging.StreamHandler
+        
         # Cache des loggers
         self._loggers_cache = {}
         self._lock = threading.Lock()
@@ -39,8 +207,15 @@ class MusicDataLogger:
         # Configuration des formatters
         self._setup_formatters()
         
+        self._router = _RoutingHandler()
+        self._queue_handler: Optional[DroppingQueueHandler] = None
+        self._listener: Optional[BatchingQueueListener] = None
+        if self.async_enabled:
+            self._start_listener()
+        
         # Configuration du logger principal
-        self._setup_main_logger()
+        if configure_main_logger:
+            self._setup_main_logger()
         
         # Statistiques de logging
         self.stats = {
@@ -51,6 +226,37 @@ class MusicDataLogger:
             'sessions_logged': set()
         }
     
+    def _start_listener(self):
+        """Démarre le thread d'écriture unique"""
+        log_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._queue_handler = DroppingQueueHandler(log_queue, self.block_timeout)
+        self._listener = BatchingQueueListener(log_queue, self._router, self.batch_size)
+        self._listener.start()
+        atexit.register(self.shutdown)
+    
+    def _attach_handlers(self, logger: logging.Logger, handlers: List[logging.Handler]):
+        """Branche les handlers : via la file en mode asynchrone, directement sinon"""
+        if self._queue_handler:
+            self._router.add_route(logger.name, handlers)
+            logger.addHandler(self._queue_handler)
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
+    
+    def _handlers_of(self, logger: logging.Logger) -> List[logging.Handler]:
+        """Handlers d'écriture d'un logger (derrière la file en mode asynchrone)"""
+        if self._queue_handler:
+            return self._router._routes.get(logger.name, [])
+        return list(logger.handlers)
+    
+    def shutdown(self):
+        """Vide la file et arrête le thread d'écriture"""
+        listener, self._listener = self._listener, None
+        if listener and listener._thread:
+            listener.stop()
+        for handler in self._router.route_handlers():
+            handler.close()
+    
     def _setup_formatters(self):
         """Configure les formatters pour différents types de logs"""
         
@@ -87,7 +293,7 @@ class MusicDataLogger:
             main_logger.handlers.clear()
         
         # Handler pour fichier principal avec rotation
-        main_file_handler = logging.handlers.RotatingFileHandler(
+        main_file_handler = self._file_handler_class(
             filename=self.logs_dir / 'music_data_extractor.log',
             maxBytes=self.max_file_size,
             backupCount=self.backup_count,
@@ -97,13 +303,12 @@ class MusicDataLogger:
         main_file_handler.setFormatter(self.detailed_formatter)
         
         # Handler console
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = self._stream_handler_class(sys.stdout)
         console_handler.setLevel(max(self.log_level, logging.INFO))  # Au minimum INFO sur console
         console_handler.setFormatter(self.console_formatter)
         
         # Ajout des handlers
-        main_logger.addHandler(main_file_handler)
-        main_logger.addHandler(console_handler)
+        self._attach_handlers(main_logger, [main_file_handler, console_handler])
         
         # Éviter la propagation vers le logger racine
         main_logger.propagate = False
@@ -142,7 +347,7 @@ class MusicDataLogger:
             else:
                 log_filename = f"{name}.log"
             
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = self._file_handler_class(
                 filename=self.logs_dir / log_filename,
                 maxBytes=self.max_file_size,
                 backupCount=self.backup_count,
@@ -151,7 +356,7 @@ class MusicDataLogger:
             file_handler.setLevel(self.log_level)
             file_handler.setFormatter(self.detailed_formatter)
             
-            logger.addHandler(file_handler)
+            self._attach_handlers(logger, [file_handler])
             logger.propagate = False
             
             self._loggers_cache[cache_key] = logger
@@ -190,7 +395,7 @@ class MusicDataLogger:
         with self._lock:
             for logger in self._loggers_cache.values():
                 logger.setLevel(new_level)
-                for handler in logger.handlers:
+                for handler in self._handlers_of(logger):
                     handler.setLevel(new_level)
         
         self.log_level = new_level
@@ -235,7 +440,7 @@ class MusicDataLogger:
             logger = self.get_session_logger(session_id, "progress")
         
         percentage = (current / total * 100) if total > 0 else 0
-        logger.info(f"📈 {step_name}: {current}/{total} ({percentage:.1f}%)")
+        logger.info("📈 %s: %d/%d (%.1f%%)", step_name, current, total, percentage)
         
         self.stats['total_log_entries'] += 1
     
@@ -263,19 +468,22 @@ class MusicDataLogger:
         if not logger:
             logger = self.get_session_logger(session_id, f"api_{api_name}")
         
+        is_error = bool(response_code and response_code >= 400)
+        self.stats['total_log_entries'] += 1
+        if not logger.isEnabledFor(logging.WARNING if is_error else logging.DEBUG):
+            return
+        
         log_msg = f"🌐 API {api_name} | {endpoint}"
         if response_code:
             log_msg += f" | Code: {response_code}"
         if duration:
             log_msg += f" | Durée: {duration:.2f}s"
         
-        if response_code and response_code >= 400:
+        if is_error:
             logger.warning(log_msg)
             self.stats['warnings_logged'] += 1
         else:
             logger.debug(log_msg)
-        
-        self.stats['total_log_entries'] += 1
     
     def log_scraping_activity(self, session_id: str, scraper_name: str, url: str,
                              success: bool, data_extracted: Optional[Dict[str, Any]] = None,
@@ -285,11 +493,11 @@ class MusicDataLogger:
             logger = self.get_session_logger(session_id, f"scraper_{scraper_name}")
         
         status_emoji = "✅" if success else "❌"
-        logger.info(f"{status_emoji} SCRAPING {scraper_name}")
-        logger.debug(f"🔗 URL: {url}")
+        logger.info("%s SCRAPING %s", status_emoji, scraper_name)
+        logger.debug("🔗 URL: %s", url)
         
         if data_extracted:
-            logger.debug(f"📦 Données extraites: {len(data_extracted)} éléments")
+            logger.debug("📦 Données extraites: %d éléments", len(data_extracted))
         
         self.stats['total_log_entries'] += 2
     
@@ -344,16 +552,23 @@ class MusicDataLogger:
         """Force la rotation de tous les logs"""
         with self._lock:
             for logger in self._loggers_cache.values():
-                for handler in logger.handlers:
+                for handler in self._handlers_of(logger):
                     if isinstance(handler, logging.handlers.RotatingFileHandler):
                         handler.doRollover()
     
-    def flush_all_logs(self):
-        """Force l'écriture de tous les logs en attente"""
+    def flush_all_logs(self, timeout: float = 5.0):
+        """Force l'écriture de tous les logs en attente (file comprise)"""
+        if self._listener:
+            # Attente bornée : la file peut être alimentée en continu
+            deadline = time.monotonic() + timeout
+            log_queue = self._listener.queue
+            while log_queue.unfinished_tasks and time.monotonic() < deadline:
+                time.sleep(0.005)
+        
         with self._lock:
             for logger in self._loggers_cache.values():
-                for handler in logger.handlers:
-                    handler.flush()
+                for handler in self._handlers_of(logger):
+                    getattr(handler, 'flush_now', handler.flush)()
     
     def get_log_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques de logging"""
@@ -364,6 +579,12 @@ class MusicDataLogger:
         stats['active_loggers'] = len(self._loggers_cache)
         stats['log_files_count'] = len(log_files)
         stats['logs_directory'] = str(self.logs_dir)
+        stats['async_enabled'] = self._queue_handler is not None
+        if self._queue_handler:
+            stats['queue_size'] = self._queue_handler.queue.qsize()
+            stats['queue_capacity'] = self.queue_size
+            stats['dropped_records'] = dict(self._queue_handler.dropped)
+            stats['batches_written'] = self._listener.batches_written if self._listener else 0
         
         return stats
     
@@ -409,12 +630,12 @@ class JsonFormatter(logging.Formatter):
 
 # ===== FONCTIONS DE CONFIGURATION GLOBALES =====
 
-def setup_logging(level: str = "INFO", debug_mode: bool = False) -> MusicDataLogger:
+def setup_logging(level: Any = "INFO", debug_mode: bool = False) -> MusicDataLogger:
     """
     Configure le système de logging pour l'application.
     
     Args:
-        level: Niveau de logging ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+        level: Niveau de logging ('DEBUG', 'INFO', 'WARNING', 'ERROR' ou constante logging)
         debug_mode: Activer le mode debug
         
     Returns:
@@ -427,14 +648,17 @@ def setup_logging(level: str = "INFO", debug_mode: bool = False) -> MusicDataLog
     if debug_mode:
         logger_manager.set_debug_mode(True)
     else:
-        log_level = getattr(logging, level.upper(), logging.INFO)
+        if isinstance(level, int):
+            log_level = level
+        else:
+            log_level = getattr(logging, level.upper(), logging.INFO)
         logger_manager.log_level = log_level
     
     # Log de démarrage
     main_logger = logger_manager.get_logger('music_data_extractor')
     main_logger.info("🎵 Music Data Extractor - Logging initialisé")
     main_logger.info(f"📁 Répertoire logs: {logger_manager.logs_dir}")
-    main_logger.info(f"📊 Niveau: {level}")
+    main_logger.info(f"📊 Niveau: {logging.getLevelName(logger_manager.log_level)}")
     main_logger.info(f"🔧 Mode debug: {'Activé' if debug_mode else 'Désactivé'}")
     
     return logger_manager
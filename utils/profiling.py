@@ -0,0 +1,370 @@
+# utils/profiling.py
+"""
+Instrumentation des chemins chauds du pipeline.
+
+Des spans chronométrés (horloge monotone) entourent les appels API, les
+accès cache, les écritures en base, le parsing et le scraping :
+
+    with span('api', 'spotify'):
+        response = session.get(...)
+
+    @profiled('db')
+    def save_checkpoint(...): ...
+
+Désactivé (par défaut), span() renvoie un context manager partagé qui ne
+fait rien : le coût se limite à un appel de fonction. Activé, chaque
+thread enregistre dans ses propres histogrammes log-linéaires (aucun verrou
+à l'enregistrement) et cumule le temps propre de chaque pile de spans ;
+les threads sont fusionnés à l'export (percentiles p50/p95/p99 par span,
+piles au format « folded » lu par flamegraph.pl et speedscope).
+"""
+
+import json
+import threading
+import time
+from functools import wraps
+from inspect import iscoroutinefunction
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_enabled = False
+_local = threading.local()
+_registry_lock = threading.Lock()
+_thread_states: List['_ThreadState'] = []
+
+
+class LogLinearHistogram:
+    """
+    Histogramme log-linéaire à la manière d'HDR Histogram.
+
+    Valeurs entières (microsecondes) : exactes sous 128, puis 64
+    sous-intervalles par puissance de deux, soit une erreur relative
+    inférieure à 1,6 % sur toute la plage.
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < 128:
+            return value
+        shift = value.bit_length() - LogLinearHistogram.SUB_BUCKET_BITS
+        return (shift << 6) + (value >> shift)
+
+    @staticmethod
+    def _bucket_value(index: int) -> int:
+        """Valeur représentative (milieu) d'un intervalle"""
+        if index < 128:
+            return index
+        shift = (index >> 6) - 1
+        low = (index - (shift << 6)) << shift
+        return low + ((1 << shift) >> 1)
+
+    def record(self, value: int):
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LogLinearHistogram'):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        threshold = max(1, percent / 100.0 * self.count)
+        cumulated = 0
+        for index in sorted(self.counts):
+            cumulated += self.counts[index]
+            if cumulated >= threshold:
+                return min(self._bucket_value(index), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Résumé en millisecondes"""
+        return {
+            'count': self.count,
+            'total_ms': round(self.total / 1000, 3),
+            'mean_ms': round(self.total / self.count / 1000, 3) if self.count else 0.0,
+            'min_ms': round((self.min or 0) / 1000, 3),
+            'p50_ms': round(self.percentile(50) / 1000, 3),
+            'p95_ms': round(self.percentile(95) / 1000, 3),
+            'p99_ms': round(self.percentile(99) / 1000, 3),
+            'max_ms': round(self.max / 1000, 3)
+        }
+
+
+class _ThreadState:
+    """Mesures d'un thread : écrites uniquement par ce thread"""
+
+    __slots__ = ('thread_name', 'histograms', 'folded', 'stack')
+
+    def __init__(self):
+        self.thread_name = threading.current_thread().name
+        self.histograms: Dict[Tuple[str, str], LogLinearHistogram] = {}
+        self.folded: Dict[str, int] = {}
+        self.stack: List['_Span'] = []
+
+
+def _thread_state() -> _ThreadState:
+    state = getattr(_local, 'state', None)
+    if state is None:
+        state = _local.state = _ThreadState()
+        with _registry_lock:
+            _thread_states.append(state)
+    return state
+
+
+class _Span:
+    """Span actif : durée totale dans l'histogramme, temps propre dans la pile"""
+
+    __slots__ = ('key', 'path', 'start', 'child_ns', 'state')
+
+    def __init__(self, category: str, name: str):
+        self.key = (category, name)
+
+    def __enter__(self) -> '_Span':
+        state = self.state = _thread_state()
+        label = f"{self.key[0]}:{self.key[1]}"
+        self.path = f"{state.stack[-1].path};{label}" if state.stack else label
+        state.stack.append(self)
+        self.child_ns = 0
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self.start
+        state = self.state
+        if state.stack[-1] is self:
+            state.stack.pop()
+        else:
+            # Coroutines entrelacées : fermeture hors ordre
+            state.stack.remove(self)
+
+        histogram = state.histograms.get(self.key)
+        if histogram is None:
+            histogram = state.histograms[self.key] = LogLinearHistogram()
+        histogram.record(duration // 1000)
+
+        state.folded[self.path] = state.folded.get(self.path, 0) + duration - self.child_ns
+        if state.stack:
+            state.stack[-1].child_ns += duration
+        return False
+
+
+class _NullSpan:
+    """Span partagé quand le profilage est désactivé"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# ===== API =====
+
+def span(category: str, name: str):
+    """
+    Context manager chronométrant un bloc.
+
+    Args:
+        category: Famille de l'opération ('api', 'cache', 'db', 'parse', 'scrape', 'step')
+        name: Source ou opération (cardinalité faible : pas d'URL ni d'ID)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(category, name)
+
+
+def profiled(category: str, name: Optional[str] = None) -> Callable:
+    """
+    Décorateur : span autour de chaque appel (nom de la fonction par défaut).
+
+    Les coroutines sont chronométrées jusqu'à leur fin ; des coroutines
+    entrelacées sur un même thread partagent sa pile de spans, à réserver
+    donc aux phases attendues l'une après l'autre.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                with _Span(category, span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(category, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_profiling(reset: bool = True):
+    """Active l'enregistrement des spans (et repart de zéro par défaut)"""
+    global _enabled
+    if reset:
+        reset_profile()
+    _enabled = True
+
+
+def disable_profiling():
+    """Désactive l'enregistrement ; les mesures restent disponibles à l'export"""
+    global _enabled
+    _enabled = False
+
+
+def is_profiling_enabled() -> bool:
+    return _enabled
+
+
+def reset_profile():
+    """Efface les mesures de tous les threads"""
+    with _registry_lock:
+        for state in _thread_states:
+            state.histograms = {}
+            state.folded = {}
+
+
+def _snapshot() -> List[_ThreadState]:
+    with _registry_lock:
+        return list(_thread_states)
+
+
+def get_profile_report() -> Dict[str, Any]:
+    """
+    Fusionne les mesures de tous les threads.
+
+    Returns:
+        Percentiles par span ('catégorie:nom') et totaux par catégorie
+    """
+    merged: Dict[Tuple[str, str], LogLinearHistogram] = {}
+    for state in _snapshot():
+        for key, histogram in list(state.histograms.items()):
+            merged.setdefault(key, LogLinearHistogram()).merge(histogram)
+
+    spans = {
+        f"{category}:{name}": histogram.to_dict()
+        for (category, name), histogram in sorted(merged.items())
+    }
+    categories: Dict[str, Dict[str, float]] = {}
+    for (category, _), histogram in merged.items():
+        totals = categories.setdefault(category, {'count': 0, 'total_ms': 0.0})
+        totals['count'] += histogram.count
+        totals['total_ms'] = round(totals['total_ms'] + histogram.total / 1000, 3)
+
+    return {
+        'enabled': _enabled,
+        'threads': len(_snapshot()),
+        'categories': categories,
+        'spans': spans
+    }
+
+
+def get_folded_stacks() -> Dict[str, int]:
+    """Temps propre (µs) par pile de spans, tous threads confondus"""
+    folded: Dict[str, int] = {}
+    for state in _snapshot():
+        for path, self_ns in list(state.folded.items()):
+            folded[path] = folded.get(path, 0) + self_ns
+    return {path: self_ns // 1000 for path, self_ns in folded.items() if self_ns >= 1000}
+
+
+def write_folded_stacks(path: Path) -> Path:
+    """Écrit les piles au format folded (« a;b;c 1234 », poids en µs)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, weight in sorted(get_folded_stacks().items()):
+            f.write(f"{stack} {weight}\n")
+    return path
+
+
+def export_profile(session_id: str, output_dir: Optional[Path] = None) -> Dict[str, Path]:
+    """
+    Exporte le profil d'une session : rapport JSON et piles folded.
+
+    Args:
+        session_id: ID de la session profilée
+        output_dir: Répertoire de sortie (logs/profiles par défaut)
+    """
+    if output_dir is None:
+        from config.settings import settings
+        output_dir = settings.logs_dir / 'profiles'
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    report_path = output_dir / f"profile_{session_id}.json"
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'session_id': session_id, **get_profile_report()}, f, indent=2, ensure_ascii=False)
+
+    return {
+        'report': report_path,
+        'folded': write_folded_stacks(output_dir / f"profile_{session_id}.folded")
+    }
+
+
+# ===== DIAGNOSTIC =====
+
+def measure_span_overhead(iterations: int = 200000) -> Dict[str, float]:
+    """
+    Coût d'un span vide, désactivé puis activé (mesures de l'appelant préservées).
+
+    Returns:
+        Nanosecondes par span dans chaque mode
+    """
+    global _enabled
+    previous = _enabled
+    state = _thread_state()
+    saved = (state.histograms, state.folded)
+    try:
+        _enabled = False
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            with span('bench', 'noop'):
+                pass
+        disabled_ns = (time.perf_counter_ns() - start) / iterations
+
+        _enabled = True
+        state.histograms, state.folded = {}, {}
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            with span('bench', 'noop'):
+                pass
+        enabled_ns = (time.perf_counter_ns() - start) / iterations
+    finally:
+        _enabled = previous
+        state.histograms, state.folded = saved
+
+    return {'disabled_ns': round(disabled_ns, 1), 'enabled_ns': round(enabled_ns, 1)}
@@ -0,0 +1,204 @@
+# utils/record_linkage.py
+"""
+Moteur de rapprochement d'enregistrements entre sources (extracteurs,
+enrichisseurs).
+
+1. Jointure exacte sur les identifiants externes (ISRC, spotify_id, genius_id)
+2. Rapprochement flou par blocs : seuls les enregistrements partageant une clé
+   de titre normalisée sont comparés, avec le scoreur en lot de utils.similarity
+3. Affectation un-pour-un : un candidat ne peut correspondre qu'à une seule
+   référence (meilleurs scores servis en premier)
+"""
+
+import re
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Set
+
+from utils.similarity import score_many, normalize_for_similarity
+
+# Identifiants externes utilisés pour la jointure exacte, par ordre de fiabilité
+DEFAULT_ID_FIELDS = ('isrc', 'spotify_id', 'genius_id')
+
+_KEY_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+_KEY_PREFIX_LENGTH = 4
+
+# Mots trop fréquents dans les titres pour servir de clé de bloc : leurs
+# listes de candidats couvriraient presque tout le catalogue
+BLOCKING_STOPWORDS = frozenset({
+    'le', 'la', 'les', 'l', 'de', 'des', 'du', 'd', 'un', 'une', 'et', 'en', 'a', 'au', 'aux',
+    'ce', 'ces', 'mon', 'ma', 'mes', 'ton', 'ta', 'tes', 'son', 'sa', 'ses', 'je', 'tu', 'il',
+    'on', 'nous', 'vous', 'ils', 'me', 'te', 'se', 'ne', 'pas', 'que', 'qui', 'y', 'pour', 'dans',
+    'the', 'an', 'of', 'and', 'in', 'to', 'my', 'you', 'i', 'it', 'is',
+    'feat', 'ft', 'featuring', 'remix', 'mix', 'edit', 'version', 'live', 'remaster', 'remastered'
+})
+
+
+# ===== CLÉS =====
+
+def _normalize_id(value: Any) -> Optional[str]:
+    """Normalise un identifiant externe (None si vide)"""
+    if value is None:
+        return None
+    normalized = str(value).strip().lower()
+    return normalized or None
+
+
+def _field_value(record: Dict[str, Any], field: str) -> str:
+    """Valeur textuelle d'un champ de comparaison"""
+    value = record.get(field)
+    return str(value).lower().strip() if value is not None else ''
+
+
+def blocking_keys(text: str) -> Set[str]:
+    """
+    Clés de bloc d'un texte : préfixes des tokens normalisés.
+
+    Deux titres proches partagent presque toujours au moins un préfixe
+    ("Bâtiment" / "Batiment (Remix)" -> "bati"). Les mots vides sont
+    ignorés ; le préfixe du texte sans espaces est ajouté pour les mots
+    collés ou coupés ("Ma vie" / "Mavie" -> "mavi").
+    """
+    normalized = normalize_for_similarity(text).replace("'", "")
+    tokens = _KEY_TOKEN_PATTERN.findall(normalized)
+    if not tokens:
+        return set()
+    keys = {token[:_KEY_PREFIX_LENGTH] for token in tokens if token not in BLOCKING_STOPWORDS}
+    keys.add(''.join(tokens)[:_KEY_PREFIX_LENGTH])
+    return keys
+
+
+# ===== SCORES =====
+
+def score_records(reference: Dict[str, Any], records: Sequence[Dict[str, Any]],
+                  match_fields: Sequence[str]) -> List[float]:
+    """
+    Score moyen par champ d'une référence contre plusieurs enregistrements.
+
+    Seuls les champs renseignés des deux côtés comptent dans la moyenne.
+
+    Returns:
+        Liste des scores, alignée sur records
+    """
+    totals = [0.0] * len(records)
+    counts = [0] * len(records)
+
+    for field in match_fields:
+        ref_value = _field_value(reference, field)
+        if not ref_value:
+            continue
+
+        values = [_field_value(record, field) for record in records]
+        for index, (value, similarity) in enumerate(zip(values, score_many(ref_value, values))):
+            if value:
+                totals[index] += similarity
+                counts[index] += 1
+
+    return [total / count if count else 0.0 for total, count in zip(totals, counts)]
+
+
+# ===== RAPPROCHEMENT =====
+
+def _link_by_ids(references: Sequence[Dict[str, Any]], candidates: Sequence[Dict[str, Any]],
+                 id_fields: Sequence[str], matches: List[Optional[Tuple[int, float]]],
+                 used: Set[int]) -> None:
+    """Jointure exacte sur les identifiants (score 1.0)"""
+    for field in id_fields:
+        index: Dict[str, int] = {}
+        for cand_index, candidate in enumerate(candidates):
+            value = _normalize_id(candidate.get(field))
+            if value is not None and cand_index not in used:
+                index.setdefault(value, cand_index)
+
+        if not index:
+            continue
+
+        for ref_index, reference in enumerate(references):
+            if matches[ref_index] is not None:
+                continue
+            cand_index = index.get(_normalize_id(reference.get(field)))
+            if cand_index is not None and cand_index not in used:
+                matches[ref_index] = (cand_index, 1.0)
+                used.add(cand_index)
+
+
+def link_records(references: Sequence[Dict[str, Any]], candidates: Sequence[Dict[str, Any]],
+                 match_fields: Sequence[str] = ('title', 'artist'),
+                 id_fields: Sequence[str] = DEFAULT_ID_FIELDS,
+                 threshold: float = 0.7) -> List[Optional[Tuple[int, float]]]:
+    """
+    Rapproche deux listes d'enregistrements.
+
+    Args:
+        references: Enregistrements de référence
+        candidates: Enregistrements à rattacher
+        match_fields: Champs comparés pour le rapprochement flou (le premier
+            sert de clé de bloc)
+        id_fields: Identifiants externes pour la jointure exacte
+        threshold: Score strictement supérieur requis pour un rapprochement flou
+
+    Returns:
+        Pour chaque référence, (index du candidat, score) ou None
+    """
+    matches: List[Optional[Tuple[int, float]]] = [None] * len(references)
+    if not references or not candidates:
+        return matches
+
+    used: Set[int] = set()
+    _link_by_ids(references, candidates, id_fields, matches, used)
+
+    if not match_fields:
+        return matches
+
+    # Index de blocs sur les candidats restants
+    block_field = match_fields[0]
+    blocks: Dict[str, List[int]] = {}
+    unblocked: List[int] = []
+    for cand_index, candidate in enumerate(candidates):
+        if cand_index in used:
+            continue
+        keys = blocking_keys(_field_value(candidate, block_field))
+        if not keys:
+            unblocked.append(cand_index)
+        for key in keys:
+            blocks.setdefault(key, []).append(cand_index)
+
+    all_remaining = [i for i in range(len(candidates)) if i not in used]
+
+    # Arêtes (score, référence, candidat) au-dessus du seuil
+    edges: List[Tuple[float, int, int]] = []
+    for ref_index, reference in enumerate(references):
+        if matches[ref_index] is not None:
+            continue
+
+        keys = blocking_keys(_field_value(reference, block_field))
+        if keys:
+            pool: Set[int] = set(unblocked)
+            for key in keys:
+                pool.update(blocks.get(key, ()))
+            pool_indices = sorted(pool)
+        else:
+            pool_indices = all_remaining
+
+        if not pool_indices:
+            continue
+
+        scores = score_records(reference, [candidates[i] for i in pool_indices], match_fields)
+        for cand_index, score in zip(pool_indices, scores):
+            if score > threshold:
+                edges.append((score, ref_index, cand_index))
+
+    # Affectation un-pour-un gloutonne par score décroissant
+    edges.sort(key=lambda edge: (-edge[0], edge[1], edge[2]))
+    for score, ref_index, cand_index in edges:
+        if matches[ref_index] is None and cand_index not in used:
+            matches[ref_index] = (cand_index, score)
+            used.add(cand_index)
+
+    return matches
+
+
+def find_best_match(reference: Dict[str, Any], candidates: Sequence[Dict[str, Any]],
+                    match_fields: Sequence[str] = ('title', 'artist'),
+                    id_fields: Sequence[str] = DEFAULT_ID_FIELDS,
+                    threshold: float = 0.7) -> Optional[Tuple[int, float]]:
+    """Rapproche une seule référence (raccourci de link_records)"""
+    return link_records([reference], candidates, match_fields, id_fields, threshold)[0]
@@ -0,0 +1,323 @@
+# utils/similarity.py
+"""
+Noyau de similarité textuelle partagé par la découverte, les processeurs et
+les extracteurs.
+
+- Normalisation mémoïsée (une seule normalisation par chaîne distincte)
+- API en lot : une requête contre N candidats (extract, score_many) et
+  N contre M (cdist)
+- Seuils avec sortie anticipée (bornes de longueur et quick_ratio)
+- Backend de référence pur Python (difflib), RapidFuzz en option
+
+Le score de référence est SequenceMatcher.ratio(), celui des comparaisons
+historiques : les seuils de configuration (déduplication, découverte,
+rapprochement) sont calibrés dessus. RapidFuzz calcule un ratio Indel
+(2 * LCS / longueurs), toujours supérieur ou égal : activer ce backend
+(similarity.backend: rapidfuzz) décale donc tous les seuils vers le haut.
+Il n'est pas sélectionné automatiquement à l'installation.
+
+SequenceMatcher met en cache l'index de sa séquence b : la chaîne fixe d'une
+comparaison en lot est toujours placée en seq2, seule seq1 varie.
+"""
+
+import logging
+import random
+import time
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Sequence, Any
+
+from config.settings import settings
+from utils.text_utils import normalize_text
+
+# Import conditionnel du backend rapide
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_BACKENDS = ('rapidfuzz', 'difflib')
+_backend = settings.get('similarity.backend', 'difflib')
+if _backend not in SUPPORTED_BACKENDS or (_backend == 'rapidfuzz' and not RAPIDFUZZ_AVAILABLE):
+    _backend = 'difflib'
+
+
+# ===== CONFIGURATION DU BACKEND =====
+
+def get_backend() -> str:
+    """Retourne le backend de similarité actif ('rapidfuzz' ou 'difflib')"""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Sélectionne le backend de similarité.
+
+    Raises:
+        ValueError: Backend inconnu ou non installé
+    """
+    global _backend
+
+    if name not in SUPPORTED_BACKENDS:
+        raise ValueError(f"Backend de similarité inconnu: {name}")
+    if name == 'rapidfuzz' and not RAPIDFUZZ_AVAILABLE:
+        raise ValueError("RapidFuzz n'est pas installé")
+
+    _backend = name
+
+
+# ===== NORMALISATION =====
+
+@lru_cache(maxsize=16384)
+def normalize_for_similarity(text: str) -> str:
+    """Normalise un texte pour la comparaison (mémoïsé)"""
+    if not text or not isinstance(text, str):
+        return ""
+    return normalize_text(text)
+
+
+def _prepare(texts: Sequence[str], normalize: bool) -> List[str]:
+    """Normalise une séquence de textes une seule fois"""
+    if normalize:
+        return [normalize_for_similarity(text) for text in texts]
+    return [text or "" for text in texts]
+
+
+# ===== KERNEL PUR PYTHON =====
+
+def _difflib_score(matcher: SequenceMatcher, varying: str, fixed: str,
+                   score_cutoff: float) -> float:
+    """
+    Score avec un SequenceMatcher dont la séquence b (indexée une seule fois)
+    est fixed : seule la séquence a change, score = ratio(varying, fixed).
+    Retourne 0.0 sous le seuil.
+    """
+    if not varying or not fixed:
+        return 0.0
+    if varying == fixed:
+        return 1.0
+
+    if score_cutoff > 0.0:
+        length_bound = 2.0 * min(len(varying), len(fixed)) / (len(varying) + len(fixed))
+        if length_bound < score_cutoff:
+            return 0.0
+
+    matcher.set_seq1(varying)
+
+    if score_cutoff > 0.0:
+        if matcher.real_quick_ratio() < score_cutoff or matcher.quick_ratio() < score_cutoff:
+            return 0.0
+
+    score = matcher.ratio()
+    return score if score >= score_cutoff else 0.0
+
+
+def _difflib_row(fixed: str, varying: List[str], score_cutoff: float) -> List[float]:
+    """
+    Scores ratio(v, fixed) pour chaque v de varying : fixed est en seq2, son
+    index (b2j) n'est construit qu'une fois pour toute la ligne.
+    """
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(fixed)
+    return [_difflib_score(matcher, value, fixed, score_cutoff) for value in varying]
+
+
+def _rapidfuzz_rows(queries: List[str], choices: List[str], score_cutoff: float) -> List[List[float]]:
+    """Matrice de scores via RapidFuzz (ratio Indel normalisé, 0-1)"""
+    matrix = _rf_process.cdist(
+        queries, choices,
+        scorer=_rf_fuzz.ratio,
+        score_cutoff=score_cutoff * 100.0,
+        workers=1
+    )
+    return [[value / 100.0 for value in row] for row in matrix.tolist()]
+
+
+# ===== API PUBLIQUE =====
+
+def similarity(text1: str, text2: str, score_cutoff: float = 0.0, normalize: bool = True) -> float:
+    """
+    Similarité entre deux textes (0.0 à 1.0).
+
+    Args:
+        text1, text2: Textes à comparer
+        score_cutoff: Seuil sous lequel 0.0 est retourné (permet la sortie anticipée)
+        normalize: Appliquer normalize_text (mémoïsé) avant comparaison
+
+    Returns:
+        Score de similarité (ratio(text1, text2), même ordre que similarity_ratio)
+    """
+    if _backend == 'rapidfuzz':
+        return score_many(text1, [text2], score_cutoff, normalize)[0]
+    prepared1, prepared2 = _prepare([text1, text2], normalize)
+    return _difflib_row(prepared2, [prepared1], score_cutoff)[0]
+
+
+def score_many(query: str, choices: Sequence[str], score_cutoff: float = 0.0,
+               normalize: bool = True) -> List[float]:
+    """
+    Compare une requête à une liste de candidats.
+
+    Avec difflib, la requête est la séquence fixe : score = ratio(candidat,
+    requête). SequenceMatcher n'étant pas symétrique, le score peut différer
+    légèrement de similarity(requête, candidat).
+
+    Returns:
+        Liste des scores, alignée sur choices
+    """
+    if not choices:
+        return []
+
+    prepared_query = _prepare([query], normalize)[0]
+    prepared_choices = _prepare(choices, normalize)
+
+    if not prepared_query:
+        return [0.0] * len(prepared_choices)
+
+    if _backend == 'rapidfuzz':
+        return _rapidfuzz_rows([prepared_query], prepared_choices, score_cutoff)[0]
+    return _difflib_row(prepared_query, prepared_choices, score_cutoff)
+
+
+def extract(query: str, choices: Sequence[str], score_cutoff: float = 0.0,
+            limit: Optional[int] = None, normalize: bool = True) -> List[Tuple[int, float]]:
+    """
+    Retourne les meilleurs candidats pour une requête.
+
+    Returns:
+        Liste de (index du candidat, score) triée par score décroissant
+    """
+    scores = score_many(query, choices, score_cutoff, normalize)
+    ranked = [
+        (index, score) for index, score in enumerate(scores)
+        if score > 0.0 and score >= score_cutoff
+    ]
+    ranked.sort(key=lambda item: (-item[1], item[0]))
+    return ranked[:limit] if limit else ranked
+
+
+def extract_one(query: str, choices: Sequence[str], score_cutoff: float = 0.0,
+                normalize: bool = True) -> Optional[Tuple[int, float]]:
+    """Retourne le meilleur candidat (index, score) ou None"""
+    best = extract(query, choices, score_cutoff, limit=1, normalize=normalize)
+    return best[0] if best else None
+
+
+def cdist(queries: Sequence[str], choices: Optional[Sequence[str]] = None,
+          score_cutoff: float = 0.0, normalize: bool = True) -> List[List[float]]:
+    """
+    Matrice de similarité N x M.
+
+    Args:
+        queries: Textes en lignes
+        choices: Textes en colonnes (None = queries, seule la moitié
+            supérieure est calculée puis recopiée)
+        score_cutoff: Seuil de sortie anticipée
+        normalize: Appliquer la normalisation mémoïsée
+
+    Returns:
+        matrix[i][j] = similarité(queries[i], choices[j])
+    """
+    symmetric = choices is None
+    prepared_queries = _prepare(queries, normalize)
+    prepared_choices = prepared_queries if symmetric else _prepare(choices, normalize)
+
+    if not prepared_queries or not prepared_choices:
+        return [[] for _ in prepared_queries]
+
+    if _backend == 'rapidfuzz':
+        return _rapidfuzz_rows(prepared_queries, prepared_choices, score_cutoff)
+
+    # Calcul par colonne : choices[j] est la séquence fixe, les requêtes
+    # varient, ce qui donne exactement ratio(queries[i], choices[j])
+    if not symmetric:
+        matrix = [[0.0] * len(prepared_choices) for _ in prepared_queries]
+        for j, choice in enumerate(prepared_choices):
+            for i, score in enumerate(_difflib_row(choice, prepared_queries, score_cutoff)):
+                matrix[i][j] = score
+        return matrix
+
+    size = len(prepared_queries)
+    matrix = [[0.0] * size for _ in range(size)]
+    for j, choice in enumerate(prepared_queries):
+        matrix[j][j] = 1.0 if choice else 0.0
+        if j:
+            for i, score in enumerate(_difflib_row(choice, prepared_queries[:j], score_cutoff)):
+                matrix[i][j] = score
+                matrix[j][i] = score
+    return matrix
+
+
+def clear_similarity_cache() -> None:
+    """Vide le cache de normalisation"""
+    normalize_for_similarity.cache_clear()
+
+
+# ===== BENCHMARK =====
+
+def _generate_benchmark_titles(count: int, seed: int) -> List[str]:
+    """Génère des titres proches (variantes, featuring, accents) pour le benchmark"""
+    rng = random.Random(seed)
+    words = [
+        'la', 'vie', 'été', 'nuit', 'rêve', 'ville', 'cœur', 'flow', 'street', 'love',
+        'freestyle', 'intro', 'outro', 'bâtiment', 'soleil', 'démon', 'gang', 'money'
+    ]
+    suffixes = ['', '', '', ' (Remix)', ' (feat. Damso)', ' - Live', ' [Radio Edit]']
+
+    titles = []
+    for _ in range(count):
+        base = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        titles.append(base.title() + rng.choice(suffixes))
+    return titles
+
+
+def run_similarity_benchmark(titles: Optional[List[str]] = None, count: int = 300,
+                             seed: int = 42, score_cutoff: float = 0.0) -> Dict[str, Any]:
+    """
+    Compare le chemin historique (normalize_text + SequenceMatcher par paire,
+    comme dans les boucles i < j des appelants) au noyau en lot (cdist).
+
+    Args:
+        titles: Titres à comparer (générés si absents)
+        count: Nombre de titres générés
+        seed: Graine du générateur
+        score_cutoff: Seuil appliqué au noyau (les scores historiques sous
+            le seuil sont ramenés à 0.0 pour la comparaison)
+
+    Returns:
+        Temps, accélération et écarts de scores sur les paires i < j
+    """
+    titles = titles or _generate_benchmark_titles(count, seed)
+    size = len(titles)
+
+    start = time.perf_counter()
+    legacy = {}
+    for i in range(size):
+        for j in range(i + 1, size):
+            norm1, norm2 = normalize_text(titles[i]), normalize_text(titles[j])
+            legacy[(i, j)] = SequenceMatcher(None, norm1, norm2).ratio() if titles[i] and titles[j] else 0.0
+    legacy_time = time.perf_counter() - start
+
+    clear_similarity_cache()
+    start = time.perf_counter()
+    bulk = cdist(titles, score_cutoff=score_cutoff)
+    bulk_time = time.perf_counter() - start
+
+    differences = [
+        abs((score if score >= score_cutoff else 0.0) - bulk[i][j])
+        for (i, j), score in legacy.items()
+    ]
+
+    return {
+        'backend': _backend,
+        'score_cutoff': score_cutoff,
+        'pairs': len(differences),
+        'legacy_seconds': round(legacy_time, 4),
+        'bulk_seconds': round(bulk_time, 4),
+        'speedup': round(legacy_time / bulk_time, 2) if bulk_time else None,
+        'max_score_difference': round(max(differences), 4) if differences else 0.0,
+        'mean_score_difference': round(sum(differences) / len(differences), 6) if differences else 0.0
+    }
@@ -9,7 +9,6 @@ import logging
 import unicodedata
 from typing import List, Dict, Optional, Tuple, Set, Any
 from functools import lru_cache
-from difflib import SequenceMatcher
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -479,12 +478,18 @@ def similarity_ratio(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    # Normalisation pour comparaison
-    norm1 = normalize_text(text1)
-    norm2 = normalize_text(text2)
+    # Noyau partagé (normalisation mémoïsée, backend RapidFuzz si disponible)
+    from utils.similarity import similarity
+    return similarity(text1, text2)
+
+def calculate_similarity(text1: str, text2: str) -> float:
+    """
+    Alias de similarity_ratio utilisé par les extracteurs et la découverte.
     
-    # Calcul de la similarité
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    Pour comparer une valeur à plusieurs candidats, préférer l'API en lot
+    de utils.similarity (score_many, extract, cdist).
+    """
+    return similarity_ratio(text1, text2)
 
 def fuzzy_match_artist(target: str, candidates: List[str], threshold: float = 0.8) -> Optional[str]:
     """
@@ -501,23 +506,10 @@ def fuzzy_match_artist(target: str, candidates: List[str], threshold: float = 0.
     if not target or not candidates:
         return None
     
-    best_match = None
-    best_score = 0.0
-    
-    target_normalized = normalize_text(target)
-    
-    for candidate in candidates:
-        if not candidate:
-            continue
-            
-        candidate_normalized = normalize_text(candidate)
-        score = similarity_ratio(target_normalized, candidate_normalized)
-        
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = candidate
+    from utils.similarity import extract_one
     
-    return best_match
+    best = extract_one(target, candidates, score_cutoff=threshold)
+    return candidates[best[0]] if best else None
 
 # ===== FONCTIONS DE DÉTECTION DE LANGUE =====
 
@@ -705,7 +697,7 @@ def get_functions_list() -> List[str]:
         'extract_featured_artists_from_title', 'parse_artist_list',
         'extract_parenthetical_info', 'split_featured_artists', 'normalize_featuring',
         'validate_artist_name', 'validate_title',
-        'similarity_ratio', 'fuzzy_match_artist', 'detect_language',
+        'similarity_ratio', 'calculate_similarity', 'fuzzy_match_artist', 'detect_language',
         'get_text_stats', 'batch_clean_names', 'create_search_terms',
         'run_text_utils_tests', 'get_functions_list'
     ]